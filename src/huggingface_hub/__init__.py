@@ -61,6 +61,9 @@ _SUBMOD_ATTRS = {
         "SyncOperation",
         "SyncPlan",
     ],
+    "_buckets_watch": [
+        "BucketSyncWatcher",
+    ],
     "_commit_scheduler": [
         "CommitScheduler",
     ],
@@ -103,9 +106,15 @@ _SUBMOD_ATTRS = {
         "attach_huggingface_oauth",
         "parse_huggingface_oauth",
     ],
+    "_parquet": [
+        "HfParquetReader",
+    ],
     "_revision": [
         "ResolvedRevision",
     ],
+    "_safetensors_reader": [
+        "HfSafetensorsReader",
+    ],
     "_sandbox": [
         "Sandbox",
         "SandboxCommandResult",
@@ -278,6 +287,7 @@ _SUBMOD_ATTRS = {
         "get_paths_info",
         "get_repo_discussions",
         "get_safetensors_metadata",
+        "get_safetensors_metadata_bulk",
         "get_space_runtime",
         "get_space_secrets",
         "get_space_variables",
@@ -374,6 +384,7 @@ _SUBMOD_ATTRS = {
         "whoami",
     ],
     "hf_file_system": [
+        "AsyncHfFileSystem",
         "HfFileSystem",
         "HfFileSystemFile",
         "HfFileSystemResolvedPath",
@@ -586,6 +597,7 @@ _SUBMOD_ATTRS = {
         "SpaceCardData",
     ],
     "serialization": [
+        "LazySafetensorsStateDict",
         "StateDictSplit",
         "get_torch_storage_id",
         "get_torch_storage_size",
@@ -595,6 +607,7 @@ _SUBMOD_ATTRS = {
         "save_torch_state_dict",
         "split_state_dict_into_shards_factory",
         "split_torch_state_dict_into_shards",
+        "upload_torch_state_dict",
     ],
     "serialization._dduf": [
         "DDUFEntry",
@@ -614,11 +627,15 @@ _SUBMOD_ATTRS = {
         "DeleteCacheStrategy",
         "HFCacheInfo",
         "HfUri",
+        "HttpPoolConfig",
         "cached_assets_path",
         "close_session",
+        "close_shared_async_session",
         "dump_environment_info",
         "get_async_session",
+        "get_http_pool_config",
         "get_session",
+        "get_shared_async_session",
         "get_token",
         "hf_raise_for_status",
         "logging",
@@ -626,6 +643,7 @@ _SUBMOD_ATTRS = {
         "scan_cache_dir",
         "set_async_client_factory",
         "set_client_factory",
+        "set_http_pool_config",
     ],
 }
 
@@ -643,6 +661,7 @@ _SUBMOD_ATTRS = {
 __all__ = [
     "ASYNC_CLIENT_FACTORY_T",
     "Agent",
+    "AsyncHfFileSystem",
     "AsyncInferenceClient",
     "AudioClassificationInput",
     "AudioClassificationOutputElement",
@@ -660,6 +679,7 @@ __all__ = [
     "BucketFileMetadata",
     "BucketFolder",
     "BucketInfo",
+    "BucketSyncWatcher",
     "BucketUrl",
     "CLIENT_FACTORY_T",
     "CONFIG_NAME",
@@ -754,7 +774,10 @@ __all__ = [
     "HfFileSystemFile",
     "HfFileSystemResolvedPath",
     "HfFileSystemStreamFile",
+    "HfParquetReader",
+    "HfSafetensorsReader",
     "HfUri",
+    "HttpPoolConfig",
     "ImageClassificationInput",
     "ImageClassificationOutputElement",
     "ImageClassificationOutputTransform",
@@ -802,6 +825,7 @@ __all__ = [
     "JobStage",
     "JobStatus",
     "KernelInfo",
+    "LazySafetensorsStateDict",
     "MCPClient",
     "ModelCard",
     "ModelCardData",
@@ -957,6 +981,7 @@ __all__ = [
     "change_discussion_status",
     "check_cli_update",
     "close_session",
+    "close_shared_async_session",
     "comment_discussion",
     "copy_files",
     "create_branch",
@@ -1015,6 +1040,7 @@ __all__ = [
     "get_discussion_details",
     "get_full_repo_name",
     "get_hf_file_metadata",
+    "get_http_pool_config",
     "get_inference_endpoint",
     "get_local_safetensors_metadata",
     "get_model_tags",
@@ -1022,7 +1048,9 @@ __all__ = [
     "get_paths_info",
     "get_repo_discussions",
     "get_safetensors_metadata",
+    "get_safetensors_metadata_bulk",
     "get_session",
+    "get_shared_async_session",
     "get_space_runtime",
     "get_space_secrets",
     "get_space_variables",
@@ -1122,6 +1150,7 @@ __all__ = [
     "search_spaces",
     "set_async_client_factory",
     "set_client_factory",
+    "set_http_pool_config",
     "set_space_sleep_time",
     "set_space_volumes",
     "snapshot_download",
@@ -1147,6 +1176,7 @@ __all__ = [
     "upload_file",
     "upload_folder",
     "upload_large_folder",
+    "upload_torch_state_dict",
     "verify_repo_checksums",
     "wait_for_job",
     "wait_for_space",
@@ -1265,6 +1295,7 @@ if TYPE_CHECKING:  # pragma: no cover
         SyncOperation,  # noqa: F401
         SyncPlan,  # noqa: F401
     )
+    from ._buckets_watch import BucketSyncWatcher  # noqa: F401
     from ._commit_scheduler import CommitScheduler  # noqa: F401
     from ._eval_results import (
         EvalResultEntry,  # noqa: F401
@@ -1305,7 +1336,9 @@ if TYPE_CHECKING:  # pragma: no cover
         attach_huggingface_oauth,  # noqa: F401
         parse_huggingface_oauth,  # noqa: F401
     )
+    from ._parquet import HfParquetReader  # noqa: F401
     from ._revision import ResolvedRevision  # noqa: F401
+    from ._safetensors_reader import HfSafetensorsReader  # noqa: F401
     from ._sandbox import (
         Sandbox,  # noqa: F401
         SandboxCommandResult,  # noqa: F401
@@ -1476,6 +1509,7 @@ if TYPE_CHECKING:  # pragma: no cover
         get_paths_info,  # noqa: F401
         get_repo_discussions,  # noqa: F401
         get_safetensors_metadata,  # noqa: F401
+        get_safetensors_metadata_bulk,  # noqa: F401
         get_space_runtime,  # noqa: F401
         get_space_secrets,  # noqa: F401
         get_space_variables,  # noqa: F401
@@ -1572,6 +1606,7 @@ if TYPE_CHECKING:  # pragma: no cover
         whoami,  # noqa: F401
     )
     from .hf_file_system import (
+        AsyncHfFileSystem,  # noqa: F401
         HfFileSystem,  # noqa: F401
         HfFileSystemFile,  # noqa: F401
         HfFileSystemResolvedPath,  # noqa: F401
@@ -1778,6 +1813,7 @@ if TYPE_CHECKING:  # pragma: no cover
         SpaceCardData,  # noqa: F401
     )
     from .serialization import (
+        LazySafetensorsStateDict,  # noqa: F401
         StateDictSplit,  # noqa: F401
         get_torch_storage_id,  # noqa: F401
         get_torch_storage_size,  # noqa: F401
@@ -1787,6 +1823,7 @@ if TYPE_CHECKING:  # pragma: no cover
         save_torch_state_dict,  # noqa: F401
         split_state_dict_into_shards_factory,  # noqa: F401
         split_torch_state_dict_into_shards,  # noqa: F401
+        upload_torch_state_dict,  # noqa: F401
     )
     from .serialization._dduf import (
         DDUFEntry,  # noqa: F401
@@ -1806,11 +1843,15 @@ if TYPE_CHECKING:  # pragma: no cover
         DeleteCacheStrategy,  # noqa: F401
         HFCacheInfo,  # noqa: F401
         HfUri,  # noqa: F401
+        HttpPoolConfig,  # noqa: F401
         cached_assets_path,  # noqa: F401
         close_session,  # noqa: F401
+        close_shared_async_session,  # noqa: F401
         dump_environment_info,  # noqa: F401
         get_async_session,  # noqa: F401
+        get_http_pool_config,  # noqa: F401
         get_session,  # noqa: F401
+        get_shared_async_session,  # noqa: F401
         get_token,  # noqa: F401
         hf_raise_for_status,  # noqa: F401
         logging,  # noqa: F401
@@ -1818,4 +1859,5 @@ if TYPE_CHECKING:  # pragma: no cover
         scan_cache_dir,  # noqa: F401
         set_async_client_factory,  # noqa: F401
         set_client_factory,  # noqa: F401
+        set_http_pool_config,  # noqa: F401
     )
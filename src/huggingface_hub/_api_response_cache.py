@@ -0,0 +1,271 @@
+# Copyright 2026-present, the HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Opt-in cache of Hub API responses, revalidated with conditional requests.
+
+Read routes of the Hub API (`/api/models/{repo_id}`, `/api/models/{repo_id}/refs`, ...) return an `ETag` header. When
+`HF_HUB_ENABLE_API_CACHE` is set, the body of these responses is cached together with its ETag. The next identical
+request is sent with an `If-None-Match` header: if the resource did not change, the Hub answers with an empty
+`304 Not Modified` and the cached body is used instead. Every call still reaches the Hub, so freshness and access
+rights are always checked server-side. Only the download and the parsing of unchanged responses are saved.
+
+Responses are cached at two levels:
+- in a bounded in-memory LRU, together with the object built from them (e.g. a `ModelInfo`). A `304` is then served
+  without parsing the JSON nor building the object again. Each call gets a shallow copy of the cached object: nested
+  values (e.g. `ModelInfo.siblings`) are shared between calls.
+- on disk, as one JSON file per request under `HF_HUB_API_CACHE` (`~/.cache/huggingface/api` by default). Files are
+  named after a hash of the URL and of the token, so that users sharing a cache folder don't share entries. The total
+  size of the folder is bounded by `HF_HUB_API_CACHE_MAX_SIZE`, least recently used files being removed first. The
+  folder is only scanned when its size, tracked across writes, may exceed this bound.
+
+```json
+{
+  "format_version": 1,
+  "url": "https://huggingface.co/api/models/gpt2/refs",
+  "etag": "W/\\"1d2-abc\\"",
+  "headers": {"content-type": "application/json; charset=utf-8"},
+  "content": "{\\"branches\\": [...], ...}"
+}
+```
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import httpx
+
+from . import constants
+from .utils import hf_raise_for_status, logging
+
+
+logger = logging.get_logger(__name__)
+
+T = TypeVar("T")
+
+API_CACHE_FORMAT_VERSION = 1
+
+# Response headers stored with the body (e.g. `Link` is needed to paginate through cached pages)
+_CACHED_HEADERS = ("content-type", "link")
+
+# In-memory LRU of cached responses, keyed by cache key.
+_IN_MEMORY_CACHE_MAX_SIZE = 256
+_IN_MEMORY_CACHE: "OrderedDict[str, CachedApiResponse]" = OrderedDict()
+_IN_MEMORY_CACHE_LOCK = threading.Lock()
+
+# Sentinel for responses that have not been parsed yet (e.g. read from disk)
+_NOT_PARSED: Any = object()
+
+# Estimated size of each cache folder, so that it is only scanned when it may exceed its bound. Initialized by a scan
+# on the first write in this process. Writes made by other processes are only accounted for at the next scan.
+_DISK_CACHE_SIZE: dict[str, int] = {}
+_DISK_CACHE_SIZE_LOCK = threading.Lock()
+
+
+@dataclass
+class CachedApiResponse:
+    """A response of the Hub API, stored with its ETag."""
+
+    url: str
+    etag: str
+    headers: dict[str, str]
+    content: str
+    # Object built from the response. Only kept in memory.
+    parsed: Any = field(default=_NOT_PARSED, repr=False, compare=False)
+
+    def as_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={**self.headers, "ETag": self.etag}, content=self.content.encode(), request=request
+        )
+
+
+def fetch_with_api_cache(
+    url: str,
+    *,
+    headers: dict[str, str],
+    send: Callable[[dict[str, str]], httpx.Response],
+    parse: Callable[[httpx.Response], T],
+    params: Any = None,
+) -> T:
+    """Send a GET request to the Hub API and build an object from its response, using the API cache if enabled.
+
+    If `HF_HUB_ENABLE_API_CACHE` is not set, this is equivalent to `parse(send(headers))` (with a status check).
+
+    Args:
+        url (`str`):
+            URL of the request.
+        headers (`dict[str, str]`):
+            Headers of the request.
+        send (`Callable[[dict[str, str]], httpx.Response]`):
+            Function sending the request with the given headers (to which `If-None-Match` is added on revalidation).
+        parse (`Callable[[httpx.Response], T]`):
+            Function building the returned object from a successful response. As its result is cached in memory and
+            (shallow) copies of it are returned to later calls, it must not depend on anything else than the response.
+        params (*optional*):
+            Query parameters sent by `send`, if any.
+    """
+    if not constants.HF_HUB_ENABLE_API_CACHE:
+        response = send(headers)
+        hf_raise_for_status(response)
+        return parse(response)
+
+    key = _api_cache_key(url, params, headers)
+    cached = read_api_cache(key)
+    response = send(headers if cached is None else {**headers, "If-None-Match": cached.etag})
+    if cached is not None and response.status_code == 304:
+        if cached.parsed is _NOT_PARSED:
+            cached.parsed = parse(cached.as_response(response.request))
+        return copy.copy(cached.parsed)
+
+    hf_raise_for_status(response)
+    parsed = parse(response)
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        write_api_cache(
+            key,
+            CachedApiResponse(
+                url=str(response.request.url),
+                etag=etag,
+                headers={name: response.headers[name] for name in _CACHED_HEADERS if name in response.headers},
+                content=response.text,
+                parsed=copy.copy(parsed),
+            ),
+        )
+    return parsed
+
+
+def _api_cache_key(url: str, params: Any, headers: Mapping[str, str]) -> str:
+    full_url = str(httpx.URL(url).copy_merge_params(params or {}))
+    authorization = next((value for name, value in headers.items() if name.lower() == "authorization"), "")
+    return hashlib.sha256(f"{full_url}\n{authorization}".encode()).hexdigest()
+
+
+def _api_cache_path(key: str) -> str:
+    return os.path.join(constants.HF_HUB_API_CACHE, f"{key}.json")
+
+
+def _remember(key: str, cached: CachedApiResponse) -> None:
+    with _IN_MEMORY_CACHE_LOCK:
+        _IN_MEMORY_CACHE[key] = cached
+        _IN_MEMORY_CACHE.move_to_end(key)
+        while len(_IN_MEMORY_CACHE) > _IN_MEMORY_CACHE_MAX_SIZE:
+            _IN_MEMORY_CACHE.popitem(last=False)
+
+
+def read_api_cache(key: str) -> CachedApiResponse | None:
+    """Return the cached response for a cache key, or `None` if not cached, invalid, or unreadable."""
+    with _IN_MEMORY_CACHE_LOCK:
+        if key in _IN_MEMORY_CACHE:
+            _IN_MEMORY_CACHE.move_to_end(key)
+            return _IN_MEMORY_CACHE[key]
+    cached = _read_api_cache_from_disk(_api_cache_path(key))
+    if cached is not None:
+        _remember(key, cached)
+    return cached
+
+
+def _read_api_cache_from_disk(path: str) -> CachedApiResponse | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format_version") != API_CACHE_FORMAT_VERSION:
+            # Unknown format (e.g. written by a newer version) => ignore and re-fetch.
+            return None
+        cached = CachedApiResponse(
+            url=data["url"], etag=data["etag"], headers=dict(data["headers"]), content=data["content"]
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring corrupted API cache file {path}: {e}")
+        return None
+
+    try:
+        os.utime(path)  # mark as recently used
+    except OSError:
+        pass
+    return cached
+
+
+def write_api_cache(key: str, cached: CachedApiResponse) -> None:
+    """Write a response to the cache (ignoring any failure), then evict old files if the cache is too large."""
+    path = _api_cache_path(key)
+    data = {
+        "format_version": API_CACHE_FORMAT_VERSION,
+        "url": cached.url,
+        "etag": cached.etag,
+        "headers": cached.headers,
+        "content": cached.content,
+    }
+
+    # Seed the in-memory cache first: even if the disk is read-only, later calls in this process are served from memory.
+    _remember(key, cached)
+    folder = os.path.dirname(path)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        try:
+            previous_size = os.path.getsize(path)
+        except FileNotFoundError:
+            previous_size = 0
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        _track_disk_cache_size(folder, os.path.getsize(path) - previous_size)
+    except OSError as e:
+        logger.warning(f"Ignored error while writing API cache file {path}: {e}")
+
+
+def _track_disk_cache_size(folder: str, delta: int) -> None:
+    """Account for a write in the estimated size of the cache folder, and evict old files if it may be too large."""
+    max_size = constants.HF_HUB_API_CACHE_MAX_SIZE
+    with _DISK_CACHE_SIZE_LOCK:
+        if folder in _DISK_CACHE_SIZE:
+            _DISK_CACHE_SIZE[folder] += delta
+            if _DISK_CACHE_SIZE[folder] <= max_size:
+                return
+        _DISK_CACHE_SIZE[folder] = _evict_api_cache(folder, max_size=max_size)
+
+
+def _evict_api_cache(folder: str, max_size: int) -> int:
+    """Remove least recently used files until the total size of the cache folder is below `max_size`.
+
+    Return the total size of the folder after eviction.
+    """
+    files = []
+    total_size = 0
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+    if total_size <= max_size:
+        return total_size
+
+    for _, size, path in sorted(files):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+        if total_size <= max_size:
+            break
+    return total_size
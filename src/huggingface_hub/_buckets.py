@@ -20,27 +20,36 @@ import fnmatch
 import json
 import mimetypes
 import os
+import sqlite3
 import stat
 import sys
+import threading
 import time
-from collections.abc import Iterator
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from . import constants, logging
-from .errors import BucketNotFoundError
+from .errors import BucketNotFoundError, HfHubHTTPError
 from .utils import (
     HfUri,
     StatusLine,
     XetFileData,
+    _format_size,
+    chunk_iterable,
     disable_progress_bars,
     enable_progress_bars,
     parse_datetime,
     parse_hf_uri,
+    parse_ratelimit_headers,
+    walk_local_files,
 )
 from .utils._hf_uris import _looks_like_hf_url
+from .utils._runtime import is_xet_available
 
 
 if TYPE_CHECKING:
@@ -52,6 +61,15 @@ logger = logging.get_logger(__name__)
 
 BUCKET_PREFIX = "hf://buckets/"
 _SYNC_TIME_WINDOW_MS = 1000  # 1s safety-window for file modification time comparisons
+_SYNC_EXECUTE_BATCH_SIZE = 1000  # max number of transfers/deletions sent at once while executing a sync
+_SYNC_EXECUTE_FLUSH_INTERVAL = 5  # seconds: flush pending transfers at least this often while planning
+_SYNC_CHECKSUM_BATCH_SIZE = 64  # max number of local files hashed at once in checksum mode
+_SYNC_BATCH_SIZE_SCALE = [10, 25, 50, 100, 250, 500, 1000]  # possible number of operations per batch
+_SYNC_INITIAL_BATCH_SIZE_INDEX = 3  # start at 100 operations per batch
+_SYNC_TARGET_BATCH_DURATION = 30.0  # seconds; grow batches if they complete faster than this
+_SYNC_MAX_CONCURRENT_BATCHES = 4  # max number of batches in flight while executing a sync
+_SYNC_MAX_RATE_LIMIT_RETRIES = 5  # max number of retries of a batch rejected with HTTP 429
+_SYNC_ACTION_LABELS = {"upload": "Uploading", "download": "Downloading", "delete": "Deleting"}
 
 
 # =============================================================================
@@ -304,21 +322,34 @@ class SyncPlan:
     dest: str
     timestamp: str
     operations: list[SyncOperation] = field(default_factory=list)
+    # Counts of the operations executed while they were computed (see `_count_streamed`). These operations are not
+    # kept in `operations`, so that memory usage does not depend on the number of files.
+    _streamed_counts: Counter[str] = field(default_factory=Counter, repr=False, compare=False)
 
     def summary(self) -> dict[str, int | str]:
-        uploads = sum(1 for op in self.operations if op.action == "upload")
-        downloads = sum(1 for op in self.operations if op.action == "download")
-        deletes = sum(1 for op in self.operations if op.action == "delete")
-        skips = sum(1 for op in self.operations if op.action == "skip")
-        total_size = sum(op.size or 0 for op in self.operations if op.action in ("upload", "download"))
+        counts = Counter(self._streamed_counts)
+        for op in self.operations:
+            _count_operation(counts, op)
         return {
-            "uploads": uploads,
-            "downloads": downloads,
-            "deletes": deletes,
-            "skips": skips,
-            "total_size": total_size,
+            "uploads": counts["upload"],
+            "downloads": counts["download"],
+            "deletes": counts["delete"],
+            "skips": counts["skip"],
+            "total_size": counts["total_size"],
         }
 
+    def _count_streamed(self, operations: Iterable[SyncOperation]) -> Iterator[SyncOperation]:
+        """Pass `operations` through, adding them to the summary of the plan without keeping them in memory."""
+        for op in operations:
+            _count_operation(self._streamed_counts, op)
+            yield op
+
+
+def _count_operation(counts: Counter[str], op: SyncOperation) -> None:
+    counts[op.action] += 1
+    if op.action in ("upload", "download"):
+        counts["total_size"] += op.size or 0
+
 
 # =============================================================================
 # Filter matching
@@ -419,7 +450,11 @@ def _stat_local(path: str) -> tuple[int, float] | None:
 
 
 def _list_local_files(local_path: str) -> Iterator[tuple[str, int, float]]:
-    """List all files in a local directory.
+    """List all files in a local directory, sorted by relative path.
+
+    Files are yielded in the same order as a sorted list of their relative paths (i.e. the order used by
+    the remote bucket listing), which lets callers merge-join local and remote listings without loading them
+    in memory. Directories are listed in parallel (see [`walk_local_files`]).
 
     Yields:
         tuple: (relative_path, size, mtime_ms) for each file
@@ -427,17 +462,8 @@ def _list_local_files(local_path: str) -> Iterator[tuple[str, int, float]]:
     local_path = os.path.abspath(local_path)
     if not os.path.isdir(local_path):
         raise ValueError(f"Local path must be a directory: {local_path}")
-
-    for root, _, files in os.walk(local_path):
-        for filename in files:
-            full_path = os.path.join(root, filename)
-            stat_info = _stat_local(full_path)
-            if stat_info is None:
-                continue
-            rel_path = os.path.relpath(full_path, local_path)
-            # Normalize to forward slashes for consistency
-            rel_path = rel_path.replace(os.sep, "/")
-            yield rel_path, stat_info[0], stat_info[1]
+    for rel_path, st in walk_local_files(local_path):
+        yield rel_path, st.st_size, st.st_mtime * 1000
 
 
 def _list_remote_files(api: "HfApi", bucket_id: str, prefix: str) -> Iterator[tuple[str, int, float, Any]]:
@@ -469,6 +495,118 @@ def _list_remote_files(api: "HfApi", bucket_id: str, prefix: str) -> Iterator[tu
         yield rel_path, item.size, mtime_ms, item
 
 
+class _UnsortedListingError(ValueError):
+    """Raised by [`_check_sorted`] when a listing is not sorted by path."""
+
+    def __init__(self, message: str, side: str, nb_sorted: int):
+        super().__init__(message)
+        self.side = side
+        # Number of items yielded before the out-of-order one
+        self.nb_sorted = nb_sorted
+
+
+def _check_sorted(items: Iterator[tuple], side: str) -> Iterator[tuple]:
+    """Pass through `(path, ...)` tuples, making sure paths are strictly increasing.
+
+    The streaming sync planner merge-joins the local and remote listings, which is only correct if both are
+    sorted by path.
+    """
+    previous: str | None = None
+    nb_sorted = 0
+    for item in items:
+        if previous is not None and item[0] <= previous:
+            raise _UnsortedListingError(
+                f"{side.capitalize()} listing is not sorted by path ('{item[0]}' after '{previous}').",
+                side=side,
+                nb_sorted=nb_sorted,
+            )
+        previous = item[0]
+        nb_sorted += 1
+        yield item
+
+
+# =============================================================================
+# Local hash cache
+# =============================================================================
+
+
+class _LocalHashCache:
+    """Persistent cache of the Xet hashes of local files, used by `sync_bucket(..., checksum=True)`.
+
+    Entries are keyed by absolute path and are only reused if the file size, modification time (ns) and inode are
+    unchanged. Stored as a SQLite database in `HF_BUCKETS_CACHE` so that a second sync of an unchanged tree does not
+    hash anything. If the database cannot be opened, files are hashed without caching.
+    """
+
+    def __init__(self, db_path: str | None = None):
+        self.db_path = db_path or os.path.join(constants.HF_BUCKETS_CACHE, "hashes.sqlite")
+        self._conn: sqlite3.Connection | None = None
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes"
+                " (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, inode INTEGER, xet_hash TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Cannot open local hash cache at '{self.db_path}': {e}. Local files will not be cached.")
+
+    def hash_files(self, paths: list[str]) -> list[str | None]:
+        """Return the Xet hash of each file (`None` if missing), hashing only the files not found in cache."""
+        results: list[str | None] = [None] * len(paths)
+        cached = self._get_many(paths)
+        to_hash: list[tuple[int, str, os.stat_result]] = []
+        for i, path in enumerate(paths):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = cached.get(path)
+            if entry is not None and entry[:3] == (st.st_size, st.st_mtime_ns, st.st_ino):
+                results[i] = entry[3]
+            else:
+                to_hash.append((i, path, st))
+
+        if to_hash:
+            from hf_xet import hash_files
+
+            rows = []
+            for (i, path, st), info in zip(to_hash, hash_files([path for _, path, _ in to_hash])):
+                results[i] = info.hash
+                rows.append((path, st.st_size, st.st_mtime_ns, st.st_ino, info.hash))
+            self._put_many(rows)
+        return results
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _get_many(self, paths: list[str]) -> dict[str, tuple[int, int, int, str]]:
+        if self._conn is None or not paths:
+            return {}
+        try:
+            cursor = self._conn.execute(
+                f"SELECT path, size, mtime_ns, inode, xet_hash FROM hashes WHERE path IN ({','.join('?' * len(paths))})",
+                paths,
+            )
+            return {row[0]: tuple(row[1:]) for row in cursor}
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to read local hash cache: {e}")
+            return {}
+
+    def _put_many(self, rows: list[tuple[str, int, int, int, str]]) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.executemany("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to write local hash cache: {e}")
+
+
 # =============================================================================
 # Sync plan computation
 # =============================================================================
@@ -493,6 +631,9 @@ def _compare_files_for_sync(
     ignore_times: bool,
     ignore_existing: bool,
     bucket_file: Any | None = None,
+    checksum: bool = False,
+    source_hash: str | None = None,
+    dest_hash: str | None = None,
 ) -> SyncOperation:
     """Compare source and dest files and return the appropriate sync operation.
 
@@ -511,6 +652,9 @@ def _compare_files_for_sync(
         ignore_times: Only compare size
         ignore_existing: Skip files that exist on receiver
         bucket_file: BucketFile object (for downloads only)
+        checksum: Compare file hashes instead of mtimes (sizes are still compared first)
+        source_hash: Xet hash of the source file (checksum mode only)
+        dest_hash: Xet hash of the dest file (checksum mode only)
 
     Returns:
         SyncOperation describing the action to take
@@ -531,7 +675,14 @@ def _compare_files_for_sync(
     size_differs = source_size != dest_size
     source_newer = (source_mtime - dest_mtime) > _SYNC_TIME_WINDOW_MS
 
-    if ignore_sizes:
+    if checksum:
+        if size_differs:
+            return SyncOperation(action=action, reason="size differs", bucket_file=bucket_file, **base_kwargs)
+        elif source_hash is None or source_hash != dest_hash:
+            return SyncOperation(action=action, reason="checksum differs", bucket_file=bucket_file, **base_kwargs)
+        else:
+            return SyncOperation(action="skip", reason="same checksum", **base_kwargs)
+    elif ignore_sizes:
         if source_newer:
             return SyncOperation(action=action, reason=source_newer_label, bucket_file=bucket_file, **base_kwargs)
         else:
@@ -562,12 +713,58 @@ def _compute_sync_plan(
     ignore_existing: bool = False,
     filter_matcher: FilterMatcher | None = None,
     status: Any | None = None,
+    checksum: bool = False,
 ) -> SyncPlan:
     """Compute the sync plan by comparing source and destination.
 
     Returns:
         SyncPlan with all operations to be performed
     """
+    plan = SyncPlan(
+        source=source,
+        dest=dest,
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
+    plan.operations.extend(
+        _iter_sync_operations(
+            source=source,
+            dest=dest,
+            api=api,
+            delete=delete,
+            ignore_times=ignore_times,
+            ignore_sizes=ignore_sizes,
+            existing=existing,
+            ignore_existing=ignore_existing,
+            filter_matcher=filter_matcher,
+            status=status,
+            checksum=checksum,
+        )
+    )
+    return plan
+
+
+def _iter_sync_operations(
+    source: str,
+    dest: str,
+    api: "HfApi",
+    delete: bool = False,
+    ignore_times: bool = False,
+    ignore_sizes: bool = False,
+    existing: bool = False,
+    ignore_existing: bool = False,
+    filter_matcher: FilterMatcher | None = None,
+    status: Any | None = None,
+    checksum: bool = False,
+) -> Iterator[SyncOperation]:
+    """Compare source and destination and yield the sync operations, sorted by path.
+
+    Local and remote listings are consumed as streams sorted by path and merge-joined. Memory usage does not
+    depend on the number of files and the first operations are yielded as soon as both listings have started. If the
+    remote listing turns out not to be sorted, the remaining operations are computed from a sorted copy of it.
+
+    With `checksum=True`, files with the same size on both sides are compared by Xet hash. Local hashes are read
+    from (and saved to) a persistent [`_LocalHashCache`].
+    """
     filter_matcher = filter_matcher or FilterMatcher()
     is_upload = not _is_bucket_path(source) and _is_bucket_path(dest)
     is_download = _is_bucket_path(source) and not _is_bucket_path(dest)
@@ -575,13 +772,6 @@ def _compute_sync_plan(
     if not is_upload and not is_download:
         raise ValueError("One of source or dest must be a bucket path (hf://buckets/...) and the other must be local.")
 
-    plan = SyncPlan(
-        source=source,
-        dest=dest,
-        timestamp=datetime.now(timezone.utc).isoformat(),
-    )
-
-    remote_total: int | None = None
     if is_upload:
         # Local -> Remote
         local_path = os.path.abspath(source)
@@ -591,211 +781,233 @@ def _compute_sync_plan(
         if not os.path.isdir(local_path):
             raise ValueError(f"Source must be a directory: {local_path}")
 
-        # Get local and remote file lists
-        local_files = {}
-        for rel_path, size, mtime_ms in _list_local_files(local_path):
-            if filter_matcher.matches(rel_path):
-                local_files[rel_path] = (size, mtime_ms)
-            if status:
-                status.update(f"Scanning local directory ({len(local_files)} files)")
-        if status:
-            status.done(f"Scanning local directory ({len(local_files)} files)")
-
-        remote_files = {}
-        if status:
-            try:
-                remote_total = api.bucket_info(bucket_id).total_files
-            except Exception:
-                pass
-        try:
-            for rel_path, size, mtime_ms, _ in _list_remote_files(api, bucket_id, prefix):
-                if filter_matcher.matches(rel_path):
-                    remote_files[rel_path] = (size, mtime_ms)
-                if status:
-                    total_str = f"/{remote_total}" if remote_total is not None else ""
-                    status.update(f"Scanning remote bucket ({len(remote_files)}{total_str} files)")
-        except BucketNotFoundError:
-            # Bucket doesn't exist yet - this is expected for new uploads
-            logger.debug(f"Bucket '{bucket_id}' not found, treating as empty.")
-        if status:
-            status.done(f"Scanning remote bucket ({len(remote_files)} files)")
-
-        # Compare files
-        all_paths = set(local_files.keys()) | set(remote_files.keys())
-        if status:
-            status.done(f"Comparing files ({len(all_paths)} paths)")
-        for path in sorted(all_paths):
-            local_info = local_files.get(path)
-            remote_info = remote_files.get(path)
-
-            if local_info and not remote_info:
-                # New file
-                if existing:
-                    # --existing: skip new files
-                    plan.operations.append(
-                        SyncOperation(
-                            action="skip",
-                            path=path,
-                            size=local_info[0],
-                            reason="new file (--existing)",
-                            local_mtime=_mtime_to_iso(local_info[1]),
-                        )
-                    )
-                else:
-                    plan.operations.append(
-                        SyncOperation(
-                            action="upload",
-                            path=path,
-                            size=local_info[0],
-                            reason="new file",
-                            local_mtime=_mtime_to_iso(local_info[1]),
-                        )
-                    )
-            elif local_info and remote_info:
-                # File exists in both - use helper to determine action
-                local_size, local_mtime = local_info
-                remote_size, remote_mtime = remote_info
-                plan.operations.append(
-                    _compare_files_for_sync(
-                        path=path,
-                        action="upload",
-                        source_size=local_size,
-                        source_mtime=local_mtime,
-                        dest_size=remote_size,
-                        dest_mtime=remote_mtime,
-                        source_newer_label="local newer",
-                        dest_newer_label="remote newer",
-                        ignore_sizes=ignore_sizes,
-                        ignore_times=ignore_times,
-                        ignore_existing=ignore_existing,
-                    )
-                )
-            elif not local_info and remote_info and delete:
-                # File only in remote and --delete mode
-                plan.operations.append(
-                    SyncOperation(
-                        action="delete",
-                        path=path,
-                        size=remote_info[0],
-                        reason="not in source (--delete)",
-                        remote_mtime=_mtime_to_iso(remote_info[1]),
-                    )
-                )
-
+        list_remote = _list_remote_files_or_empty
+        action: Literal["upload", "download"] = "upload"
+        source_newer_label, dest_newer_label = "local newer", "remote newer"
     else:
         # Remote -> Local (download)
         parsed = _parse_bucket_uri(source)
         bucket_id, prefix = parsed.id, parsed.path_in_repo
         local_path = os.path.abspath(dest)
 
-        # Get remote and local file lists
-        remote_files = {}
-        bucket_file_map: dict[str, Any] = {}
-        if status:
-            try:
-                remote_total = api.bucket_info(bucket_id).total_files
-            except Exception:
-                pass
-        for rel_path, size, mtime_ms, bucket_file in _list_remote_files(api, bucket_id, prefix):
-            if filter_matcher.matches(rel_path):
-                remote_files[rel_path] = (size, mtime_ms)
-                bucket_file_map[rel_path] = bucket_file
-            if status:
-                total_str = f"/{remote_total}" if remote_total is not None else ""
-                status.update(f"Scanning remote bucket ({len(remote_files)}{total_str} files)")
-        if status:
-            status.done(f"Scanning remote bucket ({len(remote_files)} files)")
-
-        local_files = {}
-        if os.path.isdir(local_path):
-            if delete:
-                # Full walk needed to discover local-only files for deletion.
-                for rel_path, size, mtime_ms in _list_local_files(local_path):
-                    if filter_matcher.matches(rel_path):
-                        local_files[rel_path] = (size, mtime_ms)
-                    if status:
-                        status.update(f"Scanning local directory ({len(local_files)} files)")
-            else:
-                # Without --delete, the plan only depends on paths that exist
-                # remotely. Stat just those instead of walking the whole tree,
-                # which can take minutes when dest sits in a large directory
-                # like ~/.cache/huggingface/.
-                for rel_path in remote_files:
-                    local_file = os.path.join(local_path, rel_path)
-                    stat_info = _stat_local(local_file)
-                    if stat_info is None:
-                        continue
-                    local_files[rel_path] = stat_info
-                    if status:
-                        status.update(f"Scanning local directory ({len(local_files)} files)")
-        if status:
-            status.done(f"Scanning local directory ({len(local_files)} files)")
+        list_remote = _list_remote_files
+        action = "download"
+        source_newer_label, dest_newer_label = "remote newer", "local newer"
 
-        # Compare files
-        all_paths = set(remote_files.keys()) | set(local_files.keys())
-        if status:
-            status.done(f"Comparing files ({len(all_paths)} paths)")
-        for path in sorted(all_paths):
-            remote_info = remote_files.get(path)
-            local_info = local_files.get(path)
-
-            if remote_info and not local_info:
-                # New file
-                if existing:
-                    # --existing: skip new files
-                    plan.operations.append(
-                        SyncOperation(
-                            action="skip",
-                            path=path,
-                            size=remote_info[0],
-                            reason="new file (--existing)",
-                            remote_mtime=_mtime_to_iso(remote_info[1]),
-                        )
-                    )
-                else:
-                    plan.operations.append(
-                        SyncOperation(
-                            action="download",
-                            path=path,
-                            size=remote_info[0],
-                            reason="new file",
-                            remote_mtime=_mtime_to_iso(remote_info[1]),
-                            bucket_file=bucket_file_map.get(path),
-                        )
-                    )
-            elif remote_info and local_info:
-                # File exists in both - use helper to determine action
-                remote_size, remote_mtime = remote_info
-                local_size, local_mtime = local_info
-                plan.operations.append(
-                    _compare_files_for_sync(
-                        path=path,
-                        action="download",
-                        source_size=remote_size,
-                        source_mtime=remote_mtime,
-                        dest_size=local_size,
-                        dest_mtime=local_mtime,
-                        source_newer_label="remote newer",
-                        dest_newer_label="local newer",
-                        ignore_sizes=ignore_sizes,
-                        ignore_times=ignore_times,
-                        ignore_existing=ignore_existing,
-                        bucket_file=bucket_file_map.get(path),
-                    )
-                )
-            elif not remote_info and local_info and delete:
-                # File only in local and --delete mode
-                plan.operations.append(
-                    SyncOperation(
-                        action="delete",
-                        path=path,
-                        size=local_info[0],
-                        reason="not in source (--delete)",
-                        local_mtime=_mtime_to_iso(local_info[1]),
-                    )
+    # Whether the remote listing is merge-joined with the local one, i.e. must be sorted by path
+    remote_is_joined = is_upload or (delete and os.path.isdir(local_path))
+
+    def _join(remote_files: Iterator[tuple[str, tuple]]) -> Iterator[tuple[str, tuple | None, tuple | None]]:
+        """Join the remote listing with the local files, as `(path, source_info, dest_info)`."""
+        if is_upload:
+            return _merge_sorted_listings(_list_local_entries(local_path, filter_matcher), remote_files)
+        if not os.path.isdir(local_path):
+            return ((rel_path, remote_entry, None) for rel_path, remote_entry in remote_files)
+        if delete:
+            # Full walk needed to discover local-only files for deletion.
+            return _merge_sorted_listings(remote_files, _list_local_entries(local_path, filter_matcher))
+        # Without --delete, the plan only depends on paths that exist
+        # remotely. Stat just those instead of walking the whole tree,
+        # which can take minutes when dest sits in a large directory
+        # like ~/.cache/huggingface/.
+        return (
+            (rel_path, remote_entry, _stat_local(os.path.join(local_path, rel_path)))
+            for rel_path, remote_entry in remote_files
+        )
+
+    def _remote_entries() -> Iterator[tuple[str, tuple]]:
+        return (
+            (rel_path, (size, mtime_ms, bucket_file))
+            for rel_path, size, mtime_ms, bucket_file in list_remote(api, bucket_id, prefix)
+            if filter_matcher.matches(rel_path)
+        )
+
+    def _to_operation(
+        path: str, source_info: tuple | None, dest_info: tuple | None, local_hash: str | None
+    ) -> SyncOperation | None:
+        if source_info and not dest_info:
+            # New file
+            if existing:
+                # --existing: skip new files
+                return SyncOperation(
+                    action="skip",
+                    path=path,
+                    size=source_info[0],
+                    reason="new file (--existing)",
+                    local_mtime=_mtime_to_iso(source_info[1]) if is_upload else None,
+                    remote_mtime=None if is_upload else _mtime_to_iso(source_info[1]),
                 )
+            return SyncOperation(
+                action=action,
+                path=path,
+                size=source_info[0],
+                reason="new file",
+                local_mtime=_mtime_to_iso(source_info[1]) if is_upload else None,
+                remote_mtime=None if is_upload else _mtime_to_iso(source_info[1]),
+                bucket_file=source_info[2],
+            )
+        elif source_info and dest_info:
+            # File exists in both - use helper to determine action
+            return _compare_files_for_sync(
+                path=path,
+                action=action,
+                source_size=source_info[0],
+                source_mtime=source_info[1],
+                dest_size=dest_info[0],
+                dest_mtime=dest_info[1],
+                source_newer_label=source_newer_label,
+                dest_newer_label=dest_newer_label,
+                ignore_sizes=ignore_sizes,
+                ignore_times=ignore_times,
+                ignore_existing=ignore_existing,
+                bucket_file=source_info[2] if not is_upload else None,
+                checksum=checksum,
+                source_hash=local_hash if is_upload else source_info[2].xet_hash,
+                dest_hash=dest_info[2].xet_hash if is_upload else local_hash,
+            )
+        elif dest_info and delete:
+            # File only in dest and --delete mode
+            return SyncOperation(
+                action="delete",
+                path=path,
+                size=dest_info[0],
+                reason="not in source (--delete)",
+                local_mtime=None if is_upload else _mtime_to_iso(dest_info[1]),
+                remote_mtime=_mtime_to_iso(dest_info[1]) if is_upload else None,
+            )
+        return None
 
-    return plan
+    hash_cache = _LocalHashCache() if checksum else None
+    n_paths = 0
+    last_path: str | None = None
+    # Paths emitted as "delete" by the merge-join. If the fallback below finds them again on the source side, the
+    # destination file is already scheduled for deletion and must be transferred again.
+    deleted_paths: set[str] = set()
+    try:
+        # The merge-join is only correct if the remote listing is sorted by path (local listings always are)
+        remote_files = _remote_entries()
+        if remote_is_joined:
+            remote_files = _check_sorted(remote_files, side="remote")
+        try:
+            for path, source_info, dest_info, local_hash in _with_local_hashes(
+                _join(remote_files), local_path=local_path, hash_cache=hash_cache
+            ):
+                last_path = path
+                n_paths += 1
+                if status:
+                    status.update(f"Comparing files ({n_paths} paths)")
+                op = _to_operation(path, source_info, dest_info, local_hash)
+                if op is not None:
+                    if op.action == "delete":
+                        deleted_paths.add(path)
+                    yield op
+        except _UnsortedListingError as e:
+            if e.side != "remote":
+                # Local listings are sorted by construction (see `_list_local_files`)
+                raise
+            # Operations up to `last_path` may already be executed => finish the sync from a sorted copy of the
+            # remote listing. Paths up to `last_path` are only processed if they were missed by the merge-join,
+            # i.e. if they come from the part of the remote listing that was not consumed yet.
+            logger.warning(f"{e} Falling back to sorting the whole remote listing in memory.")
+            remote_entries = list(_remote_entries())
+            consumed = {rel_path for rel_path, _ in remote_entries[: e.nb_sorted]}
+            remote_entries.sort(key=lambda entry: entry[0])
+            joined = (
+                # A path already deleted from the destination is treated as missing there
+                (path, source_info, None) if path in deleted_paths else (path, source_info, dest_info)
+                for path, source_info, dest_info in _join(iter(remote_entries))
+                if last_path is None
+                or path > last_path
+                or ((dest_info if is_upload else source_info) is not None and path not in consumed)
+            )
+            for path, source_info, dest_info, local_hash in _with_local_hashes(
+                joined, local_path=local_path, hash_cache=hash_cache
+            ):
+                n_paths += 1
+                if status:
+                    status.update(f"Comparing files ({n_paths} paths)")
+                op = _to_operation(path, source_info, dest_info, local_hash)
+                if op is not None:
+                    yield op
+        if status:
+            status.done(f"Comparing files ({n_paths} paths)")
+    finally:
+        if hash_cache is not None:
+            hash_cache.close()
+
+
+def _list_local_entries(local_path: str, filter_matcher: FilterMatcher) -> Iterator[tuple[str, tuple]]:
+    """List local files as `(rel_path, (size, mtime_ms, None))` entries to be merge-joined with the remote listing."""
+    return _check_sorted(
+        (
+            (rel_path, (size, mtime_ms, None))
+            for rel_path, size, mtime_ms in _list_local_files(local_path)
+            if filter_matcher.matches(rel_path)
+        ),
+        side="local",
+    )
+
+
+def _with_local_hashes(
+    joined: Iterable[tuple[str, tuple | None, tuple | None]],
+    *,
+    local_path: str,
+    hash_cache: _LocalHashCache | None,
+) -> Iterator[tuple[str, tuple | None, tuple | None, str | None]]:
+    """Attach the local Xet hash to each joined entry that needs it (i.e. present on both sides with the same size).
+
+    Files are hashed in batches of `_SYNC_CHECKSUM_BATCH_SIZE`. If `hash_cache` is `None`, nothing is hashed.
+    """
+    if hash_cache is None:
+        for path, source_info, dest_info in joined:
+            yield path, source_info, dest_info, None
+        return
+
+    for chunk in chunk_iterable(joined, chunk_size=_SYNC_CHECKSUM_BATCH_SIZE):
+        batch = list(chunk)
+        to_hash = [
+            i
+            for i, (_, source_info, dest_info) in enumerate(batch)
+            if source_info and dest_info and source_info[0] == dest_info[0]
+        ]
+        hashes = hash_cache.hash_files([os.path.join(local_path, batch[i][0]) for i in to_hash])
+        local_hashes = dict(zip(to_hash, hashes))
+        for i, (path, source_info, dest_info) in enumerate(batch):
+            yield path, source_info, dest_info, local_hashes.get(i)
+
+
+def _list_remote_files_or_empty(api: "HfApi", bucket_id: str, prefix: str) -> Iterator[tuple[str, int, float, Any]]:
+    """Same as `_list_remote_files` but treats a missing bucket as empty."""
+    try:
+        yield from _list_remote_files(api, bucket_id, prefix)
+    except BucketNotFoundError:
+        # Bucket doesn't exist yet - this is expected for new uploads
+        logger.debug(f"Bucket '{bucket_id}' not found, treating as empty.")
+
+
+def _merge_sorted_listings(
+    source_files: Iterator[tuple[str, tuple]], dest_files: Iterator[tuple[str, tuple]]
+) -> Iterator[tuple[str, tuple | None, tuple | None]]:
+    """Merge-join two listings sorted by path.
+
+    Yields:
+        tuple: (path, source_info, dest_info) for each path of either listing, in sorted order. The info of the
+            side where the path is missing is `None`.
+    """
+    source_item = next(source_files, None)
+    dest_item = next(dest_files, None)
+    while source_item is not None or dest_item is not None:
+        if dest_item is None or (source_item is not None and source_item[0] < dest_item[0]):
+            assert source_item is not None
+            yield source_item[0], source_item[1], None
+            source_item = next(source_files, None)
+        elif source_item is None or dest_item[0] < source_item[0]:
+            yield dest_item[0], None, dest_item[1]
+            dest_item = next(dest_files, None)
+        else:
+            yield source_item[0], source_item[1], dest_item[1]
+            source_item = next(source_files, None)
+            dest_item = next(dest_files, None)
 
 
 # =============================================================================
@@ -881,104 +1093,306 @@ def _load_plan(plan_file: str) -> SyncPlan:
 # =============================================================================
 
 
-def _execute_plan(plan: SyncPlan, api: "HfApi", verbose: bool = False, status: Any | None = None) -> None:
+def _execute_plan(
+    plan: SyncPlan, api: "HfApi", verbose: bool = False, status: Any | None = None
+) -> dict[str, "_TransferStats"]:
     """Execute a sync plan."""
-    is_upload = not _is_bucket_path(plan.source) and _is_bucket_path(plan.dest)
-    is_download = _is_bucket_path(plan.source) and not _is_bucket_path(plan.dest)
+    return _execute_operations(
+        plan.operations, source=plan.source, dest=plan.dest, api=api, verbose=verbose, status=status
+    )
+
+
+@dataclass
+class _TransferStats:
+    """Throughput of one class of sync operations (uploads, downloads or deletes)."""
+
+    nb_files: int = 0
+    nb_bytes: int = 0
+    nb_batches: int = 0
+    nb_rate_limited: int = 0
+    started_at: float | None = None
+    ended_at: float | None = None
+
+    def record(self, nb_files: int, nb_bytes: int, started_at: float, ended_at: float) -> None:
+        self.nb_files += nb_files
+        self.nb_bytes += nb_bytes
+        self.nb_batches += 1
+        self.started_at = started_at if self.started_at is None else min(self.started_at, started_at)
+        self.ended_at = ended_at if self.ended_at is None else max(self.ended_at, ended_at)
+
+    @property
+    def duration(self) -> float:
+        if self.started_at is None or self.ended_at is None:
+            return 0.0
+        return self.ended_at - self.started_at
+
+
+class _BatchPacer:
+    """Adaptive number of operations per batch, to keep each call below `_SYNC_TARGET_BATCH_DURATION`."""
+
+    def __init__(self) -> None:
+        self._index = _SYNC_INITIAL_BATCH_SIZE_INDEX
+
+    @property
+    def target(self) -> int:
+        return min(_SYNC_BATCH_SIZE_SCALE[self._index], _SYNC_EXECUTE_BATCH_SIZE)
+
+    def record_success(self, duration: float, nb_items: int) -> None:
+        if duration < _SYNC_TARGET_BATCH_DURATION and nb_items >= self.target:
+            self._index = min(self._index + 1, len(_SYNC_BATCH_SIZE_SCALE) - 1)
+        elif duration > _SYNC_TARGET_BATCH_DURATION:
+            self._index = max(self._index - 1, 0)
+
+    def record_failure(self) -> None:
+        self._index = max(self._index - 1, 0)
+
+
+class _ConcurrencyLimiter:
+    """Limit the number of batches in flight (additive increase, multiplicative decrease on rate limits)."""
+
+    def __init__(self, max_limit: int) -> None:
+        self.max_limit = max_limit
+        self.limit = max(1, max_limit // 2)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        with self._cond:
+            self.limit = min(self.limit + 1, self.max_limit)
+            self._cond.notify_all()
+
+    def on_rate_limited(self, wait: float) -> None:
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self._paused_until = max(self._paused_until, time.monotonic() + wait)
+
+    def wait_if_paused(self) -> None:
+        """Block while a rate limit is in effect, so that all batches wait for the same reset."""
+        while (remaining := self._paused_until - time.monotonic()) > 0:
+            time.sleep(remaining)
+
+
+class _SyncExecutor:
+    """Run sync operations in batches, overlapping classes of operations (uploads, downloads, deletes).
+
+    Operations of each class are grouped into batches sized by a [`_BatchPacer`] and run concurrently in a thread
+    pool, with a number of batches in flight adapted by a [`_ConcurrencyLimiter`]. Batches rejected with HTTP 429
+    are retried after the reset time given by the `RateLimit` response headers. Submitting blocks when too many
+    batches are in flight, so that operations are not planned much faster than they are executed.
+    """
+
+    def __init__(self, handlers: dict[str, Callable[[list[Any]], None]], status: Any | None = None) -> None:
+        self.handlers = handlers
+        self.status = status
+        self.stats = {kind: _TransferStats() for kind in handlers}
+        self._pacers = {kind: _BatchPacer() for kind in handlers}
+        self._pending: dict[str, list[Any]] = {kind: [] for kind in handlers}
+        self._pending_bytes = dict.fromkeys(handlers, 0)
+        self._last_flush = dict.fromkeys(handlers, time.monotonic())
+        self._limiter = _ConcurrencyLimiter(_SYNC_MAX_CONCURRENT_BATCHES)
+        self._pool = ThreadPoolExecutor(max_workers=_SYNC_MAX_CONCURRENT_BATCHES)
+        self._futures: list[Future] = []
+        self._lock = threading.Lock()
+
+    def add(self, kind: str, item: Any, size: int = 0) -> None:
+        """Queue an operation. Its batch is submitted once it is full or has been pending for too long."""
+        pending = self._pending[kind]
+        pending.append(item)
+        self._pending_bytes[kind] += size
+        if len(pending) >= self._pacers[kind].target:
+            self.flush(kind)
+
+    def flush_due(self) -> None:
+        """Submit batches that have been pending for more than `_SYNC_EXECUTE_FLUSH_INTERVAL` seconds."""
+        now = time.monotonic()
+        for kind, pending in self._pending.items():
+            if pending and now - self._last_flush[kind] > _SYNC_EXECUTE_FLUSH_INTERVAL:
+                self.flush(kind)
+
+    def flush(self, kind: str) -> None:
+        items, nb_bytes = self._pending[kind], self._pending_bytes[kind]
+        self._pending[kind], self._pending_bytes[kind] = [], 0
+        self._last_flush[kind] = time.monotonic()
+        if not items:
+            return
+        self._raise_if_failed()
+        self._limiter.acquire()
+        if self.status:
+            self.status.done(f"{_SYNC_ACTION_LABELS[kind]} {len(items)} files")
+        self._futures.append(self._pool.submit(self._run, kind, items, nb_bytes))
+
+    def close(self) -> dict[str, _TransferStats]:
+        """Submit remaining operations, wait for all batches and return the stats per class of operations."""
+        try:
+            for kind in self._pending:
+                self.flush(kind)
+            for future in self._futures:
+                future.result()  # re-raise the first error, if any
+        finally:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        return self.stats
+
+    def _raise_if_failed(self) -> None:
+        done = [future for future in self._futures if future.done()]
+        for future in done:
+            future.result()
+        self._futures = [future for future in self._futures if not future.done()]
+
+    def _run(self, kind: str, items: list[Any], nb_bytes: int) -> None:
+        try:
+            for attempt in range(_SYNC_MAX_RATE_LIMIT_RETRIES + 1):
+                self._limiter.wait_if_paused()
+                started_at = time.monotonic()
+                try:
+                    self.handlers[kind](items)
+                except HfHubHTTPError as e:
+                    if e.response.status_code != 429 or attempt == _SYNC_MAX_RATE_LIMIT_RETRIES:
+                        raise
+                    ratelimit = parse_ratelimit_headers(e.response.headers)
+                    wait = ratelimit.reset_in_seconds if ratelimit is not None else 2**attempt
+                    logger.warning(f"Rate limited while syncing {len(items)} files. Retrying in {wait}s.")
+                    with self._lock:
+                        self._pacers[kind].record_failure()
+                        self.stats[kind].nb_rate_limited += 1
+                    self._limiter.on_rate_limited(wait)
+                    continue
+                ended_at = time.monotonic()
+                with self._lock:
+                    self._pacers[kind].record_success(ended_at - started_at, len(items))
+                    self.stats[kind].record(len(items), nb_bytes, started_at, ended_at)
+                self._limiter.on_success()
+                return
+        finally:
+            self._limiter.release()
+
+
+def _execute_operations(
+    operations: Iterable[SyncOperation],
+    *,
+    source: str,
+    dest: str,
+    api: "HfApi",
+    verbose: bool = False,
+    status: Any | None = None,
+) -> dict[str, _TransferStats]:
+    """Execute sync operations as they come.
+
+    Operations can be a lazy iterator (e.g. from `_iter_sync_operations`). Uploads, downloads and deletes are
+    batched separately and run concurrently by a [`_SyncExecutor`], so that transfers start before the whole plan
+    is known.
+
+    Returns:
+        `dict[str, _TransferStats]`: throughput stats per class of operations (`"upload"`, `"download"`,
+        `"delete"`).
+    """
+    is_upload = not _is_bucket_path(source) and _is_bucket_path(dest)
+    is_download = _is_bucket_path(source) and not _is_bucket_path(dest)
 
     if is_upload:
-        local_path = os.path.abspath(plan.source)
-        parsed = _parse_bucket_uri(plan.dest)
+        local_path = os.path.abspath(source)
+        parsed = _parse_bucket_uri(dest)
+        bucket_id, prefix = parsed.id, parsed.path_in_repo
+
+        executor = _SyncExecutor(
+            handlers={
+                "upload": lambda items: api.batch_bucket_files(bucket_id, add=items),
+                "delete": lambda items: api.batch_bucket_files(bucket_id, delete=items),
+            },
+            status=status,
+        )
+        try:
+            for op in operations:
+                match op.action:
+                    case "upload":
+                        local_file = os.path.join(local_path, op.path)
+                        remote_path = f"{prefix}/{op.path}" if prefix else op.path
+                        if verbose:
+                            print(f"  Uploading: {op.path} ({op.reason})")
+                        executor.add("upload", (local_file, remote_path), size=op.size or 0)
+                    case "delete":
+                        remote_path = f"{prefix}/{op.path}" if prefix else op.path
+                        if verbose:
+                            print(f"  Deleting: {op.path} ({op.reason})")
+                        executor.add("delete", remote_path)
+                    case "skip" if verbose:
+                        print(f"  Skipping: {op.path} ({op.reason})")
+                executor.flush_due()
+        finally:
+            stats = executor.close()
+        return stats
+
+    elif is_download:
+        parsed = _parse_bucket_uri(source)
         bucket_id, prefix = parsed.id, parsed.path_in_repo
+        local_path = os.path.abspath(dest)
 
-        # Collect operations
-        add_files: list[tuple[str | Path | bytes, str]] = []
-        delete_paths: list[str] = []
+        # Ensure local directory exists
+        os.makedirs(local_path, exist_ok=True)
 
-        for op in plan.operations:
-            match op.action:
-                case "upload":
+        # Parent directories of deleted files are removed at the end, once no download can write into them anymore
+        deleted_parents: set[str] = set()
+
+        def _delete_local_files(file_paths: list[str]) -> None:
+            for file_path in file_paths:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                    deleted_parents.add(os.path.dirname(file_path))
+
+        executor = _SyncExecutor(
+            handlers={
+                "download": lambda items: api.download_bucket_files(bucket_id, items),
+                "delete": _delete_local_files,
+            },
+            status=status,
+        )
+        try:
+            for op in operations:
+                if op.action == "download":
                     local_file = os.path.join(local_path, op.path)
-                    remote_path = f"{prefix}/{op.path}" if prefix else op.path
+                    # Ensure parent directory exists
+                    os.makedirs(os.path.dirname(local_file), exist_ok=True)
                     if verbose:
-                        print(f"  Uploading: {op.path} ({op.reason})")
-                    add_files.append((local_file, remote_path))
-                case "delete":
-                    remote_path = f"{prefix}/{op.path}" if prefix else op.path
+                        print(f"  Downloading: {op.path} ({op.reason})")
+                    # Use BucketFile when available (avoids extra metadata fetch per file)
+                    if op.bucket_file is not None:
+                        executor.add("download", (op.bucket_file, local_file), size=op.size or 0)
+                    else:
+                        remote_path = f"{prefix}/{op.path}" if prefix else op.path
+                        executor.add("download", (remote_path, local_file), size=op.size or 0)
+                elif op.action == "delete":
+                    local_file = os.path.join(local_path, op.path)
                     if verbose:
                         print(f"  Deleting: {op.path} ({op.reason})")
-                    delete_paths.append(remote_path)
-                case "skip" if verbose:
+                    executor.add("delete", local_file)
+                elif op.action == "skip" and verbose:
                     print(f"  Skipping: {op.path} ({op.reason})")
+                executor.flush_due()
+        finally:
+            stats = executor.close()
 
-        # Execute batch operations
-        if add_files or delete_paths:
-            if status:
-                parts = []
-                if add_files:
-                    parts.append(f"uploading {len(add_files)} files")
-                if delete_paths:
-                    parts.append(f"deleting {len(delete_paths)} files")
-                status.done(", ".join(parts).capitalize())
-            api.batch_bucket_files(
-                bucket_id,
-                add=add_files or None,
-                delete=delete_paths or None,
-            )
-
-    elif is_download:
-        parsed = _parse_bucket_uri(plan.source)
-        bucket_id, prefix = parsed.id, parsed.path_in_repo
-        local_path = os.path.abspath(plan.dest)
-
-        # Ensure local directory exists
-        os.makedirs(local_path, exist_ok=True)
+        # Remove empty parent directories (deepest first)
+        for parent in sorted(deleted_parents, key=len, reverse=True):
+            while parent != local_path:
+                try:
+                    os.rmdir(parent)
+                    parent = os.path.dirname(parent)
+                except OSError:
+                    break
+        return stats
 
-        # Collect download operations
-        download_files: list[tuple[str | BucketFile, str | Path]] = []
-        delete_files: list[str] = []
-
-        for op in plan.operations:
-            if op.action == "download":
-                local_file = os.path.join(local_path, op.path)
-                # Ensure parent directory exists
-                os.makedirs(os.path.dirname(local_file), exist_ok=True)
-                if verbose:
-                    print(f"  Downloading: {op.path} ({op.reason})")
-                # Use BucketFile when available (avoids extra metadata fetch per file)
-                if op.bucket_file is not None:
-                    download_files.append((op.bucket_file, local_file))
-                else:
-                    remote_path = f"{prefix}/{op.path}" if prefix else op.path
-                    download_files.append((remote_path, local_file))
-            elif op.action == "delete":
-                local_file = os.path.join(local_path, op.path)
-                if verbose:
-                    print(f"  Deleting: {op.path} ({op.reason})")
-                delete_files.append(local_file)
-            elif op.action == "skip" and verbose:
-                print(f"  Skipping: {op.path} ({op.reason})")
-
-        # Execute downloads
-        if len(download_files) > 0:
-            if status:
-                status.done(f"Downloading {len(download_files)} files")
-            api.download_bucket_files(bucket_id, download_files)
-
-        # Execute deletes
-        if status and delete_files:
-            status.done(f"Deleting {len(delete_files)} local files")
-        for file_path in delete_files:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                # Remove empty parent directories
-                parent = os.path.dirname(file_path)
-                while parent != local_path:
-                    try:
-                        os.rmdir(parent)
-                        parent = os.path.dirname(parent)
-                    except OSError:
-                        break
+    return {}
 
 
 def _print_plan_summary(plan: SyncPlan) -> None:
@@ -991,6 +1405,24 @@ def _print_plan_summary(plan: SyncPlan) -> None:
     print(f"  Skips: {summary['skips']}")
 
 
+def _print_transfer_stats(stats: dict[str, _TransferStats]) -> None:
+    """Print the throughput of each class of executed operations."""
+    for kind, kind_stats in stats.items():
+        if kind_stats.nb_batches == 0:
+            continue
+        duration = max(kind_stats.duration, 1e-3)
+        line = (
+            f"  {kind.capitalize()}s: {kind_stats.nb_files} files in {kind_stats.nb_batches} batches,"
+            f" {duration:.1f}s ({kind_stats.nb_files / duration:.1f} files/s"
+        )
+        if kind_stats.nb_bytes > 0:
+            line += f", {_format_size(int(kind_stats.nb_bytes / duration))}/s"
+        line += ")"
+        if kind_stats.nb_rate_limited > 0:
+            line += f", rate limited {kind_stats.nb_rate_limited} times"
+        print(line)
+
+
 # =============================================================================
 # Public sync function (Python API)
 # =============================================================================
@@ -1015,6 +1447,9 @@ def sync_bucket_internal(
     verbose: bool = False,
     quiet: bool = False,
     token: bool | str | None = None,
+    checksum: bool = False,
+    watch: bool = False,
+    watch_interval: float = 10,
 ) -> SyncPlan:
     """Sync files between a local directory and a bucket.
 
@@ -1058,9 +1493,19 @@ def sync_bucket_internal(
             Suppress all output and progress bars.
         token (Union[bool, str, None], optional):
             A valid user access token. If not provided, the locally saved token will be used.
+        checksum (`bool`, *optional*, defaults to `False`):
+            Compare files by content hash instead of modification time. Local hashes are cached in
+            ``HF_BUCKETS_CACHE`` so that unchanged files are not hashed again. Requires ``hf_xet``.
+        watch (`bool`, *optional*, defaults to `False`):
+            After the initial sync, keep watching the local ``source`` directory and push changes to the bucket
+            until interrupted (Ctrl+C). Only supported when uploading to a bucket.
+        watch_interval (`float`, *optional*, defaults to `10`):
+            Number of seconds between two checks of the local directory in ``watch`` mode.
 
     Returns:
-        [`SyncPlan`]: The computed (or loaded) sync plan.
+        [`SyncPlan`]: The computed (or loaded) sync plan. In ``watch`` mode, the plan of the initial sync.
+        When the sync is executed, operations are streamed and not kept in ``operations``: only
+        ``summary()`` is available.
 
     Raises:
         `ValueError`: If arguments are invalid (e.g., both paths are remote, conflicting options).
@@ -1118,6 +1563,8 @@ def sync_bucket_internal(
             raise ValueError("Cannot specify ignore_times when using apply.")
         if ignore_sizes:
             raise ValueError("Cannot specify ignore_sizes when using apply.")
+        if checksum:
+            raise ValueError("Cannot specify checksum when using apply.")
         if include:
             raise ValueError("Cannot specify include when using apply.")
         if exclude:
@@ -1130,6 +1577,8 @@ def sync_bucket_internal(
             raise ValueError("Cannot specify ignore_existing when using apply.")
         if dry_run:
             raise ValueError("Cannot specify dry_run when using apply.")
+        if watch:
+            raise ValueError("Cannot specify watch when using apply.")
 
         sync_plan = _load_plan(apply)
         status = StatusLine(enabled=not quiet)
@@ -1140,12 +1589,13 @@ def sync_bucket_internal(
         if quiet:
             disable_progress_bars()
         try:
-            _execute_plan(sync_plan, api, verbose=verbose, status=status)
+            stats = _execute_plan(sync_plan, api, verbose=verbose, status=status)
         finally:
             if quiet:
                 enable_progress_bars()
 
         if not quiet:
+            _print_transfer_stats(stats)
             print("Sync completed.")
 
         return sync_plan
@@ -1169,9 +1619,24 @@ def sync_bucket_internal(
     if existing and ignore_existing:
         raise ValueError("Cannot specify both existing and ignore_existing.")
 
+    if checksum and (ignore_times or ignore_sizes):
+        raise ValueError("Cannot specify checksum with ignore_times or ignore_sizes.")
+
+    if checksum and not is_xet_available():
+        raise ValueError(
+            "Comparing files by checksum requires the hf_xet package. "
+            'Try `pip install "huggingface_hub[hf_xet]"` or `pip install hf_xet`.'
+        )
+
     if dry_run and plan:
         raise ValueError("Cannot specify both dry_run and plan.")
 
+    if watch and (dry_run or plan):
+        raise ValueError("Cannot specify watch with dry_run or plan.")
+
+    if watch and source_is_bucket:
+        raise ValueError("Watch mode is only supported when syncing a local directory to a bucket.")
+
     # Validate local path
     if source_is_bucket:
         if os.path.exists(dest) and not os.path.isdir(dest):
@@ -1191,9 +1656,8 @@ def sync_bucket_internal(
         filter_rules=filter_rules,
     )
 
-    # Compute sync plan
     status = StatusLine(enabled=not quiet and not dry_run)
-    sync_plan = _compute_sync_plan(
+    sync_kwargs: dict[str, Any] = dict(
         source=source,
         dest=dest,
         api=api,
@@ -1204,41 +1668,84 @@ def sync_bucket_internal(
         ignore_existing=ignore_existing,
         filter_matcher=filter_matcher,
         status=status,
+        checksum=checksum,
     )
 
-    if dry_run:
-        _write_plan(sync_plan, sys.stdout)
-        return sync_plan
-
-    if plan:
-        _save_plan(sync_plan, plan)
-        if not quiet:
-            _print_plan_summary(sync_plan)
-            print(f"Plan saved to: {plan}")
-        return sync_plan
-
-    # Execute plan
-    if not quiet:
-        _print_plan_summary(sync_plan)
-
-    summary = sync_plan.summary()
-    if summary["uploads"] == 0 and summary["downloads"] == 0 and summary["deletes"] == 0:
-        if not quiet:
-            print("Nothing to sync.")
+    if dry_run or plan:
+        # Compute the full sync plan
+        sync_plan = _compute_sync_plan(**sync_kwargs)
+        if plan:
+            _save_plan(sync_plan, plan)
+            if not quiet:
+                _print_plan_summary(sync_plan)
+                print(f"Plan saved to: {plan}")
+        else:
+            _write_plan(sync_plan, sys.stdout)
         return sync_plan
 
-    if not quiet:
-        print("Syncing...")
+    # Execute operations while they are computed: transfers start without waiting for the full listings
+    # Executed operations are only counted, `sync_plan.operations` stays empty
+    sync_plan = SyncPlan(source=source, dest=dest, timestamp=datetime.now(timezone.utc).isoformat())
+
+    watcher = None
+    if watch:
+        from ._buckets_watch import BucketSyncWatcher
+
+        watcher = BucketSyncWatcher(
+            source,
+            dest,
+            api=api,
+            delete=delete,
+            filter_matcher=filter_matcher,
+            interval=watch_interval,
+            sync_kwargs=dict(
+                ignore_times=ignore_times,
+                ignore_sizes=ignore_sizes,
+                existing=existing,
+                ignore_existing=ignore_existing,
+                checksum=checksum,
+            ),
+        )
 
     if quiet:
         disable_progress_bars()
     try:
-        _execute_plan(sync_plan, api, verbose=verbose, status=status)
+        if watcher is not None:
+            # Same as below, but also records the synced local state as the watcher's starting point
+            sync_plan = watcher.reconcile(verbose=verbose, status=status)
+            stats = watcher.last_stats
+        else:
+            stats = _execute_operations(
+                sync_plan._count_streamed(_iter_sync_operations(**sync_kwargs)),
+                source=source,
+                dest=dest,
+                api=api,
+                verbose=verbose,
+                status=status,
+            )
     finally:
         if quiet:
             enable_progress_bars()
 
     if not quiet:
-        print("Sync completed.")
+        _print_plan_summary(sync_plan)
+        _print_transfer_stats(stats)
+        summary = sync_plan.summary()
+        if summary["uploads"] == 0 and summary["downloads"] == 0 and summary["deletes"] == 0:
+            print("Nothing to sync.")
+        else:
+            print("Sync completed.")
+
+    if watcher is not None:
+        if not quiet:
+            print(f"Watching '{source}' for changes (every {watch_interval}s). Press Ctrl+C to stop.")
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            if not quiet:
+                print("Pushing last changes...")
+            watcher.flush()
+        finally:
+            watcher.stop()
 
     return sync_plan
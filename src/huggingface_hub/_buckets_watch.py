@@ -0,0 +1,346 @@
+# Copyright 2026-present, the HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Watch mode for bucket sync (`hf buckets sync --watch`).
+
+Keeps a local folder continuously synced to a bucket: local changes are detected by polling the folder against
+the last reconciled state (stored in a local SQLite database) and pushed in batched `batch_bucket_files` calls.
+The remote bucket is only re-listed periodically, as a safety reconciliation.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import constants, logging
+from ._buckets import (
+    FilterMatcher,
+    SyncPlan,
+    _execute_operations,
+    _iter_sync_operations,
+    _list_local_files,
+    _parse_bucket_uri,
+    _TransferStats,
+)
+from .utils import chunk_iterable
+
+
+if TYPE_CHECKING:
+    from .hf_api import HfApi
+
+
+logger = logging.get_logger(__name__)
+
+_WATCH_BATCH_SIZE = 1000  # max number of files added/deleted per `batch_bucket_files` call
+_WATCH_MAX_DELAY_FACTOR = 10  # flush pending changes after at most `interval * _WATCH_MAX_DELAY_FACTOR` seconds
+
+
+class _SyncState:
+    """Last reconciled state of a watched folder: `{relative_path: (size, mtime_ms)}` persisted in SQLite."""
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime_ms REAL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)")
+        self._conn.commit()
+
+    def load(self) -> tuple[dict[str, tuple[int, float]], float | None]:
+        """Return the reconciled files and the time (epoch seconds) of the last reconciliation, if any."""
+        files = {row[0]: (row[1], row[2]) for row in self._conn.execute("SELECT path, size, mtime_ms FROM files")}
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'last_reconcile'").fetchone()
+        return files, (row[0] if row is not None else None)
+
+    def replace_all(self, files: dict[str, tuple[int, float]], reconciled_at: float) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM files")
+            self._conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?)", ((path, size, mtime) for path, (size, mtime) in files.items())
+            )
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_reconcile', ?)", (reconciled_at,))
+
+    def update(self, upserts: dict[str, tuple[int, float]], deletes: list[str]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                ((path, size, mtime) for path, (size, mtime) in upserts.items()),
+            )
+            self._conn.executemany("DELETE FROM files WHERE path = ?", ((path,) for path in deletes))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class BucketSyncWatcher:
+    """Continuously sync a local folder to a bucket.
+
+    On start, the folder is fully synced to the bucket (same as [`sync_bucket`]). Then the folder is polled every
+    `interval` seconds and compared to the last reconciled state. Changes are debounced (pushed once a poll finds no
+    new change, or after `10 * interval` seconds at most) and sent with batched [`batch_bucket_files`] calls. Every
+    `reconcile_interval` seconds, a full sync re-lists the bucket to catch changes made outside of this process.
+
+    The reconciled state is stored in `HF_BUCKETS_CACHE`. A watcher restarted before `reconcile_interval` has elapsed
+    does not re-list the bucket: it only pushes what changed locally while it was stopped.
+
+    Args:
+        local_path (`str` or `Path`):
+            Local folder to watch.
+        bucket_path (`str`):
+            Destination bucket path, e.g. `"hf://buckets/username/my-bucket/prefix"`.
+        api ([`HfApi`]):
+            The HfApi instance to use for API calls.
+        delete (`bool`, *optional*, defaults to `False`):
+            Delete remote files that are deleted locally.
+        filter_matcher (`FilterMatcher`, *optional*):
+            Only sync the files matching these include/exclude rules.
+        interval (`float`, *optional*, defaults to `10`):
+            Number of seconds between two polls of the local folder.
+        reconcile_interval (`float`, *optional*, defaults to `3600`):
+            Number of seconds between two full reconciliations with the remote bucket.
+        sync_kwargs (`dict`, *optional*):
+            Extra comparison options passed to the full reconciliations (e.g. `ignore_times`, `checksum`).
+
+    Example:
+    ```py
+    >>> from huggingface_hub import HfApi
+    >>> from huggingface_hub import BucketSyncWatcher
+
+    >>> with BucketSyncWatcher("./outputs", "hf://buckets/username/my-bucket", api=HfApi()) as watcher:
+    ...     train()  # files written to ./outputs are pushed as they change
+    # The last changes are pushed when exiting the context manager (unless an exception was raised)
+    ```
+    """
+
+    def __init__(
+        self,
+        local_path: str | Path,
+        bucket_path: str,
+        *,
+        api: "HfApi",
+        delete: bool = False,
+        filter_matcher: FilterMatcher | None = None,
+        interval: float = 10,
+        reconcile_interval: float = 3600,
+        sync_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        if not interval > 0:
+            raise ValueError(f"'interval' must be a positive number, not '{interval}'.")
+        self.local_path = os.path.abspath(local_path)
+        if not os.path.isdir(self.local_path):
+            raise ValueError(f"Source must be an existing directory: {local_path}")
+        parsed = _parse_bucket_uri(bucket_path)
+        self.bucket_path = bucket_path
+        self.bucket_id, self.prefix = parsed.id, parsed.path_in_repo
+        self.api = api
+        self.delete = delete
+        self.filter_matcher = filter_matcher or FilterMatcher()
+        self.interval = interval
+        self.reconcile_interval = reconcile_interval
+        self.sync_kwargs = sync_kwargs or {}
+
+        state_key = hashlib.sha256(f"{self.local_path}\n{self.api.endpoint}\n{bucket_path}".encode()).hexdigest()[:16]
+        self._state_db = _SyncState(os.path.join(constants.HF_BUCKETS_CACHE, "watch", f"{state_key}.sqlite"))
+        self.state, self._last_reconcile = self._state_db.load()
+
+        # Changes detected but not pushed yet: {path: (size, mtime_ms) or None if deleted}
+        self._pending: dict[str, tuple[int, float] | None] = {}
+        self._pending_since: float | None = None
+        self.last_stats: dict[str, _TransferStats] = {}  # throughput of the last reconciliation
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def reconcile(self, verbose: bool = False, status: Any | None = None) -> SyncPlan:
+        """Fully sync the local folder to the bucket (re-listing the bucket) and reset the reconciled state.
+
+        Returns:
+            [`SyncPlan`]: the executed sync plan.
+        """
+        with self._lock:
+            logger.info(f"Reconciling '{self.local_path}' with '{self.bucket_path}'.")
+            # Snapshot before syncing: files modified during the sync are detected as changed by the next poll
+            snapshot = self.snapshot()
+            plan = SyncPlan(
+                source=self.local_path, dest=self.bucket_path, timestamp=datetime.now(timezone.utc).isoformat()
+            )
+
+            operations = _iter_sync_operations(
+                source=self.local_path,
+                dest=self.bucket_path,
+                api=self.api,
+                delete=self.delete,
+                filter_matcher=self.filter_matcher,
+                status=status,
+                **self.sync_kwargs,
+            )
+            self.last_stats = _execute_operations(
+                plan._count_streamed(operations),
+                source=self.local_path,
+                dest=self.bucket_path,
+                api=self.api,
+                verbose=verbose,
+                status=status,
+            )
+            self._mark_reconciled(snapshot)
+            return plan
+
+    def snapshot(self) -> dict[str, tuple[int, float]]:
+        """List the watched files as `{relative_path: (size, mtime_ms)}`."""
+        return {
+            rel_path: (size, mtime_ms)
+            for rel_path, size, mtime_ms in _list_local_files(self.local_path)
+            if self.filter_matcher.matches(rel_path)
+        }
+
+    def mark_reconciled(self, snapshot: dict[str, tuple[int, float]]) -> None:
+        """Record `snapshot` (see [`snapshot`]) as in sync with the bucket, e.g. after a sync made outside of the watcher."""
+        with self._lock:
+            self._mark_reconciled(snapshot)
+
+    def poll(self) -> int:
+        """Detect local changes and push them if they are due.
+
+        Returns:
+            `int`: the number of files added or deleted remotely during this call.
+        """
+        if self._last_reconcile is None or time.time() - self._last_reconcile >= self.reconcile_interval:
+            plan = self.reconcile()
+            summary = plan.summary()
+            return int(summary["uploads"]) + int(summary["deletes"])
+
+        with self._lock:
+            changes = self._detect_changes()
+            now = time.monotonic()
+            if changes:
+                self._pending.update(changes)
+                if self._pending_since is None:
+                    self._pending_since = now
+            if not self._pending:
+                return 0
+            # Debounce: wait for a quiet poll (no new changes), unless changes have been pending for too long
+            assert self._pending_since is not None
+            if changes and now - self._pending_since < self.interval * _WATCH_MAX_DELAY_FACTOR:
+                return 0
+            return self._flush()
+
+    def flush(self) -> int:
+        """Push pending changes immediately (including changes made since the last poll)."""
+        with self._lock:
+            self._pending.update(self._detect_changes())
+            return self._flush()
+
+    def run(self) -> None:
+        """Poll the local folder until [`stop`] is called. Blocking."""
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Error while syncing '{self.local_path}' to '{self.bucket_path}': {e}")
+            self._stop_event.wait(self.interval)
+
+    def start(self) -> "BucketSyncWatcher":
+        """Run the watcher in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the watcher. Pending changes are not pushed (call [`flush`] before if needed)."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._state_db.close()
+
+    def __enter__(self) -> "BucketSyncWatcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            # Push last changes before exiting. If an exception is propagating, don't push a possibly inconsistent
+            # state: the changes will be picked up by the next reconciliation.
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.stop()
+
+    def _mark_reconciled(self, snapshot: dict[str, tuple[int, float]]) -> None:
+        self.state = dict(snapshot)
+        self._last_reconcile = time.time()
+        self._state_db.replace_all(self.state, reconciled_at=self._last_reconcile)
+        self._pending.clear()
+        self._pending_since = None
+
+    def _detect_changes(self) -> dict[str, tuple[int, float] | None]:
+        """Compare the local folder with the last known state (including pending changes)."""
+        known = {**self.state, **self._pending}
+        current = self.snapshot()
+        changes: dict[str, tuple[int, float] | None] = {
+            path: info for path, info in current.items() if known.get(path) != info
+        }
+        for path, info in known.items():
+            if info is not None and path not in current:
+                changes[path] = None
+        return changes
+
+    def _flush(self) -> int:
+        if not self._pending:
+            return 0
+        adds = {path: info for path, info in self._pending.items() if info is not None}
+        deletes = [path for path, info in self._pending.items() if info is None and path in self.state]
+        if not self.delete:
+            # Deleted locally but kept remotely: forget about them so they are not reported again
+            self._state_db.update({}, deletes)
+            for path in deletes:
+                self.state.pop(path, None)
+            deletes = []
+
+        n_pushed = 0
+        to_push: list[tuple[str, tuple[int, float] | None]] = [*adds.items(), *((path, None) for path in deletes)]
+        for chunk in chunk_iterable(to_push, _WATCH_BATCH_SIZE):
+            batch_adds: dict[str, tuple[int, float]] = {}
+            batch_deletes: list[str] = []
+            for path, info in chunk:
+                if info is None:
+                    batch_deletes.append(path)
+                else:
+                    batch_adds[path] = info
+            logger.info(f"Pushing {len(batch_adds)} changed files, deleting {len(batch_deletes)} files.")
+            self.api.batch_bucket_files(
+                self.bucket_id,
+                add=[(os.path.join(self.local_path, path), self._remote_path(path)) for path in batch_adds] or None,
+                delete=[self._remote_path(path) for path in batch_deletes] or None,
+            )
+            self._state_db.update(batch_adds, batch_deletes)
+            self.state.update(batch_adds)
+            for path in batch_deletes:
+                self.state.pop(path, None)
+            n_pushed += len(batch_adds) + len(batch_deletes)
+
+        self._pending.clear()
+        self._pending_since = None
+        return n_pushed
+
+    def _remote_path(self, path: str) -> str:
+        return f"{self.prefix}/{path}" if self.prefix else path
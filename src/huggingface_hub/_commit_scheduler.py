@@ -10,7 +10,7 @@ from threading import Lock, Thread
 from typing import Optional
 
 from .hf_api import DEFAULT_IGNORE_PATTERNS, CommitInfo, CommitOperationAdd, HfApi
-from .utils import filter_repo_objects
+from .utils import filter_repo_objects, walk_local_files
 
 
 logger = logging.getLogger(__name__)
@@ -220,21 +220,17 @@ class CommitScheduler:
         with self.lock:
             logger.debug("Listing files to upload for scheduled commit.")
 
-            # List files from folder (taken from `_prepare_upload_folder_additions`)
-            relpath_to_abspath = {
-                path.relative_to(self.folder_path).as_posix(): path
-                for path in sorted(self.folder_path.glob("**/*"))  # sorted to be deterministic
-                if path.is_file()
-            }
+            # List files from folder, with their stat (sorted to be deterministic)
+            relpath_to_stat = dict(walk_local_files(self.folder_path))
             prefix = f"{self.path_in_repo.strip('/')}/" if self.path_in_repo else ""
 
             # Filter with pattern + filter out unchanged files + retrieve current file size
             files_to_upload: list[_FileToUpload] = []
             for relpath in filter_repo_objects(
-                relpath_to_abspath.keys(), allow_patterns=self.allow_patterns, ignore_patterns=self.ignore_patterns
+                relpath_to_stat.keys(), allow_patterns=self.allow_patterns, ignore_patterns=self.ignore_patterns
             ):
-                local_path = relpath_to_abspath[relpath]
-                stat = local_path.stat()
+                local_path = self.folder_path / relpath
+                stat = relpath_to_stat[relpath]
                 if self.last_uploaded.get(local_path) is None or self.last_uploaded[local_path] != stat.st_mtime:
                     files_to_upload.append(
                         _FileToUpload(
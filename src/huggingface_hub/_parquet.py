@@ -0,0 +1,519 @@
+# Copyright 2026 The HuggingFace Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Parquet-aware access layer for files on the Hub, built on top of `HfFileSystem`.
+
+Opening a parquet file through a generic filesystem costs at least two dependent round trips (footer length, then
+footer) and every column chunk is then read lazily. Here, the footer is fetched speculatively with a single suffix
+range request and cached per commit, row groups are pruned using the column statistics and the column chunks of the
+selected row groups are fetched with a few coalesced range requests, sent concurrently.
+"""
+
+import io
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote
+
+from . import constants
+from .file_download import REGEX_COMMIT_HASH
+from .hf_file_system import (
+    HfFileSystem,
+    HfFileSystemResolvedRepositoryPath,
+    _resolved_path_to_url,
+)
+from .utils import hf_raise_for_status, http_backoff, is_pyarrow_available, logging
+
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+
+logger = logging.get_logger(__name__)
+
+_PARQUET_MAGIC = b"PAR1"
+_DEFAULT_FOOTER_SAMPLE_SIZE = 64 * 1024  # 64KB is enough for most footers
+_DEFAULT_MAX_GAP = 64 * 1024  # same as `fsspec.parquet`
+_DEFAULT_MAX_BLOCK = 256 * 1024 * 1024  # same as `fsspec.parquet`
+
+# e.g. "https://huggingface.co/datasets/user/dataset/resolve/refs%2Fconvert%2Fparquet/default/train/0000.parquet"
+_DATASET_RESOLVE_URL_REGEX = re.compile(
+    r"/datasets/(?P<repo_id>[^/]+/[^/]+)/resolve/(?P<revision>[^/]+)/(?P<path_in_repo>.+)$"
+)
+
+# DNF filters, same format as `pyarrow.parquet.read_table(filters=...)`
+FILTERS_T = list[tuple[str, str, Any]] | list[list[tuple[str, str, Any]]]
+
+
+@dataclass(frozen=True)
+class ParquetFooter:
+    """
+    Tail of a parquet file on the Hub, containing at least its footer.
+
+    Attributes:
+        path (`str`):
+            Path of the file, pinned to a commit.
+        size (`int`):
+            Total size of the file, in bytes.
+        offset (`int`):
+            Offset of `data` in the file.
+        data (`bytes`):
+            Tail of the file. Ends with the serialized file metadata, its length (4 bytes) and the `PAR1` magic.
+    """
+
+    path: str
+    size: int
+    offset: int
+    data: bytes
+
+    @property
+    def metadata_length(self) -> int:
+        """Length of the serialized file metadata, in bytes."""
+        return int.from_bytes(self.data[-8:-4], "little")
+
+
+class HfParquetReader:
+    """
+    Read parquet files hosted on the Hub with as few round trips as possible.
+
+    Footers are fetched with a single suffix range request of `footer_sample_size` bytes (a second request is sent only
+    if the footer is larger than that) and cached in memory, keyed by commit. Reading a table only fetches the column
+    chunks of the row groups matching the filters, coalescing close ranges into a single request.
+
+    Parsing the footers and reading tables requires `pyarrow`.
+
+    Args:
+        fs ([`HfFileSystem`], *optional*):
+            Filesystem used to resolve paths. Defaults to a new [`HfFileSystem`] using `token`.
+        token (`bool` or `str`, *optional*):
+            A valid user access token (string). Defaults to the locally saved token. Ignored if `fs` is provided.
+        footer_sample_size (`int`, *optional*):
+            Number of bytes fetched from the end of a file to get its footer. Defaults to 64KB.
+        max_gap (`int`, *optional*):
+            Maximum gap, in bytes, between two column chunks for them to be fetched with a single request.
+            Defaults to 64KB.
+        max_block (`int`, *optional*):
+            Maximum size, in bytes, of a coalesced request. Defaults to 256MB.
+        max_workers (`int`, *optional*):
+            Maximum number of concurrent requests. Defaults to 8.
+
+    Example:
+    ```python
+    >>> from huggingface_hub import HfParquetReader
+    >>> reader = HfParquetReader()
+    >>> paths = reader.list_dataset_parquet_paths("stanfordnlp/imdb", config="plain_text", split="train")
+    >>> reader.prefetch_footers(paths)  # fetch all footers concurrently
+    >>> table = reader.read_table(paths[0], columns=["text"], filters=[("label", "==", 1)])
+    ```
+    """
+
+    def __init__(
+        self,
+        fs: HfFileSystem | None = None,
+        *,
+        token: bool | str | None = None,
+        footer_sample_size: int = _DEFAULT_FOOTER_SAMPLE_SIZE,
+        max_gap: int = _DEFAULT_MAX_GAP,
+        max_block: int = _DEFAULT_MAX_BLOCK,
+        max_workers: int = 8,
+    ):
+        if footer_sample_size < 8:
+            raise ValueError(f"`footer_sample_size` must be at least 8 bytes, got {footer_sample_size}.")
+        self.fs = fs if fs is not None else HfFileSystem(token=token)
+        self.footer_sample_size = footer_sample_size
+        self.max_gap = max_gap
+        self.max_block = max_block
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        # Maps (repo_type, repo_id, revision) to the commit the revision pointed to when first resolved
+        self._commits: dict[tuple[str, str, str], str] = {}
+        # Maps paths pinned to a commit to their footer. Commits are immutable => no invalidation needed.
+        self._footers: dict[str, ParquetFooter] = {}
+        self._metadata: dict[str, "pq.FileMetaData"] = {}
+
+    def list_dataset_parquet_paths(
+        self, repo_id: str, *, config: str | None = None, split: str | None = None
+    ) -> list[str]:
+        """
+        List the paths of the parquet files of a dataset, as converted by the Dataset Viewer.
+
+        Built on [`HfApi.list_dataset_parquet_files`]. Returned paths can be passed to any method of this class or to
+        [`HfFileSystem`].
+
+        Args:
+            repo_id (`str`):
+                The dataset repository ID (e.g. `"username/dataset-name"`).
+            config (`str`, *optional*):
+                Filter by a specific config/subset name.
+            split (`str`, *optional*):
+                Filter by a specific split name.
+
+        Returns:
+            `list[str]`: paths of the parquet files (e.g. `"datasets/username/dataset-name@refs/convert/parquet/default/train/0000.parquet"`).
+        """
+        paths = []
+        for entry in self.fs._api.list_dataset_parquet_files(repo_id, config=config):
+            if split is not None and entry.split != split:
+                continue
+            match = _DATASET_RESOLVE_URL_REGEX.search(entry.url)
+            if match is None:
+                raise ValueError(f"Unexpected parquet file URL: '{entry.url}'.")
+            revision = unquote(match.group("revision"))
+            paths.append(f"datasets/{match.group('repo_id')}@{revision}/{match.group('path_in_repo')}")
+        return paths
+
+    def pin(self, path: str) -> str:
+        """
+        Return the path pinned to the commit its revision points to.
+
+        The revision of a given repository is resolved only once per reader, so that all files are read from the same
+        commit.
+        """
+        resolved_path = self.fs.resolve_path(path)
+        if not isinstance(resolved_path, HfFileSystemResolvedRepositoryPath):
+            return resolved_path.unresolve()  # buckets are not versioned
+        if REGEX_COMMIT_HASH.match(resolved_path.revision):
+            return resolved_path.unresolve()
+        key = (resolved_path.repo_type, resolved_path.repo_id, resolved_path.revision)
+        commit = self._commits.get(key)
+        if commit is None:
+            commit = self.fs._api.repo_info(
+                resolved_path.repo_id, repo_type=resolved_path.repo_type, revision=resolved_path.revision
+            ).sha
+            assert commit is not None
+            self._commits[key] = commit
+        return HfFileSystemResolvedRepositoryPath(
+            resolved_path.repo_type, resolved_path.repo_id, commit, resolved_path.path_in_repo
+        ).unresolve()
+
+    def read_footer(self, path: str) -> ParquetFooter:
+        """
+        Fetch the footer of a parquet file, or return it from the cache.
+
+        Args:
+            path (`str`):
+                Path of the parquet file.
+
+        Returns:
+            [`ParquetFooter`]: the tail of the file, containing its footer.
+        """
+        pinned_path = self.pin(path)
+        with self._lock:
+            footer = self._footers.get(pinned_path)
+        if footer is None:
+            footer = self._fetch_footer(pinned_path)
+            with self._lock:
+                self._footers[pinned_path] = footer
+        return footer
+
+    def prefetch_footers(self, paths: list[str]) -> list[ParquetFooter]:
+        """
+        Fetch the footers of multiple parquet files concurrently.
+
+        Args:
+            paths (`list[str]`):
+                Paths of the parquet files.
+
+        Returns:
+            `list[ParquetFooter]`: the footers, in the same order as `paths`.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.read_footer, paths))
+
+    def metadata(self, path: str) -> "pq.FileMetaData":
+        """
+        Return the parsed metadata of a parquet file. Requires `pyarrow`.
+
+        Args:
+            path (`str`):
+                Path of the parquet file.
+
+        Returns:
+            `pyarrow.parquet.FileMetaData`: the file metadata (schema, row groups, column statistics...).
+        """
+        pa, pq = _import_pyarrow()
+        footer = self.read_footer(path)
+        with self._lock:
+            metadata = self._metadata.get(footer.path)
+        if metadata is None:
+            # pyarrow only needs the footer and trailer: prepend the magic to make it a valid (data-less) file
+            metadata = pq.read_metadata(pa.BufferReader(_PARQUET_MAGIC + footer.data[-(footer.metadata_length + 8) :]))
+            with self._lock:
+                self._metadata[footer.path] = metadata
+        return metadata
+
+    def select_row_groups(self, path: str, filters: FILTERS_T | None = None) -> list[int]:
+        """
+        Return the indices of the row groups that may contain rows matching `filters`, based on column statistics.
+
+        Args:
+            path (`str`):
+                Path of the parquet file.
+            filters (`list[tuple]` or `list[list[tuple]]`, *optional*):
+                Filters in disjunctive normal form, same format as `pyarrow.parquet.read_table`. Supported operators are
+                `==`, `=`, `!=`, `<`, `<=`, `>`, `>=`, `in` and `not in`.
+
+        Returns:
+            `list[int]`: indices of the selected row groups.
+        """
+        metadata = self.metadata(path)
+        if not filters:
+            return list(range(metadata.num_row_groups))
+        conjunctions = _normalize_filters(filters)
+        return [
+            i
+            for i in range(metadata.num_row_groups)
+            if any(_row_group_may_match(metadata.row_group(i), conjunction) for conjunction in conjunctions)
+        ]
+
+    def open(
+        self, path: str, *, columns: list[str] | None = None, row_groups: list[int] | None = None
+    ) -> io.RawIOBase:
+        """
+        Open a parquet file, prefetching the column chunks needed to read `columns` from `row_groups`.
+
+        The returned file-like object serves reads from the footer and the prefetched chunks. Other reads fall back to a
+        range request. Requires `pyarrow`.
+
+        Args:
+            path (`str`):
+                Path of the parquet file.
+            columns (`list[str]`, *optional*):
+                Top-level columns to prefetch. Defaults to all columns.
+            row_groups (`list[int]`, *optional*):
+                Row groups to prefetch. Defaults to all row groups.
+
+        Returns:
+            `io.RawIOBase`: a read-only, seekable file-like object.
+        """
+        footer = self.read_footer(path)
+        metadata = self.metadata(path)
+        if row_groups is None:
+            row_groups = list(range(metadata.num_row_groups))
+
+        ranges = []
+        for i in row_groups:
+            row_group = metadata.row_group(i)
+            for j in range(row_group.num_columns):
+                column = row_group.column(j)
+                if columns is not None and column.path_in_schema.split(".")[0] not in columns:
+                    continue
+                start = column.data_page_offset
+                if column.has_dictionary_page and column.dictionary_page_offset:
+                    start = min(start, column.dictionary_page_offset)
+                ranges.append((start, start + column.total_compressed_size))
+
+        blocks = _merge_ranges(ranges, max_gap=self.max_gap, max_block=self.max_block)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            contents = list(executor.map(lambda block: self._fetch_range(footer.path, *block), blocks))
+
+        parts = dict(zip(blocks, contents))
+        parts[(footer.offset, footer.size)] = footer.data
+        return _PrefetchedFile(
+            size=footer.size, parts=parts, fetch=lambda start, end: self._fetch_range(footer.path, start, end)
+        )
+
+    def read_table(
+        self, path: str, *, columns: list[str] | None = None, filters: FILTERS_T | None = None
+    ) -> "pa.Table":
+        """
+        Read a parquet file as a `pyarrow.Table`, fetching only the required column chunks. Requires `pyarrow`.
+
+        Row groups that cannot match `filters` (based on column statistics) are not fetched. Rows of the remaining row
+        groups are then filtered exactly.
+
+        Args:
+            path (`str`):
+                Path of the parquet file.
+            columns (`list[str]`, *optional*):
+                Top-level columns to read. Defaults to all columns.
+            filters (`list[tuple]` or `list[list[tuple]]`, *optional*):
+                Filters in disjunctive normal form, same format as `pyarrow.parquet.read_table`.
+
+        Returns:
+            `pyarrow.Table`: the selected rows and columns.
+        """
+        _, pq = _import_pyarrow()
+        metadata = self.metadata(path)
+        row_groups = self.select_row_groups(path, filters)
+        read_columns = columns
+        if columns is not None and filters:
+            filter_columns = [name for conjunction in _normalize_filters(filters) for name, _, _ in conjunction]
+            read_columns = list(dict.fromkeys([*columns, *filter_columns]))
+
+        with self.open(path, columns=read_columns, row_groups=row_groups) as f:
+            table = pq.ParquetFile(f, metadata=metadata).read_row_groups(row_groups, columns=read_columns)
+        if filters:
+            table = table.filter(pq.filters_to_expression(filters))
+        if columns is not None:
+            table = table.select(columns)
+        return table
+
+    def _fetch_footer(self, path: str) -> ParquetFooter:
+        response = self._get(path, f"bytes=-{self.footer_sample_size}")
+        data = response.content
+        size = _parse_content_range_size(response.headers.get("content-range")) or len(data)
+        if len(data) < 8 or data[-4:] != _PARQUET_MAGIC:
+            raise ValueError(f"'{path}' is not a parquet file.")
+        footer_size = int.from_bytes(data[-8:-4], "little") + 8
+        if footer_size > size:
+            raise ValueError(f"'{path}' is not a valid parquet file: footer is larger than the file.")
+        offset = size - len(data)
+        if footer_size > len(data):
+            # Footer larger than the speculative read => fetch the missing head of the footer
+            data = self._fetch_range(path, size - footer_size, offset) + data
+            offset = size - footer_size
+        return ParquetFooter(path=path, size=size, offset=offset, data=data)
+
+    def _fetch_range(self, path: str, start: int, end: int) -> bytes:
+        return self._get(path, f"bytes={start}-{end - 1}").content
+
+    def _get(self, path: str, range_header: str):
+        url = _resolved_path_to_url(self.fs.resolve_path(path), endpoint=self.fs.endpoint)
+        response = http_backoff(
+            "GET",
+            url,
+            headers={**self.fs._api._build_hf_headers(), "range": range_header},
+            timeout=constants.HF_HUB_DOWNLOAD_TIMEOUT,
+        )
+        hf_raise_for_status(response)
+        return response
+
+
+class _PrefetchedFile(io.RawIOBase):
+    """Read-only file-like object serving reads from prefetched parts and fetching the missing ranges."""
+
+    def __init__(self, size: int, parts: dict[tuple[int, int], bytes], fetch):
+        self.size = size
+        self.parts = parts
+        self.fetch = fetch
+        self.loc = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.loc
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self.loc = offset
+        elif whence == io.SEEK_CUR:
+            self.loc += offset
+        elif whence == io.SEEK_END:
+            self.loc = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        return self.loc
+
+    def read(self, size: int = -1) -> bytes:
+        end = self.size if size is None or size < 0 else min(self.size, self.loc + size)
+        if end <= self.loc:
+            return b""
+        for (part_start, part_end), data in self.parts.items():
+            if part_start <= self.loc and end <= part_end:
+                out = data[self.loc - part_start : end - part_start]
+                break
+        else:
+            logger.debug(f"Range {self.loc}-{end} was not prefetched, fetching it.")
+            out = self.fetch(self.loc, end)
+        self.loc += len(out)
+        return out
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _merge_ranges(ranges: list[tuple[int, int]], max_gap: int, max_block: int) -> list[tuple[int, int]]:
+    """Merge sorted byte ranges separated by at most `max_gap` bytes, without exceeding `max_block` bytes."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + max_gap and max(end, merged[-1][1]) - merged[-1][0] <= max_block:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _parse_content_range_size(content_range: str | None) -> int | None:
+    """Parse the total size from a `Content-Range` header (e.g. "bytes 100-199/1000" => 1000)."""
+    if content_range is None or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+def _normalize_filters(filters: FILTERS_T) -> list[list[tuple[str, str, Any]]]:
+    """Return filters as a list of conjunctions (list of lists of tuples)."""
+    if filters and isinstance(filters[0], tuple):
+        return [filters]  # type: ignore
+    return filters  # type: ignore
+
+
+def _row_group_may_match(row_group: "pq.RowGroupMetaData", conjunction: list[tuple[str, str, Any]]) -> bool:
+    """Return False only if column statistics prove that no row of the row group matches the conjunction."""
+    statistics = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        if column.is_stats_set and column.statistics.has_min_max:
+            statistics[column.path_in_schema] = (column.statistics.min, column.statistics.max)
+
+    for name, op, value in conjunction:
+        if name not in statistics:
+            continue  # no statistics => cannot prune
+        min_value, max_value = statistics[name]
+        try:
+            if op in ("==", "="):
+                matches = min_value <= value <= max_value
+            elif op == "!=":
+                matches = not (min_value == max_value == value)
+            elif op == "<":
+                matches = min_value < value
+            elif op == "<=":
+                matches = min_value <= value
+            elif op == ">":
+                matches = max_value > value
+            elif op == ">=":
+                matches = max_value >= value
+            elif op == "in":
+                matches = any(min_value <= v <= max_value for v in value)
+            elif op == "not in":
+                matches = not (min_value == max_value and min_value in value)
+            else:
+                raise ValueError(f"Unsupported filter operator: '{op}'.")
+        except TypeError:
+            continue  # incomparable types => cannot prune
+        if not matches:
+            return False
+    return True
+
+
+def _import_pyarrow():
+    """Make sure `pyarrow` is installed on the machine."""
+    if not is_pyarrow_available():
+        raise ImportError("Reading parquet files requires `pyarrow`. Please install it with `pip install pyarrow`.")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    return pa, pq
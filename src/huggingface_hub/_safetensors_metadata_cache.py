@@ -0,0 +1,155 @@
+# Copyright 2026-present, the HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk cache for parsed safetensors repo metadata.
+
+[`get_safetensors_metadata`] fetches the index file and the header of every shard of a repo. Because a commit hash is
+immutable, the result never changes for a given commit and can be cached forever without any invalidation logic.
+
+The metadata is stored as a JSON file under `<storage_folder>/safetensors/<commit_hash>.json`, next to the `trees/`
+cache (see `_tree_cache.py`). Parsed entries are also kept in a bounded in-memory LRU so that repeated calls in the same
+process don't even hit the disk. The LRU holds private copies and returns copies, so callers can't modify cached entries.
+
+```json
+{
+  "format_version": 1,
+  "metadata": {"total_size": 1234},
+  "sharded": true,
+  "weight_map": {"lm_head.weight": "model-00001-of-00002.safetensors", ...},
+  "files": {
+    "model-00001-of-00002.safetensors": {
+      "metadata": {"format": "pt"},
+      "tensors": {"lm_head.weight": {"dtype": "BF16", "shape": [32000, 4096], "data_offsets": [0, 262144000]}}
+    }
+  }
+}
+```
+"""
+
+import copy
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .utils import SafetensorsFileMetadata, SafetensorsRepoMetadata, TensorInfo, logging
+
+
+logger = logging.get_logger(__name__)
+
+SAFETENSORS_METADATA_CACHE_FORMAT_VERSION = 1
+
+# In-memory LRU of parsed metadata, keyed by absolute file path. Callers only ever get copies of the entries.
+_IN_MEMORY_CACHE_MAX_SIZE = 512
+_IN_MEMORY_CACHE: "OrderedDict[str, SafetensorsRepoMetadata]" = OrderedDict()
+_IN_MEMORY_CACHE_LOCK = threading.Lock()
+
+
+def _safetensors_metadata_cache_path(storage_folder: str, commit_hash: str) -> str:
+    return os.path.join(storage_folder, "safetensors", f"{commit_hash}.json")
+
+
+def _remember(path: str, metadata: SafetensorsRepoMetadata) -> None:
+    metadata = copy.deepcopy(metadata)
+    with _IN_MEMORY_CACHE_LOCK:
+        _IN_MEMORY_CACHE[path] = metadata
+        _IN_MEMORY_CACHE.move_to_end(path)
+        while len(_IN_MEMORY_CACHE) > _IN_MEMORY_CACHE_MAX_SIZE:
+            _IN_MEMORY_CACHE.popitem(last=False)
+
+
+def read_safetensors_metadata_cache(storage_folder: str, commit_hash: str) -> SafetensorsRepoMetadata | None:
+    """Return the cached metadata for a commit hash, or `None` if not cached, invalid, or unreadable."""
+    path = _safetensors_metadata_cache_path(storage_folder, commit_hash)
+    with _IN_MEMORY_CACHE_LOCK:
+        cached = _IN_MEMORY_CACHE.get(path)
+        if cached is not None:
+            _IN_MEMORY_CACHE.move_to_end(path)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    metadata = _read_safetensors_metadata_cache_from_disk(path)
+    if metadata is not None:
+        _remember(path, metadata)
+    return metadata
+
+
+def _read_safetensors_metadata_cache_from_disk(path: str) -> SafetensorsRepoMetadata | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format_version") != SAFETENSORS_METADATA_CACHE_FORMAT_VERSION:
+            # Unknown format (e.g. written by a newer version) => ignore and re-fetch.
+            return None
+        return SafetensorsRepoMetadata(
+            metadata=data["metadata"],
+            sharded=data["sharded"],
+            weight_map=data["weight_map"],
+            files_metadata={
+                filename: SafetensorsFileMetadata(
+                    metadata=info["metadata"],
+                    tensors={
+                        name: TensorInfo(
+                            dtype=tensor["dtype"],
+                            shape=tensor["shape"],
+                            data_offsets=tuple(tensor["data_offsets"]),  # type: ignore
+                        )
+                        for name, tensor in info["tensors"].items()
+                    },
+                )
+                for filename, info in data["files"].items()
+            },
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring corrupted safetensors metadata cache file {path}: {e}")
+        return None
+
+
+def write_safetensors_metadata_cache(storage_folder: str, commit_hash: str, metadata: SafetensorsRepoMetadata) -> None:
+    """Write parsed safetensors metadata to the cache (ignoring any failure)."""
+    path = _safetensors_metadata_cache_path(storage_folder, commit_hash)
+    data = {
+        "format_version": SAFETENSORS_METADATA_CACHE_FORMAT_VERSION,
+        "metadata": metadata.metadata,
+        "sharded": metadata.sharded,
+        "weight_map": metadata.weight_map,
+        "files": {
+            filename: {
+                "metadata": file_metadata.metadata,
+                "tensors": {
+                    name: {"dtype": tensor.dtype, "shape": tensor.shape, "data_offsets": list(tensor.data_offsets)}
+                    for name, tensor in file_metadata.tensors.items()
+                },
+            }
+            for filename, file_metadata in sorted(metadata.files_metadata.items())
+        },
+    }
+
+    # Seed the in-memory cache first: even if the disk is read-only, later calls in this process are served from memory.
+    _remember(path, metadata)
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Ignored error while writing safetensors metadata cache file {path}: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
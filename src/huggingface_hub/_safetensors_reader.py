@@ -0,0 +1,432 @@
+# Copyright 2026 The HuggingFace Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazy access to the tensors of a safetensors repo on the Hub, without downloading whole files.
+
+Each safetensors header gives the byte range of every tensor in its file. Reading a tensor (or a slice of its rows)
+sends a single range request for exactly these bytes. Fetched ranges are stored in the regular cache, next to the
+blob they belong to (`<cache>/<repo>/blobs/<etag>.partial/<start>-<end>`), so that they are never fetched twice. If a
+file has already been fully downloaded, it is read from the cache directly.
+
+`.partial` folders are reported by `scan_cache_dir` as incomplete files (removed by `hf cache prune`), deleted with
+their repo and removed by `hf_hub_download` once the full blob is downloaded.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import constants
+from .errors import NotASafetensorsRepoError
+from .file_download import REGEX_COMMIT_HASH, hf_hub_url, repo_folder_name
+from .hf_api import HfApi, RepoFile, _get_safetensors_metadata_size, _parse_safetensors_header
+from .serialization._torch import SAFETENSORS_TORCH_DTYPES
+from .utils import SafetensorsFileMetadata, TensorInfo, hf_raise_for_status, http_backoff, logging
+
+
+if TYPE_CHECKING:
+    import torch
+
+
+logger = logging.get_logger(__name__)
+
+# Same as `HfApi.parse_safetensors_file_metadata`: most headers fit in the first 100kb
+_HEADER_SAMPLE_SIZE = 100_000
+
+
+@dataclass(frozen=True)
+class _RemoteFile:
+    filename: str
+    etag: str
+    size: int
+
+
+class HfSafetensorsReader:
+    """
+    Read tensors from a safetensors repo on the Hub lazily, fetching only the bytes of the requested tensors.
+
+    The revision is resolved to a commit once, when the reader is created, so that all tensors are read from the same
+    commit. File headers are fetched on first access. Loading a tensor, or a slice of it, sends a single range request
+    for the needed bytes (rows of the first dimension). Fetched bytes are stored as partial entries in the regular
+    cache and reused by later reads, including from other readers.
+
+    Loading tensors requires `torch`. Raw bytes can be read with [`~HfSafetensorsReader.read_tensor_bytes`] without it.
+
+    Args:
+        repo_id (`str`):
+            A user or an organization name and a repo name separated by a `/`.
+        repo_type (`str`, *optional*):
+            Set to `"dataset"` or `"space"` if the files are in a dataset or space, `None` or `"model"` if in a model.
+        revision (`str`, *optional*):
+            The git revision to read from. Defaults to the head of the `"main"` branch.
+        token (`bool` or `str`, *optional*):
+            A valid user access token (string). Defaults to the locally saved token.
+        cache_dir (`str` or `Path`, *optional*):
+            Path to the folder where cached files are stored. Defaults to the regular cache.
+        max_workers (`int`, *optional*):
+            Maximum number of concurrent requests when loading multiple tensors. Defaults to 8.
+
+    Raises:
+        [`NotASafetensorsRepoError`]
+            If the repo doesn't have a `model.safetensors` or a `model.safetensors.index.json` file.
+
+    Example:
+    ```python
+    >>> from huggingface_hub import HfSafetensorsReader
+    >>> reader = HfSafetensorsReader("meta-llama/Llama-3.1-405B")
+    >>> reader.tensor_info("model.layers.0.mlp.up_proj.weight")
+    TensorInfo(dtype='BF16', shape=[53248, 16384], data_offsets=(...), parameter_count=872415232)
+    >>> reader.load_tensor("model.norm.weight")  # fetches 32KB
+    tensor([...], dtype=torch.bfloat16)
+    >>> reader.get_slice("model.embed_tokens.weight")[128000:128256]  # fetches 256 rows only
+    tensor([[...]], dtype=torch.bfloat16)
+    ```
+    """
+
+    def __init__(
+        self,
+        repo_id: str,
+        *,
+        repo_type: str | None = None,
+        revision: str | None = None,
+        token: bool | str | None = None,
+        cache_dir: str | Path | None = None,
+        max_workers: int = 8,
+    ):
+        self.repo_id = repo_id
+        self.repo_type = repo_type or constants.REPO_TYPE_MODEL
+        self.token = token
+        self.max_workers = max_workers
+        self._api = HfApi(token=token)
+        self._storage_folder = os.path.join(
+            str(cache_dir or constants.HF_HUB_CACHE), repo_folder_name(repo_id=repo_id, repo_type=self.repo_type)
+        )
+        self._lock = threading.Lock()
+        self._headers: dict[str, tuple[int, SafetensorsFileMetadata]] = {}  # filename -> (data offset, metadata)
+
+        if revision is not None and REGEX_COMMIT_HASH.match(revision):
+            self.commit_hash = revision
+        else:
+            commit_hash = self._api.repo_info(repo_id, repo_type=self.repo_type, revision=revision).sha
+            assert commit_hash is not None
+            self.commit_hash = commit_hash
+
+        files = self._paths_info([constants.SAFETENSORS_SINGLE_FILE, constants.SAFETENSORS_INDEX_FILE])
+        if constants.SAFETENSORS_SINGLE_FILE in files:
+            self.sharded = False
+            self.index_metadata: dict | None = None
+            self.weight_map: dict[str, str] = {}  # populated from the header below
+            self._files = {constants.SAFETENSORS_SINGLE_FILE: files[constants.SAFETENSORS_SINGLE_FILE]}
+            header = self.get_file_metadata(constants.SAFETENSORS_SINGLE_FILE)
+            self.weight_map = {name: constants.SAFETENSORS_SINGLE_FILE for name in header.tensors}
+        elif constants.SAFETENSORS_INDEX_FILE in files:
+            self.sharded = True
+            index_path = self._api.hf_hub_download(
+                repo_id,
+                constants.SAFETENSORS_INDEX_FILE,
+                repo_type=self.repo_type,
+                revision=self.commit_hash,
+                cache_dir=cache_dir,
+            )
+            with open(index_path) as f:
+                index = json.load(f)
+            self.index_metadata = index.get("metadata")
+            self.weight_map = index.get("weight_map", {})
+            self._files = self._paths_info(sorted(set(self.weight_map.values())))
+        else:
+            raise NotASafetensorsRepoError(
+                f"'{repo_id}' is not a safetensors repo. Couldn't find '{constants.SAFETENSORS_INDEX_FILE}' or"
+                f" '{constants.SAFETENSORS_SINGLE_FILE}' files."
+            )
+
+    def keys(self) -> list[str]:
+        """Return the names of all tensors in the repo."""
+        return list(self.weight_map)
+
+    def get_file_metadata(self, filename: str) -> SafetensorsFileMetadata:
+        """
+        Return the parsed header of a safetensors file of the repo, fetching it on first access.
+
+        Args:
+            filename (`str`):
+                The name of the safetensors file in the repo.
+
+        Returns:
+            [`SafetensorsFileMetadata`]: information related to the safetensors file.
+        """
+        return self._get_header(filename)[1]
+
+    def tensor_info(self, name: str) -> TensorInfo:
+        """
+        Return the dtype, shape and data offsets of a tensor.
+
+        Args:
+            name (`str`):
+                The name of the tensor.
+
+        Returns:
+            [`TensorInfo`]: information related to the tensor.
+        """
+        return self.get_file_metadata(self._filename(name)).tensors[name]
+
+    def read_tensor_bytes(self, name: str, *, start_row: int = 0, end_row: int | None = None) -> bytes:
+        """
+        Read the raw (little-endian) bytes of a tensor, or of a range of rows along its first dimension.
+
+        Args:
+            name (`str`):
+                The name of the tensor.
+            start_row (`int`, *optional*):
+                First row to read. Defaults to 0.
+            end_row (`int`, *optional*):
+                Row at which to stop reading (excluded). Defaults to the number of rows of the tensor.
+
+        Returns:
+            `bytes`: the tensor data.
+        """
+        filename = self._filename(name)
+        data_offset, metadata = self._get_header(filename)
+        info = metadata.tensors[name]
+        begin, end = info.data_offsets
+        if len(info.shape) > 0 and (start_row != 0 or end_row is not None):
+            nb_rows = info.shape[0]
+            row_size = (end - begin) // nb_rows if nb_rows > 0 else 0
+            end_row = nb_rows if end_row is None else min(end_row, nb_rows)
+            start_row = min(start_row, end_row)
+            begin, end = begin + start_row * row_size, begin + end_row * row_size
+        return self._read_range(filename, data_offset + begin, data_offset + end)
+
+    def load_tensor(self, name: str) -> "torch.Tensor":
+        """
+        Load a tensor as a `torch.Tensor`. Requires `torch`.
+
+        Args:
+            name (`str`):
+                The name of the tensor.
+
+        Returns:
+            `torch.Tensor`: the tensor, on CPU.
+        """
+        info = self.tensor_info(name)
+        return _to_torch(self.read_tensor_bytes(name), info.dtype, info.shape)
+
+    def load_tensors(self, names: list[str]) -> dict[str, "torch.Tensor"]:
+        """
+        Load multiple tensors concurrently. Requires `torch`.
+
+        Args:
+            names (`list[str]`):
+                The names of the tensors.
+
+        Returns:
+            `dict[str, torch.Tensor]`: the tensors, on CPU, in the same order as `names`.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(names, executor.map(self.load_tensor, names)))
+
+    def get_slice(self, name: str) -> "_RemoteTensorSlice":
+        """
+        Return a lazy view of a tensor, fetching only the rows needed when indexed. Requires `torch`.
+
+        Indexing along the first dimension (integer or slice) is turned into a range request for the selected rows.
+        Other dimensions are indexed in memory.
+
+        Args:
+            name (`str`):
+                The name of the tensor.
+
+        Example:
+        ```python
+        >>> view = reader.get_slice("lm_head.weight")
+        >>> view.shape
+        [128256, 16384]
+        >>> view[:10, :128]  # fetches 10 rows
+        ```
+        """
+        return _RemoteTensorSlice(self, name)
+
+    # ---------------------------------------------------------------- internals
+
+    def _filename(self, name: str) -> str:
+        try:
+            return self.weight_map[name]
+        except KeyError:
+            raise KeyError(f"Tensor '{name}' not found in '{self.repo_id}'.") from None
+
+    def _paths_info(self, paths: list[str]) -> dict[str, _RemoteFile]:
+        files = {}
+        for entry in self._api.get_paths_info(
+            self.repo_id, paths, revision=self.commit_hash, repo_type=self.repo_type, token=self.token
+        ):
+            if isinstance(entry, RepoFile):
+                # Same etag as the one used by `hf_hub_download` to name blobs
+                etag = entry.lfs.sha256 if entry.lfs is not None else entry.blob_id
+                files[entry.path] = _RemoteFile(filename=entry.path, etag=etag, size=entry.size)
+        return files
+
+    def _get_header(self, filename: str) -> tuple[int, SafetensorsFileMetadata]:
+        with self._lock:
+            header = self._headers.get(filename)
+        if header is None:
+            context_msg = f"repo '{self.repo_id}', revision '{self.commit_hash}'"
+            size = self._files[filename].size
+            sample = self._read_range(filename, 0, min(_HEADER_SAMPLE_SIZE, size))
+            metadata_size = _get_safetensors_metadata_size(sample[:8], filename, context_msg)
+            if 8 + metadata_size <= len(sample):
+                metadata_as_bytes = sample[8 : 8 + metadata_size]
+            else:
+                metadata_as_bytes = sample[8:] + self._read_range(filename, len(sample), 8 + metadata_size)
+            header = (8 + metadata_size, _parse_safetensors_header(metadata_as_bytes, filename, context_msg))
+            with self._lock:
+                self._headers[filename] = header
+        return header
+
+    def _read_range(self, filename: str, start: int, end: int) -> bytes:
+        """Read bytes [start, end) of a file, from the cache when possible."""
+        if end <= start:
+            return b""
+        file = self._files[filename]
+
+        # File already fully downloaded (e.g. by `hf_hub_download`)
+        blob_path = os.path.join(self._storage_folder, "blobs", file.etag)
+        if os.path.isfile(blob_path):
+            with open(blob_path, "rb") as f:
+                f.seek(start)
+                return f.read(end - start)
+
+        partial_dir = os.path.join(self._storage_folder, "blobs", f"{file.etag}.partial")
+        entries = _list_partial_entries(partial_dir)
+        out = bytearray()
+        pos = start
+        while pos < end:
+            covering = [entry for entry in entries if entry[0] <= pos < entry[1]]
+            if len(covering) > 0:
+                entry_start, entry_end = max(covering, key=lambda entry: entry[1])
+                stop = min(entry_end, end)
+                with open(os.path.join(partial_dir, f"{entry_start}-{entry_end}"), "rb") as f:
+                    f.seek(pos - entry_start)
+                    out += f.read(stop - pos)
+            else:
+                # Fetch the whole gap until the next cached entry with a single request
+                stop = min([entry[0] for entry in entries if pos < entry[0] < end], default=end)
+                data = self._fetch_range(filename, pos, stop)
+                _write_partial_entry(partial_dir, pos, stop, data)
+                out += data
+            pos = stop
+        return bytes(out)
+
+    def _fetch_range(self, filename: str, start: int, end: int) -> bytes:
+        url = hf_hub_url(
+            self.repo_id, filename, repo_type=self.repo_type, revision=self.commit_hash, endpoint=self._api.endpoint
+        )
+        response = http_backoff(
+            "GET",
+            url,
+            headers={**self._api._build_hf_headers(token=self.token), "range": f"bytes={start}-{end - 1}"},
+            timeout=constants.HF_HUB_DOWNLOAD_TIMEOUT,
+        )
+        hf_raise_for_status(response)
+        if len(response.content) != end - start:
+            raise ValueError(
+                f"Unexpected response when fetching bytes {start}-{end - 1} of '{filename}' in '{self.repo_id}': "
+                f"expected {end - start} bytes, got {len(response.content)}."
+            )
+        return response.content
+
+
+class _RemoteTensorSlice:
+    """Lazy view of a remote tensor. Indexing along the first dimension only fetches the selected rows."""
+
+    def __init__(self, reader: HfSafetensorsReader, name: str):
+        self.reader = reader
+        self.name = name
+        info = reader.tensor_info(name)
+        self.dtype = info.dtype
+        self.shape = info.shape
+
+    def __getitem__(self, index: Any) -> "torch.Tensor":
+        first, rest = (index[0], index[1:]) if isinstance(index, tuple) and len(index) > 0 else (index, ())
+        if len(self.shape) == 0 or not isinstance(first, (int, slice)):
+            # Scalars and advanced indexing (ellipsis, lists...): load everything, index in memory
+            return self.reader.load_tensor(self.name)[index]
+
+        nb_rows = self.shape[0]
+        if isinstance(first, int):
+            row = first + nb_rows if first < 0 else first
+            if not 0 <= row < nb_rows:
+                raise IndexError(f"Index {first} is out of bounds for dimension 0 with size {nb_rows}.")
+            rows = self._load_rows(row, row + 1)
+            return rows[(0, *rest)]
+
+        selected = range(*first.indices(nb_rows))
+        if len(selected) == 0:
+            return self._load_rows(0, 0)[(slice(None), *rest)]
+        low, high = min(selected), max(selected) + 1
+        rows = self._load_rows(low, high)
+        if selected.step != 1:
+            import torch
+
+            rows = rows[torch.tensor([row - low for row in selected])]
+        return rows[(slice(None), *rest)]
+
+    def _load_rows(self, start_row: int, end_row: int) -> "torch.Tensor":
+        data = self.reader.read_tensor_bytes(self.name, start_row=start_row, end_row=end_row)
+        return _to_torch(data, self.dtype, [end_row - start_row, *self.shape[1:]])
+
+
+def _list_partial_entries(partial_dir: str) -> list[tuple[int, int]]:
+    """List the byte ranges cached in a `<etag>.partial` folder."""
+    entries = []
+    try:
+        with os.scandir(partial_dir) as it:
+            for entry in it:
+                start, sep, end = entry.name.partition("-")
+                if sep and start.isdigit() and end.isdigit():
+                    entries.append((int(start), int(end)))
+    except FileNotFoundError:
+        pass
+    return sorted(entries)
+
+
+def _write_partial_entry(partial_dir: str, start: int, end: int, data: bytes) -> None:
+    """Store a fetched range in the cache. Failures are not fatal: the range will be fetched again next time."""
+    tmp_path = None
+    try:
+        os.makedirs(partial_dir, exist_ok=True)
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=partial_dir, suffix=".tmp")
+        with os.fdopen(tmp_fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, os.path.join(partial_dir, f"{start}-{end}"))
+    except OSError as e:
+        logger.warning(f"Ignored error while caching range {start}-{end} in {partial_dir}: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _to_torch(data: bytes, dtype: str, shape: list[int]) -> "torch.Tensor":
+    try:
+        import torch
+    except ImportError as e:
+        raise ImportError("Loading tensors requires `torch`. Please install it with `pip install torch`.") from e
+    torch_dtype = getattr(torch, SAFETENSORS_TORCH_DTYPES[dtype])
+    if len(data) == 0:
+        return torch.empty(shape, dtype=torch_dtype)
+    return torch.frombuffer(bytearray(data), dtype=torch_dtype).reshape(shape)
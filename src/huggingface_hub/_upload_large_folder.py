@@ -29,7 +29,7 @@ from urllib.parse import quote
 from ._commit_api import CommitOperationAdd, UploadInfo, _fetch_upload_modes
 from ._local_folder import LocalUploadFileMetadata, LocalUploadFilePaths, get_local_upload_paths, read_upload_metadata
 from .constants import DEFAULT_REVISION, REPO_TYPES
-from .utils import DEFAULT_IGNORE_PATTERNS, _format_size, filter_repo_objects, tqdm
+from .utils import DEFAULT_IGNORE_PATTERNS, _format_size, filter_repo_objects, tqdm, walk_local_files
 from .utils._runtime import is_xet_available
 from .utils.sha import sha_fileobj
 
@@ -225,7 +225,7 @@ def upload_large_folder_internal(
 
     # 3. List files to upload
     filtered_paths_list = filter_repo_objects(
-        (path.relative_to(folder_path).as_posix() for path in folder_path.glob("**/*") if path.is_file()),
+        (relpath for relpath, _ in walk_local_files(folder_path)),
         allow_patterns=allow_patterns,
         ignore_patterns=ignore_patterns,
     )
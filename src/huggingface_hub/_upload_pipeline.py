@@ -17,7 +17,9 @@
 How it works:
 
 - The **coordinator** (caller's thread) walks the list of files and asks the Hub, 256 files at a
-  time, what each file is (regular git blob, xet file, ignored). Regular files are accumulated
+  time, what each file is (regular git blob, xet file, ignored). Operations can also be streamed
+  from a lazy iterable (e.g. files written while the upload is running): each one is then
+  preuploaded as soon as it is produced. Regular files are accumulated
   directly; xet files are registered into a `XetSession` upload-commit, which chunks, deduplicates,
   retries and uploads them in the background while the coordinator keeps going. No Python-side
   sha256 computation: `hf_xet` computes it during chunking (single read pass over each file).
@@ -35,6 +37,7 @@ import shutil
 import sys
 import threading
 import time
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import quote
 
@@ -119,8 +122,10 @@ class _LiveDisplay:
 
     _N_LINES = 3
 
-    def __init__(self, total_files: int, enabled: bool = True) -> None:
-        self._total = total_files
+    def __init__(self, total_files: int | None, enabled: bool = True) -> None:
+        # Unknown total (streamed operations): the total grows with the number of prepared files.
+        self._total = total_files or 0
+        self._total_known = total_files is not None
         self._tty = enabled and sys.stderr.isatty()
         self._active = self._tty or logger.isEnabledFor(logging.INFO)
         self._lock = threading.Lock()
@@ -147,11 +152,14 @@ class _LiveDisplay:
     def start(self) -> None:
         if not self._active:
             return
+        message = (
+            f"Found {self._total:,} files to upload" if self._total_known else "Uploading files as they are produced"
+        )
         if self._tty:
-            sys.stderr.write(f"Found {self._total:,} files to upload\n")
+            sys.stderr.write(f"{message}\n")
             sys.stderr.flush()
         else:
-            logger.info(f"Found {self._total:,} files to upload")
+            logger.info(message)
         self._thread = threading.Thread(target=self._render_loop, name="hf-upload-display", daemon=True)
         self._thread.start()
 
@@ -168,6 +176,8 @@ class _LiveDisplay:
     def notify_prepared(self, n: int) -> None:
         with self._lock:
             self._prepared += n
+            if not self._total_known:
+                self._total = self._prepared
 
     def notify_ignored(self, n: int) -> None:
         with self._lock:
@@ -316,7 +326,7 @@ class _UploadPipeline:
         *,
         repo_id: str,
         repo_type: str,
-        add_operations: list[CommitOperationAdd],
+        add_operations: Iterable[CommitOperationAdd],
         delete_operations: list[CommitOperationDelete],
         commit_message: str,
         commit_description: str | None,
@@ -324,11 +334,14 @@ class _UploadPipeline:
         revision: str | None,
         create_pr: bool,
         parent_commit: str | None,
+        total_files: int | None = None,
     ) -> None:
         self.api = api
         self.repo_id = repo_id
         self.repo_type = repo_type
         self.add_operations = add_operations
+        if total_files is None and isinstance(add_operations, list):
+            total_files = len(add_operations)
         self.delete_operations = delete_operations
         self.commit_message = commit_message
         self.commit_description = commit_description
@@ -355,7 +368,7 @@ class _UploadPipeline:
         self.batch_queue: queue.Queue = queue.Queue(maxsize=1)
         self.errors: list[BaseException] = []
         self.abort_event = threading.Event()
-        self.display = _LiveDisplay(total_files=len(add_operations), enabled=not are_progress_bars_disabled())
+        self.display = _LiveDisplay(total_files=total_files, enabled=not are_progress_bars_disabled())
 
         # All xet uploads share the same token refresh URL. With `create_pr`, the final ref is not
         # known in advance: `?create_pr=1` makes the server grant a token valid for PR refs.
@@ -376,15 +389,17 @@ class _UploadPipeline:
         }
 
         # `.gitignore` rules are enforced server-side: forward the local one if it's being uploaded.
+        # Not possible for streamed operations as they are not known in advance.
         self.gitignore_content: str | None = None
-        for op in add_operations:
+        for op in add_operations if isinstance(add_operations, list) else []:
             if op.path_in_repo == ".gitignore":
                 with op.as_file() as f:
                     self.gitignore_content = f.read().decode()
                 break
 
     def run(self) -> "CommitInfo":
-        _warn_on_overwriting_operations([*self.delete_operations, *self.add_operations])
+        if isinstance(self.add_operations, list):
+            _warn_on_overwriting_operations([*self.delete_operations, *self.add_operations])
         committer = threading.Thread(target=self._committer_loop, name="hf-upload-committer", daemon=True)
         committer.start()
         self.display.start()
@@ -420,11 +435,10 @@ class _UploadPipeline:
         import hf_xet
 
         batch = _Batch()
-        for start in range(0, len(self.add_operations), PREUPLOAD_BATCH_SIZE):
+        for chunk in self._iter_chunks():
             if self.abort_event.is_set():
                 self._abort_batch(batch)
                 return
-            chunk = self.add_operations[start : start + PREUPLOAD_BATCH_SIZE]
             try:
                 _fetch_upload_modes(
                     additions=chunk,
@@ -476,6 +490,16 @@ class _UploadPipeline:
                     batch = _Batch()
         self._enqueue(batch)
 
+    def _iter_chunks(self) -> Iterator[list[CommitOperationAdd]]:
+        if isinstance(self.add_operations, list):
+            for start in range(0, len(self.add_operations), PREUPLOAD_BATCH_SIZE):
+                yield self.add_operations[start : start + PREUPLOAD_BATCH_SIZE]
+        else:
+            # Streamed operations are preuploaded one by one: each file starts uploading as soon as it is
+            # produced instead of waiting for a full chunk (e.g. while the next shards are still being written).
+            for op in self.add_operations:
+                yield [op]
+
     def _enqueue(self, batch: _Batch) -> None:
         if len(batch.ops) == 0 and not (self.nb_commits == 0 and len(self.delete_operations) > 0):
             return
@@ -655,7 +679,7 @@ def pipelined_upload(
     *,
     repo_id: str,
     repo_type: str,
-    add_operations: list[CommitOperationAdd],
+    add_operations: Iterable[CommitOperationAdd],
     delete_operations: list[CommitOperationDelete],
     commit_message: str,
     commit_description: str | None = None,
@@ -663,9 +687,13 @@ def pipelined_upload(
     revision: str | None = None,
     create_pr: bool = False,
     parent_commit: str | None = None,
+    total_files: int | None = None,
 ) -> "CommitInfo":
     """Upload a prepared list of operations through the streamed multi-commit pipeline.
 
+    `add_operations` can also be a lazy iterable, consumed while the upload is running. In that case, `total_files`
+    can be passed to report progress against a known total.
+
     Requires `hf_xet` to be installed. See module docstring for the architecture.
     """
 
@@ -681,4 +709,5 @@ def pipelined_upload(
         revision=revision,
         create_pr=create_pr,
         parent_commit=parent_commit,
+        total_files=total_files,
     ).run()
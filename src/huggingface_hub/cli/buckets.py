@@ -531,6 +531,8 @@ def move(
         "hf buckets sync ./data hf://buckets/user/my-bucket",
         "hf buckets sync hf://buckets/user/my-bucket ./data",
         "hf buckets sync ./data hf://buckets/user/my-bucket --delete",
+        "hf buckets sync ./data hf://buckets/user/my-bucket --checksum",
+        "hf buckets sync ./outputs hf://buckets/user/my-bucket --watch",
         'hf buckets sync hf://buckets/user/my-bucket ./data --include "*.safetensors" --exclude "*.tmp"',
         "hf buckets sync ./data hf://buckets/user/my-bucket --plan sync-plan.jsonl",
         "hf buckets sync --apply sync-plan.jsonl",
@@ -571,6 +573,13 @@ def sync(
             help="Skip files only based on modification times, ignoring sizes.",
         ),
     ] = False,
+    checksum: Annotated[
+        bool,
+        Option(
+            "--checksum",
+            help="Compare files by content hash instead of modification time (local hashes are cached).",
+        ),
+    ] = False,
     plan: Annotated[
         str | None,
         Option(
@@ -622,6 +631,19 @@ def sync(
             help="Skip updating files that exist on receiver (only create new files).",
         ),
     ] = False,
+    watch: Annotated[
+        bool,
+        Option(
+            "--watch",
+            help="After syncing, keep watching the local directory and push changes until interrupted.",
+        ),
+    ] = False,
+    watch_interval: Annotated[
+        float,
+        Option(
+            help="Seconds between two checks of the local directory in --watch mode.",
+        ),
+    ] = 10,
     verbose: Annotated[
         bool,
         Option(
@@ -640,6 +662,7 @@ def sync(
         delete=delete,
         ignore_times=ignore_times,
         ignore_sizes=ignore_sizes,
+        checksum=checksum,
         existing=existing,
         ignore_existing=ignore_existing,
         include=include,
@@ -650,6 +673,8 @@ def sync(
         dry_run=dry_run,
         verbose=verbose,
         quiet=out.is_quiet(),
+        watch=watch,
+        watch_interval=watch_interval,
     )
     if plan and not out.is_quiet():
         out.hint(f"Run `hf buckets sync --apply {plan}` to execute this plan.")
@@ -14,6 +14,7 @@
 """Contains the 'hf cache' command group with cache management subcommands."""
 
 import re
+import shutil
 import time
 from collections import defaultdict
 from collections.abc import Callable, Mapping
@@ -690,7 +691,10 @@ def prune(
     strategy.execute()
     for incomplete_file in incomplete_files:
         try:
-            incomplete_file.file_path.unlink()
+            if incomplete_file.file_path.is_dir():
+                shutil.rmtree(incomplete_file.file_path)  # `.partial` folder of cached byte ranges
+            else:
+                incomplete_file.file_path.unlink()
         except FileNotFoundError:
             pass  # already removed (e.g. by a full-repo deletion above)
         except OSError as exc:
@@ -189,6 +189,15 @@ HF_ASSETS_CACHE = os.path.expandvars(
     )
 )
 
+HF_BUCKETS_CACHE = os.path.expandvars(
+    os.path.expanduser(
+        os.getenv(
+            "HF_BUCKETS_CACHE",
+            os.path.join(HF_HOME, "buckets"),
+        )
+    )
+)
+
 HF_HUB_OFFLINE = _is_true(os.environ.get("HF_HUB_OFFLINE") or os.environ.get("TRANSFORMERS_OFFLINE"))
 
 
@@ -310,6 +319,43 @@ HF_HUB_ETAG_TIMEOUT: int = _as_int(os.environ.get("HF_HUB_ETAG_TIMEOUT")) or DEF
 # Also used as a default timeout for other requests if not specified (kept the naming for legacy reasons)
 HF_HUB_DOWNLOAD_TIMEOUT: int = _as_int(os.environ.get("HF_HUB_DOWNLOAD_TIMEOUT")) or DEFAULT_DOWNLOAD_TIMEOUT
 
+# Connection pool limits of the HTTP clients (defaults are the ones from httpx)
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HF_HUB_HTTP_MAX_CONNECTIONS: int = (
+    _as_int(os.environ.get("HF_HUB_HTTP_MAX_CONNECTIONS")) or DEFAULT_HTTP_MAX_CONNECTIONS
+)
+HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = (
+    _as_int(os.environ.get("HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS")) or DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS
+)
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 5.0
+HF_HUB_HTTP_KEEPALIVE_EXPIRY: float = float(
+    os.environ.get("HF_HUB_HTTP_KEEPALIVE_EXPIRY") or DEFAULT_HTTP_KEEPALIVE_EXPIRY
+)
+
+# Use HTTP/2 for requests to the Hub API (requires the `h2` package: `pip install httpx[http2]`)
+HF_HUB_ENABLE_HTTP2: bool = _is_true(os.environ.get("HF_HUB_ENABLE_HTTP2"))
+
+# Share a single response between identical metadata requests (`model_info`, `list_repo_refs`, `get_hf_file_metadata`,
+# ...) made concurrently from several threads
+HF_HUB_COALESCE_REQUESTS: bool = _is_true(os.environ.get("HF_HUB_COALESCE_REQUESTS"))
+
+# Opt-in cache of Hub API responses (`model_info`, `list_repo_refs`, ...), revalidated with conditional requests
+HF_HUB_ENABLE_API_CACHE: bool = _is_true(os.environ.get("HF_HUB_ENABLE_API_CACHE"))
+HF_HUB_API_CACHE = os.path.expandvars(
+    os.path.expanduser(
+        os.getenv(
+            "HF_HUB_API_CACHE",
+            os.path.join(HF_HOME, "api"),
+        )
+    )
+)
+DEFAULT_API_CACHE_MAX_SIZE = 100 * 1024 * 1024  # 100MB
+HF_HUB_API_CACHE_MAX_SIZE: int = _as_int(os.environ.get("HF_HUB_API_CACHE_MAX_SIZE")) or DEFAULT_API_CACHE_MAX_SIZE
+
+# Throttle requests to the Hub ahead of time to stay under the rate limits advertised in the `RateLimit` headers
+HF_HUB_ENABLE_RATE_LIMIT_GOVERNOR: bool = _is_true(os.environ.get("HF_HUB_ENABLE_RATE_LIMIT_GOVERNOR"))
+
 # Allows to add information about the requester in the user-agent (e.g. partner name)
 HF_HUB_USER_AGENT_ORIGIN: str | None = os.environ.get("HF_HUB_USER_AGENT_ORIGIN")
 
@@ -50,6 +50,7 @@ from .utils._http import (
     _DEFAULT_RETRY_ON_EXCEPTIONS,
     _DEFAULT_RETRY_ON_STATUS_CODES,
     _adjust_range_header,
+    _coalesce_request,
     _httpx_follow_relative_redirects_with_backoff,
     http_stream_backoff,
 )
@@ -1251,6 +1252,8 @@ def _hf_hub_download_to_cache_dir(
             xet_file_data=xet_file_data,
             tqdm_class=tqdm_class,
         )
+        # Byte ranges cached by `HfSafetensorsReader` are superseded by the full blob
+        shutil.rmtree(blob_path + ".partial", ignore_errors=True)
         if not os.path.exists(pointer_path):
             _create_symlink(blob_path, pointer_path, new_blob=True)
 
@@ -1618,8 +1621,13 @@ def get_hf_file_metadata(
     hf_headers["Accept-Encoding"] = "identity"  # prevent any compression => we want to know the real size of the file
 
     # Retrieve metadata
-    response = _httpx_follow_relative_redirects_with_backoff(
-        method="HEAD", url=url, headers=hf_headers, timeout=timeout, retry_on_errors=retry_on_errors
+    response = _coalesce_request(
+        "HEAD",
+        url,
+        lambda: _httpx_follow_relative_redirects_with_backoff(
+            method="HEAD", url=url, headers=hf_headers, timeout=timeout, retry_on_errors=retry_on_errors
+        ),
+        headers=hf_headers,
     )
     hf_raise_for_status(response)
 
@@ -37,6 +37,7 @@ import httpx
 from tqdm.auto import tqdm as base_tqdm
 
 from . import constants
+from ._api_response_cache import fetch_with_api_cache
 from ._buckets import (
     BucketFile,
     BucketFileMetadata,
@@ -87,6 +88,7 @@ from ._jobs_api import (
     _derive_job_volume_name,
 )
 from ._revision import ResolvedRevision
+from ._safetensors_metadata_cache import read_safetensors_metadata_cache, write_safetensors_metadata_cache
 from ._space_api import (
     INTERMEDIATE_SPACE_STAGES,
     SpaceHardware,
@@ -158,11 +160,12 @@ from .utils import (
     parse_xet_file_data_from_response,
     silent_tqdm,
     validate_hf_hub_args,
+    walk_local_files,
 )
 from .utils import tqdm as hf_tqdm
 from .utils._auth import _get_token_from_environment, _get_token_from_file, _get_token_from_google_colab
 from .utils._deprecation import _deprecate_arguments, _deprecate_method
-from .utils._http import _httpx_follow_relative_redirects_with_backoff
+from .utils._http import _coalesce_request, _httpx_follow_relative_redirects_with_backoff
 from .utils._runtime import is_xet_available
 from .utils._typing import CallableT
 from .utils._verification import collect_local_files, resolve_local_root, verify_maps
@@ -3331,10 +3334,9 @@ class HfApi:
             params["blobs"] = True
         if expand:
             params["expand"] = expand
-        r = get_session().get(path, headers=headers, timeout=timeout, params=params)
-        hf_raise_for_status(r)
-        data = r.json()
-        return ModelInfo(**data)
+        return self._get_api_object(
+            path, lambda r: ModelInfo(**r.json()), headers=headers, params=params, timeout=timeout
+        )
 
     @validate_hf_hub_args
     def dataset_info(
@@ -3401,10 +3403,9 @@ class HfApi:
         if expand:
             params["expand"] = expand
 
-        r = get_session().get(path, headers=headers, timeout=timeout, params=params)
-        hf_raise_for_status(r)
-        data = r.json()
-        return DatasetInfo(**data)
+        return self._get_api_object(
+            path, lambda r: DatasetInfo(**r.json()), headers=headers, params=params, timeout=timeout
+        )
 
     @validate_hf_hub_args
     def get_dataset_leaderboard(
@@ -3541,7 +3542,13 @@ class HfApi:
         if expand:
             params["expand"] = expand
 
-        r = get_session().get(path, headers=headers, timeout=timeout, params=params)
+        r = _coalesce_request(
+            "GET",
+            path,
+            lambda: get_session().get(path, headers=headers, timeout=timeout, params=params),
+            headers=headers,
+            params=params,
+        )
         hf_raise_for_status(r)
         data = r.json()
         return SpaceInfo(**data)
@@ -3581,7 +3588,9 @@ class HfApi:
             if revision is None
             else (f"{self.endpoint}/api/kernels/{repo_id}/revision/{quote(revision, safe='')}")
         )
-        r = get_session().get(path, headers=headers, timeout=timeout)
+        r = _coalesce_request(
+            "GET", path, lambda: get_session().get(path, headers=headers, timeout=timeout), headers=headers
+        )
         hf_raise_for_status(r)
         data = r.json()
         return KernelInfo(**data)
@@ -4226,24 +4235,26 @@ class HfApi:
             repo on the Hub.
         """
         repo_type = repo_type or constants.REPO_TYPE_MODEL
-        response = get_session().get(
-            f"{self.endpoint}/api/{repo_type}s/{repo_id}/refs",
-            headers=self._build_hf_headers(token=token),
-            params={"include_prs": 1} if include_pull_requests else {},
-        )
-        hf_raise_for_status(response)
-        data = response.json()
 
         def _format_as_git_ref_info(item: dict) -> GitRefInfo:
             return GitRefInfo(name=item["name"], ref=item["ref"], target_commit=item["targetCommit"])
 
-        return GitRefs(
-            branches=[_format_as_git_ref_info(item) for item in data["branches"]],
-            converts=[_format_as_git_ref_info(item) for item in data["converts"]],
-            tags=[_format_as_git_ref_info(item) for item in data["tags"]],
-            pull_requests=[_format_as_git_ref_info(item) for item in data["pullRequests"]]
-            if include_pull_requests
-            else None,
+        def _parse(response: httpx.Response) -> GitRefs:
+            data = response.json()
+            return GitRefs(
+                branches=[_format_as_git_ref_info(item) for item in data["branches"]],
+                converts=[_format_as_git_ref_info(item) for item in data["converts"]],
+                tags=[_format_as_git_ref_info(item) for item in data["tags"]],
+                pull_requests=[_format_as_git_ref_info(item) for item in data["pullRequests"]]
+                if include_pull_requests
+                else None,
+            )
+
+        return self._get_api_object(
+            f"{self.endpoint}/api/{repo_type}s/{repo_id}/refs",
+            _parse,
+            headers=self._build_hf_headers(token=token),
+            params={"include_prs": 1} if include_pull_requests else {},
         )
 
     @validate_hf_hub_args
@@ -4314,23 +4325,36 @@ class HfApi:
         repo_type = repo_type or constants.REPO_TYPE_MODEL
         revision = quote(revision, safe="") if revision is not None else constants.DEFAULT_REVISION
 
-        # Paginate over results and return the list of commits.
-        return [
-            GitCommitInfo(
-                commit_id=item["id"],
-                authors=[author["user"] for author in item["authors"]],
-                created_at=parse_datetime(item["date"]),
-                title=item["title"],
-                message=item["message"],
-                formatted_title=item.get("formatted", {}).get("title"),
-                formatted_message=item.get("formatted", {}).get("message"),
-            )
-            for item in paginate(
-                f"{self.endpoint}/api/{repo_type}s/{repo_id}/commits/{revision}",
-                headers=self._build_hf_headers(token=token),
-                params={"expand[]": "formatted"} if formatted else {},
-            )
-        ]
+        headers = self._build_hf_headers(token=token)
+
+        def _parse_page(response: httpx.Response) -> tuple[list[GitCommitInfo], str | None]:
+            commits = [
+                GitCommitInfo(
+                    commit_id=item["id"],
+                    authors=[author["user"] for author in item["authors"]],
+                    created_at=parse_datetime(item["date"]),
+                    title=item["title"],
+                    message=item["message"],
+                    formatted_title=item.get("formatted", {}).get("title"),
+                    formatted_message=item.get("formatted", {}).get("message"),
+                )
+                for item in response.json()
+            ]
+            return commits, response.links.get("next", {}).get("url")
+
+        # Paginate over results and return the list of commits. Each page is cached separately.
+        commits, next_page = self._get_api_object(
+            f"{self.endpoint}/api/{repo_type}s/{repo_id}/commits/{revision}",
+            _parse_page,
+            headers=headers,
+            params={"expand[]": "formatted"} if formatted else {},
+        )
+        commits = list(commits)
+        while next_page is not None:
+            logger.debug(f"Pagination detected. Requesting next page: {next_page}")
+            page, next_page = self._get_api_object(next_page, _parse_page, headers=headers, with_backoff=True)
+            commits.extend(page)
+        return commits
 
     @validate_hf_hub_args
     def get_paths_info(
@@ -6841,6 +6865,8 @@ class HfApi:
         revision: str | None = None,
         token: bool | str | None = None,
         timeout: float | None = constants.HF_HUB_DOWNLOAD_TIMEOUT,
+        cache_dir: str | Path | None = None,
+        use_cache: bool = True,
     ) -> SafetensorsRepoMetadata:
         """
         Parse metadata for a safetensors repo on the Hub.
@@ -6871,6 +6897,13 @@ class HfApi:
                 How many seconds to wait for the server to send data before giving up, passed to each request that
                 fetches a safetensors file header. Set to `None` to disable the timeout (not recommended, as a stalled
                 connection can hang the call indefinitely).
+            cache_dir (`str`, `Path`, *optional*):
+                Path to the folder where cached files are stored. Defaults to the value of `HF_HUB_CACHE`.
+            use_cache (`bool`, *optional*, defaults to `True`):
+                Whether to cache the parsed metadata. The revision is resolved to a commit hash and the metadata is
+                stored under `<cache_dir>/<repo_folder>/safetensors/<commit_hash>.json`, and in an in-memory LRU. Since
+                a commit is immutable, later calls for the same commit are served from the cache without fetching any
+                file header. Set to `False` to always fetch the metadata from the Hub.
 
         Returns:
             [`SafetensorsRepoMetadata`]: information related to safetensors repo.
@@ -6909,6 +6942,160 @@ class HfApi:
             NotASafetensorsRepoError: 'runwayml/stable-diffusion-v1-5' is not a safetensors repo. Couldn't find 'model.safetensors.index.json' or 'model.safetensors' files.
             ```
         """
+        return self._get_safetensors_metadata(
+            repo_id,
+            repo_type=repo_type,
+            revision=revision,
+            token=token,
+            timeout=timeout,
+            cache_dir=cache_dir,
+            use_cache=use_cache,
+        )
+
+    def get_safetensors_metadata_bulk(
+        self,
+        repo_ids: Iterable[str],
+        *,
+        repo_type: str | None = None,
+        revision: str | None = None,
+        token: bool | str | None = None,
+        timeout: float | None = constants.HF_HUB_DOWNLOAD_TIMEOUT,
+        cache_dir: str | Path | None = None,
+        use_cache: bool = True,
+        max_workers: int = 8,
+    ) -> dict[str, SafetensorsRepoMetadata | Exception]:
+        """
+        Parse metadata for many safetensors repos on the Hub, concurrently.
+
+        This is the bulk version of [`get_safetensors_metadata`], meant for services that inspect a large number of
+        repos. Repos are processed in parallel and share the same cache: repos whose metadata is already cached for
+        the resolved commit only cost a revision lookup.
+
+        A failure on one repo (e.g. it is not a safetensors repo, or it is gated) does not interrupt the others: the
+        exception is returned in place of the metadata for this repo.
+
+        Args:
+            repo_ids (`Iterable[str]`):
+                The repos to parse, as `namespace/name` strings. Duplicates are processed once.
+            repo_type (`str`, *optional*):
+                Set to `"dataset"` or `"space"` if the repos are datasets or spaces, `None` or `"model"` if they are
+                models. Default is `None`.
+            revision (`str`, *optional*):
+                The git revision to fetch the metadata from, for all repos. Defaults to the head of the `"main"`
+                branch.
+            token (`bool` or `str`, *optional*):
+                A valid user access token (string). Defaults to the locally saved
+                token, which is the recommended method for authentication (see
+                https://huggingface.co/docs/huggingface_hub/quick-start#authentication).
+                To disable authentication, pass `False`.
+            timeout (`float`, *optional*, defaults to 10):
+                How many seconds to wait for the server to send data before giving up, passed to each request that
+                fetches a safetensors file header.
+            cache_dir (`str`, `Path`, *optional*):
+                Path to the folder where cached files are stored. Defaults to the value of `HF_HUB_CACHE`.
+            use_cache (`bool`, *optional*, defaults to `True`):
+                Whether to read and write the safetensors metadata cache. See [`get_safetensors_metadata`].
+            max_workers (`int`, *optional*, defaults to 8):
+                Number of repos processed concurrently.
+
+        Returns:
+            `dict[str, SafetensorsRepoMetadata | Exception]`: a mapping from each repo id to its
+            [`SafetensorsRepoMetadata`], or to the exception raised while fetching it.
+
+        Example:
+            ```py
+            >>> from huggingface_hub import get_safetensors_metadata_bulk
+            >>> results = get_safetensors_metadata_bulk(["openai-community/gpt2", "bigscience/bloom"])
+            >>> {repo_id: sum(m.parameter_count.values()) for repo_id, m in results.items() if not isinstance(m, Exception)}
+            {'openai-community/gpt2': 137022720, 'bigscience/bloom': 176247271424}
+            ```
+        """
+        if max_workers < 1:
+            raise ValueError(f"`max_workers` must be a positive integer, got {max_workers}.")
+
+        def _get(repo_id: str) -> SafetensorsRepoMetadata | Exception:
+            try:
+                return self._get_safetensors_metadata(
+                    repo_id,
+                    repo_type=repo_type,
+                    revision=revision,
+                    token=token,
+                    timeout=timeout,
+                    cache_dir=cache_dir,
+                    use_cache=use_cache,
+                    show_progress=False,  # a single progress bar for all repos
+                )
+            except Exception as e:
+                return e
+
+        unique_repo_ids = list(dict.fromkeys(repo_ids))
+        results = hf_thread_map(
+            _get,
+            unique_repo_ids,
+            max_workers=max_workers,
+            desc="Get safetensors metadata",
+            tqdm_class=hf_tqdm,
+        )
+        return dict(zip(unique_repo_ids, results))
+
+    def _get_safetensors_metadata(
+        self,
+        repo_id: str,
+        *,
+        repo_type: str | None,
+        revision: str | None,
+        token: bool | str | None,
+        timeout: float | None,
+        cache_dir: str | Path | None,
+        use_cache: bool,
+        show_progress: bool = True,
+    ) -> SafetensorsRepoMetadata:
+        if not use_cache:
+            return self._fetch_safetensors_metadata(
+                repo_id,
+                repo_type=repo_type,
+                revision=revision,
+                token=token,
+                timeout=timeout,
+                cache_dir=cache_dir,
+                show_progress=show_progress,
+            )
+
+        commit_hash = self.resolve_revision(
+            repo_id, repo_type=repo_type, revision=revision, cache_dir=cache_dir, token=token
+        ).resolved
+        storage_folder = str(
+            Path(cache_dir or constants.HF_HUB_CACHE).expanduser().resolve()
+            / repo_folder_name(repo_id=repo_id, repo_type=repo_type or constants.REPO_TYPE_MODEL)
+        )
+        cached = read_safetensors_metadata_cache(storage_folder, commit_hash)
+        if cached is not None:
+            return cached
+
+        metadata = self._fetch_safetensors_metadata(
+            repo_id,
+            repo_type=repo_type,
+            revision=commit_hash,
+            token=token,
+            timeout=timeout,
+            cache_dir=cache_dir,
+            show_progress=show_progress,
+        )
+        write_safetensors_metadata_cache(storage_folder, commit_hash, metadata)
+        return metadata
+
+    def _fetch_safetensors_metadata(
+        self,
+        repo_id: str,
+        *,
+        repo_type: str | None,
+        revision: str | None,
+        token: bool | str | None,
+        timeout: float | None,
+        cache_dir: str | Path | None,
+        show_progress: bool = True,
+    ) -> SafetensorsRepoMetadata:
+        """Fetch safetensors metadata from the Hub, bypassing the metadata cache."""
         if self.file_exists(  # Single safetensors file => non-sharded model
             repo_id=repo_id,
             filename=constants.SAFETENSORS_SINGLE_FILE,
@@ -6946,6 +7133,7 @@ class HfApi:
                 repo_type=repo_type,
                 revision=revision,
                 token=token,
+                cache_dir=cache_dir,
             )
             with open(index_file) as f:
                 index = json.load(f)
@@ -6970,6 +7158,7 @@ class HfApi:
                 set(weight_map.values()),
                 desc="Parse safetensors files",
                 tqdm_class=hf_tqdm,
+                disable=not show_progress,
             )
 
             return SafetensorsRepoMetadata(
@@ -10227,11 +10416,11 @@ class HfApi:
         )
         ```
         """
-        r = get_session().get(
-            f"{self.endpoint}/api/collections/{collection_slug}", headers=self._build_hf_headers(token=token)
+        return self._get_api_object(
+            f"{self.endpoint}/api/collections/{collection_slug}",
+            lambda r: Collection(**{**r.json(), "endpoint": self.endpoint}),
+            headers=self._build_hf_headers(token=token),
         )
-        hf_raise_for_status(r)
-        return Collection(**{**r.json(), "endpoint": self.endpoint})
 
     def create_collection(
         self,
@@ -11564,6 +11753,38 @@ class HfApi:
             headers=self.headers,
         )
 
+    def _get_api_object(
+        self,
+        path: str,
+        parse: Callable[[httpx.Response], R],
+        *,
+        headers: dict[str, str],
+        params: Any = None,
+        with_backoff: bool = False,
+        **kwargs,
+    ) -> R:
+        """
+        GET a read route of the Hub API and build an object from the response.
+
+        Identical concurrent calls are coalesced (see `HF_HUB_COALESCE_REQUESTS`) and unchanged responses are served
+        from the API cache (see `HF_HUB_ENABLE_API_CACHE`). Extra `kwargs` are passed to the request (e.g. `timeout`).
+        """
+
+        def _send(headers: dict[str, str]) -> httpx.Response:
+            if with_backoff:
+                return http_backoff("GET", path, headers=headers, params=params, **kwargs)
+            return get_session().get(path, headers=headers, params=params, **kwargs)
+
+        return fetch_with_api_cache(
+            path,
+            headers=headers,
+            params=params,
+            send=lambda headers: _coalesce_request(
+                "GET", path, lambda: _send(headers), headers=headers, params=params
+            ),
+            parse=parse,
+        )
+
     def _prepare_folder_deletions(
         self,
         repo_id: str,
@@ -11623,12 +11844,8 @@ class HfApi:
         if not folder_path.is_dir():
             raise ValueError(f"Provided path: '{folder_path}' is not a directory")
 
-        # List files from folder
-        relpath_to_abspath = {
-            path.relative_to(folder_path).as_posix(): path
-            for path in sorted(folder_path.glob("**/*"))  # sorted to be deterministic
-            if path.is_file()
-        }
+        # List files from folder (sorted to be deterministic)
+        relpath_to_abspath = {relpath: folder_path / relpath for relpath, _ in walk_local_files(folder_path)}
 
         # Filter files
         # Patterns are applied on the path relative to `folder_path`. `path_in_repo` is prefixed after the filtering.
@@ -14864,6 +15081,9 @@ class HfApi:
         verbose: bool = False,
         quiet: bool = False,
         token: bool | str | None = None,
+        checksum: bool = False,
+        watch: bool = False,
+        watch_interval: float = 10,
     ) -> SyncPlan:
         """Sync files between a local directory and a bucket.
 
@@ -14905,9 +15125,19 @@ class HfApi:
                 Suppress all output and progress bars.
             token (Union[bool, str, None], optional):
                 A valid user access token. If not provided, the locally saved token will be used.
+            checksum (`bool`, *optional*, defaults to `False`):
+                Compare files by content hash instead of modification time. Local hashes are cached in
+                ``HF_BUCKETS_CACHE`` so that unchanged files are not hashed again. Requires ``hf_xet``.
+            watch (`bool`, *optional*, defaults to `False`):
+                After the initial sync, keep watching the local ``source`` directory and push changes to the bucket
+                until interrupted (Ctrl+C). Only supported when uploading to a bucket.
+            watch_interval (`float`, *optional*, defaults to `10`):
+                Number of seconds between two checks of the local directory in ``watch`` mode.
 
         Returns:
-            [`SyncPlan`]: The computed (or loaded) sync plan.
+            [`SyncPlan`]: The computed (or loaded) sync plan. In ``watch`` mode, the plan of the initial sync.
+            When the sync is executed, operations are streamed and not kept in ``operations``: only
+            ``summary()`` is available.
 
         Example:
             ```python
@@ -14928,6 +15158,12 @@ class HfApi:
             ...     include=["*.safetensors"],
             ... )
 
+            # Compare by content hash (e.g. after a container rebuild reset all mtimes)
+            >>> api.sync_bucket("./data", "hf://buckets/username/my-bucket", checksum=True)
+
+            # Keep pushing local changes until interrupted (e.g. checkpoints written during training)
+            >>> api.sync_bucket("./outputs", "hf://buckets/username/my-bucket", watch=True)
+
             # Dry run: preview what would be synced
             >>> plan = api.sync_bucket("./data", "hf://buckets/username/my-bucket", dry_run=True)
             >>> plan.summary()
@@ -14956,6 +15192,9 @@ class HfApi:
             verbose=verbose,
             quiet=quiet,
             token=token,
+            checksum=checksum,
+            watch=watch,
+            watch_interval=watch_interval,
         )
 
 
@@ -15191,6 +15430,7 @@ permanently_delete_lfs_files = api.permanently_delete_lfs_files
 
 # Safetensors helpers
 get_safetensors_metadata = api.get_safetensors_metadata
+get_safetensors_metadata_bulk = api.get_safetensors_metadata_bulk
 parse_safetensors_file_metadata = api.parse_safetensors_file_metadata
 
 # Background jobs
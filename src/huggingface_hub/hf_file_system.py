@@ -1,19 +1,21 @@
+import asyncio
 import os
 import tempfile
 import threading
 from collections import deque
-from collections.abc import Iterable, Iterator
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
-from itertools import chain
 from pathlib import Path, PurePosixPath
 from typing import Any, NoReturn, Union
 from urllib.parse import quote, unquote
 
 import fsspec
 import httpx
+from fsspec.asyn import AsyncFileSystem, _run_coros_in_chunks
 from fsspec.callbacks import _DEFAULT_CALLBACK, NoOpCallback, TqdmCallback
 from fsspec.config import apply_config
 from fsspec.utils import isfilelike
@@ -29,10 +31,33 @@ from .errors import (
 )
 from .file_download import hf_hub_url, http_get
 from .hf_api import SPECIAL_REFS_REVISION_REGEX, BucketFile, BucketFolder, HfApi, LastCommitInfo, RepoFile, RepoFolder
-from .utils import HFValidationError, hf_raise_for_status, http_backoff, http_stream_backoff, parse_hf_uri
+from .utils import (
+    HFValidationError,
+    chunk_iterable,
+    get_shared_async_session,
+    hf_raise_for_status,
+    http_backoff,
+    http_stream_backoff,
+    logging,
+    parse_hf_uri,
+    validate_repo_id,
+)
+from .utils._http import _async_http_backoff
+from .utils._runtime import is_xet_available
+from .utils._typing import HTTP_METHOD_T
+from .utils._xet import (
+    XetTokenType,
+    abort_xet_session,
+    get_xet_session,
+    xet_connection_info_refresh_url,
+    xet_headers_without_auth,
+)
 from .utils.insecure_hashlib import md5
 
 
+logger = logging.get_logger(__name__)
+
+
 @dataclass
 class HfFileSystemResolvedPath:
     """Top level Data structure containing information about a resolved Hugging Face file system path."""
@@ -80,6 +105,12 @@ class HfFileSystemResolvedBucketPath(HfFileSystemResolvedPath):
         self.root = "buckets/" + self.bucket_id
 
 
+# Max number of paths per `get_paths_info` call when expanding info (the Hub accepts up to 1,000 per request)
+_PATHS_INFO_BATCH_SIZE = 500
+# Max number of concurrent `get_paths_info` calls when expanding info
+_PATHS_INFO_MAX_WORKERS = 8
+
+
 # We need to improve fsspec.spec._Cached which is AbstractFileSystem's metaclass
 _cached_base: Any = type(fsspec.AbstractFileSystem)
 
@@ -252,17 +283,26 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                 self._api.repo_info(
                     repo_id, revision=revision, repo_type=repo_type, timeout=constants.HF_HUB_ETAG_TIMEOUT
                 )
-            except (RepositoryNotFoundError, HFValidationError) as e:
-                self._repo_and_revision_exists_cache[(repo_type, repo_id, revision)] = False, e
-                self._repo_and_revision_exists_cache[(repo_type, repo_id, None)] = False, e
-            except RevisionNotFoundError as e:
-                self._repo_and_revision_exists_cache[(repo_type, repo_id, revision)] = False, e
-                self._repo_and_revision_exists_cache[(repo_type, repo_id, None)] = True, None
+            except (RepositoryNotFoundError, RevisionNotFoundError, HFValidationError) as e:
+                self._cache_repo_and_revision_exist(repo_type, repo_id, revision, e)
             else:
-                self._repo_and_revision_exists_cache[(repo_type, repo_id, revision)] = True, None
-                self._repo_and_revision_exists_cache[(repo_type, repo_id, None)] = True, None
+                self._cache_repo_and_revision_exist(repo_type, repo_id, revision, None)
         return self._repo_and_revision_exists_cache[(repo_type, repo_id, revision)]
 
+    def _cache_repo_and_revision_exist(
+        self, repo_type: str, repo_id: str, revision: str | None, err: Exception | None
+    ) -> None:
+        """Cache the result of a repo existence check, `err` being the error raised by the check (if any)."""
+        if isinstance(err, (RepositoryNotFoundError, HFValidationError)):
+            self._repo_and_revision_exists_cache[(repo_type, repo_id, revision)] = False, err
+            self._repo_and_revision_exists_cache[(repo_type, repo_id, None)] = False, err
+        elif isinstance(err, RevisionNotFoundError):
+            self._repo_and_revision_exists_cache[(repo_type, repo_id, revision)] = False, err
+            self._repo_and_revision_exists_cache[(repo_type, repo_id, None)] = True, None
+        else:
+            self._repo_and_revision_exists_cache[(repo_type, repo_id, revision)] = True, None
+            self._repo_and_revision_exists_cache[(repo_type, repo_id, None)] = True, None
+
     def _bucket_exists(self, bucket_id: str) -> tuple[bool, Exception | None]:
         if bucket_id not in self._bucket_exists_cache:
             try:
@@ -294,6 +334,22 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
             `NotImplementedError`:
                 If trying to list repositories.
         """
+        return self._resolve_path_with_checks(
+            path,
+            revision=revision,
+            repo_and_revision_exist=self._repo_and_revision_exist,
+            bucket_exists=self._bucket_exists,
+        )
+
+    def _resolve_path_with_checks(
+        self,
+        path: str,
+        *,
+        revision: str | None,
+        repo_and_revision_exist: Callable[[str, str, str | None], tuple[bool, Exception | None]],
+        bucket_exists: Callable[[str], tuple[bool, Exception | None]],
+    ) -> HfFileSystemResolvedRepositoryPath | HfFileSystemResolvedBucketPath:
+        """Same as `resolve_path`, checking that repositories and buckets exist with the given callables."""
         path = self._strip_protocol(path)
         if not path:
             raise NotImplementedError("Access to buckets and repositories lists is not implemented.")
@@ -306,8 +362,8 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
 
         # --- Buckets ---
         if parsed.is_bucket:
-            bucket_exists, err = self._bucket_exists(parsed.id)
-            if not bucket_exists:
+            exists, err = bucket_exists(parsed.id)
+            if not exists:
                 _raise_file_not_found(path, err)
             return HfFileSystemResolvedBucketPath(bucket_id=parsed.id, path=parsed.path_in_repo)
 
@@ -326,8 +382,8 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                 raise ValueError(
                     f'Revision specified in path ("{revision_in_path_decoded}") and in `revision` argument ("{revision}") are not the same.'
                 )
-            repo_and_revision_exist, err = self._repo_and_revision_exist(parsed.type, repo_id, revision)
-            if not repo_and_revision_exist:
+            exists, err = repo_and_revision_exist(parsed.type, repo_id, revision)
+            if not exists:
                 _raise_file_not_found(path, err)
             return HfFileSystemResolvedRepositoryPath(
                 parsed.type, repo_id, revision, path_in_repo, _raw_revision=revision_in_path
@@ -336,8 +392,8 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
         if parsed.revision is not None and revision is None:
             revision = parsed.revision
 
-        repo_and_revision_exist, err = self._repo_and_revision_exist(parsed.type, parsed.id, revision)
-        if not repo_and_revision_exist:
+        exists, err = repo_and_revision_exist(parsed.type, parsed.id, revision)
+        if not exists:
             _raise_file_not_found(path, err)
 
         # Extract raw revision from original path for unresolve() fidelity
@@ -530,8 +586,8 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
         maxdepth = maxdepth if recursive else 1
 
         out = []
-        if path in self.dircache and not refresh:
-            cached_path_infos = self.dircache[path]
+        cached_path_infos = None if refresh else self.dircache.get(path)
+        if cached_path_infos is not None:
             out.extend(cached_path_infos)
             dirs_not_in_dircache = []
             if recursive:
@@ -544,10 +600,10 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                 while dirs_to_visit:
                     depth, dir_info = dirs_to_visit.popleft()
                     if maxdepth is None or depth <= maxdepth:
-                        if dir_info["name"] not in self.dircache:
+                        cached_path_infos = self.dircache.get(dir_info["name"])
+                        if cached_path_infos is None:
                             dirs_not_in_dircache.append(dir_info["name"])
                         else:
-                            cached_path_infos = self.dircache[dir_info["name"]]
                             out.extend(cached_path_infos)
                             dirs_to_visit.extend(
                                 [
@@ -557,21 +613,16 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                                 ]
                             )
 
-            dirs_not_expanded = []
-            if expand_info and isinstance(resolved_path, HfFileSystemResolvedRepositoryPath):
-                # Check if there are directories in repos with non-expanded entries
-                dirs_not_expanded = [self._parent(o["name"]) for o in out if o["last_commit"] is None]
-
-            if (recursive and dirs_not_in_dircache) or (expand_info and dirs_not_expanded):
-                # If the dircache is incomplete, find the common path of the missing and non-expanded entries
+            if recursive and dirs_not_in_dircache:
+                # If the dircache is incomplete, find the common path of the missing entries
                 # and extend the output with the result of `_ls_tree(common_path, recursive=True)`
-                common_prefix = os.path.commonprefix(dirs_not_in_dircache + dirs_not_expanded)
+                common_prefix = os.path.commonprefix(dirs_not_in_dircache)
                 # Get the parent directory if the common prefix itself is not a directory
                 common_path = (
                     common_prefix.rstrip("/")
                     if common_prefix.endswith("/")
                     or common_prefix == root_path
-                    or common_prefix in chain(dirs_not_in_dircache, dirs_not_expanded)
+                    or common_prefix in dirs_not_in_dircache
                     else self._parent(common_prefix)
                 )
                 if maxdepth is not None:
@@ -592,6 +643,10 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                         maxdepth=maxdepth,
                     )
                 )
+
+            if expand_info and isinstance(resolved_path, HfFileSystemResolvedRepositoryPath):
+                # Expand cached entries that were listed without expanded info
+                self._expand_path_infos(resolved_path, out)
         else:
             tree: Iterable[RepoFile | RepoFolder | BucketFile | BucketFolder]
             if isinstance(resolved_path, HfFileSystemResolvedBucketPath):
@@ -601,102 +656,82 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                     recursive=recursive,
                 )
             else:
+                # Expanded listings are paginated by 50 entries (instead of 1000) => list without expanding and
+                # expand the listed entries afterwards with batched `get_paths_info` calls
                 tree = self._api.list_repo_tree(
                     resolved_path.repo_id,
                     resolved_path.path,
                     recursive=recursive,
-                    expand=expand_info,
                     revision=resolved_path.revision,
                     repo_type=resolved_path.repo_type,
                 )
+            listed_path_infos: dict[str, list[dict[str, Any]]] = {}
             for path_info in tree:
-                cache_path = root_path + "/" + path_info.path
-                if isinstance(path_info, RepoFile):
-                    cache_path_info = {
-                        "name": cache_path,
-                        "size": path_info.size,
-                        "type": "file",
-                        "blob_id": path_info.blob_id,
-                        "lfs": path_info.lfs,
-                        "xet_hash": path_info.xet_hash,
-                        "last_commit": path_info.last_commit,
-                        "security": path_info.security,
-                    }
-                elif isinstance(path_info, BucketFile):
-                    cache_path_info = {
-                        "name": cache_path,
-                        "size": path_info.size,
-                        "type": "file",
-                        "xet_hash": path_info.xet_hash,
-                        "mtime": path_info.mtime,
-                        "uploaded_at": path_info.uploaded_at,
-                    }
-                elif isinstance(path_info, RepoFolder):
-                    cache_path_info = {
-                        "name": cache_path,
-                        "size": 0,
-                        "type": "directory",
-                        "tree_id": path_info.tree_id,
-                        "last_commit": path_info.last_commit,
-                    }
-                else:
-                    cache_path_info = {
-                        "name": cache_path,
-                        "size": 0,
-                        "type": "directory",
-                        "uploaded_at": path_info.uploaded_at,
-                    }
+                cache_path_info = _path_info_to_dict(root_path, path_info)
+                cache_path = cache_path_info["name"]
                 parent_path = self._parent(cache_path_info["name"])
-                self.dircache.setdefault(parent_path, []).append(cache_path_info)
+                listed_path_infos.setdefault(parent_path, []).append(cache_path_info)
                 depth = cache_path[len(path) :].count("/")
                 if maxdepth is None or depth <= maxdepth:
                     out.append(cache_path_info)
+            # Fill the dircache once the listing is complete, so that concurrent calls (e.g. from `AsyncHfFileSystem`)
+            # never see partial directories nor duplicate entries
+            self.dircache.update(listed_path_infos)
+            if expand_info and isinstance(resolved_path, HfFileSystemResolvedRepositoryPath):
+                self._expand_path_infos(resolved_path, out)
         return out
 
-    def _list_bucket_tree_with_folders(
-        self, bucket_id: str, prefix: str, recursive: bool
-    ) -> Iterable[BucketFile | BucketFolder]:
-        """Same as `HfApi.list_bucket_tree` but always includes folders"""
-        bucket_files = self._api.list_bucket_tree(bucket_id, prefix, recursive=recursive)
-        bucket_folders: dict[str, BucketFolder] = {}
-        min_depth = 1 + prefix.count("/") if prefix else 0
-        out: list[BucketFile | BucketFolder] = []
-
-        for bucket_entry in bucket_files:
-            # The server matches `prefix` lexically, so listing "logs" also returns "logs_existing/...".
-            # Filesystem semantics require path components => drop entries that aren't `prefix` itself
-            # or below it.
-            if prefix and bucket_entry.path != prefix and not bucket_entry.path.startswith(f"{prefix}/"):
-                continue
-            out.append(bucket_entry)
+    def _expand_path_infos(
+        self, resolved_path: HfFileSystemResolvedRepositoryPath, path_infos: list[dict[str, Any]]
+    ) -> None:
+        """Fill `last_commit` and `security` of non-expanded path infos in place.
 
-            # If recursive=False, both files and folders are returned by the server => nothing to do
-            if not recursive:
-                continue
+        Paths are expanded with batched `get_paths_info` calls, sent concurrently. Path infos are updated in place so
+        that expanded values land directly in the dircache.
+        """
+        root_path = resolved_path.root + "/"
+        to_expand = {
+            path_info["name"][len(root_path) :]: path_info
+            for path_info in path_infos
+            if path_info.get("last_commit", False) is None
+        }
+        if not to_expand:
+            return
 
-            # Otherwise, let's rebuild BucketFolders manually
-            for parent_bucket_folder_str in list(PurePosixPath(bucket_entry.path).parents)[: -min_depth - 1]:
-                parent_bucket_folder = BucketFolder(
-                    type="directory", path=str(parent_bucket_folder_str), uploaded_at=bucket_entry.uploaded_at
-                )
+        def _expand(batch: list[str]) -> list[RepoFile | RepoFolder]:
+            return self._api.get_paths_info(
+                resolved_path.repo_id,
+                batch,
+                expand=True,
+                revision=resolved_path.revision,
+                repo_type=resolved_path.repo_type,
+            )
 
-                # If folder not visited yet, add it
-                if parent_bucket_folder.path not in bucket_folders:
-                    out.append(parent_bucket_folder)
-                    bucket_folders[parent_bucket_folder.path] = parent_bucket_folder
+        batches = [list(batch) for batch in chunk_iterable(list(to_expand), chunk_size=_PATHS_INFO_BATCH_SIZE)]
+        if len(batches) == 1:
+            results: Iterable[list[RepoFile | RepoFolder]] = [_expand(batches[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(batches), _PATHS_INFO_MAX_WORKERS)) as executor:
+                results = list(executor.map(_expand, batches))
+        for paths_info in results:
+            for path_info in paths_info:
+                cache_path_info = to_expand.get(path_info.path)
+                if cache_path_info is None:
                     continue
+                cache_path_info["last_commit"] = path_info.last_commit
+                if isinstance(path_info, RepoFile):
+                    cache_path_info["security"] = path_info.security
 
-                # Otherwise, get back BucketFolder object and update its 'uploaded_at'
-                if parent_bucket_folder.uploaded_at is not None:
-                    bucket_folder = bucket_folders[parent_bucket_folder.path]
-                    if bucket_folder.uploaded_at is None or (
-                        bucket_folder.uploaded_at < parent_bucket_folder.uploaded_at
-                    ):
-                        bucket_folder.uploaded_at = parent_bucket_folder.uploaded_at
-
-        if not out:
-            raise EntryNotFoundError(f"File not found in bucket '{bucket_id}': '{prefix}'")
-        return out
+    def _list_bucket_tree_with_folders(
+        self, bucket_id: str, prefix: str, recursive: bool
+    ) -> Iterable[BucketFile | BucketFolder]:
+        """Same as `HfApi.list_bucket_tree` but always includes folders"""
+        return _with_bucket_folders(
+            self._api.list_bucket_tree(bucket_id, prefix, recursive=recursive),
+            bucket_id=bucket_id,
+            prefix=prefix,
+            recursive=recursive,
+        )
 
     def walk(self, path: str, *args, **kwargs) -> Iterator[tuple[str, list[str], list[str]]]:
         """
@@ -946,6 +981,9 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                 if not out1:
                     _raise_file_not_found(path, None)
                 out = out1[0]
+                if expand_info and not refresh and out["last_commit"] is None:
+                    # Expand all the siblings at once => subsequent `info` calls in the same directory are cached
+                    self._expand_path_infos(resolved_path, self.dircache[parent_path])
             if refresh or out is None or (expand_info and out and out["last_commit"] is None):
                 paths_info = self._api.get_paths_info(
                     resolved_path.repo_id,
@@ -956,33 +994,7 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
                 )
                 if not paths_info:
                     _raise_file_not_found(path, None)
-                path_info = paths_info[0]
-                root_path = HfFileSystemResolvedRepositoryPath(
-                    resolved_path.repo_type,
-                    resolved_path.repo_id,
-                    resolved_path.revision,
-                    path_in_repo="",
-                    _raw_revision=resolved_path._raw_revision,
-                ).unresolve()
-                if isinstance(path_info, RepoFile):
-                    out = {
-                        "name": root_path + "/" + path_info.path,
-                        "size": path_info.size,
-                        "type": "file",
-                        "blob_id": path_info.blob_id,
-                        "lfs": path_info.lfs,
-                        "xet_hash": path_info.xet_hash,
-                        "last_commit": path_info.last_commit,
-                        "security": path_info.security,
-                    }
-                else:
-                    out = {
-                        "name": root_path + "/" + path_info.path,
-                        "size": 0,
-                        "type": "directory",
-                        "tree_id": path_info.tree_id,
-                        "last_commit": path_info.last_commit,
-                    }
+                out = _path_info_to_dict(resolved_path.root, paths_info[0])
                 if not expand_info:
                     out = {k: out[k] for k in ["name", "size", "type"]}
         assert out is not None
@@ -1060,17 +1072,7 @@ class HfFileSystem(fsspec.AbstractFileSystem, metaclass=_Cached):  # ty: ignore[
         Returns:
             `str`: HTTP URL to access the file or directory on the Hub.
         """
-        resolved_path = self.resolve_path(path)
-        if isinstance(resolved_path, HfFileSystemResolvedBucketPath):
-            url = f"{self.endpoint}/buckets/{resolved_path.bucket_id}/resolve/{quote(resolved_path.path)}"
-        else:
-            url = hf_hub_url(
-                resolved_path.repo_id,
-                resolved_path.path_in_repo,
-                repo_type=resolved_path.repo_type,
-                revision=resolved_path.revision,
-                endpoint=self.endpoint,
-            )
+        url = _resolved_path_to_url(self.resolve_path(path), endpoint=self.endpoint)
         if self.isdir(path):
             url = url.replace("/resolve/", "/tree/", 1)
         return url
@@ -1191,6 +1193,15 @@ class HfFileSystemFile(fsspec.spec.AbstractBufferedFile):
         return super().__del__()
 
     def _fetch_range(self, start: int, end: int) -> bytes:
+        xet_hash = self.details.get("xet_hash")
+        if xet_hash and is_xet_available():
+            try:
+                return self._fetch_range_from_xet(xet_hash, start, end)
+            except KeyboardInterrupt:
+                abort_xet_session()
+                raise
+            except Exception as e:
+                logger.debug(f"Xet range read failed for '{self.path}', falling back to HTTP: {e}")
         headers = {
             "range": f"bytes={start}-{end - 1}",
             **self.fs._api._build_hf_headers(),
@@ -1200,6 +1211,32 @@ class HfFileSystemFile(fsspec.spec.AbstractBufferedFile):
         hf_raise_for_status(r)
         return r.content
 
+    def _fetch_range_from_xet(self, xet_hash: str, start: int, end: int) -> bytes:
+        """Read `[start, end)` through Xet, downloading only the chunks covering the range.
+
+        Chunks are reused from the local Xet cache (see `HF_XET_CACHE`) when already present.
+        """
+        from hf_xet import XetFileInfo
+
+        if isinstance(self.resolved_path, HfFileSystemResolvedBucketPath):
+            refresh_url = xet_connection_info_refresh_url(
+                token_type=XetTokenType.READ,
+                repo_id=self.resolved_path.bucket_id,
+                repo_type="bucket",
+                endpoint=self.fs.endpoint,
+            )
+        else:
+            refresh_url = xet_connection_info_refresh_url(
+                token_type=XetTokenType.READ,
+                repo_id=self.resolved_path.repo_id,
+                repo_type=self.resolved_path.repo_type,
+                revision=safe_quote(self.resolved_path.revision),
+                endpoint=self.fs.endpoint,
+            )
+        group = _get_xet_stream_group(refresh_url, self.fs._api._build_hf_headers())
+        stream = group.download_stream(XetFileInfo(xet_hash, self.size), start=start, end=end)
+        return b"".join(stream)
+
     def _initiate_upload(self) -> None:
         self.temp_file = tempfile.NamedTemporaryFile(prefix="hffs-", delete=False)
 
@@ -1391,6 +1428,589 @@ class HfFileSystemStreamFile(fsspec.spec.AbstractBufferedFile):
         self._stream_iterator = self.response.iter_bytes()
 
 
+class _ExistenceNotCached(Exception):
+    """Raised when resolving a path in [`AsyncHfFileSystem`] requires an existence check that is not cached yet."""
+
+    def __init__(self, check: Callable[[], Awaitable[None]]):
+        super().__init__()
+        self.check = check
+
+
+class AsyncHfFileSystem(AsyncFileSystem):
+    """
+    Asynchronous variant of [`HfFileSystem`], built on `httpx.AsyncClient`.
+
+    Meant for libraries driving fsspec's `AsyncFileSystem` interface (e.g. `zarr` or `pyarrow` through `fsspec.asyn`)
+    with many concurrent reads on a single event loop. File contents, directory listings and file info are fetched
+    with async requests. Path resolution (see [`HfFileSystem.resolve_path`]) and caches are shared with an underlying
+    [`HfFileSystem`], so that paths already resolved or listed don't require any request. Recursive listings
+    (`find`, `glob`) and expanded info rely on the batched calls of the underlying [`HfFileSystem`] and run in worker
+    threads.
+
+    Args:
+        endpoint (`str`, *optional*):
+            Endpoint of the Hub. Defaults to <https://huggingface.co>.
+        token (`bool` or `str`, *optional*):
+            A valid user access token (string). Defaults to the locally saved token. To disable authentication,
+            pass `False`.
+        block_size (`int`, *optional*):
+            Block size for reading files opened with [`~AsyncHfFileSystem.open`].
+        expand_info (`bool`, *optional*):
+            Whether to expand the information of the files.
+        asynchronous (`bool`, *optional*):
+            Set to `True` when the filesystem is instantiated from within a coroutine. Defaults to `False`.
+        loop (`asyncio.AbstractEventLoop`, *optional*):
+            Event loop to run the coroutines on. Defaults to fsspec's IO loop.
+        batch_size (`int`, *optional*):
+            Maximum number of concurrent requests in bulk operations (`cat_ranges`, `get`...). Defaults to fsspec's
+            configuration.
+        **storage_options (`dict`, *optional*):
+            Additional options for the filesystem. See [fsspec documentation](https://filesystem-spec.readthedocs.io/en/latest/async.html).
+
+    Usage:
+
+    ```python
+    >>> import asyncio
+    >>> from huggingface_hub import AsyncHfFileSystem
+
+    >>> async def read_headers():
+    ...     fs = AsyncHfFileSystem(asynchronous=True)
+    ...     paths = await fs._glob("datasets/my-username/my-dataset/**/*.parquet")
+    ...     return await fs._cat_ranges(paths, starts=-8, ends=None)
+
+    >>> asyncio.run(read_headers())
+    ```
+    """
+
+    root_marker = ""
+    protocol = "hf"
+
+    def __init__(
+        self,
+        *args,
+        endpoint: str | None = None,
+        token: bool | str | None = None,
+        block_size: int | None = None,
+        expand_info: bool | None = None,
+        asynchronous: bool = False,
+        loop=None,
+        batch_size: int | None = None,
+        **storage_options,
+    ):
+        super().__init__(*args, asynchronous=asynchronous, loop=loop, batch_size=batch_size, **storage_options)
+        self.endpoint = endpoint or constants.ENDPOINT
+        self.token = token
+        self.block_size = block_size
+        # Sync filesystem used for path resolution, listings and info. It is not taken from the instance cache since
+        # `HfFileSystem` instances are bound to the thread that created them. Its methods are called concurrently from
+        # worker threads: caches are only updated with atomic dict operations, so no lock is needed.
+        self._fs = HfFileSystem(
+            endpoint=endpoint,
+            token=token,
+            block_size=block_size,
+            expand_info=expand_info,
+            skip_instance_cache=True,
+        )
+        self._client: httpx.AsyncClient | None = None
+
+    async def set_session(self) -> httpx.AsyncClient:
+        """Return the `httpx.AsyncClient` used by this filesystem.
+
+        The client is shared with all calls made in the current event loop and closed when the loop shuts down (see
+        [`get_shared_async_session`]).
+        """
+        if self._client is not None:
+            return self._client
+        return get_shared_async_session()
+
+    def resolve_path(
+        self, path: str, revision: str | None = None
+    ) -> HfFileSystemResolvedRepositoryPath | HfFileSystemResolvedBucketPath:
+        """
+        Resolve a Hugging Face file system path into its components.
+
+        Same as [`HfFileSystem.resolve_path`].
+        """
+        return self._fs.resolve_path(path, revision=revision)
+
+    def invalidate_cache(self, path: str | None = None) -> None:
+        """
+        Clear the cache for a given path.
+
+        Same as [`HfFileSystem.invalidate_cache`].
+        """
+        self._fs.invalidate_cache(path)
+
+    async def _run_in_thread(self, method: str, *args, **kwargs) -> Any:
+        """Run a method of the underlying `HfFileSystem` in a worker thread."""
+        return await asyncio.to_thread(getattr(self._fs, method), *args, **kwargs)
+
+    async def _api_request(self, method: HTTP_METHOD_T, url: str, **kwargs) -> httpx.Response:
+        """Send a request to the Hub API with retries and raise if it failed."""
+        client = await self.set_session()
+        response = await _async_http_backoff(
+            client,
+            method,
+            url,
+            headers=self._fs._api._build_hf_headers(),
+            **kwargs,
+        )
+        hf_raise_for_status(response)
+        return response
+
+    async def _resolve_path(
+        self, path: str, revision: str | None = None
+    ) -> HfFileSystemResolvedRepositoryPath | HfFileSystemResolvedBucketPath:
+        """Same as [`HfFileSystem.resolve_path`], checking that the repo or bucket exists with an async request.
+
+        Paths of repos and buckets already checked are resolved from the cache of the underlying [`HfFileSystem`],
+        without any request.
+        """
+        while True:
+            try:
+                return self._fs._resolve_path_with_checks(
+                    path,
+                    revision=revision,
+                    repo_and_revision_exist=self._cached_repo_and_revision_exist,
+                    bucket_exists=self._cached_bucket_exists,
+                )
+            except _ExistenceNotCached as e:
+                await e.check()
+
+    def _cached_repo_and_revision_exist(
+        self, repo_type: str, repo_id: str, revision: str | None
+    ) -> tuple[bool, Exception | None]:
+        cached = self._fs._repo_and_revision_exists_cache.get((repo_type, repo_id, revision))
+        if cached is None:
+            raise _ExistenceNotCached(lambda: self._check_repo_and_revision_exist(repo_type, repo_id, revision))
+        return cached
+
+    def _cached_bucket_exists(self, bucket_id: str) -> tuple[bool, Exception | None]:
+        cached = self._fs._bucket_exists_cache.get(bucket_id)
+        if cached is None:
+            raise _ExistenceNotCached(lambda: self._check_bucket_exists(bucket_id))
+        return cached
+
+    async def _check_repo_and_revision_exist(self, repo_type: str, repo_id: str, revision: str | None) -> None:
+        url = f"{self.endpoint}/api/{repo_type}s/{repo_id}"
+        if revision is not None:
+            url += f"/revision/{quote(revision, safe='')}"
+        try:
+            validate_repo_id(repo_id)
+            await self._api_request("GET", url, timeout=constants.HF_HUB_ETAG_TIMEOUT)
+        except (RepositoryNotFoundError, RevisionNotFoundError, HFValidationError) as e:
+            self._fs._cache_repo_and_revision_exist(repo_type, repo_id, revision, e)
+        else:
+            self._fs._cache_repo_and_revision_exist(repo_type, repo_id, revision, None)
+
+    async def _check_bucket_exists(self, bucket_id: str) -> None:
+        try:
+            await self._api_request("GET", f"{self.endpoint}/api/buckets/{bucket_id}")
+        except BucketNotFoundError as e:
+            self._fs._bucket_exists_cache[bucket_id] = False, e
+        else:
+            self._fs._bucket_exists_cache[bucket_id] = True, None
+
+    async def _ls(self, path: str, detail: bool = True, refresh: bool = False, revision: str | None = None, **kwargs):
+        if kwargs or self._fs.expand_info:
+            # Recursive and expanded listings rely on batched and paginated calls of the underlying `HfFileSystem`
+            return await self._run_in_thread("ls", path, detail=detail, refresh=refresh, revision=revision, **kwargs)
+        resolved_path = await self._resolve_path(path, revision=revision)
+        path = resolved_path.unresolve()
+        try:
+            out = await self._ls_dir(resolved_path, refresh=refresh)
+        except EntryNotFoundError:
+            # Path could be a file
+            if not resolved_path.path:
+                _raise_file_not_found(path, None)
+            try:
+                parent_path = await self._resolve_path(self._fs._parent(path), revision=revision)
+                out = await self._ls_dir(parent_path, refresh=refresh)
+            except EntryNotFoundError:
+                out = []
+            out = [o for o in out if o["name"] == path]
+            if len(out) == 0:
+                _raise_file_not_found(path, None)
+        return out if detail else [o["name"] for o in out]
+
+    async def _ls_dir(
+        self, resolved_path: HfFileSystemResolvedRepositoryPath | HfFileSystemResolvedBucketPath, refresh: bool
+    ) -> list[dict[str, Any]]:
+        """List a directory with the (paginated) tree endpoint, sharing the dircache of the underlying `HfFileSystem`."""
+        path = resolved_path.unresolve()
+        cached_path_infos = None if refresh else self._fs.dircache.get(path)
+        if cached_path_infos is not None:
+            return list(cached_path_infos)
+
+        tree: Sequence[RepoFile | RepoFolder | BucketFile | BucketFolder]
+        if isinstance(resolved_path, HfFileSystemResolvedBucketPath):
+            encoded_prefix = "/" + quote(resolved_path.path, safe="") if resolved_path.path else ""
+            items = await self._paginate(
+                f"{self.endpoint}/api/buckets/{resolved_path.bucket_id}/tree{encoded_prefix}",
+                params={"recursive": False},
+            )
+            tree = _with_bucket_folders(
+                [BucketFile(**item) if item["type"] == "file" else BucketFolder(**item) for item in items],
+                bucket_id=resolved_path.bucket_id,
+                prefix=resolved_path.path,
+                recursive=False,
+            )
+        else:
+            encoded_path_in_repo = (
+                "/" + quote(resolved_path.path_in_repo, safe="") if resolved_path.path_in_repo else ""
+            )
+            items = await self._paginate(
+                f"{self.endpoint}/api/{resolved_path.repo_type}s/{resolved_path.repo_id}/tree/"
+                f"{quote(resolved_path.revision, safe='')}{encoded_path_in_repo}",
+                params={"recursive": False, "expand": False},
+            )
+            tree = [RepoFile(**item) if item["type"] == "file" else RepoFolder(**item) for item in items]
+        out = [_path_info_to_dict(resolved_path.root, path_info) for path_info in tree]
+        self._fs.dircache[path] = out
+        return list(out)
+
+    async def _paginate(self, url: str, params: dict[str, Any]) -> list[Any]:
+        """GET a paginated list from the Hub API (see `huggingface_hub.utils.paginate`)."""
+        response = await self._api_request("GET", url, params=params)
+        items = list(response.json())
+        # Next link already contains query params
+        while (next_page := response.links.get("next", {}).get("url")) is not None:
+            response = await self._api_request("GET", next_page)
+            items.extend(response.json())
+        return items
+
+    async def _info(self, path: str, refresh: bool = False, revision: str | None = None, **kwargs) -> dict[str, Any]:
+        expand_info = kwargs.get("expand_info", self._fs.expand_info if self._fs.expand_info is not None else False)
+        if expand_info:
+            # Expanded info relies on batched calls of the underlying `HfFileSystem`
+            return await self._run_in_thread("info", path, refresh=refresh, revision=revision, **kwargs)
+        resolved_path = await self._resolve_path(path, revision=revision)
+        path = resolved_path.unresolve()
+        if not resolved_path.path:
+            # Path is the root directory
+            out: dict[str, Any] = {"name": path, "size": 0, "type": "directory"}
+            if isinstance(resolved_path, HfFileSystemResolvedRepositoryPath):
+                out["last_commit"] = None
+            return out
+
+        if refresh and isinstance(resolved_path, HfFileSystemResolvedRepositoryPath):
+            response = await self._api_request(
+                "POST",
+                f"{self.endpoint}/api/{resolved_path.repo_type}s/{resolved_path.repo_id}/paths-info/"
+                f"{quote(resolved_path.revision, safe='')}",
+                data={"paths": [resolved_path.path_in_repo], "expand": False},
+            )
+            paths_info = response.json()
+            if not paths_info:
+                _raise_file_not_found(path, None)
+            item = paths_info[0]
+            path_info = RepoFile(**item) if item["type"] == "file" else RepoFolder(**item)
+            out = _path_info_to_dict(resolved_path.root, path_info)
+            return {k: out[k] for k in ["name", "size", "type"]}
+
+        # Fill the cache with a cheap listing of the parent directory
+        parent_path = self._fs._parent(path)
+        try:
+            parent_path_infos = await self._ls_dir(
+                await self._resolve_path(parent_path, revision=revision), refresh=refresh
+            )
+        except EntryNotFoundError:
+            _raise_file_not_found(path, None)
+        out1 = [o for o in parent_path_infos if o["name"] == path]
+        if not out1:
+            _raise_file_not_found(path, None)
+        return out1[0]
+
+    async def _find(
+        self,
+        path: str,
+        maxdepth: int | None = None,
+        withdirs: bool = False,
+        detail: bool = False,
+        refresh: bool = False,
+        revision: str | None = None,
+        **kwargs,
+    ) -> list[str] | dict[str, dict[str, Any]]:
+        return await self._run_in_thread(
+            "find",
+            path,
+            maxdepth=maxdepth,
+            withdirs=withdirs,
+            detail=detail,
+            refresh=refresh,
+            revision=revision,
+            **kwargs,
+        )
+
+    async def _glob(self, path: str, maxdepth: int | None = None, **kwargs) -> list[str] | dict[str, dict[str, Any]]:
+        return await self._run_in_thread("glob", path, maxdepth=maxdepth, **kwargs)
+
+    async def _fetch(
+        self, resolved_path: HfFileSystemResolvedPath, headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """GET a file with retries. Returns the response as-is on HTTP 416 (range not satisfiable)."""
+        client = await self.set_session()
+        response = await _async_http_backoff(
+            client,
+            "GET",
+            _resolved_path_to_url(resolved_path, endpoint=self.endpoint),
+            headers={**self._fs._api._build_hf_headers(), **(headers or {})},
+            timeout=constants.HF_HUB_DOWNLOAD_TIMEOUT,
+        )
+        if response.status_code == 416:
+            return response
+        try:
+            hf_raise_for_status(response)
+        except EntryNotFoundError as e:
+            _raise_file_not_found(resolved_path.unresolve(), e)
+        return response
+
+    async def _cat_file(
+        self, path: str, start: int | None = None, end: int | None = None, revision: str | None = None, **kwargs
+    ) -> bytes:
+        resolved_path = await self._resolve_path(path, revision=revision)
+        if (start is not None and start < 0) or (end is not None and end < 0):
+            size = (await self._info(resolved_path.unresolve()))["size"]
+            start = max(0, size + start) if start is not None and start < 0 else start
+            end = max(0, size + end) if end is not None and end < 0 else end
+        headers = {}
+        if start or end is not None:
+            start = start or 0
+            if end is not None and start >= end:
+                return b""
+            headers["range"] = f"bytes={start}-{end - 1}" if end is not None else f"bytes={start}-"
+        response = await self._fetch(resolved_path, headers=headers)
+        if response.status_code == 416:
+            # Range not satisfiable => start is past the end of the file
+            return b""
+        return response.content
+
+    async def _cat_ranges(
+        self,
+        paths: list[str],
+        starts: list[int | None] | int | None,
+        ends: list[int | None] | int | None,
+        max_gap: int | None = None,
+        batch_size: int | None = None,
+        on_error: str = "return",
+        **kwargs,
+    ) -> list[bytes | Exception]:
+        """
+        Get the contents of byte ranges from one or more files.
+
+        Ranges of a same file separated by less than `max_gap` bytes (overlapping or contiguous ranges if not set)
+        are fetched with a single request. Requests are sent concurrently, up to `batch_size` at a time.
+        """
+        if not isinstance(paths, list):
+            raise TypeError(f"Expected a list of paths, got {type(paths)}")
+        starts = starts if isinstance(starts, list) else [starts] * len(paths)
+        ends = ends if isinstance(ends, list) else [ends] * len(paths)
+        if len(starts) != len(paths) or len(ends) != len(paths):
+            raise ValueError("`paths`, `starts` and `ends` must have the same length.")
+        max_gap = max_gap or 0
+
+        # Group mergeable ranges (known and non-negative bounds) per file, others are fetched as-is
+        blocks: list[tuple[str, int | None, int | None, list[int]]] = []  # (path, start, end, indices)
+        mergeable: dict[str, list[int]] = {}
+        for i, (path, start, end) in enumerate(zip(paths, starts, ends)):
+            if start is not None and start >= 0 and end is not None and end >= 0:
+                mergeable.setdefault(path, []).append(i)
+            else:
+                blocks.append((path, start, end, [i]))
+        for path, indices in mergeable.items():
+            indices.sort(key=lambda i: starts[i])  # type: ignore
+            block_start, block_end, block_indices = starts[indices[0]], ends[indices[0]], [indices[0]]
+            for i in indices[1:]:
+                if starts[i] <= block_end + max_gap:  # type: ignore
+                    block_end = max(block_end, ends[i])  # type: ignore
+                    block_indices.append(i)
+                else:
+                    blocks.append((path, block_start, block_end, block_indices))
+                    block_start, block_end, block_indices = starts[i], ends[i], [i]
+            blocks.append((path, block_start, block_end, block_indices))
+
+        results = await _run_coros_in_chunks(
+            [self._cat_file(path, start=start, end=end, **kwargs) for path, start, end, _ in blocks],
+            batch_size=batch_size or self.batch_size,
+            nofiles=True,
+            return_exceptions=True,
+        )
+
+        out: list[bytes | Exception] = [b""] * len(paths)
+        for (_, block_start, _, indices), result in zip(blocks, results):
+            for i in indices:
+                if isinstance(result, Exception) or len(indices) == 1:
+                    out[i] = result
+                else:
+                    offset = starts[i] - block_start  # type: ignore
+                    out[i] = result[offset : offset + ends[i] - starts[i]]  # type: ignore
+        if on_error != "return":
+            for result in out:
+                if isinstance(result, Exception):
+                    raise result
+        return out
+
+    async def _get_file(
+        self, rpath: str, lpath: str, callback=_DEFAULT_CALLBACK, revision: str | None = None, **kwargs
+    ) -> None:
+        if os.path.isdir(lpath):
+            return
+        resolved_path = await self._resolve_path(rpath, revision=revision)
+        info = await self._info(resolved_path.unresolve())
+        if info["type"] == "directory":
+            os.makedirs(lpath, exist_ok=True)
+            return
+        callback.set_size(info["size"])
+
+        client = await self.set_session()
+        async with client.stream(
+            "GET",
+            _resolved_path_to_url(resolved_path, endpoint=self.endpoint),
+            headers=self._fs._api._build_hf_headers(),
+            timeout=constants.HF_HUB_DOWNLOAD_TIMEOUT,
+        ) as response:
+            try:
+                hf_raise_for_status(response)
+            except EntryNotFoundError as e:
+                _raise_file_not_found(resolved_path.unresolve(), e)
+            os.makedirs(os.path.dirname(os.path.abspath(lpath)), exist_ok=True)
+            with open(lpath, "wb") as f:
+                async for chunk in response.aiter_bytes(constants.DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    callback.relative_update(len(chunk))
+
+    def _open(  # type: ignore
+        self,
+        path: str,
+        mode: str = "rb",
+        block_size: int | None = None,
+        revision: str | None = None,
+        **kwargs,
+    ) -> Union["HfFileSystemFile", "HfFileSystemStreamFile"]:
+        """Open a file through the underlying [`HfFileSystem`] (blocking IO)."""
+        return self._fs._open(path, mode=mode, block_size=block_size, revision=revision, **kwargs)
+
+
+# Xet download stream groups shared by all `HfFileSystemFile` handles, keyed by token refresh URL and headers.
+# Each group is stored along with the session that created it so that it is recreated if the global session
+# is reset (after a fork or a KeyboardInterrupt).
+_XET_STREAM_GROUPS: dict[tuple[str, str], tuple[Any, Any]] = {}
+_XET_STREAM_GROUPS_LOCK = threading.Lock()
+
+
+def _get_xet_stream_group(refresh_url: str, headers: dict[str, str]) -> Any:
+    """Return a Xet download stream group for `refresh_url`, creating it on the global Xet session if needed."""
+    session = get_xet_session()
+    key = (refresh_url, headers.get("authorization", ""))
+    with _XET_STREAM_GROUPS_LOCK:
+        cached = _XET_STREAM_GROUPS.get(key)
+        if cached is not None and cached[0] is session:
+            return cached[1]
+        group = session.new_download_stream_group(
+            token_refresh_url=refresh_url,
+            token_refresh_headers=headers,
+            custom_headers=xet_headers_without_auth(headers),
+        )
+        _XET_STREAM_GROUPS[key] = (session, group)
+        return group
+
+
+def _path_info_to_dict(root_path: str, path_info: RepoFile | RepoFolder | BucketFile | BucketFolder) -> dict[str, Any]:
+    """Convert a path info returned by the Hub into a dircache entry."""
+    name = root_path + "/" + path_info.path
+    if isinstance(path_info, RepoFile):
+        return {
+            "name": name,
+            "size": path_info.size,
+            "type": "file",
+            "blob_id": path_info.blob_id,
+            "lfs": path_info.lfs,
+            "xet_hash": path_info.xet_hash,
+            "last_commit": path_info.last_commit,
+            "security": path_info.security,
+        }
+    if isinstance(path_info, BucketFile):
+        return {
+            "name": name,
+            "size": path_info.size,
+            "type": "file",
+            "xet_hash": path_info.xet_hash,
+            "mtime": path_info.mtime,
+            "uploaded_at": path_info.uploaded_at,
+        }
+    if isinstance(path_info, RepoFolder):
+        return {
+            "name": name,
+            "size": 0,
+            "type": "directory",
+            "tree_id": path_info.tree_id,
+            "last_commit": path_info.last_commit,
+        }
+    return {
+        "name": name,
+        "size": 0,
+        "type": "directory",
+        "uploaded_at": path_info.uploaded_at,
+    }
+
+
+def _with_bucket_folders(
+    bucket_entries: Iterable[BucketFile | BucketFolder], *, bucket_id: str, prefix: str, recursive: bool
+) -> list[BucketFile | BucketFolder]:
+    """Filter a bucket listing to the entries below `prefix`, adding the folders omitted by recursive listings."""
+    bucket_folders: dict[str, BucketFolder] = {}
+    min_depth = 1 + prefix.count("/") if prefix else 0
+    out: list[BucketFile | BucketFolder] = []
+
+    for bucket_entry in bucket_entries:
+        # The server matches `prefix` lexically, so listing "logs" also returns "logs_existing/...".
+        # Filesystem semantics require path components => drop entries that aren't `prefix` itself
+        # or below it.
+        if prefix and bucket_entry.path != prefix and not bucket_entry.path.startswith(f"{prefix}/"):
+            continue
+        out.append(bucket_entry)
+
+        # If recursive=False, both files and folders are returned by the server => nothing to do
+        if not recursive:
+            continue
+
+        # Otherwise, let's rebuild BucketFolders manually
+        for parent_bucket_folder_str in list(PurePosixPath(bucket_entry.path).parents)[: -min_depth - 1]:
+            parent_bucket_folder = BucketFolder(
+                type="directory", path=str(parent_bucket_folder_str), uploaded_at=bucket_entry.uploaded_at
+            )
+
+            # If folder not visited yet, add it
+            if parent_bucket_folder.path not in bucket_folders:
+                out.append(parent_bucket_folder)
+                bucket_folders[parent_bucket_folder.path] = parent_bucket_folder
+                continue
+
+            # Otherwise, get back BucketFolder object and update its 'uploaded_at'
+            if parent_bucket_folder.uploaded_at is not None:
+                bucket_folder = bucket_folders[parent_bucket_folder.path]
+                if bucket_folder.uploaded_at is None or (bucket_folder.uploaded_at < parent_bucket_folder.uploaded_at):
+                    bucket_folder.uploaded_at = parent_bucket_folder.uploaded_at
+
+    if not out:
+        raise EntryNotFoundError(f"File not found in bucket '{bucket_id}': '{prefix}'")
+    return out
+
+
+def _resolved_path_to_url(resolved_path: HfFileSystemResolvedPath, endpoint: str) -> str:
+    """Return the `/resolve/` URL of a resolved file path (no network call)."""
+    if isinstance(resolved_path, HfFileSystemResolvedBucketPath):
+        return f"{endpoint}/buckets/{resolved_path.bucket_id}/resolve/{quote(resolved_path.path)}"
+    assert isinstance(resolved_path, HfFileSystemResolvedRepositoryPath)
+    return hf_hub_url(
+        resolved_path.repo_id,
+        resolved_path.path_in_repo,
+        repo_type=resolved_path.repo_type,
+        revision=resolved_path.revision,
+        endpoint=endpoint,
+    )
+
+
 def safe_revision(revision: str) -> str:
     return revision if SPECIAL_REFS_REVISION_REGEX.match(revision) else safe_quote(revision)
 
@@ -1,7 +1,11 @@
+import copy
 import inspect
 import json
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import Field, asdict, dataclass, is_dataclass
 from pathlib import Path
 from typing import Any, ClassVar, Protocol, TypeVar
@@ -9,10 +13,12 @@ from typing import Any, ClassVar, Protocol, TypeVar
 import packaging.version
 
 from . import constants
-from .errors import EntryNotFoundError, HfHubHTTPError
+from ._revision import ResolvedRevision
+from .errors import EntryNotFoundError, HfHubHTTPError, RevisionResolutionError
 from .file_download import hf_hub_download
 from .hf_api import HfApi
 from .repocard import ModelCard, ModelCardData
+from .serialization import load_torch_model
 from .utils import (
     SoftTemporaryDirectory,
     is_jsonable,
@@ -23,6 +29,7 @@ from .utils import (
     unwrap_simple_optional_type,
     validate_hf_hub_args,
 )
+from .utils.tqdm import hf_thread_map
 
 
 if is_torch_available():
@@ -36,6 +43,15 @@ if is_safetensors_available():
 
 logger = logging.get_logger(__name__)
 
+# In-process memo of the parsed `config.json` of remote models, keyed by (cache folder, repo id, commit hash). A commit
+# is immutable: repeated `from_pretrained` calls on the same commit reuse the parsed config without any I/O.
+_PRETRAINED_CONFIG_MEMO_MAX_SIZE = 128
+_PRETRAINED_CONFIG_MEMO: "OrderedDict[tuple[str, str, str], dict]" = OrderedDict()
+_PRETRAINED_CONFIG_MEMO_LOCK = threading.Lock()
+
+# Maximum number of weight shards downloaded concurrently by `PyTorchModelHubMixin`
+_MAX_SHARD_DOWNLOAD_WORKERS = 8
+
 
 # Type alias for dataclass instances, copied from https://github.com/python/typeshed/blob/9f28171658b9ca6c32a7cb93fbb99fc92b17858b/stdlib/_typeshed/__init__.pyi#L349
 class DataclassInstance(Protocol):
@@ -497,32 +513,49 @@ class ModelHubMixin:
                 Additional kwargs to pass to the model during initialization.
         """
         model_id = str(pretrained_model_name_or_path)
-        config_file: str | None = None
+        config: dict | None = None
         if os.path.isdir(model_id):
             if constants.CONFIG_NAME in os.listdir(model_id):
-                config_file = os.path.join(model_id, constants.CONFIG_NAME)
+                with open(os.path.join(model_id, constants.CONFIG_NAME), encoding="utf-8") as f:
+                    config = json.load(f)
             else:
                 logger.warning(f"{constants.CONFIG_NAME} not found in {Path(model_id).resolve()}")
         else:
-            try:
-                config_file = hf_hub_download(
-                    repo_id=model_id,
-                    filename=constants.CONFIG_NAME,
+            # Resolve the revision once: the config and the weights are downloaded from the same commit
+            revision = _resolve_pretrained_revision(
+                model_id, revision=revision, cache_dir=cache_dir, local_files_only=local_files_only, token=token
+            )
+            weights_future = None
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="hf-hub-mixin") as executor:
+                if _prefetches_pretrained_weights(cls):
+                    # Download the weights while the config is being fetched
+                    weights_future = executor.submit(
+                        cls._download_pretrained_weights,
+                        model_id=model_id,
+                        revision=revision,
+                        cache_dir=cache_dir,
+                        force_download=force_download,
+                        local_files_only=local_files_only,
+                        token=token,
+                    )
+                config = _fetch_pretrained_config(
+                    model_id,
                     revision=revision,
                     cache_dir=cache_dir,
                     force_download=force_download,
-                    token=token,
                     local_files_only=local_files_only,
+                    token=token,
                 )
-            except HfHubHTTPError as e:
-                logger.info(f"{constants.CONFIG_NAME} not found on the HuggingFace Hub: {str(e)}")
-
-        # Read config
-        config = None
-        if config_file is not None:
-            with open(config_file, encoding="utf-8") as f:
-                config = json.load(f)
+                if weights_future is not None:
+                    try:
+                        if weights_future.result():
+                            # Weights have just been downloaded => no need to force it again in `_from_pretrained`
+                            force_download = False
+                    except Exception as e:
+                        # Prefetch is best-effort: `_from_pretrained` downloads the weights again and reports errors
+                        logger.debug(f"Failed to prefetch weights of {model_id}: {e}")
 
+        if config is not None:
             # Decode custom types in config
             for key, value in config.items():
                 if key in cls._hub_mixin_init_parameters:
@@ -617,6 +650,36 @@ class ModelHubMixin:
         """
         raise NotImplementedError
 
+    @classmethod
+    def _download_pretrained_weights(
+        cls,
+        *,
+        model_id: str,
+        revision: str | None,
+        cache_dir: str | Path | None,
+        force_download: bool,
+        local_files_only: bool,
+        token: str | bool | None,
+    ) -> list[str]:
+        """Overwrite this method in subclass to download the weights of a model hosted on the Hub.
+
+        [`~ModelHubMixin.from_pretrained`] calls it in a background thread while the config is being fetched, so that
+        both downloads happen concurrently. [`~ModelHubMixin._from_pretrained`] is then called with
+        `force_download=False`, meaning that calling this method again from `_from_pretrained` only returns the
+        files from the cache. By default, nothing is downloaded in advance.
+
+        This method is only called in advance if `_from_pretrained` is defined in the same class: a subclass that
+        overrides `_from_pretrained` alone doesn't prefetch the weights of its parent. Prefetch errors are ignored,
+        `_from_pretrained` is expected to report them when downloading the weights again.
+
+        Args are the same as for [`~ModelHubMixin._from_pretrained`]. `revision` is usually already resolved to a
+        commit hash (see [`HfApi.resolve_revision`]).
+
+        Returns:
+            `list[str]`: The local paths of the downloaded files.
+        """
+        return []
+
     @validate_hf_hub_args
     def push_to_hub(
         self,
@@ -776,30 +839,72 @@ class PyTorchModelHubMixin(ModelHubMixin):
         if os.path.isdir(model_id):
             print("Loading weights from local directory")
             model_file = os.path.join(model_id, constants.SAFETENSORS_SINGLE_FILE)
+            index_file = os.path.join(model_id, constants.SAFETENSORS_INDEX_FILE)
+            if not os.path.isfile(model_file) and os.path.isfile(index_file):
+                return cls._load_as_sharded_safetensors(model, index_file, map_location, strict)
             return cls._load_as_safetensor(model, model_file, map_location, strict)
         else:
-            try:
-                model_file = hf_hub_download(
-                    repo_id=model_id,
-                    filename=constants.SAFETENSORS_SINGLE_FILE,
-                    revision=revision,
-                    cache_dir=cache_dir,
-                    force_download=force_download,
-                    token=token,
-                    local_files_only=local_files_only,
-                )
-                return cls._load_as_safetensor(model, model_file, map_location, strict)
-            except EntryNotFoundError:
-                model_file = hf_hub_download(
-                    repo_id=model_id,
-                    filename=constants.PYTORCH_WEIGHTS_NAME,
-                    revision=revision,
-                    cache_dir=cache_dir,
-                    force_download=force_download,
-                    token=token,
-                    local_files_only=local_files_only,
-                )
+            model_files = cls._download_pretrained_weights(
+                model_id=model_id,
+                revision=revision,
+                cache_dir=cache_dir,
+                force_download=force_download,
+                local_files_only=local_files_only,
+                token=token,
+            )
+            model_file = model_files[0]
+            filename = os.path.basename(model_file)
+            if filename == constants.SAFETENSORS_INDEX_FILE:
+                return cls._load_as_sharded_safetensors(model, model_file, map_location, strict)
+            if filename == constants.PYTORCH_WEIGHTS_NAME:
                 return cls._load_as_pickle(model, model_file, map_location, strict)
+            return cls._load_as_safetensor(model, model_file, map_location, strict)
+
+    @classmethod
+    def _download_pretrained_weights(
+        cls,
+        *,
+        model_id: str,
+        revision: str | None,
+        cache_dir: str | Path | None,
+        force_download: bool,
+        local_files_only: bool,
+        token: str | bool | None,
+    ) -> list[str]:
+        """Download the weights of a model from the Hub, all shards concurrently.
+
+        The first returned path is either a single safetensors file, the index of a sharded safetensors checkpoint or
+        a pickle file (legacy).
+        """
+
+        def _download(filename: str) -> str:
+            return hf_hub_download(
+                repo_id=model_id,
+                filename=filename,
+                revision=revision,
+                cache_dir=cache_dir,
+                force_download=force_download,
+                token=token,
+                local_files_only=local_files_only,
+            )
+
+        try:
+            return [_download(constants.SAFETENSORS_SINGLE_FILE)]
+        except EntryNotFoundError:
+            pass
+        try:
+            index_file = _download(constants.SAFETENSORS_INDEX_FILE)
+        except EntryNotFoundError:
+            return [_download(constants.PYTORCH_WEIGHTS_NAME)]
+
+        with open(index_file, encoding="utf-8") as f:
+            shards = sorted(set(json.load(f)["weight_map"].values()))
+        return [index_file] + hf_thread_map(
+            _download,
+            shards,
+            max_workers=_MAX_SHARD_DOWNLOAD_WORKERS,
+            desc=f"Fetching {len(shards)} shards",
+        )
 
     @classmethod
     def _load_as_pickle(cls, model: T, model_file: str, map_location: str, strict: bool) -> T:
@@ -825,6 +930,89 @@ class PyTorchModelHubMixin(ModelHubMixin):
         model.eval()  # type: ignore
         return model
 
+    @classmethod
+    def _load_as_sharded_safetensors(cls, model: T, index_file: str, map_location: str, strict: bool) -> T:
+        # Shards are loaded one by one: the whole checkpoint is never held in memory at once
+        load_torch_model(model, os.path.dirname(index_file), strict=strict, map_location=map_location)  # type: ignore
+        model.eval()  # type: ignore
+        return model
+
+
+def _prefetches_pretrained_weights(cls: type) -> bool:
+    """Whether `from_pretrained` should call `cls._download_pretrained_weights` in advance.
+
+    Weights are only prefetched if `_from_pretrained` and `_download_pretrained_weights` are defined by the same class.
+    A subclass overriding `_from_pretrained` alone (e.g. to load weights from another file) loads its weights on its own.
+    """
+
+    def _owner(name: str) -> type | None:
+        return next((klass for klass in cls.__mro__ if name in vars(klass)), None)
+
+    owner = _owner("_download_pretrained_weights")
+    return owner is not ModelHubMixin and owner is _owner("_from_pretrained")
+
+
+def _resolve_pretrained_revision(
+    model_id: str,
+    *,
+    revision: str | None,
+    cache_dir: str | Path | None,
+    local_files_only: bool,
+    token: str | bool | None,
+) -> str | None:
+    try:
+        return HfApi().resolve_revision(
+            model_id, revision=revision, cache_dir=cache_dir, local_files_only=local_files_only, token=token
+        )
+    except RevisionResolutionError:
+        # Hub cannot be reached and nothing is cached => let each download raise its own explicit error
+        return revision
+
+
+def _fetch_pretrained_config(
+    model_id: str,
+    *,
+    revision: str | None,
+    cache_dir: str | Path | None,
+    force_download: bool,
+    local_files_only: bool,
+    token: str | bool | None,
+) -> dict | None:
+    """Download and parse the config of a model hosted on the Hub. Return `None` if the model has no config."""
+    memo_key = None
+    if isinstance(revision, ResolvedRevision):
+        memo_key = (str(Path(cache_dir or constants.HF_HUB_CACHE).expanduser().resolve()), model_id, revision.resolved)
+        if not force_download:
+            with _PRETRAINED_CONFIG_MEMO_LOCK:
+                if memo_key in _PRETRAINED_CONFIG_MEMO:
+                    _PRETRAINED_CONFIG_MEMO.move_to_end(memo_key)
+                    # Copy: the config is decoded in place by `from_pretrained`
+                    return copy.deepcopy(_PRETRAINED_CONFIG_MEMO[memo_key])
+
+    try:
+        config_file = hf_hub_download(
+            repo_id=model_id,
+            filename=constants.CONFIG_NAME,
+            revision=revision,
+            cache_dir=cache_dir,
+            force_download=force_download,
+            token=token,
+            local_files_only=local_files_only,
+        )
+    except HfHubHTTPError as e:
+        logger.info(f"{constants.CONFIG_NAME} not found on the HuggingFace Hub: {str(e)}")
+        return None
+    with open(config_file, encoding="utf-8") as f:
+        config = json.load(f)
+
+    if memo_key is not None:
+        with _PRETRAINED_CONFIG_MEMO_LOCK:
+            _PRETRAINED_CONFIG_MEMO[memo_key] = copy.deepcopy(config)
+            _PRETRAINED_CONFIG_MEMO.move_to_end(memo_key)
+            while len(_PRETRAINED_CONFIG_MEMO) > _PRETRAINED_CONFIG_MEMO_MAX_SIZE:
+                _PRETRAINED_CONFIG_MEMO.popitem(last=False)
+    return config
+
 
 def _load_dataclass(datacls: type[DataclassInstance], data: dict) -> DataclassInstance:
     """Load a dataclass instance from a dictionary.
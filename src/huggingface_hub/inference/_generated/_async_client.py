@@ -91,7 +91,7 @@ from huggingface_hub.inference._generated.types import (
 from huggingface_hub.inference._providers import PROVIDER_OR_POLICY_T, get_provider_helper
 from huggingface_hub.utils import (
     build_hf_headers,
-    get_async_session,
+    get_shared_async_session,
     hf_raise_for_status,
     validate_hf_hub_args,
 )
@@ -243,15 +243,16 @@ class AsyncInferenceClient:
         This method is automatically called when using the client as a context manager.
         """
         await self.exit_stack.aclose()
+        self._async_client = None
 
     async def _get_async_client(self):
-        """Get a unique async client for this AsyncInferenceClient instance.
+        """Get the async client used by this AsyncInferenceClient instance.
 
-        Returns the same client instance on subsequent calls, ensuring proper
-        connection reuse and resource management through the exit stack.
+        The client is shared with all other calls made in the same event loop (see `get_shared_async_session`), so
+        that connections are reused. Its lifecycle is managed by `huggingface_hub`: it is not closed with this instance.
         """
         if self._async_client is None:
-            self._async_client = await self.exit_stack.enter_async_context(get_async_session())
+            self._async_client = get_shared_async_session()
         return self._async_client
 
     @overload
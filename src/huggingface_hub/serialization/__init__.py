@@ -16,6 +16,7 @@
 
 from ._base import StateDictSplit, split_state_dict_into_shards_factory
 from ._torch import (
+    LazySafetensorsStateDict,
     get_torch_storage_id,
     get_torch_storage_size,
     load_state_dict_from_file,
@@ -23,4 +24,5 @@ from ._torch import (
     save_torch_model,
     save_torch_state_dict,
     split_torch_state_dict_into_shards,
+    upload_torch_state_dict,
 )
@@ -13,9 +13,12 @@
 # limitations under the License.
 """Contains helpers to split tensors into shards."""
 
+import hashlib
+import heapq
+import math
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 from .. import logging
 
@@ -23,8 +26,10 @@ from .. import logging
 TensorT = TypeVar("TensorT")
 TensorSizeFn_T = Callable[[TensorT], int]
 StorageIDFn_T = Callable[[TensorT], Any | None]
+ShardingStrategy_T = Literal["sequential", "balanced", "stable"]
 
 MAX_SHARD_SIZE = "5GB"
+SHARDING_STRATEGIES: tuple[ShardingStrategy_T, ...] = ("sequential", "balanced", "stable")
 SIZE_UNITS = {
     "TB": 10**12,
     "GB": 10**9,
@@ -54,14 +59,27 @@ def split_state_dict_into_shards_factory(
     filename_pattern: str,
     get_storage_id: StorageIDFn_T = lambda tensor: None,
     max_shard_size: int | str = MAX_SHARD_SIZE,
+    sharding_strategy: ShardingStrategy_T = "sequential",
+    layer_locality: bool = False,
 ) -> StateDictSplit:
     """
     Split a model state dictionary in shards so that each shard is smaller than a given size.
 
-    The shards are determined by iterating through the `state_dict` in the order of its keys. There is no optimization
-    made to make each shard as close as possible to the maximum size passed. For example, if the limit is 10GB and we
-    have tensors of sizes [6GB, 6GB, 2GB, 6GB, 2GB, 2GB] they will get sharded as [6GB], [6+2GB], [6+2+2GB] and not
-    [6+2+2GB], [6+2GB], [6GB].
+    With the default `"sequential"` strategy, the shards are determined by iterating through the `state_dict` in the
+    order of its keys. There is no optimization made to make each shard as close as possible to the maximum size
+    passed. For example, if the limit is 10GB and we have tensors of sizes [6GB, 6GB, 2GB, 6GB, 2GB, 2GB] they will get
+    sharded as [6GB], [6+2GB], [6+2+2GB] and not [6+2+2GB], [6+2GB], [6GB].
+
+    The `"balanced"` strategy packs tensors regardless of their order (first-fit-decreasing) to use as few shards as
+    possible, then spreads them so that shards have similar sizes. This avoids a nearly empty last shard and a
+    largest shard slowing down parallel downloads and loads. Shards are still numbered in `state_dict` order.
+
+    The `"stable"` strategy keeps tensors in `state_dict` order but cuts shards at positions derived from the tensor
+    names and sizes only: a shard ends after a tensor if a hash of its name falls below a threshold proportional to its
+    size (shards are ~`max_shard_size / 2` on average), or if the next tensor would not fit. Adding, removing or
+    resizing a tensor only changes the shard(s) around it, the other shards keep the exact same content. When
+    re-saving a fine-tuned model, unchanged shards are deduplicated on upload instead of being uploaded again (even if
+    their filename changed).
 
     > [!WARNING]
     > If one of the model's tensor is bigger than `max_shard_size`, it will end up in its own shard which will have a
@@ -81,16 +99,24 @@ def split_state_dict_into_shards_factory(
             can be formatted with `filename_pattern.format(suffix=...)` and must contain the keyword `suffix`
         max_shard_size (`int` or `str`, *optional*):
             The maximum size of each shard, in bytes. Defaults to 5GB.
+        sharding_strategy (`str`, *optional*):
+            How tensors are packed into shards, either `"sequential"`, `"balanced"` or `"stable"`. Defaults to
+            `"sequential"`.
+        layer_locality (`bool`, *optional*):
+            Whether to keep the tensors of a same layer (e.g. all `"model.layers.12.*"` tensors) in the same shard, so
+            that loading a layer reads a single file. Layers bigger than `max_shard_size` are split. Defaults to
+            `False`.
 
     Returns:
         [`StateDictSplit`]: A `StateDictSplit` object containing the shards and the index to retrieve them.
     """
-    storage_id_to_tensors: dict[Any, list[str]] = {}
+    if sharding_strategy not in SHARDING_STRATEGIES:
+        raise ValueError(
+            f"Invalid sharding strategy '{sharding_strategy}'. Must be one of {', '.join(SHARDING_STRATEGIES)}."
+        )
 
-    shard_list: list[dict[str, TensorT]] = []
-    current_shard: dict[str, TensorT] = {}
-    current_shard_size = 0
-    total_size = 0
+    storage_id_to_tensors: dict[Any, list[str]] = {}
+    tensor_sizes: dict[str, int] = {}
 
     if isinstance(max_shard_size, str):
         max_shard_size = parse_size_to_int(max_shard_size)
@@ -115,29 +141,19 @@ def split_state_dict_into_shards_factory(
                 storage_id_to_tensors[storage_id] = [key]
 
         # Compute tensor size
-        tensor_size = get_storage_size(tensor)  # type: ignore[invalid-argument-type]
-
-        # If this tensor is bigger than the maximal size, we put it in its own shard
-        if tensor_size > max_shard_size:
-            total_size += tensor_size
-            shard_list.append({key: tensor})
-            continue
-
-        # If this tensor is going to tip up over the maximal size, we split.
-        # Current shard already has some tensors, we add it to the list of shards and create a new one.
-        if current_shard_size + tensor_size > max_shard_size:
-            shard_list.append(current_shard)
-            current_shard = {}
-            current_shard_size = 0
-
-        # Add the tensor to the current shard
-        current_shard[key] = tensor
-        current_shard_size += tensor_size
-        total_size += tensor_size
-
-    # Add the last shard
-    if len(current_shard) > 0:
-        shard_list.append(current_shard)
+        tensor_sizes[key] = get_storage_size(tensor)  # type: ignore[invalid-argument-type]
+
+    total_size = sum(tensor_sizes.values())
+
+    # Pack tensors (or whole layers) into shards
+    blocks = _group_into_blocks(tensor_sizes, max_shard_size=max_shard_size, layer_locality=layer_locality)
+    if sharding_strategy == "balanced":
+        shard_keys = _pack_balanced(blocks, max_shard_size=max_shard_size, key_order=tensor_sizes)
+    elif sharding_strategy == "stable":
+        shard_keys = _pack_stable(blocks, max_shard_size=max_shard_size)
+    else:
+        shard_keys = _pack_sequential(blocks, max_shard_size=max_shard_size)
+    shard_list: list[dict[str, TensorT]] = [{key: state_dict[key] for key in keys} for keys in shard_keys]
     nb_shards = len(shard_list)
 
     # Loop over the tensors that share the same storage and assign them together
@@ -179,6 +195,159 @@ def split_state_dict_into_shards_factory(
     )
 
 
+# A block is a group of tensors that must end up in the same shard, with its total size
+_Block = tuple[list[str], int]
+
+
+def _group_into_blocks(tensor_sizes: dict[str, int], *, max_shard_size: int, layer_locality: bool) -> list[_Block]:
+    """Group tensors into blocks, in order of first appearance. One block per tensor unless `layer_locality`."""
+    if not layer_locality:
+        return [([key], size) for key, size in tensor_sizes.items()]
+
+    layers: dict[str, list[str]] = {}
+    for key in tensor_sizes:
+        layers.setdefault(_get_layer_prefix(key), []).append(key)
+
+    blocks: list[_Block] = []
+    for keys in layers.values():
+        layer_size = sum(tensor_sizes[key] for key in keys)
+        if layer_size > max_shard_size and len(keys) > 1:
+            # Layer doesn't fit in a shard => fallback to per-tensor blocks
+            blocks.extend(([key], tensor_sizes[key]) for key in keys)
+        else:
+            blocks.append((keys, layer_size))
+    return blocks
+
+
+def _get_layer_prefix(key: str) -> str:
+    """Return the layer a tensor belongs to, i.e. its name up to the first numeric part (`"model.layers.12"`)."""
+    parts = key.split(".")
+    for idx, part in enumerate(parts):
+        if part.isdigit():
+            return ".".join(parts[: idx + 1])
+    return key
+
+
+def _pack_sequential(blocks: list[_Block], *, max_shard_size: int) -> list[list[str]]:
+    """Fill shards one after the other, in blocks order."""
+    shards: list[list[str]] = []
+    current_shard: list[str] = []
+    current_shard_size = 0
+    for keys, size in blocks:
+        # If this block is bigger than the maximal size, we put it in its own shard
+        if size > max_shard_size:
+            shards.append(list(keys))
+            continue
+
+        # If this block is going to tip up over the maximal size, we split.
+        # Current shard already has some tensors, we add it to the list of shards and create a new one.
+        if current_shard_size + size > max_shard_size:
+            shards.append(current_shard)
+            current_shard = []
+            current_shard_size = 0
+
+        # Add the block to the current shard
+        current_shard.extend(keys)
+        current_shard_size += size
+
+    # Add the last shard
+    if len(current_shard) > 0:
+        shards.append(current_shard)
+    return shards
+
+
+def _pack_balanced(blocks: list[_Block], *, max_shard_size: int, key_order: dict[str, Any]) -> list[list[str]]:
+    """Pack blocks into as few shards as possible, with shard sizes as even as possible.
+
+    First-fit-decreasing gives an upper bound on the number of shards. Then, for each possible number of shards (from
+    the theoretical minimum), blocks are spread with the "largest block to the least loaded shard" heuristic. The
+    first spread fitting in `max_shard_size` is kept, otherwise the first-fit-decreasing packing is.
+    """
+    position = {key: idx for idx, key in enumerate(key_order)}
+
+    # Blocks bigger than the maximal size are put in their own shard
+    oversized = [keys for keys, size in blocks if size > max_shard_size]
+    # Sort by decreasing size (stable: ties keep the `state_dict` order)
+    fitting = sorted((block for block in blocks if block[1] <= max_shard_size), key=lambda block: -block[1])
+
+    ffd_shards: list[tuple[int, list[str]]] = []  # (size, keys)
+    for keys, size in fitting:
+        for idx, (shard_size, shard_keys) in enumerate(ffd_shards):
+            if shard_size + size <= max_shard_size:
+                ffd_shards[idx] = (shard_size + size, shard_keys + keys)
+                break
+        else:
+            ffd_shards.append((size, list(keys)))
+    packed = [keys for _, keys in ffd_shards]
+
+    if len(fitting) > 0 and max_shard_size > 0:
+        min_nb_shards = max(1, math.ceil(sum(size for _, size in fitting) / max_shard_size))
+        for nb_shards in range(min_nb_shards, len(ffd_shards) + 1):
+            spread = _spread_into_shards(fitting, nb_shards=nb_shards, max_shard_size=max_shard_size)
+            if spread is not None:
+                packed = spread
+                break
+
+    # Number shards and order tensors within shards by their position in the `state_dict`
+    shards = [sorted(keys, key=position.__getitem__) for keys in packed + oversized if len(keys) > 0]
+    return sorted(shards, key=lambda keys: position[keys[0]])
+
+
+def _pack_stable(blocks: list[_Block], *, max_shard_size: int) -> list[list[str]]:
+    """Fill shards in blocks order, ending a shard after "boundary" blocks (content-defined, see `_is_boundary`)."""
+    target_shard_size = max(max_shard_size // 2, 1)
+    shards: list[list[str]] = []
+    current_shard: list[str] = []
+    current_shard_size = 0
+    for keys, size in blocks:
+        # If this block is bigger than the maximal size, we put it in its own shard
+        if size > max_shard_size:
+            if len(current_shard) > 0:
+                shards.append(current_shard)
+            shards.append(list(keys))
+            current_shard, current_shard_size = [], 0
+            continue
+
+        # Overflow: cut before the block. Next boundaries are unaffected so the shift is local.
+        if current_shard_size + size > max_shard_size:
+            shards.append(current_shard)
+            current_shard, current_shard_size = [], 0
+
+        current_shard.extend(keys)
+        current_shard_size += size
+        if _is_boundary(keys[0], size, target_shard_size):
+            shards.append(current_shard)
+            current_shard, current_shard_size = [], 0
+
+    # Add the last shard
+    if len(current_shard) > 0:
+        shards.append(current_shard)
+    return shards
+
+
+def _is_boundary(key: str, size: int, target_shard_size: int) -> bool:
+    """Whether a shard ends after this tensor, with a probability of `size / target_shard_size`.
+
+    Only depends on the tensor name and size, not on its position: shard boundaries don't move when other tensors
+    are added, removed or resized. On average, a boundary happens every `target_shard_size` bytes.
+    """
+    key_hash = int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+    return key_hash < (size / target_shard_size) * 2**64
+
+
+def _spread_into_shards(blocks: list[_Block], *, nb_shards: int, max_shard_size: int) -> list[list[str]] | None:
+    """Assign each block (sorted by decreasing size) to the least loaded shard. Return None if a shard overflows."""
+    heap = [(0, idx) for idx in range(nb_shards)]
+    shards: list[list[str]] = [[] for _ in range(nb_shards)]
+    for keys, size in blocks:
+        shard_size, idx = heapq.heappop(heap)
+        if shard_size + size > max_shard_size:
+            return None  # the least loaded shard can't fit it => no shard can
+        shards[idx].extend(keys)
+        heapq.heappush(heap, (shard_size + size, idx))
+    return shards
+
+
 def parse_size_to_int(size_as_str: str) -> int:
     """
     Parse a size expressed as a string with digits and unit (like `"5MB"`) to an integer (in bytes).
@@ -5,14 +5,20 @@ import os
 import shutil
 import zipfile
 from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from .. import constants
 from ..errors import DDUFCorruptedFileError, DDUFExportError, DDUFInvalidEntryNameError
 
 
+if TYPE_CHECKING:
+    from ..hf_file_system import HfFileSystem
+
+
 logger = logging.getLogger(__name__)
 
 DDUF_ALLOWED_ENTRIES = {
@@ -31,6 +37,15 @@ DDUF_FOLDER_REQUIRED_ENTRIES = {
     "scheduler_config.json",
 }
 
+# Size of the chunks written to the archive when exporting a file from the local disk
+_EXPORT_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Block size used to read the central directory of a remote DDUF file (located at the end of the archive)
+_REMOTE_CENTRAL_DIRECTORY_BLOCK_SIZE = 1024 * 1024
+
+# Max number of concurrent requests when reading the local file headers of a remote DDUF file
+_REMOTE_MAX_WORKERS = 8
+
 
 @dataclass
 class DDUFEntry:
@@ -46,20 +61,26 @@ class DDUFEntry:
         length (int):
             The length of the file in the DDUF archive.
         dduf_path (str):
-            The path to the DDUF archive (for internal use).
+            The path to the DDUF archive (for internal use). Either a local path or a `hf://` URL.
     """
 
     filename: str
     length: int
     offset: int
 
-    dduf_path: Path = field(repr=False)
+    dduf_path: Path | str = field(repr=False)
+
+    @property
+    def is_remote(self) -> bool:
+        """Whether the entry belongs to a DDUF archive on the Hub (see [`read_dduf_file`])."""
+        return isinstance(self.dduf_path, str) and self.dduf_path.startswith(constants.HF_PROTOCOL)
 
     @contextmanager
     def as_mmap(self) -> Generator[bytes, None, None]:
         """Open the file as a memory-mapped file.
 
-        Useful to load safetensors directly from the file.
+        Useful to load safetensors directly from the file. For a remote DDUF archive, only the bytes of this entry
+        are downloaded.
 
         Example:
             ```py
@@ -68,10 +89,26 @@ class DDUFEntry:
             ...     tensors = safetensors.torch.load(mm)
             ```
         """
-        with self.dduf_path.open("rb") as f:
+        if self.is_remote:
+            yield self.read_bytes()
+            return
+        with Path(self.dduf_path).open("rb") as f:
             with mmap.mmap(f.fileno(), length=0, access=mmap.ACCESS_READ) as mm:
                 yield mm[self.offset : self.offset + self.length]
 
+    def read_bytes(self) -> bytes:
+        """Read the file as bytes.
+
+        For a remote DDUF archive, a single range request is made to fetch the entry.
+        """
+        if self.is_remote:
+            from ..hf_file_system import HfFileSystem
+
+            return _read_remote_range(HfFileSystem(), str(self.dduf_path), self.offset, self.length)
+        with Path(self.dduf_path).open("rb") as f:
+            f.seek(self.offset)
+            return f.read(self.length)
+
     def read_text(self, encoding: str = "utf-8") -> str:
         """Read the file as text.
 
@@ -83,9 +120,7 @@ class DDUFEntry:
             >>> index = json.loads(entry.read_text())
             ```
         """
-        with self.dduf_path.open("rb") as f:
-            f.seek(self.offset)
-            return f.read(self.length).decode(encoding=encoding)
+        return self.read_bytes().decode(encoding=encoding)
 
 
 def read_dduf_file(dduf_path: os.PathLike | str) -> dict[str, DDUFEntry]:
@@ -94,9 +129,14 @@ def read_dduf_file(dduf_path: os.PathLike | str) -> dict[str, DDUFEntry]:
 
     Only the metadata is read, the data is not loaded in memory.
 
+    The DDUF file can also be read directly from the Hub by passing a `hf://` URL (see [`HfFileSystem`]). In that case,
+    only the central directory of the archive is downloaded (using HTTP range requests) and each entry is fetched
+    lazily when read. This makes it possible to load a single component without downloading the whole archive. The
+    revision is resolved once so that all entries are read from the same version of the file.
+
     Args:
         dduf_path (`str` or `os.PathLike`):
-            The path to the DDUF file to read.
+            The path to the DDUF file to read, or a `hf://` URL to a DDUF file on the Hub.
 
     Returns:
         `dict[str, DDUFEntry]`:
@@ -125,27 +165,26 @@ def read_dduf_file(dduf_path: os.PathLike | str) -> dict[str, DDUFEntry]:
         # Load VAE weights using safetensors
         >>> with dduf_entries["vae/diffusion_pytorch_model.safetensors"].as_mmap() as mm:
         ...     state_dict = safetensors.torch.load(mm)
+
+        # Read a single component from a DDUF file on the Hub
+        >>> dduf_entries = read_dduf_file("hf://DDUF/FLUX.1-dev-DDUF/FLUX.1-dev.dduf")
+        >>> with dduf_entries["vae/diffusion_pytorch_model.safetensors"].as_mmap() as data:
+        ...     state_dict = safetensors.torch.load(data)
         ```
     """
-    entries = {}
-    dduf_path = Path(dduf_path)
-    logger.info(f"Reading DDUF file {dduf_path}")
-    with zipfile.ZipFile(str(dduf_path), "r") as zf:
-        for info in zf.infolist():
-            logger.debug(f"Reading entry {info.filename}")
-            if info.compress_type != zipfile.ZIP_STORED:
-                raise DDUFCorruptedFileError("Data must not be compressed in DDUF file.")
-
-            try:
-                _validate_dduf_entry_name(info.filename)
-            except DDUFInvalidEntryNameError as e:
-                raise DDUFCorruptedFileError(f"Invalid entry name in DDUF file: {info.filename}") from e
-
-            offset = _get_data_offset(zf, info)
-
-            entries[info.filename] = DDUFEntry(
-                filename=info.filename, offset=offset, length=info.file_size, dduf_path=dduf_path
-            )
+    if isinstance(dduf_path, str) and dduf_path.startswith(constants.HF_PROTOCOL):
+        entries = _read_remote_dduf_entries(dduf_path)
+    else:
+        entries = {}
+        dduf_path = Path(dduf_path)
+        logger.info(f"Reading DDUF file {dduf_path}")
+        with zipfile.ZipFile(str(dduf_path), "r") as zf:
+            for info in zf.infolist():
+                _validate_dduf_zip_info(info)
+                offset = _get_data_offset(zf, info)
+                entries[info.filename] = DDUFEntry(
+                    filename=info.filename, offset=offset, length=info.file_size, dduf_path=dduf_path
+                )
 
     # Consistency checks on the DDUF file
     if "model_index.json" not in entries:
@@ -157,6 +196,57 @@ def read_dduf_file(dduf_path: os.PathLike | str) -> dict[str, DDUFEntry]:
     return entries
 
 
+def _read_remote_dduf_entries(dduf_path: str) -> dict[str, DDUFEntry]:
+    """List the entries of a DDUF file on the Hub, without downloading the entries themselves."""
+    from ..file_download import REGEX_COMMIT_HASH
+    from ..hf_file_system import HfFileSystem, HfFileSystemResolvedRepositoryPath
+
+    fs = HfFileSystem()
+    resolved_path = fs.resolve_path(dduf_path)
+    if isinstance(resolved_path, HfFileSystemResolvedRepositoryPath) and not REGEX_COMMIT_HASH.match(
+        resolved_path.revision
+    ):
+        # Pin the revision: offsets are only valid for this exact version of the archive
+        commit_hash = fs._api.resolve_revision(
+            resolved_path.repo_id, repo_type=resolved_path.repo_type, revision=resolved_path.revision
+        ).resolved
+        resolved_path = HfFileSystemResolvedRepositoryPath(
+            resolved_path.repo_type, resolved_path.repo_id, commit_hash, resolved_path.path_in_repo
+        )
+    dduf_path = constants.HF_PROTOCOL + resolved_path.unresolve()
+    logger.info(f"Reading remote DDUF file {dduf_path}")
+
+    # The central directory is at the end of the archive => aligned blocks fetch it in 1 or 2 requests
+    with (
+        fs.open(dduf_path, "rb", block_size=_REMOTE_CENTRAL_DIRECTORY_BLOCK_SIZE, cache_type="blockcache") as f,
+        zipfile.ZipFile(f, "r") as zf,
+    ):
+        infos = zf.infolist()
+    for info in infos:
+        _validate_dduf_zip_info(info)
+
+    # The data offset of each entry depends on its local file header, spread across the archive
+    def _get_remote_data_offset(info: zipfile.ZipInfo) -> int:
+        return _parse_local_file_header(info, _read_remote_range(fs, dduf_path, info.header_offset, 30))
+
+    with ThreadPoolExecutor(max_workers=_REMOTE_MAX_WORKERS, thread_name_prefix="hf-dduf-header") as executor:
+        offsets = list(executor.map(_get_remote_data_offset, infos))
+
+    return {
+        info.filename: DDUFEntry(filename=info.filename, offset=offset, length=info.file_size, dduf_path=dduf_path)
+        for info, offset in zip(infos, offsets)
+    }
+
+
+def _read_remote_range(fs: "HfFileSystem", dduf_path: str, start: int, length: int) -> bytes:
+    """Read `length` bytes at `start` from a remote file, in a single range request."""
+    if length == 0:
+        return b""
+    with fs.open(dduf_path, "rb", cache_type="none") as f:
+        f.seek(start)
+        return f.read(length)
+
+
 def export_entries_as_dduf(dduf_path: str | os.PathLike, entries: Iterable[tuple[str, str | Path | bytes]]) -> None:
     """Write a DDUF file from an iterable of entries.
 
@@ -214,6 +304,16 @@ def export_entries_as_dduf(dduf_path: str | os.PathLike, entries: Iterable[tuple
         ```
     """
     logger.info(f"Exporting DDUF file '{dduf_path}'")
+    try:
+        _export_entries_as_dduf(dduf_path, entries)
+    except BaseException:
+        # Don't leave a partial or invalid archive behind
+        Path(dduf_path).unlink(missing_ok=True)
+        raise
+    logger.info(f"Done writing DDUF file {dduf_path}")
+
+
+def _export_entries_as_dduf(dduf_path: str | os.PathLike, entries: Iterable[tuple[str, str | Path | bytes]]) -> None:
     filenames = set()
     index = None
     with zipfile.ZipFile(str(dduf_path), "w", zipfile.ZIP_STORED) as archive:
@@ -223,8 +323,10 @@ def export_entries_as_dduf(dduf_path: str | os.PathLike, entries: Iterable[tuple
             filenames.add(filename)
 
             if filename == "model_index.json":
+                # Loaded once, both to validate and to write it (avoids reading the file twice)
+                content = _load_content(content)
                 try:
-                    index = json.loads(_load_content(content).decode())
+                    index = json.loads(content.decode())
                 except json.JSONDecodeError as e:
                     raise DDUFExportError("Failed to parse 'model_index.json'.") from e
 
@@ -232,6 +334,15 @@ def export_entries_as_dduf(dduf_path: str | os.PathLike, entries: Iterable[tuple
                 filename = _validate_dduf_entry_name(filename)
             except DDUFInvalidEntryNameError as e:
                 raise DDUFExportError(f"Invalid entry name: {filename}") from e
+
+            if index is not None:
+                # Fail before writing gigabytes of data if a folder is not declared in the index. Missing config files
+                # can only be detected once all entries are known.
+                try:
+                    _validate_dduf_folders_in_index(index, filenames)
+                except DDUFCorruptedFileError as e:
+                    raise DDUFExportError("Invalid DDUF file structure.") from e
+
             logger.debug(f"Adding entry '{filename}' to DDUF file")
             _dump_content_in_archive(archive, filename, content)
 
@@ -243,8 +354,6 @@ def export_entries_as_dduf(dduf_path: str | os.PathLike, entries: Iterable[tuple
     except DDUFCorruptedFileError as e:
         raise DDUFExportError("Invalid DDUF file structure.") from e
 
-    logger.info(f"Done writing DDUF file {dduf_path}")
-
 
 def export_folder_as_dduf(dduf_path: str | os.PathLike, folder_path: str | os.PathLike) -> None:
     """
@@ -287,13 +396,32 @@ def _dump_content_in_archive(archive: zipfile.ZipFile, filename: str, content: s
         if isinstance(content, (str, Path)):
             content_path = Path(content)
             with content_path.open("rb") as content_fh:
-                shutil.copyfileobj(content_fh, archive_fh, 1024 * 1024 * 8)  # type: ignore[misc]
+                _copy_file_to_archive(content_fh, archive_fh)
         elif isinstance(content, bytes):
             archive_fh.write(content)
         else:
             raise DDUFExportError(f"Invalid content type for {filename}. Must be str, Path or bytes.")
 
 
+def _copy_file_to_archive(content_fh: Any, archive_fh: Any) -> None:
+    """Copy a local file into an archive entry in a single pass.
+
+    The file is memory-mapped and written by slices: the CRC32 required by the ZIP format is computed and the data
+    written directly from the page cache, without intermediate read buffers. A kernel-side copy
+    (`copy_file_range`/`sendfile`) is not possible here since the CRC32 must be computed on the data anyway.
+    """
+    try:
+        mm = mmap.mmap(content_fh.fileno(), length=0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Empty file or not a regular file (e.g. a pipe) => fallback to buffered copy
+        shutil.copyfileobj(content_fh, archive_fh, _EXPORT_CHUNK_SIZE)
+        return
+    with mm, memoryview(mm) as view:
+        for start in range(0, len(view), _EXPORT_CHUNK_SIZE):
+            with view[start : start + _EXPORT_CHUNK_SIZE] as chunk:
+                archive_fh.write(chunk)
+
+
 def _load_content(content: str | Path | bytes) -> bytes:
     """Load the content of an entry as bytes.
 
@@ -336,19 +464,36 @@ def _validate_dduf_structure(index: Any, entry_names: Iterable[str]) -> None:
     Raises:
         - [`DDUFCorruptedFileError`]: If the DDUF file is corrupted (i.e. doesn't follow the DDUF format).
     """
-    if not isinstance(index, dict):
-        raise DDUFCorruptedFileError(f"Invalid 'model_index.json' content. Must be a dictionary. Got {type(index)}.")
-
-    dduf_folders = {entry.split("/")[0] for entry in entry_names if "/" in entry}
-    for folder in dduf_folders:
-        if folder not in index:
-            raise DDUFCorruptedFileError(f"Missing required entry '{folder}' in 'model_index.json'.")
+    entry_names = set(entry_names)
+    _validate_dduf_folders_in_index(index, entry_names)
+    for folder in {entry.split("/")[0] for entry in entry_names if "/" in entry}:
         if not any(f"{folder}/{required_entry}" in entry_names for required_entry in DDUF_FOLDER_REQUIRED_ENTRIES):
             raise DDUFCorruptedFileError(
                 f"Missing required file in folder '{folder}'. Must contains at least one of {DDUF_FOLDER_REQUIRED_ENTRIES}."
             )
 
 
+def _validate_dduf_folders_in_index(index: Any, entry_names: Iterable[str]) -> None:
+    """Check that 'model_index.json' is a dictionary declaring each folder of the DDUF file."""
+    if not isinstance(index, dict):
+        raise DDUFCorruptedFileError(f"Invalid 'model_index.json' content. Must be a dictionary. Got {type(index)}.")
+    for entry in entry_names:
+        folder = entry.split("/")[0]
+        if "/" in entry and folder not in index:
+            raise DDUFCorruptedFileError(f"Missing required entry '{folder}' in 'model_index.json'.")
+
+
+def _validate_dduf_zip_info(info: zipfile.ZipInfo) -> None:
+    logger.debug(f"Reading entry {info.filename}")
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise DDUFCorruptedFileError("Data must not be compressed in DDUF file.")
+
+    try:
+        _validate_dduf_entry_name(info.filename)
+    except DDUFInvalidEntryNameError as e:
+        raise DDUFCorruptedFileError(f"Invalid entry name in DDUF file: {info.filename}") from e
+
+
 def _get_data_offset(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> int:
     """
     Calculate the data offset for a file in a ZIP archive.
@@ -371,7 +516,12 @@ def _get_data_offset(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> int:
     # Step 2: Read the local file header
     zf.fp.seek(header_offset)
     local_file_header = zf.fp.read(30)  # Fixed-size part of the local header
+    return _parse_local_file_header(info, local_file_header)
+
 
+def _parse_local_file_header(info: zipfile.ZipInfo, local_file_header: bytes) -> int:
+    """Return the data offset of a file given the fixed-size part (30 bytes) of its local file header."""
+    header_offset = info.header_offset
     if len(local_file_header) < 30:
         raise DDUFCorruptedFileError("Incomplete local file header.")
 
@@ -13,13 +13,19 @@
 # limitations under the License.
 """Contains pytorch-specific helpers."""
 
+import contextlib
 import importlib
 import importlib.util
 import json
+import mmap as mmap_module
 import os
 import re
+import struct
+import tempfile
+import uuid
 from collections import defaultdict, namedtuple
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from functools import lru_cache
 from pathlib import Path, PureWindowsPath
 from typing import TYPE_CHECKING, Any, NamedTuple, Union
@@ -27,14 +33,44 @@ from typing import TYPE_CHECKING, Any, NamedTuple, Union
 from packaging import version
 
 from .. import constants, logging
-from ._base import MAX_SHARD_SIZE, StateDictSplit, split_state_dict_into_shards_factory
+from ._base import (
+    MAX_SHARD_SIZE,
+    ShardingStrategy_T,
+    StateDictSplit,
+    parse_size_to_int,
+    split_state_dict_into_shards_factory,
+)
 
 
 logger = logging.get_logger(__file__)
 
+# Max number of shards loaded in background threads while another shard is copied into the model
+SHARD_PREFETCH_MAX_WORKERS = 2
+
+# With `lazy=True`, tensors are copied into the model by groups of this size before their pages are released
+LAZY_LOAD_GROUP_SIZE = 256 * 1024 * 1024
+
+# Safetensors dtypes (as stored in the header) => torch dtype names
+SAFETENSORS_TORCH_DTYPES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "F8_E4M3": "float8_e4m3fn",
+    "F8_E5M2": "float8_e5m2",
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "BOOL": "bool",
+}
+
 if TYPE_CHECKING:
     import torch
 
+    from ..hf_api import CommitInfo
+
 # SAVING
 
 
@@ -49,6 +85,10 @@ def save_torch_model(
     safe_serialization: bool = True,
     is_main_process: bool = True,
     shared_tensors_to_discard: list[str] | None = None,
+    max_workers: int = 1,
+    fsync: bool = False,
+    sharding_strategy: ShardingStrategy_T = "sequential",
+    layer_locality: bool = False,
 ):
     """
     Saves a given torch model to disk, handling sharding and shared tensors issues.
@@ -103,6 +143,18 @@ def save_torch_model(
         shared_tensors_to_discard (`list[str]`, *optional*):
             List of tensor names to drop when saving shared tensors. If not provided and shared tensors are
             detected, it will drop the first name alphabetically.
+        max_workers (`int`, *optional*):
+            Number of shards serialized and written concurrently. Each worker holds one serialized shard in memory.
+            Defaults to 1 (shards are written one after the other).
+        fsync (`bool`, *optional*):
+            Whether to flush the shards and the index to stable storage before returning. Shards are flushed in a
+            single batch once all of them are written, right before the index. Defaults to `False`.
+        sharding_strategy (`str`, *optional*):
+            How tensors are packed into shards: `"sequential"` (in `state_dict` order), `"balanced"` (as few shards as
+            possible, with similar sizes) or `"stable"` (boundaries derived from tensor names, so that unchanged shards
+            are deduplicated when re-uploading an edited model). Defaults to `"sequential"`.
+        layer_locality (`bool`, *optional*):
+            Whether to keep the tensors of a same layer in the same shard. Defaults to `False`.
 
     Example:
 
@@ -129,6 +181,10 @@ def save_torch_model(
         save_directory=save_directory,
         is_main_process=is_main_process,
         shared_tensors_to_discard=shared_tensors_to_discard,
+        max_workers=max_workers,
+        fsync=fsync,
+        sharding_strategy=sharding_strategy,
+        layer_locality=layer_locality,
     )
 
 
@@ -143,6 +199,10 @@ def save_torch_state_dict(
     safe_serialization: bool = True,
     is_main_process: bool = True,
     shared_tensors_to_discard: list[str] | None = None,
+    max_workers: int = 1,
+    fsync: bool = False,
+    sharding_strategy: ShardingStrategy_T = "sequential",
+    layer_locality: bool = False,
 ) -> None:
     """
     Save a model state dictionary to the disk, handling sharding and shared tensors issues.
@@ -157,7 +217,9 @@ def save_torch_state_dict(
     [`split_torch_state_dict_into_shards`] under the hood. If `safe_serialization` is `True`, the shards are saved as
     safetensors (the default). Otherwise, the shards are saved as pickle.
 
-    Before saving the model, the `save_directory` is cleaned from any previous shard files.
+    Before saving the model, the `save_directory` is cleaned from any previous shard files. Shards can be written
+    concurrently with `max_workers`. The index file is always written last, atomically: a reader never sees an index
+    referencing a shard that is not fully written yet.
 
     > [!WARNING]
     > If one of the model's tensor is bigger than `max_shard_size`, it will end up in its own shard which will have a
@@ -197,6 +259,18 @@ def save_torch_state_dict(
         shared_tensors_to_discard (`list[str]`, *optional*):
             List of tensor names to drop when saving shared tensors. If not provided and shared tensors are
             detected, it will drop the first name alphabetically.
+        max_workers (`int`, *optional*):
+            Number of shards serialized and written concurrently. Each worker holds one serialized shard in memory.
+            Defaults to 1 (shards are written one after the other).
+        fsync (`bool`, *optional*):
+            Whether to flush the shards and the index to stable storage before returning. Shards are flushed in a
+            single batch once all of them are written, right before the index. Defaults to `False`.
+        sharding_strategy (`str`, *optional*):
+            How tensors are packed into shards: `"sequential"` (in `state_dict` order), `"balanced"` (as few shards as
+            possible, with similar sizes) or `"stable"` (boundaries derived from tensor names, so that unchanged shards
+            are deduplicated when re-uploading an edited model). Defaults to `"sequential"`.
+        layer_locality (`bool`, *optional*):
+            Whether to keep the tensors of a same layer in the same shard. Defaults to `False`.
 
     Example:
 
@@ -207,8 +281,198 @@ def save_torch_state_dict(
     # Save state dict to "path/to/folder". The model will be split into shards of 5GB each and saved as safetensors.
     >>> state_dict = model_to_save.state_dict()
     >>> save_torch_state_dict(state_dict, "path/to/folder")
+
+    # Write 4 shards at a time and flush them to disk before returning
+    >>> save_torch_state_dict(state_dict, "path/to/folder", max_workers=4, fsync=True)
     ```
     """
+    for _ in _iter_save_torch_state_dict(
+        state_dict,
+        save_directory,
+        filename_pattern=filename_pattern,
+        force_contiguous=force_contiguous,
+        max_shard_size=max_shard_size,
+        metadata=metadata,
+        safe_serialization=safe_serialization,
+        is_main_process=is_main_process,
+        shared_tensors_to_discard=shared_tensors_to_discard,
+        max_workers=max_workers,
+        fsync=fsync,
+        sharding_strategy=sharding_strategy,
+        layer_locality=layer_locality,
+    ):
+        pass
+
+
+def upload_torch_state_dict(
+    state_dict: dict[str, "torch.Tensor"],
+    repo_id: str,
+    *,
+    path_in_repo: str | None = None,
+    repo_type: str | None = None,
+    revision: str | None = None,
+    commit_message: str | None = None,
+    commit_description: str | None = None,
+    token: str | bool | None = None,
+    create_pr: bool = False,
+    save_directory: str | Path | None = None,
+    filename_pattern: str | None = None,
+    force_contiguous: bool = True,
+    max_shard_size: int | str = MAX_SHARD_SIZE,
+    metadata: dict[str, str] | None = None,
+    safe_serialization: bool = True,
+    shared_tensors_to_discard: list[str] | None = None,
+    max_workers: int = 1,
+    sharding_strategy: ShardingStrategy_T = "sequential",
+    layer_locality: bool = False,
+) -> "CommitInfo":
+    """
+    Save a model state dictionary and upload it to the Hub, uploading each shard as soon as it is written.
+
+    The state dict is saved exactly like [`save_torch_state_dict`] does. When `hf_xet` is installed, shards are
+    streamed to the upload pipeline used by [`HfApi.upload_folder`]: the first shards are already uploading while the
+    next ones are still being serialized. The index file is written and uploaded last. Without `hf_xet`, all files
+    are saved first and then uploaded in a single commit.
+
+    Files already in the repo are not deleted, even if they are shards of a previous version of the model.
+
+    Args:
+        state_dict (`dict[str, torch.Tensor]`):
+            The state dictionary to upload.
+        repo_id (`str`):
+            The repository to which the files will be uploaded, for example: `"username/custom_transformers"`.
+        path_in_repo (`str`, *optional*):
+            Relative path of the folder in the repo in which the files are uploaded. Defaults to the root folder.
+        repo_type (`str`, *optional*):
+            Set to `"dataset"` or `"space"` if uploading to a dataset or space, `None` or `"model"` if uploading to a
+            model. Default is `None`.
+        revision (`str`, *optional*):
+            The git revision to commit from. Defaults to the head of the `"main"` branch.
+        commit_message (`str`, *optional*):
+            The summary / title / first line of the generated commit.
+        commit_description (`str`, *optional*):
+            The description of the generated commit.
+        token (`str` or `bool`, *optional*):
+            A valid user access token (string). Defaults to the locally saved token.
+        create_pr (`bool`, *optional*):
+            Whether or not to create a Pull Request with that commit. Defaults to `False`.
+        save_directory (`str` or `Path`, *optional*):
+            Local directory in which the files are saved before being uploaded. Defaults to a temporary directory,
+            removed once the upload is complete.
+        filename_pattern (`str`, *optional*):
+            See [`save_torch_state_dict`].
+        force_contiguous (`boolean`, *optional*):
+            See [`save_torch_state_dict`].
+        max_shard_size (`int` or `str`, *optional*):
+            See [`save_torch_state_dict`].
+        metadata (`dict[str, str]`, *optional*):
+            See [`save_torch_state_dict`].
+        safe_serialization (`bool`, *optional*):
+            See [`save_torch_state_dict`].
+        shared_tensors_to_discard (`list[str]`, *optional*):
+            See [`save_torch_state_dict`].
+        max_workers (`int`, *optional*):
+            See [`save_torch_state_dict`].
+        sharding_strategy (`str`, *optional*):
+            See [`save_torch_state_dict`].
+        layer_locality (`bool`, *optional*):
+            See [`save_torch_state_dict`].
+
+    Returns:
+        [`CommitInfo`]: Information about the (last) commit.
+
+    Example:
+
+    ```py
+    >>> from huggingface_hub import upload_torch_state_dict
+    >>> model = ... # A PyTorch model
+
+    # Serialize 4 shards at a time while the written ones are uploaded
+    >>> upload_torch_state_dict(model.state_dict(), "username/my-model", max_workers=4)
+    ```
+    """
+    from .._commit_api import CommitOperationAdd
+    from .._upload_pipeline import pipelined_upload
+    from ..hf_api import HfApi
+    from ..utils._runtime import is_xet_available
+
+    api = HfApi()
+    path_in_repo = (path_in_repo or "").strip("/")
+    commit_message = commit_message or "Upload model using huggingface_hub"
+
+    folder_context = (
+        tempfile.TemporaryDirectory() if save_directory is None else contextlib.nullcontext(str(save_directory))
+    )
+    with folder_context as folder:
+        os.makedirs(folder, exist_ok=True)
+        add_operations = (
+            CommitOperationAdd(
+                path_in_repo=f"{path_in_repo}/{filename}" if path_in_repo else filename,
+                path_or_fileobj=os.path.join(folder, filename),
+            )
+            for filename in _iter_save_torch_state_dict(
+                state_dict,
+                folder,
+                filename_pattern=filename_pattern,
+                force_contiguous=force_contiguous,
+                max_shard_size=max_shard_size,
+                metadata=metadata,
+                safe_serialization=safe_serialization,
+                is_main_process=True,
+                shared_tensors_to_discard=shared_tensors_to_discard,
+                max_workers=max_workers,
+                fsync=False,
+                sharding_strategy=sharding_strategy,
+                layer_locality=layer_locality,
+            )
+        )
+        if is_xet_available():
+            return pipelined_upload(
+                api,
+                repo_id=repo_id,
+                repo_type=repo_type or constants.REPO_TYPE_MODEL,
+                add_operations=add_operations,
+                delete_operations=[],
+                commit_message=commit_message,
+                commit_description=commit_description,
+                token=token,
+                revision=revision,
+                create_pr=create_pr,
+            )
+        return api.create_commit(
+            repo_id=repo_id,
+            repo_type=repo_type,
+            operations=list(add_operations),
+            commit_message=commit_message,
+            commit_description=commit_description,
+            token=token,
+            revision=revision,
+            create_pr=create_pr,
+        )
+
+
+def _iter_save_torch_state_dict(
+    state_dict: dict[str, "torch.Tensor"],
+    save_directory: str | Path,
+    *,
+    filename_pattern: str | None,
+    force_contiguous: bool,
+    max_shard_size: int | str,
+    metadata: dict[str, str] | None,
+    safe_serialization: bool,
+    is_main_process: bool,
+    shared_tensors_to_discard: list[str] | None,
+    max_workers: int,
+    fsync: bool,
+    sharding_strategy: ShardingStrategy_T = "sequential",
+    layer_locality: bool = False,
+) -> Iterator[str]:
+    """Save a state dict like [`save_torch_state_dict`], yielding each file name as soon as the file is written.
+
+    Shards are yielded in completion order. The index (if any) is yielded last, once all shards are written.
+    """
+    if max_workers < 1:
+        raise ValueError(f"`max_workers` must be a positive integer, got {max_workers}.")
     save_directory = str(save_directory)
 
     if filename_pattern is None:
@@ -245,7 +509,11 @@ def save_torch_state_dict(
         )
     # Split dict
     state_dict_split = split_torch_state_dict_into_shards(
-        state_dict, filename_pattern=filename_pattern, max_shard_size=max_shard_size
+        state_dict,
+        filename_pattern=filename_pattern,
+        max_shard_size=max_shard_size,
+        sharding_strategy=sharding_strategy,
+        layer_locality=layer_locality,
     )
 
     # Only main process should clean up existing files to avoid race conditions in distributed environment
@@ -266,20 +534,50 @@ def save_torch_state_dict(
     if not state_dict_split.is_sharded:
         per_file_metadata.update(metadata)
     safe_file_kwargs = {"metadata": per_file_metadata} if safe_serialization else {}
-    for filename, tensors in state_dict_split.filename_to_tensors.items():
+
+    def _save_shard(filename: str, tensors: list[str]) -> str:
         shard = {tensor: state_dict[tensor] for tensor in tensors}
         save_file_fn(shard, os.path.join(save_directory, filename), **safe_file_kwargs)  # ty: ignore[invalid-argument-type]
         logger.debug(f"Shard saved to {filename}")
+        return filename
+
+    # Shards are written in the caller's thread by default. With `max_workers > 1`, they are written on a bounded
+    # pool and yielded as they complete (e.g. to start uploading them while the next ones are being written).
+    shards = state_dict_split.filename_to_tensors.items()
+    executor = (
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hf-save-shard") if max_workers > 1 else None
+    )
+    try:
+        if executor is None:
+            saved_files = (_save_shard(filename, tensors) for filename, tensors in shards)
+        else:
+            futures = [executor.submit(_save_shard, filename, tensors) for filename, tensors in shards]
+            saved_files = (future.result() for future in as_completed(futures))
+        for filename in saved_files:
+            yield filename
+
+        # Flush all shards at once rather than after each write: the disk can reorder and merge the writes.
+        if fsync:
+            paths = [os.path.join(save_directory, filename) for filename in state_dict_split.filename_to_tensors]
+            if executor is None:
+                for path in paths:
+                    _fsync(path)
+            else:
+                list(executor.map(_fsync, paths))
+            _fsync_directory(save_directory)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-    # Save the index (if any)
+    # Save the index (if any). Written last and atomically so that it never references a partially written shard.
     if state_dict_split.is_sharded:
         index_path = filename_pattern.format(suffix="") + ".index.json"
         index = {
             "metadata": {**state_dict_split.metadata, **metadata},
             "weight_map": state_dict_split.tensor_to_filename,
         }
-        with open(os.path.join(save_directory, index_path), "w") as f:
-            json.dump(index, f, indent=2)
+        _write_json_atomically(index, os.path.join(save_directory, index_path), fsync=fsync)
+        yield index_path
         logger.info(
             f"The model is bigger than the maximum size per checkpoint ({max_shard_size}). "
             f"Model weighs have been saved in {len(state_dict_split.filename_to_tensors)} checkpoint shards. "
@@ -289,19 +587,57 @@ def save_torch_state_dict(
     logger.info(f"Model weights successfully saved to {save_directory}!")
 
 
+def _write_json_atomically(data: Any, path: str, *, fsync: bool) -> None:
+    """Write a JSON file via a temp file + `os.replace` so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    # Unlike `tempfile.mkstemp` (0o600), create the file with the permissions of a regular file (0o666 minus umask)
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+    tmp_fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(tmp_fd, "w") as f:
+            json.dump(data, f, indent=2)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if fsync:
+        _fsync_directory(directory)
+
+
+def _fsync(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(path: str) -> None:
+    # Persists the directory entries (new or renamed files). Directories cannot be opened on Windows.
+    if os.name != "nt":
+        _fsync(path)
+
+
 def split_torch_state_dict_into_shards(
     state_dict: dict[str, "torch.Tensor"],
     *,
     filename_pattern: str = constants.SAFETENSORS_WEIGHTS_FILE_PATTERN,
     max_shard_size: int | str = MAX_SHARD_SIZE,
+    sharding_strategy: ShardingStrategy_T = "sequential",
+    layer_locality: bool = False,
 ) -> StateDictSplit:
     """
     Split a model state dictionary in shards so that each shard is smaller than a given size.
 
-    The shards are determined by iterating through the `state_dict` in the order of its keys. There is no optimization
-    made to make each shard as close as possible to the maximum size passed. For example, if the limit is 10GB and we
-    have tensors of sizes [6GB, 6GB, 2GB, 6GB, 2GB, 2GB] they will get sharded as [6GB], [6+2GB], [6+2+2GB] and not
-    [6+2+2GB], [6+2GB], [6GB].
+    With the default `"sequential"` strategy, the shards are determined by iterating through the `state_dict` in the
+    order of its keys. There is no optimization made to make each shard as close as possible to the maximum size
+    passed. For example, if the limit is 10GB and we have tensors of sizes [6GB, 6GB, 2GB, 6GB, 2GB, 2GB] they will get
+    sharded as [6GB], [6+2GB], [6+2+2GB] and not [6+2+2GB], [6+2GB], [6GB]. Use `sharding_strategy="balanced"` to pack
+    them in as few shards as possible, with similar sizes.
 
 
     > [!TIP]
@@ -321,6 +657,11 @@ def split_torch_state_dict_into_shards(
             Defaults to `"model{suffix}.safetensors"`.
         max_shard_size (`int` or `str`, *optional*):
             The maximum size of each shard, in bytes. Defaults to 5GB.
+        sharding_strategy (`str`, *optional*):
+            How tensors are packed into shards, either `"sequential"`, `"balanced"` or `"stable"`. See
+            [`split_state_dict_into_shards_factory`] for details. Defaults to `"sequential"`.
+        layer_locality (`bool`, *optional*):
+            Whether to keep the tensors of a same layer in the same shard. Defaults to `False`.
 
     Returns:
         [`StateDictSplit`]: A `StateDictSplit` object containing the shards and the index to retrieve them.
@@ -356,6 +697,8 @@ def split_torch_state_dict_into_shards(
         filename_pattern=filename_pattern,
         get_storage_size=get_torch_storage_size,
         get_storage_id=get_torch_storage_id,
+        sharding_strategy=sharding_strategy,
+        layer_locality=layer_locality,
     )
 
 
@@ -372,6 +715,8 @@ def load_torch_model(
     map_location: Union[str, "torch.device"] | None = None,
     mmap: bool = False,
     filename_pattern: str | None = None,
+    prefetch_budget: int | str | None = None,
+    lazy: bool = False,
 ) -> NamedTuple:
     """
     Load a checkpoint into a model, handling both sharded and non-sharded checkpoints.
@@ -400,6 +745,16 @@ def load_torch_model(
             The pattern to look for the index file. Pattern must be a string that
             can be formatted with `filename_pattern.format(suffix=...)` and must contain the keyword `suffix`
             Defaults to `"model{suffix}.safetensors"`.
+        prefetch_budget (`int` or `str`, *optional*):
+            For sharded checkpoints only. Maximum size of the shards loaded in advance (in bytes, or as a string like
+            `"10GB"`) while the current shard is copied into the model. Loading the next shards overlaps with copying
+            the current one, at the cost of up to `prefetch_budget` additional memory. By default, shards are loaded
+            one at a time and at most one shard is held in memory.
+        lazy (`bool`, *optional*, defaults to `False`):
+            For safetensors checkpoints only. If True, each file is memory-mapped (see [`LazySafetensorsStateDict`])
+            and copied into the model by groups of tensors, releasing the memory pages of each group once copied.
+            Peak memory is the model plus a few hundred MB instead of the model plus a whole shard.
+            `prefetch_budget` is ignored: the next shard is read ahead into the OS page cache instead.
     Returns:
         `NamedTuple`: A named tuple with `missing_keys` and `unexpected_keys` fields.
             - `missing_keys` is a list of str containing the missing keys, i.e. keys that are in the model but not in the checkpoint.
@@ -426,6 +781,8 @@ def load_torch_model(
         raise ValueError(f"Checkpoint path {checkpoint_path} does not exist")
     # 1. Check if checkpoint is a single file
     if checkpoint_path.is_file():
+        if lazy and checkpoint_path.suffix == ".safetensors":
+            return _load_lazy_checkpoint_file(model, checkpoint_path, strict=strict, map_location=map_location)
         state_dict = load_state_dict_from_file(
             checkpoint_file=checkpoint_path,
             map_location=map_location,
@@ -450,11 +807,15 @@ def load_torch_model(
             strict=strict,
             weights_only=weights_only,
             filename_pattern=filename_pattern,
+            prefetch_budget=prefetch_budget,
+            lazy=lazy,
         )
 
     # Look for single model file
     model_files = list(checkpoint_path.glob("*.safetensors" if safe else "*.bin"))
     if len(model_files) == 1:
+        if lazy and model_files[0].suffix == ".safetensors":
+            return _load_lazy_checkpoint_file(model, model_files[0], strict=strict, map_location=map_location)
         state_dict = load_state_dict_from_file(
             checkpoint_file=model_files[0],
             map_location=map_location,
@@ -476,11 +837,15 @@ def _load_sharded_checkpoint(
     strict: bool = False,
     weights_only: bool = False,
     filename_pattern: str = constants.SAFETENSORS_WEIGHTS_FILE_PATTERN,
+    prefetch_budget: int | str | None = None,
+    lazy: bool = False,
 ) -> NamedTuple:
     """
     Loads a sharded checkpoint into a model. This is the same as
     [`torch.nn.Module.load_state_dict`](https://pytorch.org/docs/stable/generated/torch.nn.Module.html?highlight=load_state_dict#torch.nn.Module.load_state_dict)
     but for a sharded checkpoint. Each shard is loaded one by one and removed from memory after being loaded into the model.
+    With a `prefetch_budget`, the next shards are loaded in background threads while the current one is copied into
+    the model.
 
     Args:
         model (`torch.nn.Module`):
@@ -496,6 +861,11 @@ def _load_sharded_checkpoint(
             The pattern to look for the index file. Pattern must be a string that
             can be formatted with `filename_pattern.format(suffix=...)` and must contain the keyword `suffix`
             Defaults to `"model{suffix}.safetensors"`.
+        prefetch_budget (`int` or `str`, *optional*):
+            Maximum size of the shards loaded in advance (in bytes, or as a string like `"10GB"`). Defaults to no
+            prefetching.
+        lazy (`bool`, *optional*, defaults to `False`):
+            Whether to memory-map safetensors shards and copy them into the model by groups of tensors.
 
     Returns:
         `NamedTuple`: A named tuple with `missing_keys` and `unexpected_keys` fields,
@@ -547,18 +917,23 @@ def _load_sharded_checkpoint(
 
     # 4. Load each shard using `load_state_dict`
     # Get unique shard files (multiple parameters can be in same shard)
-    for shard_file in shard_files:
-        # Load shard into memory
-        shard_path = os.path.join(save_directory, shard_file)
-        state_dict = load_state_dict_from_file(
-            shard_path,
-            map_location="cpu",
-            weights_only=weights_only,
-        )
-        # Update model with parameters from this shard
-        model.load_state_dict(state_dict, strict=strict)
-        # Explicitly remove the state dict from memory
-        del state_dict
+    shard_paths = [os.path.join(save_directory, shard_file) for shard_file in sorted(shard_files)]
+    if lazy and expected_extension == ".safetensors":
+        for shard_idx, shard_path in enumerate(shard_paths):
+            if shard_idx + 1 < len(shard_paths):
+                _warm_page_cache(shard_paths[shard_idx + 1])
+            with LazySafetensorsStateDict(shard_path) as lazy_state_dict:
+                _load_lazy_state_dict_into_model(model, lazy_state_dict)
+    else:
+        if isinstance(prefetch_budget, str):
+            prefetch_budget = parse_size_to_int(prefetch_budget)
+        for state_dict in _iter_shard_state_dicts(
+            shard_paths, weights_only=weights_only, prefetch_budget=prefetch_budget
+        ):
+            # Update model with parameters from this shard
+            model.load_state_dict(state_dict, strict=strict)
+            # Explicitly remove the state dict from memory
+            del state_dict
 
     # 5. Return compatibility info
     loaded_keys = set(index["weight_map"].keys())
@@ -568,11 +943,74 @@ def _load_sharded_checkpoint(
     )
 
 
+def _iter_shard_state_dicts(
+    shard_paths: list[str], *, weights_only: bool, prefetch_budget: int | None
+) -> Iterator[dict[str, "torch.Tensor"]]:
+    """Load shards in order, prefetching the next ones in background threads within `prefetch_budget` bytes.
+
+    The shard being yielded is not counted in the budget: peak memory is at most one shard plus `prefetch_budget`.
+    The first shard that does not fit in the budget is read ahead into the OS page cache (which does not count in the
+    process memory), so that loading it is fast once its turn comes.
+    """
+    if not prefetch_budget or len(shard_paths) < 2:
+        for shard_path in shard_paths:
+            yield load_state_dict_from_file(shard_path, map_location="cpu", weights_only=weights_only)
+        return
+
+    sizes = [os.path.getsize(shard_path) for shard_path in shard_paths]
+    with ThreadPoolExecutor(max_workers=SHARD_PREFETCH_MAX_WORKERS, thread_name_prefix="hf-shard-prefetch") as pool:
+        futures: dict[int, Future] = {}
+        next_to_submit = 0
+        ahead_bytes = 0  # size of the shards submitted after the current one
+        warmed = -1
+        try:
+            for current in range(len(shard_paths)):
+                if current == next_to_submit:
+                    futures[current] = pool.submit(
+                        load_state_dict_from_file, shard_paths[current], map_location="cpu", weights_only=weights_only
+                    )
+                    next_to_submit += 1
+                else:
+                    ahead_bytes -= sizes[current]
+                while next_to_submit < len(shard_paths) and ahead_bytes + sizes[next_to_submit] <= prefetch_budget:
+                    futures[next_to_submit] = pool.submit(
+                        load_state_dict_from_file,
+                        shard_paths[next_to_submit],
+                        map_location="cpu",
+                        weights_only=weights_only,
+                    )
+                    ahead_bytes += sizes[next_to_submit]
+                    next_to_submit += 1
+                if warmed < next_to_submit < len(shard_paths):
+                    _warm_page_cache(shard_paths[next_to_submit])
+                    warmed = next_to_submit
+                # Do not keep a reference to the state dict: it is freed as soon as the caller is done with it
+                yield futures.pop(current).result()
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+
+def _warm_page_cache(path: str) -> None:
+    """Hint the OS to read a file into the page cache in the background (no-op if not supported)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
 def load_state_dict_from_file(
     checkpoint_file: str | os.PathLike,
     map_location: Union[str, "torch.device"] | None = None,
     weights_only: bool = False,
     mmap: bool = False,
+    lazy: bool = False,
 ) -> dict[str, "torch.Tensor"] | Any:
     """
     Loads a checkpoint file, handling both safetensors and pickle checkpoint formats.
@@ -591,10 +1029,15 @@ def load_state_dict_from_file(
             Whether to use memory-mapped file loading. Memory mapping can improve loading performance
             for large models in PyTorch >= 2.1.0 with zipfile-based checkpoints. Has no effect when
             loading safetensors files, as the `safetensors` library uses memory mapping by default.
+        lazy (`bool`, *optional*, defaults to `False`):
+            For safetensors files only. If True, return a [`LazySafetensorsStateDict`]: only the header is read when
+            opening the file and each tensor is created on access, as a zero-copy view on a memory-mapped file.
+            Pages are only read from disk when the tensor data is accessed. Has no effect when loading pickle files.
 
     Returns:
         `Union[dict[str, "torch.Tensor"], Any]`: The loaded checkpoint.
-            - For safetensors files: always returns a dictionary mapping parameter names to tensors.
+            - For safetensors files: always returns a dictionary mapping parameter names to tensors (a read-only
+              [`LazySafetensorsStateDict`] mapping if `lazy=True`).
             - For pickle files: returns any Python object that was pickled (commonly a state dict, but could be
               an entire model, optimizer state, or any other Python object).
 
@@ -619,6 +1062,10 @@ def load_state_dict_from_file(
     # Load a safetensors checkpoint
     >>> state_dict = load_state_dict_from_file("path/to/model.safetensors")
     >>> model.load_state_dict(state_dict)
+
+    # Lazily load a safetensors checkpoint and read a tensor-parallel shard of a weight
+    >>> with load_state_dict_from_file("path/to/model.safetensors", lazy=True) as state_dict:
+    ...     weight = state_dict.get_slice("lm_head.weight")[rank * 1024 : (rank + 1) * 1024]
     ```
     """
     checkpoint_path = Path(checkpoint_file)
@@ -631,6 +1078,8 @@ def load_state_dict_from_file(
         )
 
     # Load safetensors checkpoint
+    if checkpoint_path.suffix == ".safetensors" and lazy:
+        return LazySafetensorsStateDict(checkpoint_path, device=_safetensors_device(map_location))
     if checkpoint_path.suffix == ".safetensors":
         try:
             from safetensors import safe_open
@@ -650,12 +1099,7 @@ def load_state_dict_from_file(
                 f"The safetensors archive passed at {checkpoint_file} does not contain the valid metadata. Make sure "
                 "you save your model with the `save_torch_model` method."
             )
-        device = str(map_location.type) if map_location is not None and hasattr(map_location, "type") else map_location
-        # meta device is not supported with safetensors, falling back to CPU
-        if device == "meta":
-            logger.warning("Meta device is not supported with safetensors. Falling back to CPU device.")
-            device = "cpu"
-        return load_file(checkpoint_file, device=device)  # type: ignore[arg-type]
+        return load_file(checkpoint_file, device=_safetensors_device(map_location))  # type: ignore[arg-type]
     # Otherwise, load from pickle
     try:
         import torch
@@ -680,6 +1124,210 @@ def load_state_dict_from_file(
     )
 
 
+class LazySafetensorsStateDict(Mapping[str, "torch.Tensor"]):
+    """Read-only state dict backed by a memory-mapped safetensors file.
+
+    Returned by [`load_state_dict_from_file`] with `lazy=True`. Only the header is parsed when the file is opened.
+    Tensors are created on access as zero-copy views on a single memory map of the file, so that data is only read from
+    disk when it is actually used. Use [`~LazySafetensorsStateDict.get_slice`] to read a slice of a tensor (e.g. a
+    tensor-parallel shard) without reading the rest of it.
+
+    The file is mapped copy-on-write: tensors can be modified in place without altering the file on disk.
+
+    Args:
+        path (`str` or `os.PathLike`):
+            Path to the safetensors file.
+        device (`str`, *optional*):
+            Device on which tensors are returned. Tensors are zero-copy views only on CPU (the default), otherwise
+            they are copied to the device on access.
+
+    Example:
+        ```py
+        >>> from huggingface_hub import LazySafetensorsStateDict
+        >>> with LazySafetensorsStateDict("model.safetensors") as state_dict:
+        ...     embeddings = state_dict["model.embed_tokens.weight"]  # nothing read from disk yet
+        ...     rows = state_dict.get_slice("lm_head.weight")[:1024]  # only reads the first 1024 rows
+        ```
+    """
+
+    def __init__(self, path: str | os.PathLike, *, device: str | None = None) -> None:
+        self.path = Path(path)
+        self.device = device
+        with self.path.open("rb") as f:
+            try:
+                (header_size,) = struct.unpack("<Q", f.read(8))
+                header = json.loads(f.read(header_size))
+            except (struct.error, ValueError) as e:
+                raise OSError(f"Invalid safetensors file at {self.path}: could not parse header.") from e
+            # see comment: https://github.com/huggingface/transformers/blob/3d213b57fe74302e5902d68ed9478c3ad1aaa713/src/transformers/modeling_utils.py#L3966
+            self.metadata: dict[str, str] | None = header.pop("__metadata__", None)
+            if self.metadata is not None and self.metadata.get("format") not in ["pt", "mlx"]:
+                raise OSError(
+                    f"The safetensors archive passed at {self.path} does not contain the valid metadata. Make sure "
+                    "you save your model with the `save_torch_model` method."
+                )
+            self._tensors: dict[str, dict[str, Any]] = header
+            self._data_offset = 8 + header_size
+            size = os.fstat(f.fileno()).st_size
+            # An empty mapping is not allowed => no mmap if the file has no tensor data
+            self._mmap = (
+                mmap_module.mmap(f.fileno(), length=0, access=mmap_module.ACCESS_COPY)
+                if size > self._data_offset
+                else None
+            )
+
+    def __getitem__(self, key: str) -> "torch.Tensor":
+        tensor = self._cpu_tensor(key)
+        return tensor if self.device in (None, "cpu") else tensor.to(self.device)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tensors)
+
+    def __len__(self) -> int:
+        return len(self._tensors)
+
+    def __enter__(self) -> "LazySafetensorsStateDict":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_slice(self, key: str) -> "_LazyTensorSlice":
+        """Return a sliceable handle on a tensor.
+
+        Indexing the handle only reads the requested part of the tensor (on CPU, a slice on the first dimension only
+        reads the corresponding rows) and only copies this part to the device, if any.
+        """
+        if key not in self._tensors:
+            raise KeyError(key)
+        return _LazyTensorSlice(self, key)
+
+    def release(self, keys: Iterable[str] | None = None) -> None:
+        """Release the memory pages backing some tensors (all of them by default).
+
+        Data is read again from disk if the tensors are accessed later. Meant to be called once the tensors have been
+        copied elsewhere (e.g. into a model) to lower the peak memory usage. In-place modifications made to tensors
+        returned by this state dict are lost. No-op on platforms that do not support `madvise`.
+        """
+        if self._mmap is None or not hasattr(mmap_module, "MADV_DONTNEED"):
+            return
+        if keys is None:
+            self._mmap.madvise(mmap_module.MADV_DONTNEED)
+            return
+        page_size = mmap_module.PAGESIZE
+        for key in keys:
+            start, end = (self._data_offset + offset for offset in self._tensors[key]["data_offsets"])
+            # Only release pages entirely owned by the tensor
+            start = -(-start // page_size) * page_size
+            end = end // page_size * page_size
+            if end > start:
+                self._mmap.madvise(mmap_module.MADV_DONTNEED, start, end - start)
+
+    def close(self) -> None:
+        """Close the memory map. Tensors returned so far keep it open until they are garbage-collected."""
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Tensors still reference the map => it is closed when they are garbage-collected
+                pass
+
+    def _cpu_tensor(self, key: str) -> "torch.Tensor":
+        import torch
+
+        info = self._tensors[key]
+        dtype = getattr(torch, SAFETENSORS_TORCH_DTYPES[info["dtype"]])
+        start, end = info["data_offsets"]
+        if end == start:
+            return torch.empty(info["shape"], dtype=dtype)
+        return torch.frombuffer(
+            self._mmap,  # type: ignore[arg-type]
+            dtype=dtype,
+            count=(end - start) // dtype.itemsize,
+            offset=self._data_offset + start,
+        ).reshape(info["shape"])
+
+    def _iter_key_groups(self, group_size: int) -> Iterator[list[str]]:
+        """Iterate over the keys by groups of contiguous tensors of roughly `group_size` bytes (in file order)."""
+        group: list[str] = []
+        group_bytes = 0
+        for key in sorted(self._tensors, key=lambda key: self._tensors[key]["data_offsets"][0]):
+            start, end = self._tensors[key]["data_offsets"]
+            group.append(key)
+            group_bytes += end - start
+            if group_bytes >= group_size:
+                yield group
+                group, group_bytes = [], 0
+        if group:
+            yield group
+
+
+class _LazyTensorSlice:
+    """Sliceable handle on a tensor of a [`LazySafetensorsStateDict`], see [`LazySafetensorsStateDict.get_slice`]."""
+
+    def __init__(self, state_dict: LazySafetensorsStateDict, key: str) -> None:
+        self._state_dict = state_dict
+        self._key = key
+
+    @property
+    def shape(self) -> list[int]:
+        return list(self._state_dict._tensors[self._key]["shape"])
+
+    @property
+    def dtype(self) -> str:
+        return self._state_dict._tensors[self._key]["dtype"]
+
+    def get_shape(self) -> list[int]:
+        # Same API as `safetensors.safe_open(...).get_slice(...)`
+        return self.shape
+
+    def get_dtype(self) -> str:
+        return self.dtype
+
+    def __getitem__(self, index: Any) -> "torch.Tensor":
+        # Slicing a view does not read anything: only the pages of the selected elements are read when used
+        tensor = self._state_dict._cpu_tensor(self._key)[index]
+        device = self._state_dict.device
+        return tensor if device in (None, "cpu") else tensor.to(device)
+
+
+def _safetensors_device(map_location: Union[str, "torch.device"] | None) -> str | None:
+    device = str(map_location.type) if map_location is not None and hasattr(map_location, "type") else map_location
+    # meta device is not supported with safetensors, falling back to CPU
+    if device == "meta":
+        logger.warning("Meta device is not supported with safetensors. Falling back to CPU device.")
+        device = "cpu"
+    return device  # type: ignore[return-value]
+
+
+def _load_lazy_checkpoint_file(
+    model: "torch.nn.Module",
+    checkpoint_file: Path,
+    *,
+    strict: bool,
+    map_location: Union[str, "torch.device"] | None,
+) -> NamedTuple:
+    with LazySafetensorsStateDict(checkpoint_file, device=_safetensors_device(map_location)) as state_dict:
+        if strict:
+            _validate_keys_for_strict_loading(model, state_dict.keys())
+        _load_lazy_state_dict_into_model(model, state_dict)
+        loaded_keys = set(state_dict.keys())
+    model_keys = set(model.state_dict().keys())
+    return _IncompatibleKeys(
+        missing_keys=list(model_keys - loaded_keys), unexpected_keys=list(loaded_keys - model_keys)
+    )
+
+
+def _load_lazy_state_dict_into_model(model: "torch.nn.Module", state_dict: LazySafetensorsStateDict) -> None:
+    """Copy a lazy state dict into a model by groups of tensors, releasing the pages of each group once copied.
+
+    At most `LAZY_LOAD_GROUP_SIZE` bytes of the file are resident in memory at a time, on top of the model itself.
+    """
+    for keys in state_dict._iter_key_groups(LAZY_LOAD_GROUP_SIZE):
+        model.load_state_dict({key: state_dict[key] for key in keys}, strict=False)
+        state_dict.release(keys)
+
+
 # HELPERS
 
 
@@ -58,20 +58,33 @@ from ._hf_uris import HfMount, HfUri, is_hf_uri, parse_hf_mount, parse_hf_uri
 from ._http import (
     ASYNC_CLIENT_FACTORY_T,
     CLIENT_FACTORY_T,
+    HttpPoolConfig,
+    RateLimitBudget,
     RateLimitInfo,
     close_session,
+    close_shared_async_session,
     fix_hf_endpoint_in_url,
     get_async_session,
+    get_http_pool_config,
+    get_rate_limit_budget,
     get_session,
+    get_shared_async_session,
     hf_raise_for_status,
     http_backoff,
     http_stream_backoff,
     parse_ratelimit_headers,
     set_async_client_factory,
     set_client_factory,
+    set_http_pool_config,
 )
 from ._pagination import paginate
-from ._paths import DEFAULT_IGNORE_PATTERNS, FORBIDDEN_FOLDERS, filter_repo_objects
+from ._paths import DEFAULT_IGNORE_PATTERNS, FORBIDDEN_FOLDERS, filter_repo_objects, walk_local_files
+from ._request_timing import (
+    RequestTiming,
+    RequestTimingHistograms,
+    add_request_timing_callback,
+    remove_request_timing_callback,
+)
 from ._runtime import (
     dump_environment_info,
     get_aiohttp_version,
@@ -84,6 +97,7 @@ from ._runtime import (
     get_jinja_version,
     get_numpy_version,
     get_pillow_version,
+    get_pyarrow_version,
     get_pydantic_version,
     get_pydot_version,
     get_python_version,
@@ -104,6 +118,7 @@ from ._runtime import (
     is_numpy_available,
     is_package_available,
     is_pillow_available,
+    is_pyarrow_available,
     is_pydantic_available,
     is_pydot_available,
     is_safetensors_available,
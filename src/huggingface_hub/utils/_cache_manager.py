@@ -319,9 +319,12 @@ class DeleteCacheStrategy:
         for path in self.refs:
             _try_delete_path(path, path_type="ref")
 
-        # Delete blob files
+        # Delete blob files (and the byte ranges cached for them, if any)
         for path in self.blobs:
             _try_delete_path(path, path_type="blob")
+            partial_path = path.with_name(path.name + ".partial")
+            if partial_path.is_dir():
+                _try_delete_path(partial_path, path_type="partial blob")
 
         logger.info(f"Cache deletion done. Saved {self.expected_freed_size_str}.")
 
@@ -330,15 +333,15 @@ class DeleteCacheStrategy:
 class CachedIncompleteFileInfo:
     """Frozen data structure holding information about a single incomplete download.
 
-    Interrupted downloads leave `<cache>/<repo>/blobs/<etag>.incomplete` files behind.
-    These are not part of any committed revision, so they are surfaced separately by
-    [`scan_cache_dir`].
+    Interrupted downloads leave `<cache>/<repo>/blobs/<etag>.incomplete` files behind. Byte ranges of a file read
+    without downloading it entirely (see [`HfSafetensorsReader`]) are stored in a `<cache>/<repo>/blobs/<etag>.partial`
+    folder. These are not part of any committed revision, so they are surfaced separately by [`scan_cache_dir`].
 
     Args:
         file_path (`Path`):
-            Path of the `.incomplete` file in the `blobs` folder.
+            Path of the `.incomplete` file or of the `.partial` folder in the `blobs` folder.
         size_on_disk (`int`):
-            Size of the partially-downloaded file in bytes.
+            Size of the partially-downloaded file (or total size of the folder) in bytes.
     """
 
     file_path: Path
@@ -359,7 +362,8 @@ class HFCacheInfo:
             cache-system while scanning.
         incomplete_files (`frozenset[CachedIncompleteFileInfo]`):
             Set of [`~CachedIncompleteFileInfo`] describing orphaned `*.incomplete`
-            files left behind by interrupted downloads.
+            files left behind by interrupted downloads and `*.partial` folders of
+            cached byte ranges.
         warnings (`list[CorruptedCacheException]`):
             List of [`~CorruptedCacheException`] that occurred while scanning the cache.
             Those exceptions are captured so that the scan can continue. Corrupted repos
@@ -712,11 +716,12 @@ def scan_cache_dir(cache_dir: str | Path | None = None) -> HFCacheInfo:
 
 
 def _scan_incomplete_files(cache_dir: Path) -> frozenset[CachedIncompleteFileInfo]:
-    """Find orphaned `*.incomplete` partial-download files in the cache.
+    """Find orphaned `*.incomplete` partial-download files and `*.partial` folders in the cache.
 
     Interrupted downloads leave `<cache>/<repo>/blobs/<etag>.incomplete` files behind.
-    These are not part of any committed revision, so they are reported separately in the
-    [`~HFCacheInfo`] returned by [`scan_cache_dir`].
+    Byte ranges read by [`HfSafetensorsReader`] are stored as `<cache>/<repo>/blobs/<etag>.partial/<start>-<end>`
+    files (along with `*.tmp` files left by interrupted writes). These are not part of any committed revision, so
+    they are reported separately in the [`~HFCacheInfo`] returned by [`scan_cache_dir`].
     """
     files: set[CachedIncompleteFileInfo] = set()
     for path in cache_dir.glob("*/blobs/*.incomplete"):
@@ -725,6 +730,16 @@ def _scan_incomplete_files(cache_dir: Path) -> frozenset[CachedIncompleteFileInf
         except OSError:
             continue
         files.add(CachedIncompleteFileInfo(file_path=path, size_on_disk=size_on_disk))
+    for path in cache_dir.glob("*/blobs/*.partial"):
+        if not path.is_dir():
+            continue
+        size_on_disk = 0
+        for entry in path.iterdir():
+            try:
+                size_on_disk += entry.stat().st_size
+            except OSError:
+                continue
+        files.add(CachedIncompleteFileInfo(file_path=path, size_on_disk=size_on_disk))
     return frozenset(files)
 
 
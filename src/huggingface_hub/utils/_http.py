@@ -13,6 +13,7 @@
 # limitations under the License.
 """Contains utilities to handle HTTP requests in huggingface_hub."""
 
+import asyncio
 import atexit
 import io
 import json
@@ -20,10 +21,12 @@ import os
 import re
 import threading
 import time
+import urllib.request
 import uuid
-from collections.abc import Callable, Generator, Mapping
-from contextlib import contextmanager
-from dataclasses import dataclass
+import weakref
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, replace
 from shlex import quote
 from typing import Any, TypeVar
 from urllib.parse import urlparse
@@ -46,6 +49,8 @@ from ..errors import (
 )
 from . import logging
 from ._lfs import SliceFileObj
+from ._request_timing import _REQUEST_TIMING_CALLBACKS, _retry_attempt, record_response, start_request_timing
+from ._runtime import is_h2_available
 from ._typing import HTTP_METHOD_T
 
 
@@ -164,6 +169,179 @@ def _parse_retry_after(headers: Mapping[str, str]) -> int | None:
     return None  #  e.g. "Retry-After: Wed, 21 Oct 2015 07:28:00 GMT" - not supported
 
 
+@dataclass(frozen=True)
+class RateLimitBudget:
+    """
+    Current budget of a class of Hub endpoints, as tracked by the rate-limit governor.
+
+    See [`get_rate_limit_budget`].
+
+    Attributes:
+        endpoint_class (`str`):
+            The class of endpoints sharing this budget: `"api"`, `"resolvers"` (file downloads) or `"pages"`.
+        remaining (`float`):
+            The number of requests that can be sent right away. Negative if requests are waiting for the budget to
+            refill.
+        limit (`int`):
+            The maximum number of requests allowed in a window.
+        window_seconds (`float`):
+            The duration of a window, in seconds. The budget refills at a rate of `limit / window_seconds` requests
+            per second.
+        blocked_for_seconds (`float`):
+            The number of seconds before requests are allowed again, after the limit has been reached. 0 if not
+            blocked.
+    """
+
+    endpoint_class: str
+    remaining: float
+    limit: int
+    window_seconds: float
+    blocked_for_seconds: float
+
+
+class _TokenBucket:
+    """Token bucket of a class of endpoints, refilled at the rate advertised by the Hub."""
+
+    def __init__(self, limit: int, window_seconds: float, now: float) -> None:
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.tokens = float(limit)
+        self.updated_at = now
+        self.blocked_until = now
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.window_seconds
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(float(self.limit), self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """Take a token and return how long to wait before sending the request."""
+        self.refill(now)
+        self.tokens -= 1
+        delay = max(0.0, self.blocked_until - now)
+        if self.tokens < 0:
+            delay = max(delay, -self.tokens / self.rate)
+        return delay
+
+    def observe(self, info: RateLimitInfo, now: float) -> None:
+        if info.limit is not None and info.window_seconds:
+            self.limit, self.window_seconds = info.limit, float(info.window_seconds)
+        self.refill(now)
+        # Only lower the budget: tokens already reserved by waiting requests are not known by the server yet
+        self.tokens = min(self.tokens, float(info.remaining))
+        if info.remaining <= 0:
+            self.blocked_until = max(self.blocked_until, now + info.reset_in_seconds)
+
+
+class _RateLimitGovernor:
+    """Process-wide budget of requests to the Hub, fed by the `RateLimit` headers of every response.
+
+    Requests are grouped by class of endpoints (`"api"`, `"resolvers"`, `"pages"`), each class having its own budget on
+    the server. A class is not throttled until a response advertising its rate limit has been received.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    def reserve(self, url: httpx.URL) -> float:
+        endpoint_class = _endpoint_class(url)
+        if endpoint_class is None:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(endpoint_class)
+            return bucket.reserve(time.monotonic()) if bucket is not None else 0.0
+
+    def observe(self, response: httpx.Response) -> None:
+        endpoint_class = _endpoint_class(response.request.url)
+        if endpoint_class is None:
+            return
+        info = parse_ratelimit_headers(response.headers)
+        if info is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(endpoint_class)
+            if bucket is None:
+                limit = info.limit if info.limit is not None else info.remaining
+                window_seconds = info.window_seconds or info.reset_in_seconds
+                if limit <= 0 or window_seconds <= 0:
+                    return
+                bucket = self._buckets[endpoint_class] = _TokenBucket(limit, float(window_seconds), now)
+            bucket.observe(info, now)
+
+    def budget(self) -> dict[str, RateLimitBudget]:
+        now = time.monotonic()
+        with self._lock:
+            for bucket in self._buckets.values():
+                bucket.refill(now)
+            return {
+                endpoint_class: RateLimitBudget(
+                    endpoint_class=endpoint_class,
+                    remaining=bucket.tokens,
+                    limit=bucket.limit,
+                    window_seconds=bucket.window_seconds,
+                    blocked_for_seconds=max(0.0, bucket.blocked_until - now),
+                )
+                for endpoint_class, bucket in self._buckets.items()
+            }
+
+    def reset(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+
+def _endpoint_class(url: httpx.URL) -> str | None:
+    """Return the class of Hub endpoints a URL belongs to, or `None` if not a request to the Hub."""
+    if url.netloc.decode() != urlparse(constants.ENDPOINT).netloc:
+        return None
+    if url.path.startswith("/api/"):
+        return "api"
+    if "/resolve/" in url.path:
+        return "resolvers"
+    return "pages"
+
+
+_RATE_LIMIT_GOVERNOR = _RateLimitGovernor()
+
+
+def get_rate_limit_budget() -> dict[str, RateLimitBudget]:
+    """
+    Return the current budget of requests to the Hub, per class of endpoints.
+
+    The budget is tracked from the `RateLimit` headers returned by the Hub on every response received by the default
+    HTTP clients. Classes of endpoints for which no rate limit has been advertised yet are not returned.
+
+    If `HF_HUB_ENABLE_RATE_LIMIT_GOVERNOR` is set, requests are throttled ahead of time to stay within this budget:
+    once a class of endpoints has no budget left, its requests wait for it to refill instead of being rejected with
+    a 429 error. The budget is shared by all threads of the process, and refills at the rate advertised by the Hub.
+
+    Example:
+    ```python
+    >>> from huggingface_hub import model_info
+    >>> from huggingface_hub.utils import get_rate_limit_budget
+    >>> model_info("gpt2")
+    >>> get_rate_limit_budget()
+    {'api': RateLimitBudget(endpoint_class='api', remaining=499.0, limit=500, window_seconds=300.0, blocked_for_seconds=0.0)}
+    ```
+    """
+    return _RATE_LIMIT_GOVERNOR.budget()
+
+
+def _rate_limit_delay(request: httpx.Request) -> float:
+    if not constants.HF_HUB_ENABLE_RATE_LIMIT_GOVERNOR:
+        return 0.0
+    delay = _RATE_LIMIT_GOVERNOR.reserve(request.url)
+    if delay > 0:
+        logger.info(
+            f"Rate limit budget exhausted. Waiting {delay:.1f}s before sending {request.method} {request.url}."
+        )
+    return delay
+
+
 # When raising an error, we include the request id in the error message for easier debugging.
 # Request ID is sourced from headers in order of precedence: "X-Request-Id", "X-Amzn-Trace-Id", "X-Amz-Cf-Id".
 X_REQUEST_ID = "x-request-id"
@@ -247,15 +425,8 @@ def _parse_job_id_from_url(url: str) -> str | None:
     return match.group(1) if match else None
 
 
-def hf_request_event_hook(request: httpx.Request) -> None:
-    """
-    Event hook that will be used to make HTTP requests to the Hugging Face Hub.
-
-    What it does:
-    - Block requests if offline mode is enabled
-    - Add a request ID to the request headers
-    - Log the request if debug mode is enabled
-    """
+def _prepare_hf_request(request: httpx.Request) -> str | None:
+    """Block requests if offline mode is enabled, add a request ID and log the request."""
     if constants.is_offline_mode():
         raise OfflineModeIsEnabled(
             f"Cannot reach {request.url}: offline mode is enabled. To disable it, please unset the `HF_HUB_OFFLINE` environment variable."
@@ -280,14 +451,50 @@ def hf_request_event_hook(request: httpx.Request) -> None:
     return request_id
 
 
-async def async_hf_request_event_hook(request: httpx.Request) -> None:
+def hf_request_event_hook(request: httpx.Request) -> str | None:
+    """
+    Event hook that will be used to make HTTP requests to the Hugging Face Hub.
+
+    What it does:
+    - Block requests if offline mode is enabled
+    - Add a request ID to the request headers
+    - Log the request if debug mode is enabled
+    - Wait for the rate limit budget to refill if needed (see [`get_rate_limit_budget`])
+    - Time the request if instrumentation is enabled (see [`add_request_timing_callback`])
+    """
+    request_id = _prepare_hf_request(request)
+    delay = _rate_limit_delay(request)
+    if delay > 0:
+        time.sleep(delay)
+    if _REQUEST_TIMING_CALLBACKS:
+        start_request_timing(request, _endpoint_class(request.url) or "other", is_async=False)
+    return request_id
+
+
+async def async_hf_request_event_hook(request: httpx.Request) -> str | None:
     """
     Async version of `hf_request_event_hook`.
     """
-    return hf_request_event_hook(request)
+    request_id = _prepare_hf_request(request)
+    delay = _rate_limit_delay(request)
+    if delay > 0:
+        await asyncio.sleep(delay)
+    if _REQUEST_TIMING_CALLBACKS:
+        start_request_timing(request, _endpoint_class(request.url) or "other", is_async=True)
+    return request_id
+
+
+def hf_response_event_hook(response: httpx.Response) -> None:
+    """Event hook tracking the rate limit budget advertised by the Hub and the timings of the request."""
+    _RATE_LIMIT_GOVERNOR.observe(response)
+    if _REQUEST_TIMING_CALLBACKS:
+        record_response(response)
 
 
 async def async_hf_response_event_hook(response: httpx.Response) -> None:
+    _RATE_LIMIT_GOVERNOR.observe(response)
+    if _REQUEST_TIMING_CALLBACKS:
+        record_response(response)
     if response.status_code >= 400:
         # If response will raise, read content from stream to have it available when raising the exception
         # If content-length is not set or is too large, skip reading the content to avoid OOM
@@ -301,25 +508,155 @@ async def async_hf_response_event_hook(response: httpx.Response) -> None:
                 await response.aread()
 
 
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    """
+    Configuration of the connection pools of the default HTTP clients used by `huggingface_hub`.
+
+    Use [`get_http_pool_config`] to get the current configuration and [`set_http_pool_config`] to update it.
+
+    Attributes:
+        max_connections (`int`):
+            Maximum number of concurrent connections in a pool. Set with `HF_HUB_HTTP_MAX_CONNECTIONS`.
+        max_keepalive_connections (`int`):
+            Maximum number of idle connections kept alive in a pool. Set with `HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS`.
+        keepalive_expiry (`float`):
+            Time (in seconds) after which an idle connection is closed. Set with `HF_HUB_HTTP_KEEPALIVE_EXPIRY`.
+        http2 (`bool`):
+            Whether requests to the Hub API use HTTP/2. Requires the `h2` package. Set with `HF_HUB_ENABLE_HTTP2`.
+    """
+
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    http2: bool
+
+
+_HTTP_POOL_CONFIG: HttpPoolConfig | None = None  # if None, read from environment variables
+_WARNED_H2_MISSING = False
+
+
+def get_http_pool_config() -> HttpPoolConfig:
+    """
+    Return the configuration of the connection pools of the default HTTP clients (see [`set_http_pool_config`]).
+    """
+    if _HTTP_POOL_CONFIG is not None:
+        return _HTTP_POOL_CONFIG
+    return HttpPoolConfig(
+        max_connections=constants.HF_HUB_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=constants.HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=constants.HF_HUB_HTTP_KEEPALIVE_EXPIRY,
+        http2=constants.HF_HUB_ENABLE_HTTP2,
+    )
+
+
+def set_http_pool_config(
+    *,
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    http2: bool | None = None,
+) -> None:
+    """
+    Configure the connection pools of the default HTTP clients used by `huggingface_hub`.
+
+    Values default to the `HF_HUB_HTTP_MAX_CONNECTIONS`, `HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS`,
+    `HF_HUB_HTTP_KEEPALIVE_EXPIRY` and `HF_HUB_ENABLE_HTTP2` environment variables. Parameters that are not passed are
+    left unchanged. Shared clients are closed and recreated with the new configuration on their next use. This has no
+    effect if a custom client factory is set with [`set_client_factory`] or [`set_async_client_factory`].
+
+    Requests to the Hub API and requests to other hosts (CDN, Xet storage, ...) use separate pools, so that many
+    concurrent downloads do not delay API calls. Each pool is bounded by the limits below.
+
+    Args:
+        max_connections (`int`, *optional*):
+            Maximum number of concurrent connections in a pool. Increase it when running many threads, e.g. with a
+            high `max_workers` in [`snapshot_download`].
+        max_keepalive_connections (`int`, *optional*):
+            Maximum number of idle connections kept alive in a pool, to be reused by later requests.
+        keepalive_expiry (`float`, *optional*):
+            Time (in seconds) after which an idle connection is closed.
+        http2 (`bool`, *optional*):
+            Whether to use HTTP/2 for requests to the Hub API. Requests are multiplexed over a few connections instead
+            of opening one connection each. Requires the `h2` package (`pip install httpx[http2]`).
+
+    Example:
+    ```py
+    >>> from huggingface_hub import set_http_pool_config, snapshot_download
+    >>> set_http_pool_config(max_connections=64, max_keepalive_connections=64, http2=True)
+    >>> snapshot_download("openai-community/gpt2", max_workers=64)
+    ```
+    """
+    global _HTTP_POOL_CONFIG
+    if http2 and not is_h2_available():
+        raise ImportError("HTTP/2 requires the `h2` package. Please install it with `pip install httpx[http2]`.")
+    updates = {
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+        "keepalive_expiry": keepalive_expiry,
+        "http2": http2,
+    }
+    config = replace(get_http_pool_config(), **{key: value for key, value in updates.items() if value is not None})
+    with _CLIENT_LOCK:
+        _HTTP_POOL_CONFIG = config
+        close_session()
+        _forget_shared_async_sessions(list(_GLOBAL_ASYNC_CLIENTS), close=True)
+
+
+def _default_pool_kwargs(
+    transport_cls: type[httpx.HTTPTransport] | type[httpx.AsyncHTTPTransport],
+) -> dict[str, Any]:
+    """Connection pool arguments of the default `httpx.Client` and `httpx.AsyncClient`."""
+    global _WARNED_H2_MISSING
+    config = get_http_pool_config()
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    http2 = config.http2
+    if http2 and not is_h2_available():
+        if not _WARNED_H2_MISSING:
+            _WARNED_H2_MISSING = True
+            logger.warning("`HF_HUB_ENABLE_HTTP2` is set but `h2` is not installed: falling back to HTTP/1.1.")
+        http2 = False
+
+    if urllib.request.getproxies():
+        # Proxies from the environment are mounted by httpx for all hosts. A transport mounted for the Hub API host
+        # would bypass them => use a single pool.
+        return {"limits": limits, "http2": http2}
+    return {
+        # Other hosts (CDN, Xet storage, ...) => HTTP/1.1, as files are downloaded in parallel over several connections
+        "transport": transport_cls(limits=limits),
+        "mounts": {f"all://{urlparse(constants.ENDPOINT).netloc}": transport_cls(limits=limits, http2=http2)},
+    }
+
+
 def default_client_factory() -> httpx.Client:
     """
     Factory function to create a `httpx.Client` with the default transport.
+
+    Connection pools are configured with [`set_http_pool_config`].
     """
     return httpx.Client(
-        event_hooks={"request": [hf_request_event_hook]},
+        event_hooks={"request": [hf_request_event_hook], "response": [hf_response_event_hook]},
         follow_redirects=True,
         timeout=None,
+        **_default_pool_kwargs(httpx.HTTPTransport),
     )
 
 
 def default_async_client_factory() -> httpx.AsyncClient:
     """
     Factory function to create a `httpx.AsyncClient` with the default transport.
+
+    Connection pools are configured with [`set_http_pool_config`].
     """
     return httpx.AsyncClient(
         event_hooks={"request": [async_hf_request_event_hook], "response": [async_hf_response_event_hook]},
         follow_redirects=True,
         timeout=None,
+        **_default_pool_kwargs(httpx.AsyncHTTPTransport),
     )
 
 
@@ -331,6 +668,13 @@ _GLOBAL_CLIENT_FACTORY: CLIENT_FACTORY_T = default_client_factory
 _GLOBAL_ASYNC_CLIENT_FACTORY: ASYNC_CLIENT_FACTORY_T = default_async_client_factory
 _GLOBAL_CLIENT: httpx.Client | None = None
 
+# Shared async clients, one per event loop (a `httpx.AsyncClient` cannot be used across event loops). Each client is
+# stored with the async generator closing it when its loop shuts down (see `_aclose_on_loop_shutdown`).
+_SharedAsyncClient = tuple[httpx.AsyncClient, AsyncGenerator[None, None]]
+_GLOBAL_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedAsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def set_client_factory(client_factory: CLIENT_FACTORY_T) -> None:
     """
@@ -362,7 +706,10 @@ def set_async_client_factory(async_client_factory: ASYNC_CLIENT_FACTORY_T) -> No
     > It is recommended to use an async context manager to ensure the client is properly closed when the context is exited.
     """
     global _GLOBAL_ASYNC_CLIENT_FACTORY
-    _GLOBAL_ASYNC_CLIENT_FACTORY = async_client_factory
+    with _CLIENT_LOCK:
+        _GLOBAL_ASYNC_CLIENT_FACTORY = async_client_factory
+        # Shared clients are recreated with the new factory
+        _forget_shared_async_sessions(list(_GLOBAL_ASYNC_CLIENTS), close=True)
 
 
 def get_session() -> httpx.Client:
@@ -389,10 +736,83 @@ def get_async_session() -> httpx.AsyncClient:
     > [!WARNING]
     > Contrary to the `httpx.Client` that is shared between all calls made by `huggingface_hub`, the `httpx.AsyncClient` is not shared.
     > It is recommended to use an async context manager to ensure the client is properly closed when the context is exited.
+    > Use [`get_shared_async_session`] to get a client shared with other calls made in the same event loop.
     """
     return _GLOBAL_ASYNC_CLIENT_FACTORY()
 
 
+def get_shared_async_session() -> httpx.AsyncClient:
+    """
+    Get a `httpx.AsyncClient` object shared between all calls made in the current event loop.
+
+    This is the async counterpart of [`get_session`]: connections are kept alive and reused between requests instead
+    of paying for a new TCP and TLS handshake each time. One client is created per event loop, using the factory set
+    with [`set_async_client_factory`]. It is closed automatically when its event loop shuts down (e.g. at the end of
+    `asyncio.run`). Therefore you should not close it manually. Use [`close_shared_async_session`] if you need to.
+
+    Must be called from a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _CLIENT_LOCK:
+        # Drop clients of loops closed without shutting down their async generators (their connections are unusable)
+        _forget_shared_async_sessions([other for other in _GLOBAL_ASYNC_CLIENTS if other.is_closed()], close=False)
+
+        entry = _GLOBAL_ASYNC_CLIENTS.get(loop)
+        if entry is not None:
+            if not entry[0].is_closed:
+                return entry[0]
+            _forget_shared_async_sessions([loop], close=False)  # closed manually by the user
+
+        client = _GLOBAL_ASYNC_CLIENT_FACTORY()
+        hook = _aclose_on_loop_shutdown(client)
+        try:
+            # Run the generator until its `yield`: it is now registered in the loop and finalized on shutdown
+            hook.asend(None).send(None)
+        except StopIteration:
+            pass
+        _GLOBAL_ASYNC_CLIENTS[loop] = (client, hook)
+        return client
+
+
+async def close_shared_async_session() -> None:
+    """
+    Close the `httpx.AsyncClient` shared in the current event loop (see [`get_shared_async_session`]).
+
+    A new client will be created on the next call to [`get_shared_async_session`]. Shared clients are closed
+    automatically when their event loop shuts down, so calling this method is only needed in rare cases (e.g. after a
+    transient `SSLError`).
+    """
+    with _CLIENT_LOCK:
+        entry = _GLOBAL_ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+async def _aclose_on_loop_shutdown(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    # Event loops have no "on close" callback. However, `loop.shutdown_asyncgens()` (called by `asyncio.run` right
+    # before closing the loop) closes all suspended async generators => used as a hook to close the client while its
+    # loop is still running. Resuming the generator instead "detaches" it: it ends without closing the client.
+    try:
+        yield
+    except GeneratorExit:
+        await client.aclose()
+        raise
+
+
+def _forget_shared_async_sessions(loops: list[asyncio.AbstractEventLoop], close: bool) -> None:
+    """Remove shared async clients from the registry. Must be called with `_CLIENT_LOCK` held."""
+    for loop in loops:
+        client, hook = _GLOBAL_ASYNC_CLIENTS.pop(loop)
+        try:
+            # Detach the shutdown hook synchronously: if garbage-collected while suspended, it would be scheduled on
+            # its loop, which might be closed already
+            hook.asend(None).send(None)
+        except StopAsyncIteration:
+            pass
+        if close and loop.is_running() and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.create_task, client.aclose())
+
+
 def close_session() -> None:
     """
     Close the global `httpx.Client` used by `huggingface_hub`.
@@ -415,9 +835,97 @@ def close_session() -> None:
             logger.warning(f"Error closing client: {e}")
 
 
+class _InFlightRequest:
+    """A request whose response is awaited by several threads (see [`_coalesce_request`])."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: httpx.Response | None = None
+        self.error: BaseException | None = None
+
+
+_IN_FLIGHT_LOCK = threading.Lock()
+_IN_FLIGHT_REQUESTS: dict[tuple, _InFlightRequest] = {}
+
+
+def _coalesce_request(
+    method: HTTP_METHOD_T,
+    url: str,
+    send: Callable[[], httpx.Response],
+    *,
+    headers: Mapping[str, str] | None = None,
+    params: Any = None,
+) -> httpx.Response:
+    """Send an idempotent request, sharing its response with identical requests made concurrently by other threads.
+
+    Only enabled if `HF_HUB_COALESCE_REQUESTS` is set. Otherwise, `send` is simply called. When enabled, the first
+    thread sends the request and the other threads asking for the same `method`, `url`, `headers` and `params` in
+    the meantime wait for its response (or its error) instead of sending their own. Requests are only coalesced while
+    in flight: no response is cached once the first one completes.
+
+    The shared response must be fully read (i.e. not streamed) as it is consumed by several threads. Its status is not
+    checked: each caller is expected to call [`hf_raise_for_status`] on it.
+
+    Args:
+        method (`str`):
+            HTTP method. Only `GET` and `HEAD` requests should be coalesced.
+        url (`str`):
+            The URL of the resource to fetch.
+        send (`Callable[[], httpx.Response]`):
+            Function sending the request. Called once per group of identical requests.
+        headers (`dict`, *optional*):
+            Headers of the request. Requests sent with different headers (e.g. a different token) are not coalesced.
+        params (*optional*):
+            Query parameters of the request.
+    """
+    if not constants.HF_HUB_COALESCE_REQUESTS:
+        return send()
+
+    key = (
+        method,
+        url,
+        str(httpx.QueryParams(params)),
+        tuple(sorted((name.lower(), value) for name, value in (headers or {}).items())),
+    )
+    with _IN_FLIGHT_LOCK:
+        in_flight = _IN_FLIGHT_REQUESTS.get(key)
+        is_leader = in_flight is None
+        if in_flight is None:
+            in_flight = _IN_FLIGHT_REQUESTS[key] = _InFlightRequest()
+
+    if not is_leader:
+        in_flight.done.wait()
+        if in_flight.error is not None:
+            raise in_flight.error
+        assert in_flight.response is not None
+        return in_flight.response
+
+    try:
+        in_flight.response = send()
+        return in_flight.response
+    except BaseException as e:
+        in_flight.error = e
+        raise
+    finally:
+        with _IN_FLIGHT_LOCK:
+            del _IN_FLIGHT_REQUESTS[key]
+        in_flight.done.set()
+
+
+def _reset_sessions_after_fork() -> None:
+    global _IN_FLIGHT_LOCK
+    close_session()
+    # Requests in flight in the parent process will never complete in the child
+    _IN_FLIGHT_LOCK = threading.Lock()
+    _IN_FLIGHT_REQUESTS.clear()
+    _RATE_LIMIT_GOVERNOR.reset()
+    # Event loops of the parent process are not running in the child => forget their clients without closing them
+    _forget_shared_async_sessions(list(_GLOBAL_ASYNC_CLIENTS), close=False)
+
+
 atexit.register(close_session)
 if hasattr(os, "register_at_fork"):
-    os.register_at_fork(after_in_child=close_session)
+    os.register_at_fork(after_in_child=_reset_sessions_after_fork)
 
 
 _DEFAULT_RETRY_ON_EXCEPTIONS: tuple[type[Exception], ...] = (
@@ -499,12 +1007,15 @@ def _http_backoff_base(
                 return True  # Should retry
 
             if stream:
-                with client.stream(method=method, url=url, **kwargs) as response:
+                with ExitStack() as stack:
+                    with _retry_attempt(nb_tries - 1):
+                        response = stack.enter_context(client.stream(method=method, url=url, **kwargs))
                     if not _should_retry(response):
                         yield response
                         return
             else:
-                response = client.request(method=method, url=url, **kwargs)
+                with _retry_attempt(nb_tries - 1):
+                    response = client.request(method=method, url=url, **kwargs)
                 if not _should_retry(response):
                     yield response
                     return
@@ -691,6 +1202,56 @@ def http_stream_backoff(
     )
 
 
+async def _async_http_backoff(
+    client: httpx.AsyncClient,
+    method: HTTP_METHOD_T,
+    url: str,
+    *,
+    max_retries: int = 5,
+    base_wait_time: float = 1,
+    max_wait_time: float = 8,
+    retry_on_exceptions: tuple[type[Exception], ...] = _DEFAULT_RETRY_ON_EXCEPTIONS,
+    retry_on_status_codes: tuple[int, ...] = _DEFAULT_RETRY_ON_STATUS_CODES,
+    **kwargs,
+) -> httpx.Response:
+    """Async counterpart of [`http_backoff`], performing the request on the provided `httpx.AsyncClient`.
+
+    Same retry policy as the sync version (exponential backoff, `ratelimit` and `Retry-After` headers are honored).
+    Streaming and file-like `data` are not supported.
+    """
+    nb_tries = 0
+    sleep_time = base_wait_time
+    while True:
+        nb_tries += 1
+        ratelimit_reset: int | None = None
+        try:
+            with _retry_attempt(nb_tries - 1):
+                response = await client.request(method=method, url=url, **kwargs)
+            if response.status_code not in retry_on_status_codes:
+                return response
+            logger.warning(f"HTTP Error {response.status_code} thrown while requesting {method} {url}")
+            if nb_tries > max_retries:
+                hf_raise_for_status(response)
+                return response
+            if (
+                response.status_code == 429
+                and (ratelimit_info := parse_ratelimit_headers(response.headers)) is not None
+                and ratelimit_info.remaining == 0
+            ):
+                ratelimit_reset = ratelimit_info.reset_in_seconds
+            elif (retry_after := _parse_retry_after(response.headers)) is not None:
+                ratelimit_reset = retry_after
+        except retry_on_exceptions as err:
+            logger.warning(f"'{err}' thrown while requesting {method} {url}")
+            if nb_tries > max_retries:
+                raise err
+
+        actual_sleep = float(ratelimit_reset) + 1 if ratelimit_reset is not None else sleep_time
+        logger.warning(f"Retrying in {actual_sleep}s [Retry {nb_tries}/{max_retries}].")
+        await asyncio.sleep(actual_sleep)
+        sleep_time = min(max_wait_time, sleep_time * 2)
+
+
 def _httpx_follow_relative_redirects_with_backoff(
     method: HTTP_METHOD_T, url: str, *, retry_on_errors: bool = False, **httpx_kwargs
 ) -> httpx.Response:
@@ -13,7 +13,11 @@
 # limitations under the License.
 """Contains utilities to handle paths in Huggingface Hub."""
 
-from collections.abc import Callable, Generator, Iterable
+import os
+import stat
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import TypeVar
@@ -21,6 +25,12 @@ from typing import TypeVar
 
 T = TypeVar("T")
 
+# Number of threads listing directories in `walk_local_files`. Walking is I/O bound (one `stat` per file), which is
+# slow on network filesystems (NFS, Lustre,...): listing several directories at once hides the latency.
+WALK_MAX_WORKERS = 16
+# Maximum number of directories listed ahead of the walk, per worker. Bounds the memory used by prefetched listings.
+WALK_PREFETCH_FACTOR = 4
+
 # Always ignore `.git` and `.cache/huggingface` folders in commits
 DEFAULT_IGNORE_PATTERNS = [
     ".git",
@@ -153,3 +163,103 @@ def _add_wildcard_to_directories(pattern: str) -> str:
     if pattern.endswith("/"):
         return pattern + "*"
     return pattern
+
+
+def walk_local_files(root: str | Path, max_workers: int = WALK_MAX_WORKERS) -> Iterator[tuple[str, os.stat_result]]:
+    """Recursively list the regular files in a local directory, sorted by relative path.
+
+    Directories are listed in parallel with `os.scandir` by a pool of threads: as soon as a directory is listed, its
+    subdirectories are queued for listing while the files of the current directory are yielded. At most
+    `4 * max_workers` directories are listed ahead of the files being yielded, so that memory usage stays bounded on
+    wide trees. Output is streamed and sorted as a list of relative paths would be (`"a.txt"` < `"a/b.txt"` <
+    `"a0.txt"`), which makes it deterministic and suitable to merge-join with other sorted listings.
+
+    Symlinks to files are followed, symlinks to directories are not (same as `Path.glob("**/*")`). Entries that
+    cannot be accessed (e.g. removed while walking) are skipped.
+
+    Args:
+        root (`str` or `Path`):
+            Directory to walk.
+        max_workers (`int`, *optional*):
+            Maximum number of directories listed concurrently. Defaults to 16.
+
+    Yields:
+        `tuple[str, os.stat_result]`: the path of each file relative to `root` (with `/` separators) and its stat.
+
+    Example:
+    ```py
+    >>> from huggingface_hub.utils import walk_local_files
+    >>> for relpath, st in walk_local_files("./data"):
+    ...     print(relpath, st.st_size)
+    config.json 1024
+    shards/shard-00000.parquet 104857600
+    ```
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hf-walk") as pool:
+        try:
+            yield from _walk_sorted(pool, os.fspath(root), max_pending=WALK_PREFETCH_FACTOR * max_workers)
+        finally:
+            # Drop queued listings if the caller stops iterating early. Exiting the `with` block then only waits for
+            # the listings already running.
+            pool.shutdown(cancel_futures=True)
+
+
+def _walk_sorted(pool: ThreadPoolExecutor, root: str, max_pending: int) -> Iterator[tuple[str, os.stat_result]]:
+    """Depth-first walk of `root`, listing up to `max_pending` directories ahead in the background.
+
+    Directories are prefetched in the order they will be consumed, as far as it is known: the remaining subdirectories
+    of the innermost directory first, then those of its parents.
+    """
+    # Submitted listings that have not been consumed yet, by path
+    pending: dict[str, Future[list[tuple[str, str, os.stat_result | None]]]] = {}
+    # Directories being walked, innermost last: (relative path, remaining entries, subdirectories not submitted yet)
+    stack: list[tuple[str, Iterator[tuple[str, str, os.stat_result | None]], deque[str]]] = []
+
+    def _enter(path: str, rel_dir: str) -> None:
+        listing = pending.pop(path, None)
+        if listing is None:
+            # Not prefetched => it is the next subdirectory to submit of the innermost directory
+            if stack:
+                stack[-1][2].popleft()
+            listing = pool.submit(_scan_dir, path)
+        entries = listing.result()
+        stack.append((rel_dir, iter(entries), deque(path for _, path, st in entries if st is None)))
+        for _, _, to_submit in reversed(stack):
+            while to_submit and len(pending) < max_pending:
+                next_path = to_submit.popleft()
+                pending[next_path] = pool.submit(_scan_dir, next_path)
+
+    _enter(root, "")
+    while stack:
+        rel_dir, entries, _ = stack[-1]
+        for key, path, st in entries:
+            if st is None:
+                _enter(path, rel_dir + key)
+                break
+            yield rel_dir + key, st
+        else:
+            stack.pop()
+
+
+def _scan_dir(path: str) -> list[tuple[str, str, os.stat_result | None]]:
+    """List a directory as sorted `(key, path, stat)` tuples, where `stat` is `None` for directories.
+
+    Directory keys end with a `/` so that sorting keys is equivalent to sorting full relative paths.
+    """
+    entries = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.name + "/", entry.path, None))
+                        continue
+                    st = entry.stat()  # follow symlinks to files
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    entries.append((entry.name, entry.path, st))
+    except OSError:
+        return []
+    entries.sort(key=lambda item: item[0])
+    return entries
@@ -0,0 +1,370 @@
+# Copyright 2026-present, the HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-request timing instrumentation of the HTTP clients used by `huggingface_hub`.
+
+Timings are collected by the event hooks of the default clients (see `_http.py`), using the `trace` extension of
+`httpcore` to time the phases of each request. Nothing is collected until a callback is registered with
+[`add_request_timing_callback`].
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from . import logging
+
+
+logger = logging.get_logger(__name__)
+
+REQUEST_TIMING_CALLBACK_T = Callable[["RequestTiming"], None]
+
+# Registered callbacks. Mutated in place: hooks check it directly to keep the cost close to nothing when empty.
+_REQUEST_TIMING_CALLBACKS: list[REQUEST_TIMING_CALLBACK_T] = []
+_REQUEST_TIMING_LOCK = threading.Lock()
+
+# Number of previous attempts of the request being sent (set by `http_backoff`)
+_RETRY_ATTEMPT: contextvars.ContextVar[int] = contextvars.ContextVar("hf_retry_attempt", default=0)
+
+# Key of the timer in `request.extensions`
+_TIMER_EXTENSION = "hf_request_timer"
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """
+    Timings of an HTTP request made by `huggingface_hub`.
+
+    Phases that did not happen for this request (e.g. `connect` and `tls` when a connection is reused from the pool)
+    are `None`. Redirects are followed as separate requests: each hop is reported on its own, and `redirect` is the time
+    spent in the previous hops before sending this one.
+
+    Attributes:
+        method (`str`):
+            HTTP method of the request.
+        url (`str`):
+            URL of the request.
+        endpoint_class (`str`):
+            `"api"`, `"resolvers"` (file downloads) or `"pages"` for requests to the Hub, `"other"` for any other host
+            (e.g. a CDN).
+        status_code (`int`, *optional*):
+            Status code of the response. `None` if no response was received.
+        error (`str`, *optional*):
+            Name of the exception raised while sending the request or receiving the response, if any.
+        retry (`int`):
+            Number of previous attempts of this request (see [`http_backoff`]).
+        connect (`float`, *optional*):
+            Time to open the TCP connection, including DNS resolution, in seconds.
+        tls (`float`, *optional*):
+            Time of the TLS handshake, in seconds.
+        ttfb (`float`, *optional*):
+            Time between sending the request and receiving the response headers, in seconds.
+        redirect (`float`):
+            Time spent in previous redirection hops, in seconds.
+        transfer (`float`, *optional*):
+            Time to receive the response body, in seconds. For streamed responses, this includes the time spent by the
+            caller between two chunks.
+        total (`float`):
+            Time between the start of the request and the closing of the response, in seconds.
+        bytes_downloaded (`int`):
+            Number of bytes of the response body, as received on the wire (i.e. before decompression).
+        bytes_uploaded (`int`, *optional*):
+            Size of the request body, if known.
+    """
+
+    method: str
+    url: str
+    endpoint_class: str
+    status_code: int | None
+    error: str | None
+    retry: int
+    connect: float | None
+    tls: float | None
+    ttfb: float | None
+    redirect: float
+    transfer: float | None
+    total: float
+    bytes_downloaded: int
+    bytes_uploaded: int | None
+
+
+def add_request_timing_callback(callback: REQUEST_TIMING_CALLBACK_T) -> None:
+    """
+    Register a callback called with a [`~utils.RequestTiming`] after each HTTP request made by `huggingface_hub`.
+
+    Timings are only collected by the default HTTP clients (see [`set_client_factory`]), once at least one callback
+    is registered. Callbacks are called from the thread (or event loop) that made the request, when its response is
+    closed. They must be fast and must not raise.
+
+    Example:
+    ```python
+    >>> from huggingface_hub import hf_hub_download
+    >>> from huggingface_hub.utils import add_request_timing_callback, remove_request_timing_callback
+    >>> add_request_timing_callback(print)
+    >>> hf_hub_download("gpt2", "config.json")
+    RequestTiming(method='HEAD', url='https://huggingface.co/gpt2/resolve/main/config.json', endpoint_class='resolvers', status_code=200, ...)
+    >>> remove_request_timing_callback(print)
+    ```
+    """
+    with _REQUEST_TIMING_LOCK:
+        _REQUEST_TIMING_CALLBACKS.append(callback)
+
+
+def remove_request_timing_callback(callback: REQUEST_TIMING_CALLBACK_T) -> None:
+    """
+    Unregister a callback registered with [`~utils.add_request_timing_callback`].
+
+    Does nothing if the callback is not registered.
+    """
+    with _REQUEST_TIMING_LOCK:
+        if callback in _REQUEST_TIMING_CALLBACKS:
+            _REQUEST_TIMING_CALLBACKS.remove(callback)
+
+
+@contextmanager
+def _retry_attempt(attempt: int) -> Generator[None, None, None]:
+    """Tag the requests sent in this context as the `attempt`-th retry."""
+    token = _RETRY_ATTEMPT.set(attempt)
+    try:
+        yield
+    finally:
+        _RETRY_ATTEMPT.reset(token)
+
+
+class _RequestTimer:
+    """Collect the timings of a single request, using the `trace` extension of `httpcore`."""
+
+    def __init__(self, request: httpx.Request, endpoint_class: str, previous: "_RequestTimer | None") -> None:
+        self.request = request
+        self.endpoint_class = endpoint_class
+        self.retry = _RETRY_ATTEMPT.get()
+        self.started_at = time.perf_counter()
+        self.chain_started_at = previous.chain_started_at if previous is not None else self.started_at
+        # Trace callback set by the user, if any
+        self.user_trace = previous.user_trace if previous is not None else request.extensions.get("trace")
+        self.events: dict[str, float] = {}
+        self.response: httpx.Response | None = None
+        self.error: str | None = None
+        self.done = False
+
+    def trace(self, name: str, info: dict[str, Any]) -> None:
+        # e.g. "connection.connect_tcp.started" or "http11.receive_response_headers.complete"
+        event = name.partition(".")[2]
+        self.events[event] = time.perf_counter()
+        if event.endswith(".failed") and self.error is None:
+            self.error = type(info.get("exception")).__name__
+        if event.startswith("response_closed.") or (name.startswith("connection.") and event.endswith(".failed")):
+            self.finish()
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self.trace(name, info)
+
+    def _phase(self, name: str) -> float | None:
+        started = self.events.get(f"{name}.started")
+        ended = self.events.get(f"{name}.complete")
+        return ended - started if started is not None and ended is not None else None
+
+    def finish(self) -> None:
+        if self.done:
+            return
+        self.done = True
+        now = time.perf_counter()
+
+        ttfb = None
+        sent_at = self.events.get("send_request_headers.started")
+        headers_received_at = self.events.get("receive_response_headers.complete")
+        if sent_at is not None and headers_received_at is not None:
+            ttfb = headers_received_at - sent_at
+
+        transfer = None
+        body_started_at = self.events.get("receive_response_body.started")
+        if body_started_at is not None:
+            transfer = self.events.get("receive_response_body.complete", now) - body_started_at
+
+        content_length = self.request.headers.get("Content-Length")
+        timing = RequestTiming(
+            method=self.request.method,
+            url=str(self.request.url),
+            endpoint_class=self.endpoint_class,
+            status_code=self.response.status_code if self.response is not None else None,
+            error=self.error,
+            retry=self.retry,
+            connect=self._phase("connect_tcp"),
+            tls=self._phase("start_tls"),
+            ttfb=ttfb,
+            redirect=self.started_at - self.chain_started_at,
+            transfer=transfer,
+            total=now - self.started_at,
+            bytes_downloaded=self.response.num_bytes_downloaded if self.response is not None else 0,
+            bytes_uploaded=int(content_length) if content_length is not None and content_length.isdigit() else None,
+        )
+        for callback in list(_REQUEST_TIMING_CALLBACKS):
+            try:
+                callback(timing)
+            except Exception as e:
+                logger.warning(f"Error in request timing callback {callback}: {e}")
+
+
+def start_request_timing(request: httpx.Request, endpoint_class: str, is_async: bool) -> None:
+    """Start timing a request. Called from the request event hooks."""
+    previous = request.extensions.get(_TIMER_EXTENSION)
+    timer = _RequestTimer(request, endpoint_class, previous=previous if isinstance(previous, _RequestTimer) else None)
+    if timer.user_trace is None:
+        trace: Callable = timer.atrace if is_async else timer.trace
+    elif is_async:
+
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            timer.trace(name, info)
+            await timer.user_trace(name, info)  # type: ignore
+    else:
+
+        def trace(name: str, info: dict[str, Any]) -> None:
+            timer.trace(name, info)
+            timer.user_trace(name, info)  # type: ignore
+
+    request.extensions[_TIMER_EXTENSION] = timer
+    request.extensions["trace"] = trace
+
+
+def record_response(response: httpx.Response) -> None:
+    """Attach a response to the timer of its request. Called from the response event hooks."""
+    timer = response.request.extensions.get(_TIMER_EXTENSION)
+    if isinstance(timer, _RequestTimer):
+        timer.response = response
+
+
+class RequestTimingHistograms:
+    """
+    In-memory histograms of the timings of HTTP requests, per class of endpoints and phase.
+
+    Register an instance with [`~utils.add_request_timing_callback`] to start collecting timings. Histograms can then
+    be read with [`~utils.RequestTimingHistograms.get`] or exported in the Prometheus text format with
+    [`~utils.RequestTimingHistograms.to_prometheus`].
+
+    Args:
+        buckets (`tuple[float, ...]`, *optional*):
+            Upper bounds of the buckets of the histograms, in seconds.
+
+    Example:
+    ```python
+    >>> from huggingface_hub import snapshot_download
+    >>> from huggingface_hub.utils import RequestTimingHistograms, add_request_timing_callback
+    >>> histograms = RequestTimingHistograms()
+    >>> add_request_timing_callback(histograms)
+    >>> snapshot_download("gpt2")
+    >>> histograms.get("resolvers", "ttfb")
+    {'count': 26, 'sum': 1.92, 'buckets': {0.005: 0, 0.01: 0, 0.025: 2, ...}}
+    >>> print(histograms.to_prometheus())
+    # HELP hf_hub_http_request_duration_seconds Duration of the phases of HTTP requests made by huggingface_hub.
+    # TYPE hf_hub_http_request_duration_seconds histogram
+    hf_hub_http_request_duration_seconds_bucket{endpoint_class="resolvers",phase="ttfb",le="0.005"} 0
+    ...
+    ```
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    PHASES = ("connect", "tls", "ttfb", "redirect", "transfer", "total")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all collected timings."""
+        with self._lock:
+            # (endpoint_class, phase) => [count per bucket (non-cumulative, last one is +Inf), sum]
+            self._histograms: dict[tuple[str, str], tuple[list[int], list[float]]] = {}
+            # (endpoint_class, status) => number of requests
+            self._requests: dict[tuple[str, str], int] = {}
+            # endpoint_class => value
+            self._bytes_downloaded: dict[str, int] = {}
+            self._retries: dict[str, int] = {}
+
+    def __call__(self, timing: RequestTiming) -> None:
+        status = str(timing.status_code) if timing.status_code is not None else "error"
+        with self._lock:
+            for phase in self.PHASES:
+                value = getattr(timing, phase)
+                if value is None or (phase == "redirect" and value == 0):
+                    continue
+                counts, total = self._histograms.setdefault(
+                    (timing.endpoint_class, phase), ([0] * (len(self.buckets) + 1), [0.0])
+                )
+                counts[bisect.bisect_left(self.buckets, value)] += 1
+                total[0] += value
+            key = (timing.endpoint_class, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._bytes_downloaded[timing.endpoint_class] = (
+                self._bytes_downloaded.get(timing.endpoint_class, 0) + timing.bytes_downloaded
+            )
+            if timing.retry > 0:
+                self._retries[timing.endpoint_class] = self._retries.get(timing.endpoint_class, 0) + 1
+
+    def get(self, endpoint_class: str, phase: str) -> dict[str, Any] | None:
+        """
+        Return the histogram of a phase for a class of endpoints, or `None` if no timing has been collected.
+
+        The histogram is returned as a dict with the number of values (`count`), their `sum` and the cumulative count
+        of values lower or equal to each bucket bound (`buckets`).
+        """
+        with self._lock:
+            histogram = self._histograms.get((endpoint_class, phase))
+            if histogram is None:
+                return None
+            counts, total = histogram
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                buckets[bound] = cumulative
+            return {"count": sum(counts), "sum": total[0], "buckets": buckets}
+
+    def to_prometheus(self, prefix: str = "hf_hub_http") -> str:
+        """Export the collected timings in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Duration of the phases of HTTP requests made by huggingface_hub.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (endpoint_class, phase), (counts, total) in sorted(self._histograms.items()):
+                labels = f'endpoint_class="{endpoint_class}",phase="{phase}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {sum(counts)}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {total[0]}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {sum(counts)}")
+
+            lines.append(f"# HELP {prefix}_requests_total Number of HTTP requests made by huggingface_hub.")
+            lines.append(f"# TYPE {prefix}_requests_total counter")
+            for (endpoint_class, status), count in sorted(self._requests.items()):
+                lines.append(f'{prefix}_requests_total{{endpoint_class="{endpoint_class}",status="{status}"}} {count}')
+
+            lines.append(f"# HELP {prefix}_response_bytes_total Number of bytes received by huggingface_hub.")
+            lines.append(f"# TYPE {prefix}_response_bytes_total counter")
+            for endpoint_class, count in sorted(self._bytes_downloaded.items()):
+                lines.append(f'{prefix}_response_bytes_total{{endpoint_class="{endpoint_class}"}} {count}')
+
+            lines.append(f"# HELP {prefix}_retries_total Number of retried HTTP requests made by huggingface_hub.")
+            lines.append(f"# TYPE {prefix}_retries_total counter")
+            for endpoint_class, count in sorted(self._retries.items()):
+                lines.append(f'{prefix}_retries_total{{endpoint_class="{endpoint_class}"}} {count}')
+        return "\n".join(lines) + "\n"
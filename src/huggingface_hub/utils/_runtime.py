@@ -36,12 +36,14 @@ _CANDIDATES = {
     "fastcore": {"fastcore"},
     "gradio": {"gradio"},
     "graphviz": {"graphviz"},
+    "h2": {"h2"},
     "hf_xet": {"hf_xet"},
     "jinja": {"Jinja2"},
     "httpx": {"httpx"},
     "keras": {"keras"},
     "numpy": {"numpy"},
     "pillow": {"Pillow"},
+    "pyarrow": {"pyarrow"},
     "pydantic": {"pydantic"},
     "pydot": {"pydot"},
     "safetensors": {"safetensors"},
@@ -144,6 +146,15 @@ def get_graphviz_version() -> str:
     return _get_version("graphviz")
 
 
+# h2
+def is_h2_available() -> bool:
+    return is_package_available("h2")
+
+
+def get_h2_version() -> str:
+    return _get_version("h2")
+
+
 # httpx
 def is_httpx_available() -> bool:
     return is_package_available("httpx")
@@ -184,6 +195,15 @@ def get_numpy_version() -> str:
     return _get_version("numpy")
 
 
+# Pyarrow
+def is_pyarrow_available() -> bool:
+    return is_package_available("pyarrow")
+
+
+def get_pyarrow_version() -> str:
+    return _get_version("pyarrow")
+
+
 # Jinja
 def is_jinja_available() -> bool:
     return is_package_available("jinja")
@@ -418,9 +438,11 @@ def dump_environment_info() -> dict[str, Any]:
 
     # Installed dependencies
     info["httpx"] = get_httpx_version()
+    info["h2"] = get_h2_version()
     info["hf_xet"] = get_xet_version()
     info["gradio"] = get_gradio_version()
     info["tensorboard"] = get_tensorboard_version()
+    info["pyarrow"] = get_pyarrow_version()
 
     # Environment variables
     info["ENDPOINT"] = constants.ENDPOINT
@@ -440,6 +462,15 @@ def dump_environment_info() -> dict[str, Any]:
     info["HF_HUB_DOWNLOAD_TIMEOUT"] = constants.HF_HUB_DOWNLOAD_TIMEOUT
     info["HF_XET_HIGH_PERFORMANCE"] = constants.HF_XET_HIGH_PERFORMANCE
 
+    # Effective configuration of the HTTP connection pools (environment variables or `set_http_pool_config`)
+    from ._http import get_http_pool_config
+
+    http_pool_config = get_http_pool_config()
+    info["HF_HUB_HTTP_MAX_CONNECTIONS"] = http_pool_config.max_connections
+    info["HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS"] = http_pool_config.max_keepalive_connections
+    info["HF_HUB_HTTP_KEEPALIVE_EXPIRY"] = http_pool_config.keepalive_expiry
+    info["HF_HUB_ENABLE_HTTP2"] = http_pool_config.http2
+
     print("\nCopy-and-paste the text below in your GitHub issue.\n")
     print("\n".join([f"- {prop}: {val}" for prop, val in info.items()]) + "\n")
     return info
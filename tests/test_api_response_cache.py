@@ -0,0 +1,201 @@
+import json
+import os
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from huggingface_hub import HfApi, _api_response_cache, constants
+from huggingface_hub._api_response_cache import (
+    _DISK_CACHE_SIZE,
+    _IN_MEMORY_CACHE,
+    CachedApiResponse,
+    _api_cache_key,
+    fetch_with_api_cache,
+    read_api_cache,
+    write_api_cache,
+)
+from huggingface_hub.errors import RepositoryNotFoundError
+
+
+URL = f"{constants.ENDPOINT}/api/models/user/model"
+ETAG = 'W/"1f3-abc"'
+
+
+@pytest.fixture(autouse=True)
+def api_cache(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(constants, "HF_HUB_ENABLE_API_CACHE", True)
+    monkeypatch.setattr(constants, "HF_HUB_API_CACHE", str(tmp_path))
+    _IN_MEMORY_CACHE.clear()
+    _DISK_CACHE_SIZE.clear()
+    yield tmp_path
+    _IN_MEMORY_CACHE.clear()
+    _DISK_CACHE_SIZE.clear()
+
+
+def _response(status_code: int = 200, json_data: object = None, url: str = URL, **headers: str) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        json=json_data,
+        headers={"ETag": ETAG, **headers} if status_code == 200 else headers,
+        request=httpx.Request("GET", url),
+    )
+
+
+def _fetch(send: Mock, parse: Mock, headers: dict | None = None) -> object:
+    return fetch_with_api_cache(URL, headers=headers or {}, send=send, parse=parse)
+
+
+def test_write_and_read_roundtrip(api_cache):
+    key = _api_cache_key(URL, None, {})
+    write_api_cache(key, CachedApiResponse(url=URL, etag=ETAG, headers={}, content='{"id": "user/model"}'))
+    assert json.loads((api_cache / f"{key}.json").read_text())["format_version"] == 1
+
+    _IN_MEMORY_CACHE.clear()  # force a read from disk
+    cached = read_api_cache(key)
+    assert cached == CachedApiResponse(url=URL, etag=ETAG, headers={}, content='{"id": "user/model"}')
+    assert cached.as_response(httpx.Request("GET", URL)).json() == {"id": "user/model"}
+
+
+def test_key_depends_on_params_and_token():
+    assert _api_cache_key(URL, {"expand": ["sha"]}, {}) == _api_cache_key(f"{URL}?expand=sha", None, {})
+    assert _api_cache_key(URL, None, {}) != _api_cache_key(URL, {"expand": ["sha"]}, {})
+    assert _api_cache_key(URL, None, {"authorization": "Bearer hf_a"}) != _api_cache_key(
+        URL, None, {"authorization": "Bearer hf_b"}
+    )
+
+
+def test_revalidate_and_serve_304_from_cache():
+    send = Mock(return_value=_response(json_data={"sha": "abc"}))
+    parse = Mock(side_effect=lambda r: r.json())
+
+    first = _fetch(send, parse, headers={"user-agent": "test"})
+    assert first == {"sha": "abc"}
+    assert "If-None-Match" not in send.call_args.args[0]
+
+    # Not modified => copy of the cached object, not parsed again
+    send.return_value = _response(304)
+    second = _fetch(send, parse, headers={"user-agent": "test"})
+    assert second == first
+    assert second is not first
+    assert send.call_args.args[0] == {"user-agent": "test", "If-None-Match": ETAG}
+    assert parse.call_count == 1
+
+    # From disk => parsed once again
+    _IN_MEMORY_CACHE.clear()
+    assert _fetch(send, parse) == {"sha": "abc"}
+    assert parse.call_count == 2
+
+    # Modified => cache is updated
+    send.return_value = _response(json_data={"sha": "def"}, ETag='W/"1f3-def"')
+    assert _fetch(send, parse) == {"sha": "def"}
+    _IN_MEMORY_CACHE.clear()
+    send.return_value = _response(304)
+    assert _fetch(send, parse) == {"sha": "def"}
+    assert send.call_args.args[0]["If-None-Match"] == 'W/"1f3-def"'
+
+
+def test_errors_and_responses_without_etag_are_not_cached(api_cache):
+    send = Mock(return_value=_response(404, **{"X-Error-Code": "RepoNotFound"}))
+    with pytest.raises(RepositoryNotFoundError):
+        _fetch(send, Mock())
+
+    send.return_value = httpx.Response(200, json={}, request=httpx.Request("GET", URL))
+    _fetch(send, Mock())
+    assert os.listdir(api_cache) == []
+    assert len(_IN_MEMORY_CACHE) == 0
+
+
+def test_disabled(api_cache, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(constants, "HF_HUB_ENABLE_API_CACHE", False)
+    send = Mock(return_value=_response(json_data={"sha": "abc"}))
+    parse = Mock(side_effect=lambda r: r.json())
+    _fetch(send, parse)
+    _fetch(send, parse)
+    assert parse.call_count == 2
+    assert "If-None-Match" not in send.call_args.args[0]
+    assert os.listdir(api_cache) == []
+
+
+def test_disk_cache_is_bounded(api_cache, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(constants, "HF_HUB_API_CACHE_MAX_SIZE", 500)
+    keys = []
+    for i in range(5):
+        keys.append(f"{i:064d}")
+        write_api_cache(keys[-1], CachedApiResponse(url=URL, etag=ETAG, headers={}, content="x" * 100))
+        os.utime(api_cache / f"{keys[-1]}.json", (i, i))
+
+    remaining = sorted(path.stem for path in api_cache.iterdir())
+    assert remaining == keys[-len(remaining) :]
+    assert 0 < len(remaining) < 5
+    assert sum(path.stat().st_size for path in api_cache.iterdir()) <= 500
+
+
+def test_disk_cache_is_only_scanned_when_it_may_be_too_large(api_cache, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(constants, "HF_HUB_API_CACHE_MAX_SIZE", 2000)
+    with patch.object(_api_response_cache, "_evict_api_cache", wraps=_api_response_cache._evict_api_cache) as evict:
+        for i in range(5):
+            write_api_cache(f"{i:064d}", CachedApiResponse(url=URL, etag=ETAG, headers={}, content="x" * 100))
+        assert evict.call_count == 1  # first write of the process
+
+        # Overwriting an entry doesn't grow the cache
+        write_api_cache(f"{0:064d}", CachedApiResponse(url=URL, etag=ETAG, headers={}, content="x" * 100))
+        assert evict.call_count == 1
+
+        for i in range(5, 20):
+            write_api_cache(f"{i:064d}", CachedApiResponse(url=URL, etag=ETAG, headers={}, content="x" * 100))
+        assert evict.call_count > 1
+    assert sum(path.stat().st_size for path in api_cache.iterdir()) <= 2000
+
+
+def test_cached_object_is_not_modified_by_callers():
+    send = Mock(return_value=_response(json_data={"sha": "abc"}))
+    parse = Mock(side_effect=lambda r: Mock(sha=r.json()["sha"]))
+
+    _fetch(send, parse).sha = "modified"
+    send.return_value = _response(304)
+    served = _fetch(send, parse)
+    served.sha = "modified again"
+    assert _fetch(send, parse).sha == "abc"
+
+
+class TestHfApiWithApiCache:
+    @pytest.fixture
+    def session(self):
+        session = Mock()
+        with patch("huggingface_hub.hf_api.get_session", return_value=session):
+            yield session
+
+    def test_model_info(self, session: Mock):
+        api = HfApi(token=False)
+        session.get.return_value = _response(json_data={"id": "user/model", "sha": "abc"})
+        info = api.model_info("user/model")
+        assert info.sha == "abc"
+
+        session.get.return_value = _response(304)
+        cached_info = api.model_info("user/model")
+        assert cached_info == info
+        assert cached_info is not info
+        assert session.get.call_args.kwargs["headers"]["If-None-Match"] == ETAG
+
+        # Different query => different cache entry
+        session.get.return_value = _response(json_data={"id": "user/model", "sha": "abc"})
+        assert api.model_info("user/model", expand=["sha"]) is not info
+
+    def test_list_repo_commits_pages_are_cached(self, session: Mock):
+        api = HfApi(token=False)
+        commit = {"id": "abc", "authors": [], "date": "2024-01-01T00:00:00.000Z", "title": "Update", "message": ""}
+        commits_url = f"{URL}/commits/main"
+        next_url = f"{commits_url}?p=1"
+
+        session.get.return_value = _response(json_data=[commit], url=commits_url, Link=f'<{next_url}>; rel="next"')
+        with patch("huggingface_hub.hf_api.http_backoff", return_value=_response(json_data=[commit], url=next_url)):
+            assert len(api.list_repo_commits("user/model")) == 2
+
+        # All pages are revalidated and served from the cache
+        session.get.return_value = _response(304, url=commits_url)
+        with patch("huggingface_hub.hf_api.http_backoff", return_value=_response(304, url=next_url)) as mock:
+            commits = api.list_repo_commits("user/model")
+        assert [c.commit_id for c in commits] == ["abc", "abc"]
+        assert mock.call_args.args == ("GET", next_url)
+        assert mock.call_args.kwargs["headers"]["If-None-Match"] == ETAG
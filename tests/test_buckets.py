@@ -12,12 +12,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import threading
 import warnings
+from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
 from huggingface_hub import HfApi
-from huggingface_hub._buckets import BucketFile, BucketInfo
+from huggingface_hub._buckets import (
+    BucketFile,
+    BucketInfo,
+    _BatchPacer,
+    _compute_sync_plan,
+    _iter_sync_operations,
+    _list_local_files,
+    _LocalHashCache,
+    _merge_sorted_listings,
+    _SyncExecutor,
+    sync_bucket_internal,
+)
+from huggingface_hub._buckets_watch import BucketSyncWatcher
 from huggingface_hub._jobs_api import _derive_job_volume_name
 from huggingface_hub.errors import BucketNotFoundError, EntryNotFoundError, HfHubHTTPError
 
@@ -605,3 +621,355 @@ def test_sync_job_volume_empty_dir_uploads_placeholder(api: HfApi, tmp_path):
         if isinstance(entry, BucketFile)
     }
     assert files == {f"{volume.path}/.keep"}
+
+
+# -- sync planner (offline) --
+
+
+def _make_bucket_file(
+    path: str, size: int, mtime: str = "2026-01-01T00:00:00.000Z", xet_hash: str = "a" * 64
+) -> BucketFile:
+    return BucketFile(type="file", path=path, size=size, xetHash=xet_hash, mtime=mtime)
+
+
+def _mock_sync_api(remote_files: list[BucketFile]) -> Mock:
+    api = Mock()
+    api.list_bucket_tree.side_effect = lambda *args, **kwargs: iter(remote_files)
+    return api
+
+
+def _write_files(root, files: dict[str, str], mtime: float = 1767225600) -> None:  # 2026-01-01
+    for path, content in files.items():
+        file_path = root / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+        os.utime(file_path, (mtime, mtime))
+
+
+def test_list_local_files_sorted_by_path(tmp_path):
+    _write_files(tmp_path, {"b.txt": "", "a/b.txt": "", "a.txt": "", "a-b/c.txt": "", "a/a/z.txt": ""})
+    paths = [path for path, _, _ in _list_local_files(str(tmp_path))]
+    assert paths == sorted(paths) == ["a-b/c.txt", "a.txt", "a/a/z.txt", "a/b.txt", "b.txt"]
+
+
+def test_merge_sorted_listings():
+    source = iter([("a", 1), ("c", 3), ("d", 4)])
+    dest = iter([("b", 2), ("c", 30)])
+    assert list(_merge_sorted_listings(source, dest)) == [
+        ("a", 1, None),
+        ("b", None, 2),
+        ("c", 3, 30),
+        ("d", 4, None),
+    ]
+
+
+def test_compute_sync_plan_upload(tmp_path):
+    _write_files(tmp_path, {"new.txt": "new", "same.txt": "same", "changed.txt": "changed!"})
+    api = _mock_sync_api(
+        [
+            _make_bucket_file("changed.txt", 3),
+            _make_bucket_file("only_remote.txt", 1),
+            _make_bucket_file("same.txt", 4),
+        ]
+    )
+    plan = _compute_sync_plan(str(tmp_path), "hf://buckets/username/my-bucket", api=api, delete=True)
+    assert [(op.path, op.action, op.reason) for op in plan.operations] == [
+        ("changed.txt", "upload", "size differs"),
+        ("new.txt", "upload", "new file"),
+        ("only_remote.txt", "delete", "not in source (--delete)"),
+        ("same.txt", "skip", "identical"),
+    ]
+
+
+def test_compute_sync_plan_download_without_delete_does_not_walk(tmp_path):
+    _write_files(tmp_path, {"same.txt": "same", "unrelated/file.txt": "unrelated"})
+    api = _mock_sync_api([_make_bucket_file("new.txt", 3), _make_bucket_file("same.txt", 4)])
+    plan = _compute_sync_plan("hf://buckets/username/my-bucket", str(tmp_path), api=api)
+    assert [(op.path, op.action) for op in plan.operations] == [("new.txt", "download"), ("same.txt", "skip")]
+    assert plan.operations[0].bucket_file.path == "new.txt"
+
+
+def test_compute_sync_plan_falls_back_to_sorting_unsorted_remote_listing(tmp_path, caplog):
+    _write_files(tmp_path, {"a.txt": "a", "c.txt": "c", "d.txt": "d"})
+    api = _mock_sync_api(
+        [
+            _make_bucket_file("b.txt", 1),
+            _make_bucket_file("d.txt", 1),
+            # Out of order: missed by the merge-join
+            _make_bucket_file("0.txt", 1),
+            _make_bucket_file("a.txt", 1),
+        ]
+    )
+    plan = _compute_sync_plan(str(tmp_path), "hf://buckets/username/my-bucket", api=api, delete=True)
+
+    # Operations computed before the out-of-order path are kept, missed paths are processed afterwards
+    assert [(op.path, op.action, op.reason) for op in plan.operations] == [
+        ("a.txt", "upload", "new file"),
+        ("b.txt", "delete", "not in source (--delete)"),
+        ("c.txt", "upload", "new file"),
+        ("d.txt", "skip", "identical"),
+        ("0.txt", "delete", "not in source (--delete)"),
+        ("a.txt", "skip", "identical"),
+    ]
+    assert api.list_bucket_tree.call_count == 2
+    assert "Remote listing is not sorted by path" in caplog.text
+
+
+def test_compute_sync_plan_unsorted_remote_listing_redownloads_deleted_files(tmp_path, caplog):
+    _write_files(tmp_path, {"a.txt": "a", "b.txt": "b"})
+    api = _mock_sync_api(
+        [
+            _make_bucket_file("b.txt", 1),
+            # Out of order: "a.txt" is first considered missing on the remote and deleted locally
+            _make_bucket_file("a.txt", 1),
+            _make_bucket_file("c.txt", 1),
+        ]
+    )
+    plan = _compute_sync_plan("hf://buckets/username/my-bucket", str(tmp_path), api=api, delete=True)
+
+    # The local deletion of "a.txt" is already emitted => the file must be downloaded again
+    assert [(op.path, op.action, op.reason) for op in plan.operations] == [
+        ("a.txt", "delete", "not in source (--delete)"),
+        ("b.txt", "skip", "identical"),
+        ("a.txt", "download", "new file"),
+        ("c.txt", "download", "new file"),
+    ]
+    assert "Remote listing is not sorted by path" in caplog.text
+
+
+def test_sync_bucket_streams_operations_into_batches(tmp_path, monkeypatch):
+    """Transfers start while the remote listing is still being consumed."""
+    monkeypatch.setattr("huggingface_hub._buckets._SYNC_EXECUTE_BATCH_SIZE", 2)
+    _write_files(tmp_path, {f"{i}.txt": "content" for i in range(5)})
+
+    events = []
+    first_upload_done = threading.Event()
+
+    def _list_bucket_tree(*args, **kwargs):
+        for i in range(5):
+            if i == 2:
+                assert first_upload_done.wait(timeout=5)
+            events.append(f"list {i}.txt")
+            yield _make_bucket_file(f"{i}.txt", 1)
+
+    def _batch_bucket_files(bucket_id, add=None, delete=None):
+        events.append(f"upload {[path for _, path in add]}")
+        first_upload_done.set()
+
+    api = Mock()
+    api.list_bucket_tree.side_effect = _list_bucket_tree
+    api.batch_bucket_files.side_effect = _batch_bucket_files
+
+    plan = sync_bucket_internal(str(tmp_path), "hf://buckets/username/my-bucket", api=api, quiet=True)
+    assert plan.summary()["uploads"] == 5
+    assert plan.summary()["total_size"] == 5 * len("content")
+    assert plan.operations == []  # executed operations are counted, not kept in memory
+    assert events[:3] == ["list 0.txt", "list 1.txt", "upload ['0.txt', '1.txt']"]
+    assert sorted(event for event in events if event.startswith("upload")) == [
+        "upload ['0.txt', '1.txt']",
+        "upload ['2.txt', '3.txt']",
+        "upload ['4.txt']",
+    ]
+
+
+def test_batch_pacer_adapts_to_batch_duration():
+    pacer = _BatchPacer()
+    initial = pacer.target
+    pacer.record_success(duration=1.0, nb_items=initial)
+    assert pacer.target > initial
+    pacer.record_success(duration=120.0, nb_items=pacer.target)
+    assert pacer.target == initial
+    pacer.record_failure()
+    assert pacer.target < initial
+
+
+def test_sync_executor_retries_rate_limited_batches():
+    response = httpx.Response(
+        429, headers={"ratelimit": '"api";r=0;t=0'}, request=httpx.Request("POST", "https://huggingface.co")
+    )
+    calls = []
+
+    def _handler(items):
+        calls.append(list(items))
+        if len(calls) == 1:
+            raise HfHubHTTPError("429 Too Many Requests", response=response)
+
+    executor = _SyncExecutor(handlers={"upload": _handler, "delete": Mock()})
+    for i in range(3):
+        executor.add("upload", f"{i}.txt", size=10)
+    stats = executor.close()
+
+    assert calls == [["0.txt", "1.txt", "2.txt"]] * 2
+    assert stats["upload"].nb_files == 3
+    assert stats["upload"].nb_bytes == 30
+    assert stats["upload"].nb_rate_limited == 1
+    assert stats["delete"].nb_batches == 0
+
+
+def test_sync_executor_raises_batch_errors():
+    executor = _SyncExecutor(handlers={"upload": Mock(side_effect=ValueError("boom"))})
+    executor.add("upload", "0.txt")
+    with pytest.raises(ValueError, match="boom"):
+        executor.close()
+
+
+def test_local_hash_cache_only_hashes_changed_files(tmp_path):
+    from hf_xet import hash_files
+
+    _write_files(tmp_path / "data", {"a.txt": "aaa", "b.txt": "bbb"})
+    paths = [str(tmp_path / "data" / "a.txt"), str(tmp_path / "data" / "b.txt"), str(tmp_path / "missing.txt")]
+    expected = [info.hash for info in hash_files(paths[:2])] + [None]
+
+    with patch("hf_xet.hash_files", side_effect=hash_files) as mock_hash_files:
+        cache = _LocalHashCache(str(tmp_path / "cache" / "hashes.sqlite"))
+        assert cache.hash_files(paths) == expected
+        assert mock_hash_files.call_args.args[0] == paths[:2]
+        cache.close()
+
+        # Persistent: a new cache instance hashes nothing
+        cache = _LocalHashCache(str(tmp_path / "cache" / "hashes.sqlite"))
+        assert cache.hash_files(paths) == expected
+        assert mock_hash_files.call_count == 1
+
+        # Rewritten file is hashed again
+        _write_files(tmp_path / "data", {"a.txt": "AAA"}, mtime=1767225601)
+        assert cache.hash_files(paths)[0] == hash_files([paths[0]])[0].hash
+        assert mock_hash_files.call_args.args[0] == paths[:1]
+        cache.close()
+
+
+def test_compute_sync_plan_checksum(tmp_path, monkeypatch):
+    from hf_xet import hash_files
+
+    monkeypatch.setattr("huggingface_hub.constants.HF_BUCKETS_CACHE", str(tmp_path / "cache"))
+    _write_files(tmp_path / "data", {"same.txt": "same", "changed.txt": "abcd"}, mtime=1893456000)  # local is newer
+    same_hash = hash_files([str(tmp_path / "data" / "same.txt")])[0].hash
+    api = _mock_sync_api(
+        [
+            _make_bucket_file("changed.txt", 4, xet_hash="b" * 64),
+            _make_bucket_file("same.txt", 4, xet_hash=same_hash),
+        ]
+    )
+    plan = _compute_sync_plan(str(tmp_path / "data"), "hf://buckets/username/my-bucket", api=api, checksum=True)
+    assert [(op.path, op.action, op.reason) for op in plan.operations] == [
+        ("changed.txt", "upload", "checksum differs"),
+        ("same.txt", "skip", "same checksum"),
+    ]
+
+
+def test_iter_sync_operations_closes_hash_cache(tmp_path, monkeypatch):
+    hash_cache = Mock()
+    hash_cache.hash_files.side_effect = lambda paths: ["b" * 64] * len(paths)
+    monkeypatch.setattr("huggingface_hub._buckets._LocalHashCache", lambda: hash_cache)
+    _write_files(tmp_path, {"a.txt": "a", "b.txt": "b"})
+    api = _mock_sync_api([_make_bucket_file("a.txt", 1), _make_bucket_file("b.txt", 1)])
+
+    # Stopped early (e.g. a transfer failed)
+    operations = _iter_sync_operations(str(tmp_path), "hf://buckets/username/my-bucket", api=api, checksum=True)
+    next(operations)
+    operations.close()
+    hash_cache.close.assert_called_once()
+
+    # Listing failed
+    api.list_bucket_tree.side_effect = RuntimeError("listing failed")
+    with pytest.raises(RuntimeError, match="listing failed"):
+        list(_iter_sync_operations(str(tmp_path), "hf://buckets/username/my-bucket", api=api, checksum=True))
+    assert hash_cache.close.call_count == 2
+
+
+def test_sync_bucket_checksum_incompatible_with_ignore_times(tmp_path):
+    with pytest.raises(ValueError, match="checksum"):
+        sync_bucket_internal(
+            str(tmp_path), "hf://buckets/username/my-bucket", api=Mock(), checksum=True, ignore_times=True
+        )
+
+
+# -- watch mode (offline) --
+
+
+def _mock_watch_api(monkeypatch, tmp_path) -> Mock:
+    monkeypatch.setattr("huggingface_hub.constants.HF_BUCKETS_CACHE", str(tmp_path / "cache"))
+    api = _mock_sync_api([])
+    api.endpoint = "https://huggingface.co"
+    api.pushed = []
+    api.batch_bucket_files.side_effect = lambda bucket_id, add=None, delete=None: api.pushed.append(
+        ([path for _, path in add or []], list(delete or []))
+    )
+    return api
+
+
+def test_bucket_sync_watcher_debounces_and_batches_changes(tmp_path, monkeypatch):
+    api = _mock_watch_api(monkeypatch, tmp_path)
+    _write_files(tmp_path / "data", {"a.txt": "a", "b.txt": "b"})
+    watcher = BucketSyncWatcher(str(tmp_path / "data"), "hf://buckets/username/my-bucket/out", api=api, delete=True)
+
+    # First poll: full sync
+    assert watcher.poll() == 2
+    assert api.pushed == [(["out/a.txt", "out/b.txt"], [])]
+    assert watcher.poll() == 0
+
+    # Changes are pushed once a poll finds no new change
+    _write_files(tmp_path / "data", {"a.txt": "aa", "c.txt": "c"})
+    (tmp_path / "data" / "b.txt").unlink()
+    assert watcher.poll() == 0
+    _write_files(tmp_path / "data", {"d.txt": "d"})
+    assert watcher.poll() == 0
+    assert watcher.poll() == 4
+    assert api.pushed[1:] == [(["out/a.txt", "out/c.txt", "out/d.txt"], ["out/b.txt"])]
+    assert api.list_bucket_tree.call_count == 1  # bucket is not re-listed
+    watcher.stop()
+
+
+def test_bucket_sync_watcher_resumes_from_persisted_state(tmp_path, monkeypatch):
+    api = _mock_watch_api(monkeypatch, tmp_path)
+    _write_files(tmp_path / "data", {"a.txt": "a", "b.txt": "b"})
+    watcher = BucketSyncWatcher(str(tmp_path / "data"), "hf://buckets/username/my-bucket", api=api)
+    watcher.reconcile()
+    watcher.stop()
+
+    # Changes made while stopped are pushed without re-listing the bucket
+    _write_files(tmp_path / "data", {"b.txt": "bb"})
+    api = _mock_watch_api(monkeypatch, tmp_path)
+    watcher = BucketSyncWatcher(str(tmp_path / "data"), "hf://buckets/username/my-bucket", api=api)
+    assert watcher.flush() == 1
+    assert api.pushed == [(["b.txt"], [])]
+    api.list_bucket_tree.assert_not_called()
+    watcher.stop()
+
+
+def test_bucket_sync_watcher_context_manager(tmp_path, monkeypatch):
+    api = _mock_watch_api(monkeypatch, tmp_path)
+    _write_files(tmp_path / "data", {"a.txt": "a"})
+
+    def _watcher() -> BucketSyncWatcher:
+        return BucketSyncWatcher(str(tmp_path / "data"), "hf://buckets/username/my-bucket", api=api, interval=3600)
+
+    _watcher().reconcile()
+
+    # Last changes are pushed on exit
+    with _watcher():
+        _write_files(tmp_path / "data", {"b.txt": "b"})
+    assert api.pushed[-1] == (["b.txt"], [])
+
+    # Not pushed if an exception is raised, but the watcher is stopped anyway
+    watcher = _watcher()
+    with pytest.raises(RuntimeError, match="training failed"):
+        with watcher:
+            _write_files(tmp_path / "data", {"c.txt": "c"})
+            raise RuntimeError("training failed")
+    assert api.pushed[-1] == (["b.txt"], [])
+    assert watcher._thread is None
+
+    # Watcher is stopped even if the last push fails
+    api.batch_bucket_files.side_effect = RuntimeError("push failed")
+    watcher = _watcher()
+    with pytest.raises(RuntimeError, match="push failed"):
+        with watcher:
+            pass
+    assert watcher._thread is None
+    assert watcher._stop_event.is_set()
+
+
+def test_sync_bucket_watch_requires_local_source(tmp_path):
+    with pytest.raises(ValueError, match="Watch mode"):
+        sync_bucket_internal("hf://buckets/username/my-bucket", str(tmp_path), api=Mock(), watch=True)
@@ -330,6 +330,22 @@ class TestCacheCommand:
             assert "1 incomplete download(s)" in result.output
             assert not incomplete.exists()
 
+    def test_prune_deletes_partial_folders(self, runner: CliRunner) -> None:
+        with SoftTemporaryDirectory() as tmp_dir:
+            cache_dir = Path(tmp_dir)
+            repo_dir = cache_dir / "models--user--model"
+            (repo_dir / "snapshots").mkdir(parents=True)
+            (repo_dir / "refs").mkdir()
+            partial = repo_dir / "blobs" / ("a" * 64 + ".partial")
+            partial.mkdir(parents=True)
+            (partial / "0-16").write_bytes(b"partial download")
+
+            result = runner.invoke(app, ["cache", "prune", "--cache-dir", str(cache_dir), "--yes"])
+
+            assert result.exit_code == 0
+            assert "1 incomplete download(s)" in result.output
+            assert not partial.exists()
+
     def test_ls_hints_incomplete_files(self, runner: CliRunner) -> None:
         with SoftTemporaryDirectory() as tmp_dir:
             cache_dir = Path(tmp_dir)
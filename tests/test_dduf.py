@@ -236,3 +236,91 @@ class TestReadDDUFFile:
             archive.writestr("model.safetensors", b"this is safetensors content")
         with pytest.raises(DDUFCorruptedFileError, match="Missing required 'model_index.json' entry"):
             read_dduf_file(tmp_path / "dummy.dduf")
+
+
+class TestStreamingExport:
+    @pytest.fixture
+    def pipeline_folder(self, tmp_path: Path) -> Path:
+        folder = tmp_path / "pipeline"
+        (folder / "vae").mkdir(parents=True)
+        (folder / "model_index.json").write_text(json.dumps({"vae": ["diffusers", "AutoencoderKL"]}))
+        (folder / "vae" / "config.json").write_text("{}")
+        (folder / "vae" / "model.safetensors").write_bytes(bytes(range(256)) * 10)
+        (folder / "vae" / "empty.txt").touch()
+        return folder
+
+    def test_export_by_chunks(self, tmp_path: Path, pipeline_folder: Path, mocker: MockerFixture):
+        mocker.patch("huggingface_hub.serialization._dduf._EXPORT_CHUNK_SIZE", 100)
+        export_folder_as_dduf(tmp_path / "pipeline.dduf", pipeline_folder)
+
+        entries = read_dduf_file(tmp_path / "pipeline.dduf")
+        assert entries["vae/model.safetensors"].read_bytes() == bytes(range(256)) * 10
+        assert entries["vae/empty.txt"].read_bytes() == b""
+        with zipfile.ZipFile(tmp_path / "pipeline.dduf") as archive:
+            assert archive.testzip() is None  # CRCs are valid
+
+    def test_model_index_read_once(self, tmp_path: Path, pipeline_folder: Path, mocker: MockerFixture):
+        spy = mocker.spy(Path, "open")
+        export_entries_as_dduf(
+            tmp_path / "pipeline.dduf",
+            [
+                ("model_index.json", pipeline_folder / "model_index.json"),
+                ("vae/config.json", pipeline_folder / "vae" / "config.json"),
+            ],
+        )
+        assert [call.args[0].name for call in spy.call_args_list].count("model_index.json") == 1
+        assert (
+            read_dduf_file(tmp_path / "pipeline.dduf")["model_index.json"].read_text()
+            == (pipeline_folder / "model_index.json").read_text()
+        )
+
+    def test_fail_early_on_undeclared_folder(self, tmp_path: Path):
+        def _entries():
+            yield "model_index.json", b'{"vae": ["diffusers", "AutoencoderKL"]}'
+            yield "vae/config.json", b"{}"
+            yield "text_encoder/config.json", b"{}"
+            raise AssertionError("Should not consume entries after an invalid one")
+
+        with pytest.raises(DDUFExportError, match="Invalid DDUF file structure") as e:
+            export_entries_as_dduf(tmp_path / "pipeline.dduf", _entries())
+        assert "text_encoder" in str(e.value.__cause__)
+        assert not (tmp_path / "pipeline.dduf").exists()  # partial archive is removed
+
+
+class TestReadRemoteDDUFFile:
+    COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+    @pytest.fixture
+    def fake_fs(self, tmp_path: Path, mocker: MockerFixture):
+        from huggingface_hub.hf_file_system import HfFileSystemResolvedRepositoryPath
+
+        with zipfile.ZipFile(tmp_path / "pipeline.dduf", "w") as archive:
+            archive.writestr("model_index.json", b'{"vae": ["diffusers", "AutoencoderKL"]}')
+            archive.writestr("vae/config.json", b"{}")
+            archive.writestr("vae/model.safetensors", b"vae weights")
+
+        fs = mocker.Mock()
+        fs.resolve_path.return_value = HfFileSystemResolvedRepositoryPath(
+            "model", "username/my_model", "main", "pipeline.dduf"
+        )
+        fs._api.resolve_revision.return_value.resolved = self.COMMIT
+        fs.open.side_effect = lambda path, mode, **kwargs: (tmp_path / "pipeline.dduf").open(mode)
+        mocker.patch("huggingface_hub.hf_file_system.HfFileSystem", return_value=fs)
+        return fs
+
+    def test_read_remote_dduf_file(self, fake_fs):
+        entries = read_dduf_file("hf://username/my_model/pipeline.dduf")
+        assert set(entries) == {"model_index.json", "vae/config.json", "vae/model.safetensors"}
+
+        # Revision is pinned to a commit
+        entry = entries["vae/model.safetensors"]
+        assert entry.is_remote
+        assert entry.dduf_path == f"hf://username/my_model@{self.COMMIT}/pipeline.dduf"
+
+        # Only the requested entry is read, with a single range request
+        fake_fs.open.reset_mock()
+        assert entry.read_bytes() == b"vae weights"
+        with entry.as_mmap() as data:
+            assert data == b"vae weights"
+        assert fake_fs.open.call_count == 2
+        assert all(call.kwargs["cache_type"] == "none" for call in fake_fs.open.call_args_list)
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 import datetime
 import io
@@ -11,17 +12,21 @@ from typing import Iterable, Optional, Type
 from unittest.mock import Mock, patch
 
 import fsspec
+import httpx
 import pytest
 
 from huggingface_hub import HfApi, constants, hf_file_system
 from huggingface_hub.errors import BucketNotFoundError, RepositoryNotFoundError, RevisionNotFoundError
+from huggingface_hub.hf_api import RepoFile, RepoFolder
 from huggingface_hub.hf_file_system import (
+    AsyncHfFileSystem,
     HfFileSystem,
     HfFileSystemFile,
     HfFileSystemResolvedBucketPath,
     HfFileSystemResolvedRepositoryPath,
     HfFileSystemStreamFile,
 )
+from huggingface_hub.utils import get_shared_async_session
 
 from .testing_constants import ENDPOINT_STAGING, TOKEN
 from .testing_utils import OfflineSimulationMode, offline, repo_name
@@ -907,3 +912,300 @@ def test_hf_file_system_file_can_handle_gzipped_file():
     with fs.open("datasets/allenai/math_qa/math_qa.py", "r", encoding="utf-8") as f:
         out = f.read()
     assert "class MathQa" in out
+
+
+class TestAsyncHfFileSystem:
+    CONTENT = b"0123456789" * 10
+
+    @pytest.fixture
+    def async_fs(self):
+        requested_ranges = []
+        api_requests = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.startswith("/api/"):
+                api_requests.append((request.method, request.url.path))
+                if request.url.path in ("/api/models/username/my_model", "/api/models/username/my_model/revision/dev"):
+                    return httpx.Response(200, json={})
+                if request.url.path == "/api/models/username/my_model/tree/main/sub":
+                    if request.url.params.get("cursor") is None:
+                        next_page = "https://hub.test/api/models/username/my_model/tree/main/sub?cursor=1"
+                        return httpx.Response(
+                            200,
+                            json=[{"type": "directory", "path": "sub/dir", "oid": "tree"}],
+                            headers={"Link": f'<{next_page}>; rel="next"'},
+                        )
+                    return httpx.Response(200, json=[{"type": "file", "path": "sub/a.txt", "size": 1, "oid": "blob"}])
+                if request.url.path == "/api/models/username/my_model/paths-info/main":
+                    return httpx.Response(200, json=[{"type": "file", "path": "data.bin", "size": 42, "oid": "blob"}])
+                if "/tree/" in request.url.path:
+                    return httpx.Response(404, headers={"X-Error-Code": "EntryNotFound"})
+                return httpx.Response(404, headers={"X-Error-Code": "RepoNotFound"})
+
+            assert request.url.path == "/username/my_model/resolve/main/data.bin"
+            range_header = request.headers.get("range")
+            requested_ranges.append(range_header)
+            if range_header is None:
+                return httpx.Response(200, content=self.CONTENT)
+            start, end = range_header.removeprefix("bytes=").split("-")
+            end = int(end) + 1 if end else len(self.CONTENT)
+            if int(start) >= len(self.CONTENT):
+                return httpx.Response(416)
+            return httpx.Response(206, content=self.CONTENT[int(start) : end])
+
+        fs = AsyncHfFileSystem(endpoint="https://hub.test", skip_instance_cache=True)
+        fs._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        fs._fs.dircache["username/my_model"] = [
+            {"name": "username/my_model/data.bin", "size": len(self.CONTENT), "type": "file"}
+        ]
+        with mock_repo_info(fs._fs):
+            yield fs, requested_ranges, api_requests
+
+    def test_resolve_path_shared_with_sync_fs(self, async_fs):
+        fs, _, _ = async_fs
+        resolved = fs.resolve_path("hf://username/my_model@dev/data.bin")
+        assert resolved == fs._fs.resolve_path("hf://username/my_model@dev/data.bin")
+
+    def test_cat_file(self, async_fs):
+        fs, requested_ranges, _ = async_fs
+        assert fs.cat_file("username/my_model/data.bin") == self.CONTENT
+        assert fs.cat_file("username/my_model/data.bin", start=10, end=20) == self.CONTENT[10:20]
+        assert fs.cat_file("username/my_model/data.bin", start=-5) == self.CONTENT[-5:]
+        assert fs.cat_file("username/my_model/data.bin", start=200) == b""
+        assert requested_ranges == [None, "bytes=10-19", "bytes=95-", "bytes=200-"]
+
+    def test_cat_ranges_merges_close_ranges(self, async_fs):
+        fs, requested_ranges, _ = async_fs
+        out = fs.cat_ranges(["username/my_model/data.bin"] * 3, starts=[0, 12, 50], ends=[10, 20, 60], max_gap=5)
+        assert out == [self.CONTENT[0:10], self.CONTENT[12:20], self.CONTENT[50:60]]
+        assert sorted(requested_ranges) == ["bytes=0-19", "bytes=50-59"]
+
+    def test_path_resolution_is_cached(self, async_fs):
+        fs, _, api_requests = async_fs
+        for _ in range(3):
+            fs.cat_file("username/my_model/data.bin", start=-5)
+        # Existence of the repo is checked once, size is read from the dircache
+        assert api_requests == [("GET", "/api/models/username/my_model")]
+
+        with pytest.raises(FileNotFoundError):
+            fs.cat_file("username/unknown/data.bin")
+        with pytest.raises(FileNotFoundError):
+            fs.cat_file("username/unknown/data.bin")
+        assert api_requests[1:] == [("GET", "/api/models/username/unknown")]
+
+    def test_ls_and_info_use_async_requests(self, async_fs):
+        fs, requested_ranges, api_requests = async_fs
+        with patch.object(fs._fs, "ls", side_effect=AssertionError("must not be called")):
+            assert fs.ls("username/my_model", detail=False) == ["username/my_model/data.bin"]
+            assert fs.ls("username/my_model/sub", detail=False) == [
+                "username/my_model/sub/dir",
+                "username/my_model/sub/a.txt",
+            ]
+            assert fs.info("username/my_model/sub/a.txt") == {
+                "name": "username/my_model/sub/a.txt",
+                "size": 1,
+                "type": "file",
+                "blob_id": "blob",
+                "lfs": None,
+                "xet_hash": None,
+                "last_commit": None,
+                "security": None,
+            }
+            assert fs.ls("username/my_model/sub/a.txt", detail=False) == ["username/my_model/sub/a.txt"]
+            # Listing is paginated and cached
+            assert [path for _, path in api_requests].count("/api/models/username/my_model/tree/main/sub") == 2
+
+            assert fs.info("username/my_model/data.bin", refresh=True) == {
+                "name": "username/my_model/data.bin",
+                "size": 42,
+                "type": "file",
+            }
+            assert api_requests[-1] == ("POST", "/api/models/username/my_model/paths-info/main")
+            with pytest.raises(FileNotFoundError):
+                fs.info("username/my_model/missing.txt")
+        assert requested_ranges == []
+
+    def test_ls_bucket(self):
+        def _handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/buckets/username/my_bucket":
+                return httpx.Response(200, json={})
+            assert request.url.path == "/api/buckets/username/my_bucket/tree/logs"
+            assert request.url.params["recursive"] == "false"
+            return httpx.Response(
+                200,
+                json=[
+                    {"type": "file", "path": "logs/a.txt", "size": 1, "xetHash": "hash"},
+                    # Lexical match of the prefix: not in the "logs" folder
+                    {"type": "file", "path": "logs_old.txt", "size": 1, "xetHash": "hash"},
+                ],
+            )
+
+        fs = AsyncHfFileSystem(endpoint="https://hub.test", skip_instance_cache=True)
+        fs._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        assert fs.ls("buckets/username/my_bucket/logs", detail=False) == ["buckets/username/my_bucket/logs/a.txt"]
+        assert fs.info("buckets/username/my_bucket/logs/a.txt")["size"] == 1
+
+    def test_concurrent_listings_are_not_serialized(self):
+        in_flight = []
+        both_in_flight = asyncio.Event()
+
+        async def _handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.startswith("/api/models/username/my_model/tree/"):
+                # Both listings must be in flight at the same time to complete
+                in_flight.append(request.url.path)
+                if len(in_flight) == 2:
+                    both_in_flight.set()
+                await asyncio.wait_for(both_in_flight.wait(), timeout=5)
+                return httpx.Response(200, json=[])
+            return httpx.Response(200, json={})
+
+        fs = AsyncHfFileSystem(endpoint="https://hub.test", skip_instance_cache=True)
+        fs._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+        async def _ls_twice():
+            return await asyncio.gather(fs._ls("username/my_model/a"), fs._ls("username/my_model/b"))
+
+        assert fsspec.asyn.sync(fs.loop, _ls_twice) == [[], []]
+        assert sorted(in_flight) == [
+            "/api/models/username/my_model/tree/main/a",
+            "/api/models/username/my_model/tree/main/b",
+        ]
+
+    def test_set_session_uses_shared_client(self):
+        fs = AsyncHfFileSystem(skip_instance_cache=True)
+
+        async def _sessions():
+            return await fs.set_session(), await fs.set_session(), get_shared_async_session()
+
+        first, second, shared = fsspec.asyn.sync(fs.loop, _sessions)
+        assert first is second is shared
+
+    def test_get_file(self, async_fs, tmp_path: Path):
+        fs, _, _ = async_fs
+        fs.get_file("username/my_model/data.bin", str(tmp_path / "data.bin"))
+        assert (tmp_path / "data.bin").read_bytes() == self.CONTENT
+
+    def test_get(self, async_fs, tmp_path: Path):
+        # Regression test: `AsyncFileSystem._get` must not be shadowed by an internal helper
+        fs, _, _ = async_fs
+        fs.get("username/my_model/data.bin", str(tmp_path / "data.bin"))
+        assert (tmp_path / "data.bin").read_bytes() == self.CONTENT
+
+
+def test_find_detail_expands_info_in_batches():
+    fs = HfFileSystem(skip_instance_cache=True)
+    tree = [RepoFolder(path="data", oid="tree")] + [
+        RepoFile(path=f"data/{i:04d}.txt", size=1, oid=f"blob{i}") for i in range(1200)
+    ]
+    last_commit = {"id": "commit", "title": "Upload", "date": "2026-01-01T00:00:00.000Z"}
+
+    def _get_paths_info(repo_id, paths, *, expand, **kwargs):
+        assert expand
+        return [
+            RepoFolder(path=path, oid="tree", lastCommit=last_commit)
+            if path == "data"
+            else RepoFile(path=path, size=1, oid="blob", lastCommit=last_commit)
+            for path in paths
+        ]
+
+    with (
+        mock_repo_info(fs),
+        patch.object(fs._api, "list_repo_tree", return_value=tree) as mock_list_repo_tree,
+        patch.object(fs._api, "get_paths_info", side_effect=_get_paths_info) as mock_get_paths_info,
+    ):
+        out = fs.find("username/my_model", detail=True, expand_info=True)
+        assert len(out) == 1200
+        assert all(info["last_commit"].oid == "commit" for info in out.values())
+
+        # 1 non-expanded listing + 3 batched expansions (500 + 500 + 201 paths)
+        mock_list_repo_tree.assert_called_once()
+        assert mock_list_repo_tree.call_args.kwargs.get("expand", False) is False
+        assert sorted(len(call.args[1]) for call in mock_get_paths_info.call_args_list) == [201, 500, 500]
+
+        # Expanded info went straight into the dircache => no more calls
+        assert fs.info("username/my_model/data/0042.txt", expand_info=True)["last_commit"].oid == "commit"
+        assert fs.find("username/my_model", detail=True, expand_info=True) == out
+        assert mock_list_repo_tree.call_count == 1
+        assert mock_get_paths_info.call_count == 3
+
+
+def test_info_expands_siblings_at_once():
+    fs = HfFileSystem(skip_instance_cache=True)
+    tree = [RepoFile(path=f"{i}.txt", size=1, oid=f"blob{i}") for i in range(10)]
+    last_commit = {"id": "commit", "title": "Upload", "date": "2026-01-01T00:00:00.000Z"}
+
+    with (
+        mock_repo_info(fs),
+        patch.object(fs._api, "list_repo_tree", return_value=tree),
+        patch.object(
+            fs._api,
+            "get_paths_info",
+            side_effect=lambda repo_id, paths, **kwargs: [
+                RepoFile(path=path, size=1, oid="blob", lastCommit=last_commit) for path in paths
+            ],
+        ) as mock_get_paths_info,
+    ):
+        fs.ls("username/my_model")
+        for i in range(10):
+            assert fs.info(f"username/my_model/{i}.txt", expand_info=True)["last_commit"].oid == "commit"
+        mock_get_paths_info.assert_called_once()
+
+
+class TestHfFileSystemFileXetRangeReads:
+    XET_HASH = "a" * 64
+    CONTENT = bytes(range(256)) * 4
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.fs = HfFileSystem(skip_instance_cache=True, token="hf_token")
+        self.info = {
+            "name": "username/my_model/model.bin",
+            "size": len(self.CONTENT),
+            "type": "file",
+            "xet_hash": self.XET_HASH,
+        }
+        self.session = Mock()
+        group = self.session.new_download_stream_group.return_value
+        group.download_stream.side_effect = lambda file_info, start, end: iter(
+            [self.CONTENT[start : (start + end) // 2], self.CONTENT[(start + end) // 2 : end]]
+        )
+        with (
+            mock_repo_info(self.fs),
+            patch.object(self.fs, "info", return_value=self.info),
+            patch.object(hf_file_system, "is_xet_available", return_value=True),
+            patch.object(hf_file_system, "get_xet_session", return_value=self.session),
+            patch.object(hf_file_system, "_XET_STREAM_GROUPS", {}),
+            patch.object(hf_file_system, "http_backoff") as self.mock_http_backoff,
+        ):
+            yield
+
+    def test_fetch_range_uses_xet(self):
+        with self.fs.open("username/my_model/model.bin", block_size=100) as f:
+            assert f._fetch_range(300, 400) == self.CONTENT[300:400]
+        self.mock_http_backoff.assert_not_called()
+
+        # Only the requested range is streamed
+        group = self.session.new_download_stream_group.return_value
+        assert group.download_stream.call_args.args[0].hash == self.XET_HASH
+        assert group.download_stream.call_args.kwargs == {"start": 300, "end": 400}
+
+        kwargs = self.session.new_download_stream_group.call_args.kwargs
+        assert kwargs["token_refresh_url"] == f"{constants.ENDPOINT}/api/models/username/my_model/xet-read-token/main"
+        assert kwargs["token_refresh_headers"]["authorization"] == "Bearer hf_token"
+        assert "authorization" not in kwargs["custom_headers"]
+
+    def test_stream_group_shared_across_handles(self):
+        for _ in range(3):
+            with self.fs.open("username/my_model/model.bin", block_size=100) as f:
+                f.read(10)
+        self.session.new_download_stream_group.assert_called_once()
+
+    def test_fetch_range_falls_back_to_http(self):
+        self.session.new_download_stream_group.side_effect = RuntimeError("CAS unavailable")
+        self.mock_http_backoff.return_value = httpx.Response(
+            206, content=self.CONTENT[:100], request=httpx.Request("GET", "https://huggingface.co")
+        )
+        with self.fs.open("username/my_model/model.bin", block_size=100) as f:
+            assert f._fetch_range(0, 100) == self.CONTENT[:100]
+        self.mock_http_backoff.assert_called_once()
+        assert self.mock_http_backoff.call_args.kwargs["headers"]["range"] == "bytes=0-99"
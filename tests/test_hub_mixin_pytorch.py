@@ -9,9 +9,10 @@ from unittest.mock import Mock
 import pytest
 from pytest_mock import MockerFixture
 
-from huggingface_hub import HfApi, ModelCard, constants, hf_hub_download
+from huggingface_hub import HfApi, ModelCard, constants, hf_hub_download, save_torch_state_dict
+from huggingface_hub._revision import ResolvedRevision
 from huggingface_hub.errors import RemoteEntryNotFoundError
-from huggingface_hub.hub_mixin import ModelHubMixin, PyTorchModelHubMixin
+from huggingface_hub.hub_mixin import _PRETRAINED_CONFIG_MEMO, ModelHubMixin, PyTorchModelHubMixin
 from huggingface_hub.serialization._torch import storage_ptr
 from huggingface_hub.utils import SoftTemporaryDirectory, is_torch_available
 
@@ -21,6 +22,8 @@ from .testing_utils import repo_name
 
 DUMMY_OBJECT = object()
 
+COMMIT_HASH = "0123456789abcdef0123456789abcdef01234567"
+
 DUMMY_MODEL_CARD_TEMPLATE = """
 ---
 {{ card_data }}
@@ -183,20 +186,28 @@ class TestPytorchHubMixin:
         from_pretrained_mock.assert_called_once()
         assert model is from_pretrained_mock.return_value
 
+    @pytest.fixture
+    def resolved_revision(self, mocker: MockerFixture) -> ResolvedRevision:
+        revision = ResolvedRevision(resolved=COMMIT_HASH, initial=None)
+        mocker.patch.object(HfApi, "resolve_revision", return_value=revision)
+        return revision
+
     def pretend_file_download(self, tmp_dir: Path, **kwargs):
         if kwargs.get("filename") == "config.json":
             raise RemoteEntryNotFoundError("no config", response=Mock())
         DummyModel().save_pretrained(tmp_dir)
         return tmp_dir / "model.safetensors"
 
-    def test_from_pretrained_model_from_hub_prefer_safetensor(self, mocker: MockerFixture, tmp_path) -> None:
+    def test_from_pretrained_model_from_hub_prefer_safetensor(
+        self, mocker: MockerFixture, tmp_path, resolved_revision
+    ) -> None:
         hf_hub_download_mock = mocker.patch("huggingface_hub.hub_mixin.hf_hub_download")
         hf_hub_download_mock.side_effect = lambda **kwargs: self.pretend_file_download(tmp_path, **kwargs)
         model = DummyModel.from_pretrained("namespace/repo_name")
         hf_hub_download_mock.assert_any_call(
             repo_id="namespace/repo_name",
             filename="model.safetensors",
-            revision=None,
+            revision=resolved_revision,
             cache_dir=None,
             force_download=False,
             token=None,
@@ -206,7 +217,7 @@ class TestPytorchHubMixin:
 
     def pretend_file_download_fallback(self, tmp_dir: Path, **kwargs):
         filename = kwargs.get("filename")
-        if filename == "model.safetensors" or filename == "config.json":
+        if filename in ("model.safetensors", "model.safetensors.index.json", "config.json"):
             raise RemoteEntryNotFoundError("not found", response=Mock())
 
         class TestMixin(ModelHubMixin):
@@ -216,14 +227,16 @@ class TestPytorchHubMixin:
         TestMixin().save_pretrained(tmp_dir)
         return tmp_dir / constants.PYTORCH_WEIGHTS_NAME
 
-    def test_from_pretrained_model_from_hub_fallback_pickle(self, mocker: MockerFixture, tmp_path) -> None:
+    def test_from_pretrained_model_from_hub_fallback_pickle(
+        self, mocker: MockerFixture, tmp_path, resolved_revision
+    ) -> None:
         hf_hub_download_mock = mocker.patch("huggingface_hub.hub_mixin.hf_hub_download")
         hf_hub_download_mock.side_effect = lambda **kwargs: self.pretend_file_download_fallback(tmp_path, **kwargs)
         model = DummyModel.from_pretrained("namespace/repo_name")
         hf_hub_download_mock.assert_any_call(
             repo_id="namespace/repo_name",
             filename="model.safetensors",
-            revision=None,
+            revision=resolved_revision,
             cache_dir=None,
             force_download=False,
             token=None,
@@ -232,7 +245,7 @@ class TestPytorchHubMixin:
         hf_hub_download_mock.assert_any_call(
             repo_id="namespace/repo_name",
             filename="pytorch_model.bin",
-            revision=None,
+            revision=resolved_revision,
             cache_dir=None,
             force_download=False,
             token=None,
@@ -240,6 +253,90 @@ class TestPytorchHubMixin:
         )
         assert model is not None
 
+    def test_from_pretrained_model_from_hub_sharded(self, mocker: MockerFixture, tmp_path, resolved_revision) -> None:
+        state_dict = DummyModel().state_dict()
+        save_torch_state_dict(state_dict, tmp_path, max_shard_size=8)  # 1 shard per tensor
+
+        def _download(filename: str, **kwargs) -> str:
+            if filename in ("config.json", "model.safetensors"):
+                raise RemoteEntryNotFoundError("not found", response=Mock())
+            return str(tmp_path / filename)
+
+        hf_hub_download_mock = mocker.patch("huggingface_hub.hub_mixin.hf_hub_download", side_effect=_download)
+        model = DummyModel.from_pretrained("namespace/repo_name")
+
+        downloaded = [call.kwargs["filename"] for call in hf_hub_download_mock.call_args_list]
+        assert downloaded.count("model-00001-of-00002.safetensors") == 2  # prefetched, then served from cache
+        assert downloaded.count("model-00002-of-00002.safetensors") == 2
+        assert all(call.kwargs["revision"] is resolved_revision for call in hf_hub_download_mock.call_args_list)
+        assert torch.equal(model.l1.weight, state_dict["l1.weight"])
+        assert torch.equal(model.l1.bias, state_dict["l1.bias"])
+
+    def test_from_pretrained_custom_from_pretrained_does_not_prefetch(
+        self, mocker: MockerFixture, tmp_path, resolved_revision
+    ) -> None:
+        class CustomWeightsModel(DummyModel):
+            @classmethod
+            def _from_pretrained(cls, *, model_id: str, revision, cache_dir, force_download, local_files_only, token):
+                model = cls()
+                weights_file = hf_hub_download(repo_id=model_id, filename="weights.pt", revision=revision)
+                model.load_state_dict(torch.load(weights_file, weights_only=True))
+                return model
+
+        state_dict = DummyModel().state_dict()
+        torch.save(state_dict, tmp_path / "weights.pt")
+
+        def _download(filename: str, **kwargs) -> str:
+            if filename != "weights.pt":
+                raise RemoteEntryNotFoundError(f"{filename} missing", response=Mock())
+            return str(tmp_path / filename)
+
+        mocker.patch("huggingface_hub.hub_mixin.hf_hub_download", side_effect=_download)
+        custom_download_mock = mocker.patch(f"{__name__}.hf_hub_download", side_effect=_download)
+        model = CustomWeightsModel.from_pretrained("namespace/repo_name")
+
+        custom_download_mock.assert_called_once()
+        assert torch.equal(model.l1.weight, state_dict["l1.weight"])
+
+    def test_from_pretrained_prefetch_failure_is_ignored(self, mocker: MockerFixture, tmp_path, resolved_revision):
+        DummyModel().save_pretrained(tmp_path)
+        nb_weights_calls = 0
+
+        def _download(filename: str, **kwargs) -> str:
+            nonlocal nb_weights_calls
+            if filename == "config.json":
+                raise RemoteEntryNotFoundError("no config", response=Mock())
+            nb_weights_calls += 1
+            if nb_weights_calls == 1:
+                raise OSError("connection reset")  # prefetch fails, `_from_pretrained` downloads again
+            return str(tmp_path / filename)
+
+        mocker.patch("huggingface_hub.hub_mixin.hf_hub_download", side_effect=_download)
+        model = DummyModel.from_pretrained("namespace/repo_name")
+
+        assert nb_weights_calls == 2
+        assert model is not None
+
+    def test_from_pretrained_config_memo(self, mocker: MockerFixture, tmp_path, resolved_revision) -> None:
+        _PRETRAINED_CONFIG_MEMO.clear()
+        DummyModelNoConfig(num_classes=50).save_pretrained(tmp_path)
+        hf_hub_download_mock = mocker.patch(
+            "huggingface_hub.hub_mixin.hf_hub_download",
+            side_effect=lambda filename, **kwargs: str(tmp_path / filename),
+        )
+
+        for _ in range(2):
+            model = DummyModelNoConfig.from_pretrained("namespace/repo_name", cache_dir=tmp_path)
+            assert model.num_classes == 50
+        downloaded = [call.kwargs["filename"] for call in hf_hub_download_mock.call_args_list]
+        assert downloaded.count("config.json") == 1  # parsed config is reused for the same commit
+
+        # Weights are downloaded once even if `force_download=True`
+        hf_hub_download_mock.reset_mock()
+        DummyModelNoConfig.from_pretrained("namespace/repo_name", cache_dir=tmp_path, force_download=True)
+        assert [call.kwargs["force_download"] for call in hf_hub_download_mock.call_args_list].count(True) == 2
+        _PRETRAINED_CONFIG_MEMO.clear()
+
     def test_from_pretrained_model_id_and_revision(self, mocker: MockerFixture) -> None:
         """Regression test for #1313.
         See https://github.com/huggingface/huggingface_hub/issues/1313."""
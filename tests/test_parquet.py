@@ -0,0 +1,139 @@
+import io
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from huggingface_hub import HfFileSystem
+from huggingface_hub._parquet import HfParquetReader, _merge_ranges, _PrefetchedFile
+from huggingface_hub.utils import is_pyarrow_available
+
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+def _make_parquet_file() -> bytes:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({"id": list(range(1000)), "text": [f"row {i}" for i in range(1000)]})
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=100)
+    return buffer.getvalue()
+
+
+class _FakeHub:
+    """Serve range requests on a single file and record them."""
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.ranges: list[str] = []
+
+    def http_backoff(self, method: str, url: str, *, headers: dict, **kwargs) -> httpx.Response:
+        assert f"/datasets/username/my_dataset/resolve/{COMMIT}/data.parquet" in url
+        range_header = headers["range"]
+        self.ranges.append(range_header)
+        start, end = range_header.removeprefix("bytes=").split("-")
+        size = len(self.content)
+        if start == "":
+            start, end = max(0, size - int(end)), size - 1
+        start, end = int(start), min(int(end), size - 1)
+        return httpx.Response(
+            206,
+            content=self.content[start : end + 1],
+            headers={"content-range": f"bytes {start}-{end}/{size}"},
+            request=httpx.Request(method, url),
+        )
+
+
+@pytest.fixture
+def fs() -> HfFileSystem:
+    fs = HfFileSystem(skip_instance_cache=True)
+    fs._api.repo_info = Mock(return_value=Mock(sha=COMMIT))
+    return fs
+
+
+def test_merge_ranges():
+    assert _merge_ranges([(50, 60), (0, 10), (12, 20)], max_gap=5, max_block=100) == [(0, 20), (50, 60)]
+    assert _merge_ranges([(0, 10), (12, 20)], max_gap=5, max_block=15) == [(0, 10), (12, 20)]
+    assert _merge_ranges([(0, 10), (5, 8)], max_gap=0, max_block=100) == [(0, 10)]
+
+
+def test_prefetched_file_falls_back_to_fetch():
+    fetch = Mock(return_value=b"xyz")
+    f = _PrefetchedFile(size=10, parts={(0, 4): b"abcd"}, fetch=fetch)
+    assert f.read(2) == b"ab"
+    assert f.read(2) == b"cd"
+    fetch.assert_not_called()
+    assert f.read(3) == b"xyz"
+    fetch.assert_called_once_with(4, 7)
+    assert f.seek(-1, io.SEEK_END) == 9
+
+
+def test_pin_resolves_revision_once(fs: HfFileSystem):
+    reader = HfParquetReader(fs)
+    assert (
+        reader.pin("datasets/username/my_dataset/data.parquet")
+        == f"datasets/username/my_dataset@{COMMIT}/data.parquet"
+    )
+    assert (
+        reader.pin("datasets/username/my_dataset/other.parquet")
+        == f"datasets/username/my_dataset@{COMMIT}/other.parquet"
+    )
+    assert sum(call.kwargs["revision"] == "main" for call in fs._api.repo_info.call_args_list) == 1
+
+
+def test_read_footer_single_request_and_cached(fs: HfFileSystem):
+    hub = _FakeHub(b"\x00" * 1000 + b"metadata" + (8).to_bytes(4, "little") + b"PAR1")
+    reader = HfParquetReader(fs, footer_sample_size=100)
+    with patch("huggingface_hub._parquet.http_backoff", hub.http_backoff):
+        footer = reader.read_footer("datasets/username/my_dataset/data.parquet")
+        assert reader.read_footer("datasets/username/my_dataset/data.parquet") is footer
+    assert hub.ranges == ["bytes=-100"]
+    assert footer.size == 1016
+    assert footer.offset == 916
+    assert footer.metadata_length == 8
+
+
+def test_read_footer_larger_than_sample(fs: HfFileSystem):
+    hub = _FakeHub(b"\x00" * 1000 + b"m" * 200 + (200).to_bytes(4, "little") + b"PAR1")
+    reader = HfParquetReader(fs, footer_sample_size=100)
+    with patch("huggingface_hub._parquet.http_backoff", hub.http_backoff):
+        footer = reader.read_footer("datasets/username/my_dataset/data.parquet")
+    assert hub.ranges == ["bytes=-100", "bytes=1000-1107"]
+    assert footer.offset == 1000
+    assert footer.data == hub.content[1000:]
+
+
+def test_read_footer_not_parquet(fs: HfFileSystem):
+    hub = _FakeHub(b"not a parquet file")
+    reader = HfParquetReader(fs)
+    with patch("huggingface_hub._parquet.http_backoff", hub.http_backoff):
+        with pytest.raises(ValueError, match="is not a parquet file"):
+            reader.read_footer("datasets/username/my_dataset/data.parquet")
+
+
+def test_metadata_requires_pyarrow(fs: HfFileSystem):
+    hub = _FakeHub(b"\x00" * 1000 + b"metadata" + (8).to_bytes(4, "little") + b"PAR1")
+    reader = HfParquetReader(fs)
+    with (
+        patch("huggingface_hub._parquet.http_backoff", hub.http_backoff),
+        patch("huggingface_hub._parquet.is_pyarrow_available", return_value=False),
+    ):
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            reader.metadata("datasets/username/my_dataset/data.parquet")
+
+
+@pytest.mark.skipif(not is_pyarrow_available(), reason="Test requires pyarrow")
+def test_read_table_with_filters(fs: HfFileSystem):
+    hub = _FakeHub(_make_parquet_file())
+    reader = HfParquetReader(fs)
+    with patch("huggingface_hub._parquet.http_backoff", hub.http_backoff):
+        assert reader.select_row_groups("datasets/username/my_dataset/data.parquet", [("id", ">=", 950)]) == [9]
+        table = reader.read_table(
+            "datasets/username/my_dataset/data.parquet", columns=["text"], filters=[("id", ">=", 950)]
+        )
+    assert table.column_names == ["text"]
+    assert table.column("text").to_pylist() == [f"row {i}" for i in range(950, 1000)]
+    # 1 request for the footer + 1 coalesced request for the 2 column chunks of the selected row group
+    assert len(hub.ranges) == 2
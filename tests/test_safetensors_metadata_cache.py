@@ -0,0 +1,147 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from huggingface_hub import HfApi
+from huggingface_hub._revision import ResolvedRevision
+from huggingface_hub._safetensors_metadata_cache import (
+    _IN_MEMORY_CACHE,
+    read_safetensors_metadata_cache,
+    write_safetensors_metadata_cache,
+)
+from huggingface_hub.errors import NotASafetensorsRepoError
+from huggingface_hub.utils import SafetensorsFileMetadata, SafetensorsRepoMetadata, TensorInfo
+
+
+COMMIT_HASH = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture(autouse=True)
+def clear_in_memory_cache():
+    _IN_MEMORY_CACHE.clear()
+    yield
+    _IN_MEMORY_CACHE.clear()
+
+
+def _metadata() -> SafetensorsRepoMetadata:
+    return SafetensorsRepoMetadata(
+        metadata={"total_size": 24},
+        sharded=True,
+        weight_map={"a": "model-00001-of-00002.safetensors", "b": "model-00002-of-00002.safetensors"},
+        files_metadata={
+            "model-00001-of-00002.safetensors": SafetensorsFileMetadata(
+                metadata={"format": "pt"},
+                tensors={"a": TensorInfo(dtype="F32", shape=[2, 2], data_offsets=(0, 16))},
+            ),
+            "model-00002-of-00002.safetensors": SafetensorsFileMetadata(
+                metadata={},
+                tensors={"b": TensorInfo(dtype="BF16", shape=[4], data_offsets=(0, 8))},
+            ),
+        },
+    )
+
+
+def test_write_and_read_roundtrip(tmp_path):
+    write_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH, _metadata())
+    path = tmp_path / "safetensors" / f"{COMMIT_HASH}.json"
+    assert json.loads(path.read_text())["format_version"] == 1
+
+    _IN_MEMORY_CACHE.clear()  # force a read from disk
+    cached = read_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH)
+    assert cached == _metadata()
+    assert cached.parameter_count == {"F32": 4, "BF16": 4}
+
+
+def test_read_missing_unknown_version_or_corrupted(tmp_path, caplog):
+    assert read_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH) is None
+
+    path = tmp_path / "safetensors" / f"{COMMIT_HASH}.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps({"format_version": 999}))
+    assert read_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH) is None
+
+    path.write_text("not json")
+    assert read_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH) is None
+    assert "Ignoring corrupted safetensors metadata cache file" in caplog.text
+
+
+def test_in_memory_cache_is_bounded(tmp_path):
+    with patch("huggingface_hub._safetensors_metadata_cache._IN_MEMORY_CACHE_MAX_SIZE", 2):
+        for commit in ("a" * 40, "b" * 40, "c" * 40):
+            write_safetensors_metadata_cache(str(tmp_path), commit, _metadata())
+        read_safetensors_metadata_cache(str(tmp_path), "b" * 40)  # "b" is now the most recently used
+        write_safetensors_metadata_cache(str(tmp_path), "d" * 40, _metadata())
+
+    assert [path.rsplit("/", 1)[1][0] for path in _IN_MEMORY_CACHE] == ["b", "d"]
+
+
+def test_cached_entry_is_not_modified_by_callers(tmp_path):
+    metadata = _metadata()
+    write_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH, metadata)
+    metadata.weight_map["c"] = "other.safetensors"
+
+    cached = read_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH)
+    assert cached == _metadata()
+    cached.files_metadata.clear()
+    assert read_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH) == _metadata()
+
+
+def test_failed_write_leaves_no_tmp_file(tmp_path, caplog):
+    with patch("huggingface_hub._safetensors_metadata_cache.os.replace", side_effect=OSError("disk full")):
+        write_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH, _metadata())
+
+    assert "Ignored error while writing safetensors metadata cache file" in caplog.text
+    assert list((tmp_path / "safetensors").iterdir()) == []
+    # The in-memory cache is still seeded
+    assert read_safetensors_metadata_cache(str(tmp_path), COMMIT_HASH) == _metadata()
+
+
+class TestGetSafetensorsMetadataCache:
+    @pytest.fixture
+    def api(self, tmp_path):
+        api = HfApi()
+        with (
+            patch.object(api, "resolve_revision", return_value=ResolvedRevision(resolved=COMMIT_HASH, initial=None)),
+            patch.object(api, "_fetch_safetensors_metadata", side_effect=lambda *args, **kwargs: _metadata()),
+        ):
+            yield api
+
+    def test_cached_by_commit(self, api: HfApi, tmp_path):
+        assert api.get_safetensors_metadata("user/model", cache_dir=tmp_path) == _metadata()
+        assert api._fetch_safetensors_metadata.call_args.kwargs["revision"] == COMMIT_HASH
+        assert (tmp_path / "models--user--model" / "safetensors" / f"{COMMIT_HASH}.json").is_file()
+
+        # Second call is served from the in-memory cache, then from disk
+        api.get_safetensors_metadata("user/model", cache_dir=tmp_path)
+        _IN_MEMORY_CACHE.clear()
+        api.get_safetensors_metadata("user/model", cache_dir=tmp_path)
+        assert api._fetch_safetensors_metadata.call_count == 1
+
+    def test_use_cache_false(self, api: HfApi, tmp_path):
+        api.get_safetensors_metadata("user/model", cache_dir=tmp_path, use_cache=False)
+        api.get_safetensors_metadata("user/model", cache_dir=tmp_path, use_cache=False)
+        assert api._fetch_safetensors_metadata.call_count == 2
+        api.resolve_revision.assert_not_called()
+        assert not (tmp_path / "models--user--model").exists()
+
+    def test_bulk(self, api: HfApi, tmp_path):
+        error = NotASafetensorsRepoError("not a safetensors repo")
+
+        def _fetch(repo_id, **kwargs):
+            assert kwargs["show_progress"] is False
+            if repo_id == "user/not-safetensors":
+                raise error
+            return _metadata()
+
+        api._fetch_safetensors_metadata = Mock(side_effect=_fetch)
+        results = api.get_safetensors_metadata_bulk(
+            ["user/model-1", "user/not-safetensors", "user/model-2", "user/model-1"], cache_dir=tmp_path
+        )
+        assert list(results) == ["user/model-1", "user/not-safetensors", "user/model-2"]
+        assert results["user/model-1"] == _metadata()
+        assert results["user/not-safetensors"] is error
+
+        # All successful results are cached
+        api.get_safetensors_metadata_bulk(["user/model-1", "user/model-2"], cache_dir=tmp_path)
+        assert api._fetch_safetensors_metadata.call_count == 3
@@ -0,0 +1,185 @@
+import json
+import struct
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from huggingface_hub import HfSafetensorsReader
+from huggingface_hub._safetensors_reader import _write_partial_entry
+from huggingface_hub.errors import NotASafetensorsRepoError
+from huggingface_hub.hf_api import RepoFile
+from huggingface_hub.utils import is_torch_available
+
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+def _make_safetensors_file(tensors: dict[str, tuple[str, list[int], bytes]]) -> bytes:
+    """Build a safetensors file from raw (dtype, shape, data) tuples, without depending on `safetensors`."""
+    header, offset = {}, 0
+    for name, (dtype, shape, data) in tensors.items():
+        header[name] = {"dtype": dtype, "shape": shape, "data_offsets": [offset, offset + len(data)]}
+        offset += len(data)
+    header_bytes = json.dumps(header).encode()
+    return struct.pack("<Q", len(header_bytes)) + header_bytes + b"".join(data for _, _, data in tensors.values())
+
+
+class _FakeHub:
+    """Serve range requests on a set of files and record them."""
+
+    def __init__(self, files: dict[str, bytes]):
+        self.files = files
+        self.ranges: list[tuple[str, str]] = []
+
+    def paths_info(self, repo_id, paths, **kwargs):
+        return [
+            RepoFile(
+                path=path,
+                size=len(self.files[path]),
+                oid="gitoid",
+                lfs={"size": 0, "oid": f"sha-{path}", "pointerSize": 0},
+            )
+            for path in paths
+            if path in self.files
+        ]
+
+    def http_backoff(self, method: str, url: str, *, headers: dict, **kwargs) -> httpx.Response:
+        assert f"/username/my_model/resolve/{COMMIT}/" in url
+        filename = url.rsplit("/", 1)[1]
+        self.ranges.append((filename, headers["range"]))
+        start, end = map(int, headers["range"].removeprefix("bytes=").split("-"))
+        return httpx.Response(206, content=self.files[filename][start : end + 1], request=httpx.Request(method, url))
+
+
+@pytest.fixture
+def single_file_hub(tmp_path):
+    hub = _FakeHub(
+        {
+            "model.safetensors": _make_safetensors_file(
+                {
+                    "embed": ("U8", [4, 3], bytes(range(12))),
+                    "bias": ("U8", [2], b"\x10\x11"),
+                }
+            )
+        }
+    )
+    with (
+        patch("huggingface_hub._safetensors_reader.http_backoff", hub.http_backoff),
+        patch("huggingface_hub._safetensors_reader.HfApi.repo_info", Mock(return_value=Mock(sha=COMMIT))),
+        patch("huggingface_hub._safetensors_reader.HfApi.get_paths_info", side_effect=hub.paths_info),
+    ):
+        yield hub
+
+
+def test_read_tensor_bytes_single_file(single_file_hub: _FakeHub, tmp_path):
+    reader = HfSafetensorsReader("username/my_model", cache_dir=tmp_path)
+    assert reader.commit_hash == COMMIT
+    assert not reader.sharded
+    assert reader.keys() == ["embed", "bias"]
+    assert reader.tensor_info("embed").shape == [4, 3]
+    assert len(single_file_hub.ranges) == 1  # header fetched with a single request
+
+    assert reader.read_tensor_bytes("embed") == bytes(range(12))
+    assert reader.read_tensor_bytes("embed", start_row=1, end_row=3) == bytes(range(3, 9))
+    assert reader.read_tensor_bytes("bias") == b"\x10\x11"
+    # Everything was in the speculative header read => no extra request
+    assert len(single_file_hub.ranges) == 1
+
+
+def test_fetched_ranges_are_cached_on_disk(single_file_hub: _FakeHub, tmp_path):
+    with patch("huggingface_hub._safetensors_reader._HEADER_SAMPLE_SIZE", 8):
+        reader = HfSafetensorsReader("username/my_model", cache_dir=tmp_path)
+        header_size = reader._get_header("model.safetensors")[0]
+        assert reader.read_tensor_bytes("embed", start_row=2) == bytes(range(6, 12))
+
+        # Only the requested rows were fetched
+        assert single_file_hub.ranges[-1] == ("model.safetensors", f"bytes={header_size + 6}-{header_size + 11}")
+        partial_dir = tmp_path / "models--username--my_model" / "blobs" / "sha-model.safetensors.partial"
+        assert (partial_dir / f"{header_size + 6}-{header_size + 12}").is_file()
+
+        # A new reader reuses the cached ranges: only the missing bytes are fetched
+        nb_requests = len(single_file_hub.ranges)
+        reader = HfSafetensorsReader("username/my_model", cache_dir=tmp_path, revision=COMMIT)
+        assert reader.read_tensor_bytes("embed") == bytes(range(12))
+        assert single_file_hub.ranges[nb_requests:] == [
+            ("model.safetensors", f"bytes={header_size}-{header_size + 5}")
+        ]
+
+
+def test_read_from_fully_downloaded_blob(single_file_hub: _FakeHub, tmp_path):
+    blobs = tmp_path / "models--username--my_model" / "blobs"
+    blobs.mkdir(parents=True)
+    (blobs / "sha-model.safetensors").write_bytes(single_file_hub.files["model.safetensors"])
+
+    reader = HfSafetensorsReader("username/my_model", cache_dir=tmp_path)
+    assert reader.read_tensor_bytes("bias") == b"\x10\x11"
+    assert single_file_hub.ranges == []
+
+
+def test_failed_range_write_leaves_no_tmp_file(tmp_path):
+    partial_dir = tmp_path / "sha.partial"
+    with patch("huggingface_hub._safetensors_reader.os.replace", side_effect=OSError("disk full")):
+        _write_partial_entry(str(partial_dir), 0, 4, b"data")
+    assert list(partial_dir.iterdir()) == []
+
+
+def test_sharded_repo(tmp_path):
+    hub = _FakeHub(
+        {
+            "model-00001-of-00002.safetensors": _make_safetensors_file({"a": ("U8", [2], b"ab")}),
+            "model-00002-of-00002.safetensors": _make_safetensors_file({"b": ("U8", [3], b"cde")}),
+            "model.safetensors.index.json": b"",
+        }
+    )
+    index_path = tmp_path / "index.json"
+    index_path.write_text(
+        json.dumps(
+            {
+                "metadata": {"total_size": 5},
+                "weight_map": {"a": "model-00001-of-00002.safetensors", "b": "model-00002-of-00002.safetensors"},
+            }
+        )
+    )
+    with (
+        patch("huggingface_hub._safetensors_reader.http_backoff", hub.http_backoff),
+        patch("huggingface_hub._safetensors_reader.HfApi.get_paths_info", side_effect=hub.paths_info),
+        patch("huggingface_hub._safetensors_reader.HfApi.hf_hub_download", return_value=str(index_path)),
+    ):
+        reader = HfSafetensorsReader("username/my_model", cache_dir=tmp_path, revision=COMMIT)
+        assert reader.sharded
+        assert reader.index_metadata == {"total_size": 5}
+        assert hub.ranges == []  # headers are fetched lazily
+        assert reader.read_tensor_bytes("b") == b"cde"
+        assert [filename for filename, _ in hub.ranges] == ["model-00002-of-00002.safetensors"]
+
+        with pytest.raises(KeyError, match="not found"):
+            reader.tensor_info("c")
+
+
+def test_not_a_safetensors_repo(tmp_path):
+    hub = _FakeHub({"pytorch_model.bin": b""})
+    with patch("huggingface_hub._safetensors_reader.HfApi.get_paths_info", side_effect=hub.paths_info):
+        with pytest.raises(NotASafetensorsRepoError):
+            HfSafetensorsReader("username/my_model", cache_dir=tmp_path, revision=COMMIT)
+
+
+@pytest.mark.skipif(not is_torch_available(), reason="Test requires torch")
+def test_load_tensor_and_slices(single_file_hub: _FakeHub, tmp_path):
+    import torch
+
+    reader = HfSafetensorsReader("username/my_model", cache_dir=tmp_path)
+    expected = torch.arange(12, dtype=torch.uint8).reshape(4, 3)
+
+    assert torch.equal(reader.load_tensor("embed"), expected)
+    assert list(reader.load_tensors(["bias", "embed"])) == ["bias", "embed"]
+
+    view = reader.get_slice("embed")
+    assert view.shape == [4, 3]
+    assert torch.equal(view[1:3], expected[1:3])
+    assert torch.equal(view[-1], expected[-1])
+    assert torch.equal(view[::2, 1:], expected[::2, 1:])
+    assert torch.equal(view[3:1], expected[3:1])
+    assert torch.equal(view[..., 0], expected[..., 0])
+    with pytest.raises(IndexError):
+        view[4]
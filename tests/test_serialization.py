@@ -1,4 +1,6 @@
 import json
+import os
+import stat
 import struct
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,6 +11,7 @@ from pytest_mock import MockerFixture
 
 from huggingface_hub import constants
 from huggingface_hub.serialization import (
+    LazySafetensorsStateDict,
     get_torch_storage_size,
     load_state_dict_from_file,
     load_torch_model,
@@ -16,9 +19,14 @@ from huggingface_hub.serialization import (
     save_torch_state_dict,
     split_state_dict_into_shards_factory,
     split_torch_state_dict_into_shards,
+    upload_torch_state_dict,
 )
 from huggingface_hub.serialization._base import parse_size_to_int
-from huggingface_hub.serialization._torch import _load_sharded_checkpoint
+from huggingface_hub.serialization._torch import (
+    _iter_save_torch_state_dict,
+    _iter_shard_state_dicts,
+    _load_sharded_checkpoint,
+)
 from huggingface_hub.utils import is_torch_available
 
 
@@ -213,6 +221,116 @@ def test_multiple_shards(dummy_state_dict):
     assert state_dict_split.metadata == {"total_size": 50}
 
 
+def test_multiple_shards_balanced(dummy_state_dict):
+    state_dict_split = split_state_dict_into_shards_factory(
+        dummy_state_dict,
+        get_storage_id=_dummy_get_storage_id,
+        get_storage_size=_dummy_get_storage_size,
+        max_shard_size=10,
+        filename_pattern="file{suffix}.dummy",
+        sharding_strategy="balanced",
+    )
+
+    # Same output format, one shard less than the sequential strategy. Shards are numbered in state dict order.
+    assert state_dict_split.filename_to_tensors == {
+        "file-00001-of-00003.dummy": ["layer_1", "layer_4", "layer_5"],
+        "file-00002-of-00003.dummy": ["layer_2"],
+        "file-00003-of-00003.dummy": ["layer_3"],  # bigger than max size => own shard
+    }
+    assert state_dict_split.tensor_to_filename["layer_5"] == "file-00001-of-00003.dummy"
+    assert state_dict_split.metadata == {"total_size": 50}
+
+
+def test_balanced_shards_have_even_sizes():
+    state_dict = {f"layer_{idx}": [size] for idx, size in enumerate([6, 6, 2, 6, 2, 2])}
+    split_kwargs = dict(
+        get_storage_size=_dummy_get_storage_size, max_shard_size=10, filename_pattern="file{suffix}.dummy"
+    )
+
+    def shard_sizes(split):
+        return [sum(state_dict[key][0] for key in keys) for keys in split.filename_to_tensors.values()]
+
+    sequential = split_state_dict_into_shards_factory(state_dict, **split_kwargs)
+    balanced = split_state_dict_into_shards_factory(state_dict, sharding_strategy="balanced", **split_kwargs)
+
+    assert shard_sizes(sequential) == [6, 8, 10]
+    assert shard_sizes(balanced) == [8, 8, 8]
+
+
+@pytest.mark.parametrize("sharding_strategy", ["sequential", "balanced"])
+def test_shards_with_layer_locality(sharding_strategy):
+    state_dict = {
+        "model.layers.0.a": [4],
+        "model.layers.0.b": [4],
+        "model.layers.1.a": [4],
+        "model.layers.1.b": [4],
+        "lm_head": [4],
+    }
+    state_dict_split = split_state_dict_into_shards_factory(
+        state_dict,
+        get_storage_size=_dummy_get_storage_size,
+        max_shard_size=12,
+        filename_pattern="file{suffix}.dummy",
+        sharding_strategy=sharding_strategy,
+        layer_locality=True,
+    )
+    # Tensors of a same layer are never split across shards
+    mapping = state_dict_split.tensor_to_filename
+    assert len(state_dict_split.filename_to_tensors) == 2
+    assert mapping["model.layers.0.a"] == mapping["model.layers.0.b"]
+    assert mapping["model.layers.1.a"] == mapping["model.layers.1.b"]
+
+
+def test_layer_locality_splits_oversized_layer():
+    state_dict = {"model.layers.0.a": [6], "model.layers.0.b": [6], "lm_head": [2]}
+    state_dict_split = split_state_dict_into_shards_factory(
+        state_dict,
+        get_storage_size=_dummy_get_storage_size,
+        max_shard_size=10,
+        filename_pattern="file{suffix}.dummy",
+        layer_locality=True,
+    )
+    assert list(state_dict_split.filename_to_tensors.values()) == [
+        ["model.layers.0.a"],
+        ["model.layers.0.b", "lm_head"],
+    ]
+
+
+def test_stable_shards_are_content_stable():
+    state_dict = {f"layer_{idx}": [size] for idx, size in enumerate([3, 5, 2, 8, 1, 4, 6, 2, 7, 3, 5, 1, 2, 6, 4, 3])}
+    split_kwargs = dict(
+        get_storage_size=_dummy_get_storage_size,
+        max_shard_size=12,
+        filename_pattern="file{suffix}.dummy",
+        sharding_strategy="stable",
+    )
+    before = split_state_dict_into_shards_factory(state_dict, **split_kwargs)
+    assert before.is_sharded
+    for keys in before.filename_to_tensors.values():
+        assert sum(state_dict[key][0] for key in keys) <= 12  # overflow is handled by cutting the shard early
+
+    # Insert a tensor in the middle of the state dict
+    edited = dict(list(state_dict.items())[:8]) | {"new_layer": [1]} | dict(list(state_dict.items())[8:])
+    after = split_state_dict_into_shards_factory(edited, **split_kwargs)
+
+    # Only the shard containing the new tensor changes (filenames may change, not the contents)
+    shards_before = {tuple(keys) for keys in before.filename_to_tensors.values()}
+    shards_after = {tuple(keys) for keys in after.filename_to_tensors.values()}
+    changed = shards_after - shards_before
+    assert len(changed) == 1
+    assert "new_layer" in next(iter(changed))
+
+
+def test_invalid_sharding_strategy(dummy_state_dict):
+    with pytest.raises(ValueError, match="Invalid sharding strategy"):
+        split_state_dict_into_shards_factory(
+            dummy_state_dict,
+            get_storage_size=_dummy_get_storage_size,
+            filename_pattern="file{suffix}.dummy",
+            sharding_strategy="random",
+        )
+
+
 def test_tensor_same_storage():
     state_dict_split = split_state_dict_into_shards_factory(
         {
@@ -350,6 +468,10 @@ def test_save_torch_model(mocker: MockerFixture, tmp_path: Path) -> None:
         safe_serialization=True,
         is_main_process=True,
         shared_tensors_to_discard=None,
+        max_workers=1,
+        fsync=False,
+        sharding_strategy="sequential",
+        layer_locality=False,
     )
 
 
@@ -380,6 +502,94 @@ def test_save_torch_state_dict_sharded(tmp_path: Path, torch_state_dict: dict[st
     }
 
 
+@pytest.mark.parametrize("fsync", [False, True])
+def test_save_torch_state_dict_parallel_matches_sequential(
+    tmp_path: Path, torch_state_dict: dict[str, "torch.Tensor"], fsync: bool
+) -> None:
+    (tmp_path / "sequential").mkdir()
+    (tmp_path / "parallel").mkdir()
+    save_torch_state_dict(torch_state_dict, tmp_path / "sequential", max_shard_size=10)
+    save_torch_state_dict(torch_state_dict, tmp_path / "parallel", max_shard_size=10, max_workers=3, fsync=fsync)
+
+    sequential_files = sorted(path.name for path in (tmp_path / "sequential").iterdir())
+    assert sorted(path.name for path in (tmp_path / "parallel").iterdir()) == sequential_files
+    for name in sequential_files:
+        assert (tmp_path / "parallel" / name).read_bytes() == (tmp_path / "sequential" / name).read_bytes()
+
+
+def test_iter_save_torch_state_dict_yields_index_last(
+    tmp_path: Path, torch_state_dict: dict[str, "torch.Tensor"]
+) -> None:
+    saved = []
+    for filename in _iter_save_torch_state_dict(
+        torch_state_dict,
+        tmp_path,
+        filename_pattern=None,
+        force_contiguous=True,
+        max_shard_size=10,
+        metadata=None,
+        safe_serialization=True,
+        is_main_process=True,
+        shared_tensors_to_discard=None,
+        max_workers=2,
+        fsync=False,
+    ):
+        if filename.endswith(".safetensors"):
+            # Index is not written before all shards are
+            assert not (tmp_path / "model.safetensors.index.json").exists()
+        saved.append(filename)
+
+    assert saved[-1] == "model.safetensors.index.json"
+    assert sorted(saved[:-1]) == [f"model-0000{i}-of-00005.safetensors" for i in range(1, 6)]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(saved)  # no leftover temporary file
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_save_torch_state_dict_index_has_default_permissions(
+    tmp_path: Path, torch_state_dict: dict[str, "torch.Tensor"]
+) -> None:
+    save_torch_state_dict(torch_state_dict, tmp_path, max_shard_size=10)
+    (tmp_path / "reference").touch()
+    expected_mode = stat.S_IMODE((tmp_path / "reference").stat().st_mode)  # 0o666 minus umask
+    assert stat.S_IMODE((tmp_path / "model.safetensors.index.json").stat().st_mode) == expected_mode
+
+
+def test_save_torch_state_dict_invalid_max_workers(
+    tmp_path: Path, torch_state_dict: dict[str, "torch.Tensor"]
+) -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        save_torch_state_dict(torch_state_dict, tmp_path, max_workers=0)
+
+
+def test_upload_torch_state_dict_streams_shards(
+    mocker: MockerFixture, tmp_path: Path, torch_state_dict: dict[str, "torch.Tensor"]
+) -> None:
+    uploaded = []
+
+    def _fake_pipelined_upload(api, *, add_operations, **kwargs):
+        for op in add_operations:
+            # Each file is complete when handed over to the upload pipeline
+            assert Path(op.path_or_fileobj).is_file()
+            uploaded.append(op.path_in_repo)
+        return "commit-info"
+
+    mocker.patch("huggingface_hub.utils._runtime.is_xet_available", return_value=True)
+    mocker.patch("huggingface_hub._upload_pipeline.pipelined_upload", side_effect=_fake_pipelined_upload)
+
+    info = upload_torch_state_dict(
+        torch_state_dict,
+        "user/repo",
+        path_in_repo="weights",
+        save_directory=tmp_path,
+        max_shard_size=10,
+        max_workers=2,
+    )
+
+    assert info == "commit-info"
+    assert uploaded[-1] == "weights/model.safetensors.index.json"
+    assert sorted(uploaded[:-1]) == [f"weights/model-0000{i}-of-00005.safetensors" for i in range(1, 6)]
+
+
 def test_save_torch_state_dict_unsafe_not_sharded(
     tmp_path: Path, caplog: pytest.LogCaptureFixture, torch_state_dict: dict[str, "torch.Tensor"]
 ) -> None:
@@ -676,6 +886,50 @@ def test_load_sharded_state_dict(
         assert torch.equal(loaded_state_dict[key], torch_state_dict[key])
 
 
+@pytest.mark.skipif(not is_torch_available(), reason="Test requires torch")
+@pytest.mark.parametrize("prefetch_budget", [30, "1KB"])
+def test_load_sharded_state_dict_with_prefetch(
+    tmp_path: Path,
+    torch_state_dict: dict[str, "torch.Tensor"],
+    dummy_model: "torch.nn.Module",
+    prefetch_budget,
+):
+    """Shards are loaded ahead of time but copied into the model in order."""
+    import torch
+
+    save_torch_state_dict(torch_state_dict, save_directory=tmp_path, max_shard_size=30)
+    result = load_torch_model(dummy_model, tmp_path, prefetch_budget=prefetch_budget)
+    assert not result.missing_keys
+    assert not result.unexpected_keys
+
+    loaded_state_dict = dummy_model.state_dict()
+    for key in torch_state_dict:
+        assert torch.equal(loaded_state_dict[key], torch_state_dict[key])
+
+
+def test_iter_shard_state_dicts_respects_prefetch_budget(tmp_path: Path, mocker):
+    """At most `prefetch_budget` bytes of shards are loaded ahead of the one being consumed."""
+    shard_paths = []
+    for i in range(5):
+        shard_path = tmp_path / f"shard-{i}.safetensors"
+        shard_path.write_bytes(b"0" * 10)
+        shard_paths.append(str(shard_path))
+
+    loaded = []
+    mocker.patch(
+        "huggingface_hub.serialization._torch.load_state_dict_from_file",
+        side_effect=lambda path, **kwargs: loaded.append(path) or {"path": path},
+    )
+
+    iterator = _iter_shard_state_dicts(shard_paths, weights_only=False, prefetch_budget=25)
+    consumed = []
+    for state_dict in iterator:
+        consumed.append(state_dict["path"])
+        # current shard + 2 shards of 10 bytes ahead (a 3rd one would exceed the 25 bytes budget)
+        assert len(loaded) <= len(consumed) + 2
+    assert consumed == shard_paths
+
+
 @pytest.mark.skipif(not is_torch_available(), reason="Test requires torch")
 def test_load_from_directory_not_sharded(
     tmp_path: Path, torch_state_dict: dict[str, "torch.Tensor"], dummy_model: "torch.nn.Module"
@@ -698,6 +952,65 @@ def test_load_from_directory_not_sharded(
         assert torch.equal(loaded_state_dict[key], torch_state_dict[key])
 
 
+@pytest.mark.skipif(not is_torch_available(), reason="Test requires torch")
+def test_load_state_dict_from_file_lazy(tmp_path: Path):
+    import torch
+
+    state_dict = {
+        "weight": torch.arange(24, dtype=torch.float32).reshape(6, 4),
+        "bias": torch.arange(4, dtype=torch.bfloat16),
+        "empty": torch.zeros((0, 3)),
+    }
+    save_torch_state_dict(state_dict, tmp_path)
+
+    with load_state_dict_from_file(tmp_path / "model.safetensors", lazy=True) as lazy_state_dict:
+        assert isinstance(lazy_state_dict, LazySafetensorsStateDict)
+        assert lazy_state_dict.metadata == {"format": "pt"}
+        assert set(lazy_state_dict) == set(state_dict)
+        for key, tensor in state_dict.items():
+            assert torch.equal(lazy_state_dict[key], tensor)
+
+        # Slices are views on the memory map (no copy of the whole tensor)
+        weight_slice = lazy_state_dict.get_slice("weight")
+        assert weight_slice.get_shape() == [6, 4]
+        assert weight_slice.get_dtype() == "F32"
+        assert torch.equal(weight_slice[2:4], state_dict["weight"][2:4])
+        assert torch.equal(weight_slice[:, 1:3], state_dict["weight"][:, 1:3])
+        assert weight_slice[2:4].data_ptr() == lazy_state_dict["weight"].data_ptr() + 2 * 4 * 4
+
+        # Tensors are writable without modifying the file
+        lazy_state_dict["weight"].add_(1)
+        lazy_state_dict.release()
+    assert torch.equal(load_state_dict_from_file(tmp_path / "model.safetensors")["weight"], state_dict["weight"])
+
+
+@pytest.mark.skipif(not is_torch_available(), reason="Test requires torch")
+@pytest.mark.parametrize("sharded", [True, False])
+def test_load_torch_model_lazy(
+    tmp_path: Path,
+    torch_state_dict: dict[str, "torch.Tensor"],
+    dummy_model: "torch.nn.Module",
+    sharded: bool,
+    mocker,
+):
+    import torch
+
+    # Tensors are copied into the model by groups of 16 bytes, then their pages are released
+    mocker.patch("huggingface_hub.serialization._torch.LAZY_LOAD_GROUP_SIZE", 16)
+    release = mocker.spy(LazySafetensorsStateDict, "release")
+    save_torch_state_dict(torch_state_dict, save_directory=tmp_path, max_shard_size=30 if sharded else "5GB")
+    assert (tmp_path / "model.safetensors.index.json").exists() == sharded
+
+    for key in torch_state_dict:
+        dummy_model.get_parameter(key).data.zero_()
+    result = load_torch_model(dummy_model, tmp_path, lazy=True)
+    assert not result.missing_keys
+    assert not result.unexpected_keys
+    for key, tensor in dummy_model.state_dict().items():
+        assert torch.equal(tensor, torch_state_dict[key])
+    assert sorted(key for call in release.call_args_list for key in call.args[1]) == sorted(torch_state_dict)
+
+
 @pytest.mark.parametrize("safe_serialization", [True, False])
 def test_load_state_dict_missing_file(safe_serialization):
     """Test proper error handling when file is missing."""
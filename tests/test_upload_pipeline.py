@@ -310,6 +310,23 @@ class TestUploadPipeline:
         # (mirrors `create_commit` semantics; the PR ref is only used for the commit calls)
         assert all(call["revision"] == "main" and call["create_pr"] is True for call in endpoint.preupload_calls)
 
+    def test_streamed_operations_are_preuploaded_one_by_one(self, fake_api, tmp_path):
+        ops = make_ops(tmp_path, [("a.bin", b"x" * 100), ("b.bin", b"y" * 100), ("c.json", b"{}")])
+        consumed = []
+
+        def stream():
+            for op in ops:
+                consumed.append(op.path_in_repo)
+                yield op
+
+        info, endpoint, session = run_pipeline(fake_api, stream())
+
+        assert consumed == ["a.bin", "b.bin", "c.json"]
+        assert len(endpoint.preupload_calls) == 3  # one preupload call per file, as soon as it is produced
+        assert len(endpoint.calls) == 1
+        assert endpoint.committed_paths(0) == ["a.bin", "b.bin", "c.json"]
+        assert session.commits[0].files == [str(tmp_path / "a.bin"), str(tmp_path / "b.bin")]
+
     def test_commit_failure_splits_batch(self, fake_api, tmp_path):
         ops = make_ops(tmp_path, [(f"f{i}.bin", f"{i}".encode() * 100) for i in range(4)])
         endpoint = FakeCommitEndpoint(fail_on_nth_call={0})  # first attempt (4 files) fails
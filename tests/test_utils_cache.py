@@ -241,6 +241,26 @@ class TestIgnoredCacheFiles:
         assert len(report.repos) == 1
 
 
+class TestIncompleteCacheFiles:
+    def test_scan_reports_partial_folders(self, tmp_path) -> None:
+        blobs_path = tmp_path / "models--foo--bar" / "blobs"
+        blobs_path.mkdir(parents=True)
+        (tmp_path / "models--foo--bar" / "snapshots").mkdir()
+        (blobs_path / "aaa.incomplete").write_bytes(b"12345")
+        partial_path = blobs_path / "bbb.partial"
+        partial_path.mkdir()
+        (partial_path / "0-8").write_bytes(b"01234567")
+        (partial_path / "tmp123.tmp").write_bytes(b"012")
+
+        report = scan_cache_dir(tmp_path)
+
+        assert {file.file_path.name: file.size_on_disk for file in report.incomplete_files} == {
+            "aaa.incomplete": 5,
+            "bbb.partial": 11,
+        }
+        assert report.incomplete_size_on_disk == 16
+
+
 @pytest.mark.production
 class TestCorruptedCacheUtils:
     repo_path: Path
@@ -605,6 +625,11 @@ class TestDeleteStrategyExecute:
         blob_1.touch()
         blob_2.touch()
         blob_3.touch()
+        blob_1_partial = repo_B_path / "blobs" / "blob_1.partial"
+        blob_2_partial = repo_B_path / "blobs" / "blob_2.partial"
+        blob_1_partial.mkdir()
+        blob_2_partial.mkdir()
+        (blob_2_partial / "0-8").touch()
 
         # Snapshot folders in repo_B
         snapshot_1 = repo_B_path / "snapshots" / "snapshot_1"
@@ -632,6 +657,10 @@ class TestDeleteStrategyExecute:
         assert not blob_2.exists()
         assert not blob_3.exists()
 
+        # Cached byte ranges are deleted along with their blob
+        assert blob_1_partial.exists()
+        assert not blob_2_partial.exists()
+
         # Only ref `main` remains
         assert refs_main_path.exists()
         assert not refs_pr_1_path.exists()
@@ -1,16 +1,20 @@
+import asyncio
 import threading
 import time
 import weakref
+from dataclasses import replace
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Generator, Optional
+from typing import Callable, Generator, Optional
 from unittest.mock import Mock, call, patch
 from urllib.parse import urlparse
 from uuid import UUID
 
+import httpcore
 import httpx
 import pytest
 from httpx import ConnectTimeout, HTTPError
 
+from huggingface_hub import constants
 from huggingface_hub.constants import ENDPOINT
 from huggingface_hub.errors import (
     BucketNotFoundError,
@@ -18,22 +22,41 @@ from huggingface_hub.errors import (
     OfflineModeIsEnabled,
     RepositoryNotFoundError,
 )
+from huggingface_hub.utils import (
+    RequestTiming,
+    RequestTimingHistograms,
+    add_request_timing_callback,
+    remove_request_timing_callback,
+)
 from huggingface_hub.utils._http import (
+    _IN_FLIGHT_REQUESTS,
     _WARNED_TOPICS,
     RateLimitInfo,
     _adjust_range_header,
+    _coalesce_request,
     _parse_bucket_id_from_url,
     _parse_repo_info_from_url,
     _parse_retry_after,
+    _RateLimitGovernor,
     _warn_on_warning_headers,
+    async_hf_request_event_hook,
+    close_shared_async_session,
+    default_async_client_factory,
     default_client_factory,
     fix_hf_endpoint_in_url,
     get_async_session,
+    get_http_pool_config,
+    get_rate_limit_budget,
     get_session,
+    get_shared_async_session,
     hf_raise_for_status,
+    hf_request_event_hook,
+    hf_response_event_hook,
     http_backoff,
     parse_ratelimit_headers,
+    set_async_client_factory,
     set_client_factory,
+    set_http_pool_config,
 )
 
 
@@ -387,6 +410,286 @@ def test_proxy_env_is_used(monkeypatch):
     set_client_factory(default_client_factory)
 
 
+class TestHttpPoolConfig:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+        for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr("huggingface_hub.utils._http._HTTP_POOL_CONFIG", None)
+        set_client_factory(default_client_factory)
+        yield
+        set_client_factory(default_client_factory)
+
+    def test_default_config_from_constants(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(constants, "HF_HUB_HTTP_MAX_CONNECTIONS", 12)
+        config = get_http_pool_config()
+        assert config.max_connections == 12
+        assert config.max_keepalive_connections == constants.HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS
+        assert not config.http2
+
+    def test_separate_pools_for_hub_api_and_other_hosts(self) -> None:
+        set_http_pool_config(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30)
+        client = get_session()
+
+        api_transport = client._transport_for_url(httpx.URL(f"{ENDPOINT}/api/models/gpt2"))
+        cdn_transport = client._transport_for_url(httpx.URL("https://cas-bridge.xethub.hf.co/xet-bridge-us/abc"))
+        assert api_transport is not cdn_transport
+        for transport in (api_transport, cdn_transport):
+            assert transport._pool._max_connections == 64
+            assert transport._pool._max_keepalive_connections == 32
+            assert transport._pool._keepalive_expiry == 30
+
+    def test_set_config_recreates_session(self) -> None:
+        client = get_session()
+        set_http_pool_config(max_connections=8)
+        assert client.is_closed
+        assert get_session()._transport._pool._max_connections == 8
+        assert get_http_pool_config().max_keepalive_connections == constants.HF_HUB_HTTP_MAX_KEEPALIVE_CONNECTIONS
+
+    def test_single_pool_with_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("HTTPS_PROXY", "http://localhost:3128")
+        client = default_client_factory()
+        # The proxy is used for the Hub API too
+        api_transport = client._transport_for_url(httpx.URL(f"{ENDPOINT}/api/models/gpt2"))
+        assert isinstance(api_transport._pool, httpcore.HTTPProxy)
+
+    def test_http2_requires_h2(self) -> None:
+        with patch("huggingface_hub.utils._http.is_h2_available", return_value=False):
+            with pytest.raises(ImportError, match="h2"):
+                set_http_pool_config(http2=True)
+
+    def test_http2_falls_back_if_h2_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(constants, "HF_HUB_ENABLE_HTTP2", True)
+        with patch("huggingface_hub.utils._http.is_h2_available", return_value=False):
+            client = default_client_factory()
+        assert not client._transport_for_url(httpx.URL(f"{ENDPOINT}/api/models/gpt2"))._pool._http2
+
+
+class TestCoalesceRequest:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(constants, "HF_HUB_COALESCE_REQUESTS", True)
+        self.release = threading.Event()
+
+    def _send(self, response: object = None) -> Mock:
+        def _wait_and_respond(*args, **kwargs):
+            self.release.wait(timeout=5)
+            if isinstance(response, Exception):
+                raise response
+            return response or httpx.Response(200, json={"sha": "abc"})
+
+        return Mock(side_effect=_wait_and_respond)
+
+    def _run_concurrently(self, *calls: Callable[[], object]) -> list:
+        results: list = [None] * len(calls)
+
+        def _run(index: int) -> None:
+            try:
+                results[index] = calls[index]()
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=_run, args=(i,)) for i in range(len(calls))]
+        for thread in threads:
+            thread.start()
+        # Wait until all threads are either sending the request or waiting for it
+        if not self.release.is_set():
+            deadline = time.time() + 5
+            while len(_IN_FLIGHT_REQUESTS) == 0 and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            self.release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_requests_share_response(self) -> None:
+        send = self._send()
+        url = f"{ENDPOINT}/api/models/gpt2"
+        call = lambda: _coalesce_request("GET", url, send, headers={"authorization": "Bearer hf_xxx"})  # noqa: E731
+
+        results = self._run_concurrently(*[call] * 8)
+        assert send.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert results[0].json() == {"sha": "abc"}
+        assert _IN_FLIGHT_REQUESTS == {}
+
+        # Not cached once completed
+        call()
+        assert send.call_count == 2
+
+    def test_different_requests_are_not_coalesced(self) -> None:
+        send = self._send()
+        url = f"{ENDPOINT}/api/models/gpt2"
+        self._run_concurrently(
+            lambda: _coalesce_request("GET", url, send, headers={"authorization": "Bearer hf_xxx"}),
+            lambda: _coalesce_request("GET", url, send, headers={"authorization": "Bearer hf_yyy"}),
+            lambda: _coalesce_request("GET", url, send, params={"expand": ["sha"]}),
+            lambda: _coalesce_request("HEAD", url, send),
+        )
+        assert send.call_count == 4
+
+    def test_error_is_shared(self) -> None:
+        error = httpx.ConnectError("Connection refused")
+        send = self._send(error)
+        call = lambda: _coalesce_request("HEAD", f"{ENDPOINT}/gpt2/resolve/main/config.json", send)  # noqa: E731
+
+        results = self._run_concurrently(call, call, call)
+        assert send.call_count == 1
+        assert all(result is error for result in results)
+        assert _IN_FLIGHT_REQUESTS == {}
+
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(constants, "HF_HUB_COALESCE_REQUESTS", False)
+        send = self._send()
+        self.release.set()
+        call = lambda: _coalesce_request("GET", f"{ENDPOINT}/api/models/gpt2", send)  # noqa: E731
+        self._run_concurrently(call, call, call)
+        assert send.call_count == 3
+
+    def test_hf_api_model_info(self) -> None:
+        from huggingface_hub import HfApi
+
+        session = Mock()
+        session.get.side_effect = self._send(
+            httpx.Response(
+                200, json={"id": "gpt2", "sha": "abc"}, request=httpx.Request("GET", f"{ENDPOINT}/api/models/gpt2")
+            )
+        )
+        api = HfApi(token=False)
+        with patch("huggingface_hub.hf_api.get_session", return_value=session):
+            results = self._run_concurrently(*[lambda: api.model_info("gpt2")] * 4)
+        assert session.get.call_count == 1
+        assert [info.sha for info in results] == ["abc"] * 4
+        assert len({id(info) for info in results}) == 4  # each caller gets its own object
+
+
+class TestRateLimitGovernor:
+    @pytest.fixture(autouse=True)
+    def governor(self, monkeypatch: pytest.MonkeyPatch) -> _RateLimitGovernor:
+        governor = _RateLimitGovernor()
+        monkeypatch.setattr("huggingface_hub.utils._http._RATE_LIMIT_GOVERNOR", governor)
+        monkeypatch.setattr(constants, "HF_HUB_ENABLE_RATE_LIMIT_GOVERNOR", True)
+        return governor
+
+    @staticmethod
+    def _response(url: str, remaining: int, reset: int = 100, limit: int = 10, window: int = 10) -> httpx.Response:
+        headers = {
+            "RateLimit": f'"api";r={remaining};t={reset}',
+            "RateLimit-Policy": f'"fixed window";"api";q={limit};w={window}',
+        }
+        return httpx.Response(200, headers=headers, request=httpx.Request("GET", url))
+
+    def test_budget_tracked_per_endpoint_class(self, governor: _RateLimitGovernor) -> None:
+        assert get_rate_limit_budget() == {}
+        hf_response_event_hook(self._response(f"{ENDPOINT}/api/models/gpt2", remaining=8))
+        hf_response_event_hook(self._response(f"{ENDPOINT}/gpt2/resolve/main/config.json", remaining=3, limit=5))
+        hf_response_event_hook(self._response("https://cas-bridge.xethub.hf.co/abc", remaining=0))  # not the Hub
+
+        budget = get_rate_limit_budget()
+        assert set(budget) == {"api", "resolvers"}
+        assert budget["api"].remaining == pytest.approx(8, abs=0.1)
+        assert budget["api"].limit == 10
+        assert budget["api"].window_seconds == 10
+        assert budget["api"].blocked_for_seconds == 0
+        assert budget["resolvers"].remaining == pytest.approx(3, abs=0.1)
+
+    def test_throttle_when_budget_is_exhausted(self, governor: _RateLimitGovernor) -> None:
+        url = httpx.URL(f"{ENDPOINT}/api/models/gpt2")
+        assert governor.reserve(url) == 0  # no budget advertised yet
+
+        governor.observe(self._response(str(url), remaining=2))
+        assert governor.reserve(url) == 0
+        assert governor.reserve(url) == 0
+        # Budget refills at 10 requests / 10s => each extra request waits one more second
+        assert governor.reserve(url) == pytest.approx(1, abs=0.1)
+        assert governor.reserve(url) == pytest.approx(2, abs=0.1)
+        assert get_rate_limit_budget()["api"].remaining == pytest.approx(-2, abs=0.1)
+
+        # Other classes are not throttled
+        assert governor.reserve(httpx.URL(f"{ENDPOINT}/gpt2/resolve/main/config.json")) == 0
+
+        # Server says no budget left => wait until the window resets, and do not raise the local budget
+        governor.observe(self._response(str(url), remaining=0, reset=55))
+        assert get_rate_limit_budget()["api"].blocked_for_seconds == pytest.approx(55, abs=0.1)
+        assert governor.reserve(url) == pytest.approx(55, abs=0.1)
+        governor.observe(self._response(str(url), remaining=9))
+        assert get_rate_limit_budget()["api"].remaining < 0
+
+    def test_request_event_hook_waits(self, governor: _RateLimitGovernor, monkeypatch: pytest.MonkeyPatch) -> None:
+        governor.observe(self._response(f"{ENDPOINT}/api/models/gpt2", remaining=0, reset=3))
+        with patch("huggingface_hub.utils._http.time.sleep") as mock_sleep:
+            hf_request_event_hook(httpx.Request("GET", f"{ENDPOINT}/api/models/gpt2"))
+        assert mock_sleep.call_args.args[0] == pytest.approx(3, abs=0.1)
+
+        # Disabled => budget is tracked but requests are not throttled
+        monkeypatch.setattr(constants, "HF_HUB_ENABLE_RATE_LIMIT_GOVERNOR", False)
+        with patch("huggingface_hub.utils._http.time.sleep") as mock_sleep:
+            hf_request_event_hook(httpx.Request("GET", f"{ENDPOINT}/api/models/gpt2"))
+        mock_sleep.assert_not_called()
+
+    def test_async_request_event_hook_waits(self, governor: _RateLimitGovernor) -> None:
+        governor.observe(self._response(f"{ENDPOINT}/api/models/gpt2", remaining=0, reset=3))
+        with patch("huggingface_hub.utils._http.asyncio.sleep") as mock_sleep:
+            asyncio.run(async_hf_request_event_hook(httpx.Request("GET", f"{ENDPOINT}/api/models/gpt2")))
+        assert mock_sleep.call_args.args[0] == pytest.approx(3, abs=0.1)
+
+
+class TestSharedAsyncSession:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> Generator[None, None, None]:
+        set_async_client_factory(default_async_client_factory)
+        yield
+        set_async_client_factory(default_async_client_factory)
+
+    def test_shared_in_loop_and_closed_on_loop_shutdown(self) -> None:
+        async def _get_twice() -> httpx.AsyncClient:
+            client = get_shared_async_session()
+            assert get_shared_async_session() is client
+            assert not client.is_closed
+            return client
+
+        client_1 = asyncio.run(_get_twice())
+        client_2 = asyncio.run(_get_twice())
+        assert client_1 is not client_2  # one client per event loop
+        assert client_1.is_closed and client_2.is_closed  # closed by `asyncio.run`
+
+    def test_loop_closed_without_shutdown(self) -> None:
+        loop = asyncio.new_event_loop()
+        client = loop.run_until_complete(self._get())
+        loop.close()
+        assert asyncio.run(self._get()) is not client
+
+    def test_close_shared_async_session(self) -> None:
+        async def _main() -> None:
+            client = get_shared_async_session()
+            await close_shared_async_session()
+            assert client.is_closed
+            assert get_shared_async_session() is not client
+
+        asyncio.run(_main())
+
+    def test_set_async_client_factory_resets_shared_session(self) -> None:
+        async def _main() -> None:
+            client = get_shared_async_session()
+            set_async_client_factory(lambda: httpx.AsyncClient(headers={"x-test-header": "4"}))
+            new_client = get_shared_async_session()
+            assert new_client.headers["x-test-header"] == "4"
+            for _ in range(10):  # previous client is closed in the background
+                await asyncio.sleep(0)
+            assert client.is_closed
+
+        asyncio.run(_main())
+
+    def test_requires_running_loop(self) -> None:
+        with pytest.raises(RuntimeError):
+            get_shared_async_session()
+
+    @staticmethod
+    async def _get() -> httpx.AsyncClient:
+        return get_shared_async_session()
+
+
 def test_client_get_request():
     # Check that sync client works
     client = get_session()
@@ -413,6 +716,14 @@ class FakeServerHandler(BaseHTTPRequestHandler):
             self._send_response(200, b"OK")
             return
 
+        # Redirect to health check endpoint
+        if parsed.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/health")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
         # Main endpoint (always fails with 500)
         self._send_response(500, b"This is a 500 error")
 
@@ -488,6 +799,104 @@ async def test_raise_on_status_async_stream(fake_server: str):
         _check_raise_status(response)
 
 
+class TestRequestTiming:
+    @pytest.fixture(autouse=True)
+    def timings(self) -> Generator[list[RequestTiming], None, None]:
+        timings: list[RequestTiming] = []
+        add_request_timing_callback(timings.append)
+        yield timings
+        remove_request_timing_callback(timings.append)
+
+    def test_sync_request(self, fake_server: str, timings: list[RequestTiming]) -> None:
+        with default_client_factory() as client:
+            client.get(f"{fake_server}/health")
+
+        (first,) = timings
+        assert first.method == "GET"
+        assert first.url == f"{fake_server}/health"
+        assert first.endpoint_class == "other"
+        assert first.status_code == 200
+        assert first.error is None
+        assert first.retry == 0
+        assert first.bytes_downloaded == 2
+        assert first.connect is not None and first.connect >= 0
+        assert first.tls is None  # plain HTTP
+        assert first.ttfb is not None and first.transfer is not None
+        assert first.total >= first.ttfb + first.transfer
+
+    def test_redirect(self, fake_server: str, timings: list[RequestTiming]) -> None:
+        with default_client_factory() as client:
+            client.get(f"{fake_server}/redirect")
+
+        redirect, final = timings
+        assert redirect.status_code == 302
+        assert redirect.redirect == 0
+        assert final.status_code == 200
+        assert final.url == f"{fake_server}/health"
+        assert final.redirect >= redirect.total
+
+    def test_retry(self, fake_server: str, timings: list[RequestTiming]) -> None:
+        with pytest.raises(HfHubHTTPError):
+            http_backoff("GET", f"{fake_server}/error", max_retries=2, base_wait_time=0)
+        assert [(timing.status_code, timing.retry) for timing in timings] == [(500, 0), (500, 1), (500, 2)]
+
+    def test_connection_error(self, timings: list[RequestTiming]) -> None:
+        with default_client_factory() as client:
+            with pytest.raises(httpx.ConnectError):
+                client.get("http://127.0.0.1:1/")
+        assert timings[0].status_code is None
+        assert timings[0].error == "ConnectError"
+
+    @pytest.mark.asyncio
+    async def test_async_request(self, fake_server: str, timings: list[RequestTiming]) -> None:
+        async with default_async_client_factory() as client:
+            await client.get(f"{fake_server}/health")
+        assert timings[0].status_code == 200
+        assert timings[0].connect is not None
+
+    def test_disabled(self, fake_server: str, timings: list[RequestTiming]) -> None:
+        remove_request_timing_callback(timings.append)
+        with default_client_factory() as client:
+            response = client.get(f"{fake_server}/health")
+        assert "trace" not in response.request.extensions
+        assert timings == []
+
+    def test_histograms_and_prometheus(self) -> None:
+        histograms = RequestTimingHistograms(buckets=(0.1, 1.0))
+        timing = RequestTiming(
+            method="GET",
+            url=f"{ENDPOINT}/api/models/gpt2",
+            endpoint_class="api",
+            status_code=200,
+            error=None,
+            retry=0,
+            connect=0.05,
+            tls=None,
+            ttfb=0.5,
+            redirect=0.0,
+            transfer=0.01,
+            total=0.6,
+            bytes_downloaded=100,
+            bytes_uploaded=None,
+        )
+        histograms(timing)
+        histograms(replace(timing, ttfb=2.0, status_code=None, error="ReadTimeout", retry=1))
+
+        assert histograms.get("api", "ttfb") == {"count": 2, "sum": 2.5, "buckets": {0.1: 0, 1.0: 1}}
+        assert histograms.get("api", "tls") is None
+        assert histograms.get("api", "redirect") is None
+
+        text = histograms.to_prometheus()
+        assert "# TYPE hf_hub_http_request_duration_seconds histogram" in text
+        assert 'hf_hub_http_request_duration_seconds_bucket{endpoint_class="api",phase="ttfb",le="1.0"} 1' in text
+        assert 'hf_hub_http_request_duration_seconds_bucket{endpoint_class="api",phase="ttfb",le="+Inf"} 2' in text
+        assert 'hf_hub_http_request_duration_seconds_count{endpoint_class="api",phase="total"} 2' in text
+        assert 'hf_hub_http_requests_total{endpoint_class="api",status="200"} 1' in text
+        assert 'hf_hub_http_requests_total{endpoint_class="api",status="error"} 1' in text
+        assert 'hf_hub_http_response_bytes_total{endpoint_class="api"} 200' in text
+        assert 'hf_hub_http_retries_total{endpoint_class="api"} 1' in text
+
+
 class TestParseRatelimitHeaders:
     def test_parse_full_headers(self):
         """Test parsing both ratelimit and ratelimit-policy headers."""
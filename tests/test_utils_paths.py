@@ -1,10 +1,14 @@
+import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
+from unittest.mock import patch
 
 import pytest
 
-from huggingface_hub.utils import DEFAULT_IGNORE_PATTERNS, filter_repo_objects
+from huggingface_hub.utils import DEFAULT_IGNORE_PATTERNS, filter_repo_objects, walk_local_files
+from huggingface_hub.utils._paths import WALK_PREFETCH_FACTOR, _scan_dir
 
 
 @dataclass
@@ -218,3 +222,51 @@ class TestDefaultIgnorePatterns:
             items=self.PATHS_TO_IGNORE + self.VALID_PATHS, ignore_patterns=DEFAULT_IGNORE_PATTERNS
         )
         assert list(filtered_paths) == self.VALID_PATHS
+
+
+class TestWalkLocalFiles:
+    def test_walk_sorted_with_stats(self, tmp_path: Path) -> None:
+        for relpath in ["b.txt", "a/b.txt", "a.txt", "a-b/c.txt", "a/a/z.txt", "empty/"]:
+            path = tmp_path / relpath
+            if relpath.endswith("/"):
+                path.mkdir(parents=True)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(relpath)
+
+        result = list(walk_local_files(tmp_path, max_workers=2))
+        assert [relpath for relpath, _ in result] == ["a-b/c.txt", "a.txt", "a/a/z.txt", "a/b.txt", "b.txt"]
+        assert all(st.st_size == len(relpath) for relpath, st in result)
+
+    @pytest.mark.skipif(os.name == "nt", reason="Symlinks require admin rights on Windows")
+    def test_walk_follows_file_symlinks_only(self, tmp_path: Path) -> None:
+        (tmp_path / "dir").mkdir()
+        (tmp_path / "dir" / "file.txt").write_text("content")
+        (tmp_path / "link.txt").symlink_to(tmp_path / "dir" / "file.txt")
+        (tmp_path / "link_dir").symlink_to(tmp_path / "dir")
+
+        assert [relpath for relpath, _ in walk_local_files(tmp_path)] == ["dir/file.txt", "link.txt"]
+
+    def test_walk_prefetch_is_bounded(self, tmp_path: Path) -> None:
+        for i in range(100):
+            for j in range(3):
+                (tmp_path / f"{i:03d}" / f"{j}").mkdir(parents=True)
+                (tmp_path / f"{i:03d}" / f"{j}" / "file.txt").touch()
+
+        scanned = []
+
+        def _scan(path: str):
+            scanned.append(path)
+            return _scan_dir(path)
+
+        with patch("huggingface_hub.utils._paths._scan_dir", side_effect=_scan):
+            walk = walk_local_files(tmp_path, max_workers=2)
+            assert next(walk)[0] == "000/0/file.txt"
+            time.sleep(0.2)  # let the workers list what has been submitted
+            # root + "000" + "000/0" + at most `max_pending` directories ahead
+            assert len(scanned) <= 3 + WALK_PREFETCH_FACTOR * 2
+            assert len(list(walk)) == 299
+        assert len(scanned) == 1 + 100 + 300
+
+    def test_walk_missing_dir(self, tmp_path: Path) -> None:
+        assert list(walk_local_files(tmp_path / "missing")) == []
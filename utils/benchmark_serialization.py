@@ -0,0 +1,360 @@
+# coding=utf-8
+# Copyright 2026-present, the HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the serialization helpers and `PyTorchModelHubMixin` on synthetic checkpoints.
+
+Each benchmark runs in a fresh process so that its peak memory is measured independently. For every run, the wall
+time, the throughput (checkpoint bytes / wall time), the peak RSS of the process and the RSS increase during the timed
+section are reported. The median over `--repeat` runs is kept.
+
+Results can be saved as JSON (`--output`) and compared with a previous run (`--compare`), e.g. to check a change
+against the main branch:
+
+    git checkout main && python utils/benchmark_serialization.py --output main.json
+    git checkout my-branch && python utils/benchmark_serialization.py --compare main.json
+
+Usage:
+    python utils/benchmark_serialization.py                                  # print a table
+    python utils/benchmark_serialization.py --total-size 5GB --num-tensors 500 --output results.json
+    python utils/benchmark_serialization.py --only load_torch_model --only load_torch_model[lazy]
+"""
+
+import argparse
+import functools
+import json
+import multiprocessing
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class Config:
+    total_size: int  # bytes
+    num_tensors: int
+    max_shard_size: int  # bytes
+    workdir: str
+
+
+# SYNTHETIC CHECKPOINTS
+
+
+def make_state_dict(config: Config) -> dict:
+    """`num_tensors` float32 tensors totalling `total_size` bytes, with the keys and shapes of `make_model`."""
+    import torch
+
+    # Tensors are filled so that their pages are resident in memory
+    return {f"layers.{idx}.weight": torch.full((1, _numel(config)), float(idx)) for idx in range(config.num_tensors)}
+
+
+def make_model(config: Config):
+    return _model_class()(num_tensors=config.num_tensors, numel=_numel(config))
+
+
+def _numel(config: Config) -> int:
+    return max(1, config.total_size // 4 // config.num_tensors)
+
+
+@functools.cache
+def _model_class() -> type:
+    import torch
+
+    from huggingface_hub import PyTorchModelHubMixin
+
+    class BenchmarkModel(torch.nn.Module, PyTorchModelHubMixin):
+        def __init__(self, num_tensors: int = 1, numel: int = 1):
+            super().__init__()
+            self.layers = torch.nn.ModuleList(torch.nn.Linear(numel, 1, bias=False) for _ in range(num_tensors))
+
+    return BenchmarkModel
+
+
+def prepare_fixtures(config: Config) -> None:
+    """Save the checkpoints read by the loading benchmarks (not measured)."""
+    from huggingface_hub import export_folder_as_dduf, save_torch_state_dict
+
+    workdir = Path(config.workdir)
+    state_dict = make_state_dict(config)
+    (workdir / "checkpoint").mkdir()
+    save_torch_state_dict(state_dict, workdir / "checkpoint", max_shard_size=config.max_shard_size)
+
+    # A diffusers-like pipeline with a single component
+    pipeline = workdir / "pipeline"
+    (pipeline / "transformer").mkdir(parents=True)
+    save_torch_state_dict(state_dict, pipeline / "transformer", max_shard_size=config.max_shard_size)
+    (pipeline / "transformer" / "config.json").write_text("{}")
+    (pipeline / "model_index.json").write_text(json.dumps({"transformer": ["diffusers", "Transformer"]}))
+    export_folder_as_dduf(workdir / "pipeline.dduf", pipeline)
+
+    model = make_model(config)
+    model.load_state_dict(state_dict)
+    model.save_pretrained(workdir / "mixin")
+
+
+# BENCHMARKS
+# Each benchmark does its own setup, then times a single section with `measure(nb_bytes)`.
+
+
+def bench_split(config: Config, measure: Callable) -> None:
+    from huggingface_hub import split_state_dict_into_shards_factory
+    from huggingface_hub.serialization._base import SHARDING_STRATEGIES
+
+    # Tensors are not allocated: only their sizes matter
+    sizes = {f"layers.{idx}.weight": config.total_size // config.num_tensors for idx in range(config.num_tensors)}
+    with measure(0):
+        for strategy in SHARDING_STRATEGIES:
+            split_state_dict_into_shards_factory(
+                sizes,  # type: ignore[arg-type]
+                get_storage_size=lambda size: size,
+                filename_pattern="model{suffix}.safetensors",
+                max_shard_size=config.max_shard_size,
+                sharding_strategy=strategy,
+            )
+
+
+def _bench_save(max_workers: int) -> Callable:
+    def _bench(config: Config, measure: Callable) -> None:
+        from huggingface_hub import save_torch_state_dict
+
+        state_dict = make_state_dict(config)
+        with tempfile.TemporaryDirectory(dir=config.workdir) as save_directory:
+            with measure(config.total_size):
+                save_torch_state_dict(
+                    state_dict, save_directory, max_shard_size=config.max_shard_size, max_workers=max_workers
+                )
+
+    return _bench
+
+
+def _bench_load(**kwargs) -> Callable:
+    def _bench(config: Config, measure: Callable) -> None:
+        from huggingface_hub import load_torch_model
+
+        model = make_model(config)
+        with measure(config.total_size):
+            load_torch_model(model, Path(config.workdir) / "checkpoint", **kwargs)
+
+    return _bench
+
+
+def bench_dduf_export(config: Config, measure: Callable) -> None:
+    from huggingface_hub import export_folder_as_dduf
+
+    with tempfile.TemporaryDirectory(dir=config.workdir) as tmpdir:
+        with measure(config.total_size):
+            export_folder_as_dduf(Path(tmpdir) / "pipeline.dduf", Path(config.workdir) / "pipeline")
+
+
+def bench_dduf_read(config: Config, measure: Callable) -> None:
+    from huggingface_hub import read_dduf_file
+
+    with measure(config.total_size):
+        for entry in read_dduf_file(Path(config.workdir) / "pipeline.dduf").values():
+            with entry.as_mmap() as data:
+                assert len(data) == entry.length
+
+
+def bench_hub_mixin_from_pretrained(config: Config, measure: Callable) -> None:
+    model_class = _model_class()
+    with measure(config.total_size):
+        model_class.from_pretrained(Path(config.workdir) / "mixin")
+
+
+BENCHMARKS: dict[str, Callable[[Config, Callable], None]] = {
+    "split_state_dict_into_shards_factory": bench_split,
+    "save_torch_state_dict": _bench_save(max_workers=1),
+    "save_torch_state_dict[max_workers=4]": _bench_save(max_workers=4),
+    "load_torch_model": _bench_load(),
+    "load_torch_model[prefetch]": _bench_load(prefetch_budget="2GB"),
+    "load_torch_model[lazy]": _bench_load(lazy=True),
+    "export_folder_as_dduf": bench_dduf_export,
+    "read_dduf_file": bench_dduf_read,
+    "PyTorchModelHubMixin.from_pretrained": bench_hub_mixin_from_pretrained,
+}
+
+
+# MEASUREMENTS
+
+
+def _current_rss() -> int | None:
+    """Current resident set size in bytes (Linux only)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()  # type: ignore[union-attr]
+    except (OSError, AttributeError):
+        return None
+
+
+def _peak_rss() -> int | None:
+    """Peak resident set size in bytes."""
+    # On Linux, `ru_maxrss` survives `exec` and would report the peak of the parent process: prefer `VmHWM`
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # bytes on macOS, kilobytes on Linux
+
+
+def _run_in_subprocess(name: str, config: Config) -> dict:
+    result: dict = {}
+
+    @contextmanager
+    def measure(nb_bytes: int):
+        rss_before = _current_rss()
+        start = time.perf_counter()
+        yield
+        result["wall_time"] = time.perf_counter() - start
+        result["nb_bytes"] = nb_bytes
+        result["peak_rss"] = _peak_rss()
+        # Peak RSS can't be reset: the increase is only meaningful if the peak is reached in the timed section
+        result["rss_increase"] = (
+            result["peak_rss"] - rss_before if result["peak_rss"] is not None and rss_before is not None else None
+        )
+
+    BENCHMARKS[name](config, measure)
+    return result
+
+
+def run(names: list[str], config: Config, repeat: int) -> list[dict]:
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        pool.apply(prepare_fixtures, (config,))
+
+    results = []
+    for name in names:
+        runs = []
+        for _ in range(repeat):
+            with ctx.Pool(1) as pool:
+                runs.append(pool.apply(_run_in_subprocess, (name, config)))
+        wall_time = statistics.median(r["wall_time"] for r in runs)
+        peak_rss = [r["peak_rss"] for r in runs if r["peak_rss"] is not None]
+        rss_increase = [r["rss_increase"] for r in runs if r["rss_increase"] is not None]
+        results.append(
+            {
+                "benchmark": name,
+                "wall_time_s": wall_time,
+                "wall_times_s": [r["wall_time"] for r in runs],
+                "throughput_mb_s": runs[0]["nb_bytes"] / 1e6 / wall_time if runs[0]["nb_bytes"] else None,
+                "peak_rss_mb": statistics.median(peak_rss) / 1e6 if peak_rss else None,
+                "rss_increase_mb": statistics.median(rss_increase) / 1e6 if rss_increase else None,
+            }
+        )
+        print(f"{name}: {wall_time:.3f}s", file=sys.stderr)
+    return results
+
+
+def environment() -> dict:
+    import huggingface_hub
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import torch
+
+        torch_version = torch.__version__
+    except ImportError:
+        torch_version = None
+    return {
+        "commit": commit,
+        "huggingface_hub": huggingface_hub.__version__,
+        "torch": torch_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def print_table(results: list[dict], baseline: dict[str, dict] | None = None) -> None:
+    def _fmt(value: float | None, pattern: str) -> str:
+        return "n/a" if value is None else pattern.format(value)
+
+    header = f"{'benchmark':<40}{'time (s)':>10}{'MB/s':>10}{'peak RSS (MB)':>15}{'RSS +(MB)':>11}"
+    print(header + (f"{'vs baseline':>13}" if baseline else ""))
+    for row in results:
+        line = (
+            f"{row['benchmark']:<40}{row['wall_time_s']:>10.3f}{_fmt(row['throughput_mb_s'], '{:.0f}'):>10}"
+            f"{_fmt(row['peak_rss_mb'], '{:.0f}'):>15}{_fmt(row['rss_increase_mb'], '{:.0f}'):>11}"
+        )
+        if baseline:
+            previous = baseline.get(row["benchmark"])
+            ratio = row["wall_time_s"] / previous["wall_time_s"] if previous else None
+            line += f"{_fmt(ratio, '{:.2f}x'):>13}"
+        print(line)
+
+
+def main() -> None:
+    from huggingface_hub.serialization._base import parse_size_to_int
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--total-size", default="1GB", help="Total size of the synthetic checkpoint (default: 1GB).")
+    parser.add_argument("--num-tensors", type=int, default=100, help="Number of tensors (default: 100).")
+    parser.add_argument("--max-shard-size", default="256MB", help="Maximum shard size (default: 256MB).")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs per benchmark (default: 3).")
+    parser.add_argument(
+        "--only", action="append", choices=list(BENCHMARKS), help="Benchmark to run (repeatable). Defaults to all."
+    )
+    parser.add_argument("--output", help="Save results as JSON to this path.")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with.")
+    parser.add_argument(
+        "--workdir", help="Folder in which checkpoints are written (default: a temporary folder).", default=None
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        config = Config(
+            total_size=parse_size_to_int(args.total_size),
+            num_tensors=args.num_tensors,
+            max_shard_size=parse_size_to_int(args.max_shard_size),
+            workdir=workdir,
+        )
+        results = run(args.only or list(BENCHMARKS), config, repeat=args.repeat)
+
+    report = {
+        "environment": environment(),
+        "config": {key: value for key, value in asdict(config).items() if key != "workdir"},
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    baseline = None
+    if args.compare:
+        baseline = {row["benchmark"]: row for row in json.loads(Path(args.compare).read_text())["results"]}
+    print_table(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
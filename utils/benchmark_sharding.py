@@ -0,0 +1,160 @@
+# coding=utf-8
+# Copyright 2026-present, the HuggingFace Inc. team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure bytes re-uploaded across successive saves of an edited checkpoint, for each sharding strategy.
+
+A Llama-like state dict (no actual tensor is allocated) is saved, edited, and saved again. A shard is re-uploaded
+if no shard with the exact same content was uploaded by the previous save: this is file-level deduplication (LFS, or
+Xet when a whole file is unchanged), regardless of the shard filename.
+
+Usage:
+    python utils/benchmark_sharding.py                          # print a table
+    python utils/benchmark_sharding.py --max-shard-size 2GB --json
+"""
+
+import argparse
+import json
+from dataclasses import dataclass, replace
+
+from huggingface_hub.serialization import split_state_dict_into_shards_factory
+from huggingface_hub.serialization._base import SHARDING_STRATEGIES
+
+
+@dataclass(frozen=True)
+class FakeTensor:
+    size: int
+    version: int = 0  # bumped when the tensor values change
+
+
+def llama_like_state_dict(nb_layers: int = 32, hidden: int = 4096, intermediate: int = 11008, vocab: int = 32000):
+    dtype_size = 2  # bf16
+    state_dict = {"model.embed_tokens.weight": FakeTensor(vocab * hidden * dtype_size)}
+    for idx in range(nb_layers):
+        prefix = f"model.layers.{idx}"
+        for name in ("q_proj", "k_proj", "v_proj", "o_proj"):
+            state_dict[f"{prefix}.self_attn.{name}.weight"] = FakeTensor(hidden * hidden * dtype_size)
+        for name in ("gate_proj", "up_proj", "down_proj"):
+            state_dict[f"{prefix}.mlp.{name}.weight"] = FakeTensor(hidden * intermediate * dtype_size)
+        state_dict[f"{prefix}.input_layernorm.weight"] = FakeTensor(hidden * dtype_size)
+        state_dict[f"{prefix}.post_attention_layernorm.weight"] = FakeTensor(hidden * dtype_size)
+    state_dict["model.norm.weight"] = FakeTensor(hidden * dtype_size)
+    state_dict["lm_head.weight"] = FakeTensor(vocab * hidden * dtype_size)
+    return state_dict
+
+
+def insert_after(state_dict: dict, after: str, key: str, tensor: FakeTensor) -> dict:
+    edited = {}
+    for name, value in state_dict.items():
+        edited[name] = value
+        if name == after:
+            edited[key] = tensor
+    return edited
+
+
+def scenarios(base: dict) -> list[tuple[str, dict]]:
+    """Successive edits, each one applied on top of the previous one."""
+    hidden_bytes = base["model.norm.weight"].size
+    edits = []
+
+    # Add a small adapter in the middle of the model
+    added = insert_after(
+        base,
+        "model.layers.15.self_attn.q_proj.weight",
+        "model.layers.15.self_attn.q_proj.lora_A",
+        FakeTensor(16 * hidden_bytes),
+    )
+    edits.append(("add a tensor", added))
+
+    # Resize the embeddings (new tokens added to the vocabulary)
+    resized = dict(added)
+    for key in ("model.embed_tokens.weight", "lm_head.weight"):
+        resized[key] = FakeTensor(resized[key].size + 256 * hidden_bytes)
+    edits.append(("resize embeddings", resized))
+
+    # Fine-tune the last 2 layers only
+    tuned = {
+        key: replace(tensor, version=tensor.version + 1)
+        if key.startswith(("model.layers.30.", "model.layers.31."))
+        else tensor
+        for key, tensor in resized.items()
+    }
+    edits.append(("fine-tune 2 layers", tuned))
+
+    # Remove the adapter
+    removed = {key: tensor for key, tensor in tuned.items() if "lora" not in key}
+    edits.append(("remove a tensor", removed))
+    return edits
+
+
+def shard_contents(state_dict: dict, strategy: str, max_shard_size: int | str) -> dict[tuple, int]:
+    """Map each shard content (tensors names, sizes and versions) to its size."""
+    split = split_state_dict_into_shards_factory(
+        state_dict,
+        get_storage_size=lambda tensor: tensor.size,
+        filename_pattern="model{suffix}.safetensors",
+        max_shard_size=max_shard_size,
+        sharding_strategy=strategy,
+    )
+    contents = {}
+    for keys in split.filename_to_tensors.values():
+        content = tuple((key, state_dict[key].size, state_dict[key].version) for key in keys)
+        contents[content] = sum(state_dict[key].size for key in keys)
+    return contents
+
+
+def run(max_shard_size: str) -> list[dict]:
+    base = llama_like_state_dict()
+    results = []
+    for strategy in SHARDING_STRATEGIES:
+        previous = shard_contents(base, strategy, max_shard_size)
+        for scenario, state_dict in scenarios(base):
+            current = shard_contents(state_dict, strategy, max_shard_size)
+            total_bytes = sum(current.values())
+            reuploaded_bytes = sum(size for content, size in current.items() if content not in previous)
+            results.append(
+                {
+                    "strategy": strategy,
+                    "scenario": scenario,
+                    "nb_shards": len(current),
+                    "max_shard_bytes": max(current.values()),
+                    "total_bytes": total_bytes,
+                    "reuploaded_bytes": reuploaded_bytes,
+                    "reuploaded_ratio": reuploaded_bytes / total_bytes,
+                }
+            )
+            previous = current
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-shard-size", default="5GB", help="Maximum shard size (default: 5GB).")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON.")
+    args = parser.parse_args()
+
+    results = run(args.max_shard_size)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'strategy':<12}{'scenario':<22}{'shards':>8}{'re-uploaded':>14}{'ratio':>8}")
+    for row in results:
+        print(
+            f"{row['strategy']:<12}{row['scenario']:<22}{row['nb_shards']:>8}"
+            f"{row['reuploaded_bytes'] / 1e9:>12.2f}GB{row['reuploaded_ratio']:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
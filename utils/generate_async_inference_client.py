@@ -138,7 +138,7 @@ def _add_imports(code: str) -> str:
         repl=(
             r"\1"
             + "from .._common import _async_yield_from\n"
-            + "from huggingface_hub.utils import get_async_session\n"
+            + "from huggingface_hub.utils import get_shared_async_session\n"
             + "from typing import AsyncIterable\n"
             + "from contextlib import AsyncExitStack\n"
             + "from typing import Set\n"
@@ -244,15 +244,16 @@ ENTER_EXIT_STACK_ASYNC_CODE = """
         This method is automatically called when using the client as a context manager.
         \"""
         await self.exit_stack.aclose()
+        self._async_client = None
 
     async def _get_async_client(self):
-        \"""Get a unique async client for this AsyncInferenceClient instance.
+        \"""Get the async client used by this AsyncInferenceClient instance.
 
-        Returns the same client instance on subsequent calls, ensuring proper
-        connection reuse and resource management through the exit stack.
+        The client is shared with all other calls made in the same event loop (see `get_shared_async_session`), so
+        that connections are reused. Its lifecycle is managed by `huggingface_hub`: it is not closed with this instance.
         \"""
         if self._async_client is None:
-            self._async_client = await self.exit_stack.enter_async_context(get_async_session())
+            self._async_client = get_shared_async_session()
         return self._async_client
 """
 